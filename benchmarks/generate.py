@@ -0,0 +1,184 @@
+"""Synthetic SKGD projects for benchmarks.
+
+``make_project`` builds a project the way a real one grows: ``skgd init``
+output, then N feature specs with M tasks each, a long learnings.md, a
+state.yaml with a large session history plus a state journal, and an
+engine asset tree. ``make_v1_project`` strips the result back to the
+v1.x layout so the full v1 -> v3 upgrade path can be timed.
+
+Usage:
+    python benchmarks/generate.py /tmp/big-game --scale large
+"""
+
+import json
+import os
+import random
+import shutil
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "src"))
+
+# name -> (specs, tasks per spec, learnings entries, state history entries, asset files)
+SCALES = {
+    "small": (10, 20, 500, 200, 200),
+    "medium": (50, 40, 5000, 2000, 2000),
+    "large": (200, 60, 50000, 10000, 20000),
+}
+
+WORDS = ("player enemy dash jump camera input shader pool spawn wave ui menu "
+         "save load collision physics sprite animation audio level boss loot "
+         "inventory dialog quest timer score combo particle tween signal node").split()
+
+ASSET_KINDS = [
+    ("Sprites", ".png", b"\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00\x20\x00\x00\x00\x20\x08\x06\x00\x00\x00"),
+    ("Audio", ".wav", b"RIFF\x24\x00\x00\x00WAVEfmt \x10\x00\x00\x00\x01\x00\x01\x00\x44\xac\x00\x00"),
+    ("Models", ".obj", b"v 0 0 0\nv 1 0 0\nv 0 1 0\nf 1 2 3\n"),
+    ("Animations", ".anim", b"%YAML 1.1\nAnimationClip:\n  m_Name: clip\n"),
+]
+
+
+def _sentence(rng: random.Random, n: int = 8) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(n)).capitalize()
+
+
+def _write(path: Path, text: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+
+
+def init_project(dest: Path, engine: str = "unity", lang: str = "en") -> None:
+    """Install the templates into dest like `skgd init -y` (no probes, no prompts)."""
+    from skgd.cli import copy_templates, get_readme_content, update_config
+
+    copy_templates(dest, "bash", "opus", lang, engine)
+    update_config(dest, dest.name, "opus", "bash", lang, engine)
+    _write(dest / "README.md", get_readme_content(dest.name, engine, lang))
+
+
+def write_specs(dest: Path, specs: int, tasks: int, rng: random.Random) -> None:
+    for i in range(1, specs + 1):
+        feature = dest / "docs" / "specs" / f"{i:03d}-{rng.choice(WORDS)}-{rng.choice(WORDS)}"
+        _write(feature / "spec.md", "\n".join(
+            [f"# Spec {i}", "", "## Acceptance Criteria", ""]
+            + [f"- [ ] AC-{n}: {_sentence(rng)}" for n in range(1, 6)]) + "\n")
+        _write(feature / "plan.md", "\n".join(
+            [f"# Plan {i}", ""] + [f"- {_sentence(rng, 12)}" for _ in range(20)]) + "\n")
+        lines = [f"# Tasks {i}", ""]
+        per_phase = max(1, tasks // 4)
+        for t in range(1, tasks + 1):
+            if (t - 1) % per_phase == 0:
+                lines += ["", f"## Phase {(t - 1) // per_phase + 1}: {_sentence(rng, 2)}", ""]
+            box = "x" if rng.random() < 0.4 else " "
+            tag = " [P]" if rng.random() < 0.3 else ""
+            lines.append(f"- [{box}] T{t:03d}{tag} {_sentence(rng)} in Scripts/{rng.choice(WORDS)}.cs")
+        _write(feature / "tasks.md", "\n".join(lines) + "\n")
+
+
+def write_learnings(dest: Path, entries: int, rng: random.Random) -> None:
+    sections = ["## Technical Learnings", "## Design Learnings", "## Process Learnings",
+                "## Bug Patterns"]
+    lines = ["# Project Learnings", ""]
+    per_section = max(1, entries // len(sections))
+    for s, heading in enumerate(sections):
+        lines += [heading, ""]
+        for n in range(per_section):
+            day = 1 + (s * per_section + n) % 28
+            lines.append(f"- 2025-{1 + n % 12:02d}-{day:02d} {rng.choice(WORDS)}: {_sentence(rng, 10)}")
+        lines.append("")
+    _write(dest / ".skgd" / "memory" / "learnings.md", "\n".join(lines))
+
+
+def write_state(dest: Path, history: int, rng: random.Random) -> None:
+    import yaml
+
+    path = dest / ".skgd" / "state.yaml"
+    with open(path, "r", encoding="utf-8") as f:
+        state = yaml.safe_load(f) or {}
+    impl = state.setdefault("implementation", {})
+    impl["sessions"] = {"count": history, "history": [
+        {"date": f"2025-{1 + n % 12:02d}-{1 + n % 28:02d}", "range": f"T{n % 60 + 1:03d}-T{n % 60 + 5:03d}",
+         "completed": rng.randint(1, 5), "duration_min": rng.randint(10, 120)}
+        for n in range(history)
+    ]}
+    with open(path, "w", encoding="utf-8") as f:
+        yaml.dump(state, f, default_flow_style=False, sort_keys=False)
+
+    # Uncompacted journal tail, as left by scripts between compactions
+    seq = time.time_ns()
+    with open(dest / ".skgd" / "state.journal", "w", encoding="utf-8") as f:
+        for n in range(min(history, 500)):
+            f.write(json.dumps({"seq": seq + n, "op": "set", "key": "implementation.last_completed",
+                                "value": f"T{n % 60 + 1:03d}"}) + "\n")
+
+
+def write_assets(dest: Path, engine: str, count: int, rng: random.Random) -> None:
+    base = dest / "Assets" if engine == "unity" else dest / "assets"
+    for n in range(count):
+        folder, ext, header = ASSET_KINDS[n % len(ASSET_KINDS)]
+        path = base / folder / rng.choice(WORDS) / f"{rng.choice(WORDS)}_{n:05d}{ext}"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(header + os.urandom(rng.randint(64, 2048)))
+    if engine == "godot":
+        _write(dest / "project.godot", "config_version=5\n")
+
+
+def make_project(dest: Path, scale: str = "small", engine: str = "unity", lang: str = "en",
+                 seed: int = 0) -> Path:
+    """Create an up-to-date (v3) synthetic project at dest."""
+    specs, tasks, learnings, history, assets = SCALES[scale]
+    rng = random.Random(seed)
+    init_project(dest, engine, lang)
+    _write(dest / "docs" / "game-brief.md", f"# {dest.name}\n\n{_sentence(rng, 30)}\n")
+    write_specs(dest, specs, tasks, rng)
+    write_learnings(dest, learnings, rng)
+    write_state(dest, history, rng)
+    write_assets(dest, engine, assets, rng)
+    return dest
+
+
+def make_v1_project(dest: Path, scale: str = "small", engine: str = "unity", lang: str = "en",
+                    seed: int = 0) -> Path:
+    """Create a synthetic project in the v1.x layout (no i18n, assets pipeline or manifest)."""
+    import yaml
+
+    make_project(dest, scale, engine, lang, seed)
+    skgd = dest / ".skgd"
+    for rel in ("i18n", "memory/session-context.md", "memory/assets-catalog.md",
+                "templates/learnings-core.md", "manifest.json"):
+        path = skgd / rel
+        if path.is_dir():
+            shutil.rmtree(path)
+        elif path.exists():
+            path.unlink()
+    config_path = skgd / "config.yaml"
+    with open(config_path, "r", encoding="utf-8") as f:
+        config = yaml.safe_load(f) or {}
+    config["version"] = "1.0"
+    config.get("mcp", {}).pop("assets", None)
+    with open(config_path, "w", encoding="utf-8") as f:
+        yaml.dump(config, f, default_flow_style=False, sort_keys=False)
+    return dest
+
+
+def main() -> None:
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Generate a synthetic SKGD project.")
+    parser.add_argument("dest", type=Path)
+    parser.add_argument("--scale", choices=sorted(SCALES), default="small")
+    parser.add_argument("--engine", choices=["unity", "godot"], default="unity")
+    parser.add_argument("--lang", choices=["en", "fr"], default="en")
+    parser.add_argument("--v1", action="store_true", help="Generate the v1.x layout")
+    args = parser.parse_args()
+    if args.dest.exists():
+        parser.error(f"{args.dest} already exists")
+    make = make_v1_project if args.v1 else make_project
+    make(args.dest, args.scale, args.engine, args.lang)
+    print(f"Generated {args.scale} project in {args.dest}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,214 @@
+"""CLI hot-path benchmarks on synthetic projects.
+
+Times, at each scale of ``generate.SCALES``:
+
+- ``init``: ``skgd init NAME -y`` (new project)
+- ``init_here``: ``skgd init --here -y`` in an existing engine project
+  holding the scale's specs, learnings and asset tree
+- ``upgrade_v1_v3``: ``skgd upgrade -y`` on a v1.x project
+- ``upgrade_noop``: ``skgd upgrade -y`` on an up-to-date project
+- ``detect_existing_project`` and ``update_config`` (direct calls)
+
+Commands run in-process through click's test runner, against this
+checkout's ``src/``; startup time is covered by ``skgd --startup-profile``.
+Each case is run ``--repeat`` times on a fresh copy of the project (copies
+are made outside the timed region) and min/median/mean are recorded.
+
+Usage:
+    python benchmarks/run.py                           # small + medium
+    python benchmarks/run.py --scale large -o base.json
+    python benchmarks/run.py --compare base.json       # exit 1 on regressions
+"""
+
+import argparse
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from generate import ROOT, SCALES, make_project, make_v1_project
+
+from click.testing import CliRunner
+
+from skgd import __version__
+from skgd.cli import detect_existing_project, main as skgd_main, update_config
+
+DEFAULT_OUTPUT = ROOT / "benchmarks" / "results.json"
+
+# Cases faster than this are looped so one sample is long enough to time
+MIN_SAMPLE_SECONDS = 0.05
+
+
+@contextmanager
+def chdir(path: Path):
+    previous = os.getcwd()
+    os.chdir(path)
+    try:
+        yield
+    finally:
+        os.chdir(previous)
+
+
+def run_cli(*args: str) -> None:
+    result = CliRunner().invoke(skgd_main, list(args), catch_exceptions=False)
+    if result.exit_code != 0:
+        raise RuntimeError(f"skgd {' '.join(args)} exited {result.exit_code}:\n{result.output[-2000:]}")
+
+
+def measure(run: Callable[[], None], setup: Optional[Callable[[], None]] = None,
+            repeat: int = 5) -> dict:
+    """Time run() repeat times (setup() before each, untimed); seconds per call."""
+    number = 1
+    if setup is None:
+        # Calibrate the loop count for sub-millisecond calls
+        start = time.perf_counter()
+        run()
+        elapsed = time.perf_counter() - start
+        number = max(1, int(MIN_SAMPLE_SECONDS / elapsed)) if elapsed else 1000
+    samples = []
+    for _ in range(repeat):
+        if setup:
+            setup()
+        start = time.perf_counter()
+        for _ in range(number):
+            run()
+        samples.append((time.perf_counter() - start) / number)
+    return {
+        "min": min(samples),
+        "median": statistics.median(samples),
+        "mean": statistics.mean(samples),
+        "repeat": repeat,
+        "number": number,
+    }
+
+
+def bench_scale(scale: str, work: Path, engine: str, repeat: int) -> Dict[str, dict]:
+    """All cases at one scale; work is an empty scratch directory."""
+    v3 = make_project(work / "v3" / "game", scale, engine)
+    v1 = make_v1_project(work / "v1" / "game", scale, engine)
+    bare = work / "bare" / "game"
+    shutil.copytree(v3, bare, symlinks=True)
+    for rel in (".skgd", ".claude", "README.md"):
+        path = bare / rel
+        shutil.rmtree(path) if path.is_dir() else path.unlink()
+    target = work / "target"
+
+    def fresh_copy(source: Path) -> Callable[[], None]:
+        def setup():
+            if target.exists():
+                shutil.rmtree(target)
+            shutil.copytree(source, target, symlinks=True)
+        return setup
+
+    def clear_target():
+        if target.exists():
+            shutil.rmtree(target)
+
+    def init_here():
+        with chdir(target):
+            run_cli("init", "--here", "-y", "-e", engine)
+
+    results = {}
+    results["init"] = measure(lambda: run_cli("init", str(target), "-y", "-e", engine),
+                              clear_target, repeat)
+    results["init_here"] = measure(init_here, fresh_copy(bare), repeat)
+    results["upgrade_v1_v3"] = measure(lambda: run_cli("upgrade", str(target), "-y"),
+                                       fresh_copy(v1), repeat)
+    # No-op upgrades exit 0 after detecting that nothing changed
+    results["upgrade_noop"] = measure(lambda: run_cli("upgrade", str(v3), "-y"), None, repeat)
+    results["detect_existing_project"] = measure(lambda: detect_existing_project(v3), None, repeat)
+
+    fresh_copy(v3)()
+    results["update_config"] = measure(
+        lambda: update_config(target, "game", "opus", "bash", "en", engine), None, repeat)
+    return results
+
+
+def git_commit() -> Optional[str]:
+    try:
+        out = subprocess.run(["git", "-C", str(ROOT), "rev-parse", "--short", "HEAD"],
+                             capture_output=True, text=True, check=True)
+        return out.stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(current: dict, baseline: dict, threshold: float) -> List[str]:
+    """Print best-sample ratios against a baseline; returns the regressed cases."""
+    regressions = []
+    print(f"\nvs {baseline['meta'].get('commit') or 'baseline'} (best of each case, threshold x{threshold:.2f})")
+    for scale, cases in current["results"].items():
+        for case, result in cases.items():
+            old = baseline["results"].get(scale, {}).get(case)
+            if not old:
+                continue
+            ratio = result["min"] / old["min"] if old["min"] else 1.0
+            flag = "  REGRESSION" if ratio > threshold else ""
+            print(f"  {scale:<7} {case:<24} {old['min'] * 1000:9.2f}ms -> "
+                  f"{result['min'] * 1000:9.2f}ms  x{ratio:.2f}{flag}")
+            if flag:
+                regressions.append(f"{scale}/{case}")
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark skgd CLI hot paths.")
+    parser.add_argument("--scale", action="append", choices=sorted(SCALES),
+                        help="Scale to run (repeatable; default: small and medium)")
+    parser.add_argument("--engine", choices=["unity", "godot"], default="unity")
+    parser.add_argument("--repeat", type=int, default=5, help="Samples per case")
+    parser.add_argument("--output", "-o", type=Path, default=DEFAULT_OUTPUT,
+                        help="Results file (default: benchmarks/results.json)")
+    parser.add_argument("--compare", type=Path, help="Baseline results to compare against")
+    parser.add_argument("--threshold", type=float, default=1.25,
+                        help="Slowdown ratio (best samples) counted as a regression")
+    args = parser.parse_args()
+
+    scales = args.scale or ["small", "medium"]
+    report = {
+        "meta": {
+            "skgd": __version__,
+            "commit": git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpus": os.cpu_count(),
+            "engine": args.engine,
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "scales": {s: dict(zip(("specs", "tasks", "learnings", "history", "assets"), SCALES[s]))
+                   for s in scales},
+        "results": {},
+    }
+    for scale in scales:
+        with tempfile.TemporaryDirectory(prefix=f"skgd-bench-{scale}-") as tmp:
+            print(f"{scale}: generating project...", flush=True)
+            report["results"][scale] = results = bench_scale(scale, Path(tmp), args.engine, args.repeat)
+        for case, r in results.items():
+            print(f"  {case:<24} median {r['median'] * 1000:9.2f}ms  min {r['min'] * 1000:9.2f}ms")
+
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+        f.write("\n")
+    print(f"\nResults written to {args.output}")
+
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare(report, baseline, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s): {', '.join(regressions)}")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,43 @@
+"""Hatch build hook: generate build-time template artifacts."""
+
+import json
+import sys
+import tempfile
+from pathlib import Path
+
+from hatchling.builders.hooks.plugin.interface import BuildHookInterface
+
+
+class CustomBuildHook(BuildHookInterface):
+    """Ship the template manifest and packed template bundles with the wheel.
+
+    The loose template tree is excluded from wheels (see pyproject.toml);
+    installed copies read the memory-mapped packs instead.
+    """
+
+    def initialize(self, version, build_data):
+        root = Path(self.root)
+        sys.path.insert(0, str(root / "src"))
+        try:
+            from skgd.bundle import PACK_SUFFIX, pack_tree
+            from skgd.manifest import PACKAGE_MANIFEST, build_manifest
+        finally:
+            sys.path.pop(0)
+
+        template_dir = root / "src" / "skgd" / "templates"
+        out_dir = Path(tempfile.mkdtemp(prefix="skgd-build-"))
+
+        manifest_path = out_dir / PACKAGE_MANIFEST
+        with open(manifest_path, "w", encoding="utf-8") as f:
+            json.dump(build_manifest(template_dir), f, indent=1, sort_keys=True)
+        build_data["force_include"][str(manifest_path)] = (
+            f"skgd/templates/{PACKAGE_MANIFEST}"
+        )
+
+        # One pack per top-level directory (languages + common)
+        for top in sorted(p for p in template_dir.iterdir() if p.is_dir()):
+            pack_path = out_dir / (top.name + PACK_SUFFIX)
+            pack_tree(top, pack_path, prefix=top.name + "/")
+            build_data["force_include"][str(pack_path)] = (
+                f"skgd/templates/{pack_path.name}"
+            )
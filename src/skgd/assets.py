@@ -0,0 +1,646 @@
+"""Asset scanner - regenerates the tables of ``memory/assets-catalog.md``.
+
+``skgd assets scan`` walks the engine's asset roots (``Assets/`` for Unity,
+the project tree for Godot) and extracts, from file headers only, image
+dimensions, audio durations, mesh polygon counts and animation frame
+counts. New and changed files are processed on a thread pool; results are
+cached in ``.skgd/cache/assets.json`` keyed by path, mtime and size, so a
+rescan of an unchanged project only stats files. Content hashes flag
+duplicate files.
+
+The category and By Feature tables of the catalog are rewritten
+deterministically (sorted by path). Hand-maintained "Used By" and
+"Status" cells are kept; an empty "Used By" is filled with the features
+whose spec, plan or tasks mention the file name. Every other section of
+the catalog is left as is.
+"""
+
+import hashlib
+import json
+import os
+import re
+import struct
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import click
+
+from .cli import detect_project_settings, require_project_root
+from .copyengine import default_jobs, human_size
+from .fleet import SKIP_DIRS
+
+
+CATALOG_FILE = ".skgd/memory/assets-catalog.md"
+CACHE_FILE = "assets.json"
+CACHE_VERSION = 1
+
+CATEGORIES = ("sprites", "models", "animations", "audio")
+
+EXTENSIONS = {
+    "sprites": {".png", ".jpg", ".jpeg", ".webp", ".bmp", ".tga", ".gif", ".psd", ".svg"},
+    "models": {".obj", ".gltf", ".glb", ".fbx", ".blend", ".dae", ".3ds"},
+    "animations": {".anim", ".aseprite", ".ase"},
+    "audio": {".wav", ".ogg", ".opus", ".mp3", ".flac", ".aif", ".aiff"},
+}
+# Godot text resources are only assets when they hold an animation
+GODOT_RESOURCES = {".tres"}
+
+# Directories never scanned besides fleet.SKIP_DIRS
+EXTRA_SKIP_DIRS = {"docs", "addons"}
+
+HEAD_BYTES = 64 * 1024
+HASH_CHUNK = 1024 * 1024
+
+_MP3_BITRATES = {
+    1: [0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320],
+    2: [0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160],
+}
+_MP3_RATES = {1: [44100, 48000, 32000], 2: [22050, 24000, 16000], 25: [11025, 12000, 8000]}
+
+
+# --- Header parsers -------------------------------------------------------
+
+def image_size(head: bytes, ext: str) -> Optional[Tuple[int, int]]:
+    """(width, height) from an image header, None if unknown."""
+    try:
+        if head[:8] == b"\x89PNG\r\n\x1a\n":
+            return struct.unpack(">II", head[16:24])
+        if head[:6] in (b"GIF87a", b"GIF89a"):
+            return struct.unpack("<HH", head[6:10])
+        if head[:2] == b"BM":
+            w, h = struct.unpack("<ii", head[18:26])
+            return w, abs(h)
+        if head[:4] == b"8BPS":
+            h, w = struct.unpack(">II", head[14:22])
+            return w, h
+        if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+            chunk = head[12:16]
+            if chunk == b"VP8X":
+                return (int.from_bytes(head[24:27], "little") + 1,
+                        int.from_bytes(head[27:30], "little") + 1)
+            if chunk == b"VP8L":
+                bits = int.from_bytes(head[21:25], "little")
+                return (bits & 0x3FFF) + 1, ((bits >> 14) & 0x3FFF) + 1
+            if chunk == b"VP8 ":
+                w, h = struct.unpack("<HH", head[26:30])
+                return w & 0x3FFF, h & 0x3FFF
+        if head[:2] == b"\xff\xd8":
+            return _jpeg_size(head)
+        if ext == ".tga" and len(head) >= 18:
+            return struct.unpack("<HH", head[12:16])
+        if ext == ".svg":
+            m = re.search(rb'<svg[^>]*?\swidth="(\d+)[^"]*"[^>]*?\sheight="(\d+)', head)
+            if m:
+                return int(m.group(1)), int(m.group(2))
+    except (struct.error, ValueError, IndexError):
+        pass
+    return None
+
+
+def _jpeg_size(head: bytes) -> Optional[Tuple[int, int]]:
+    i = 2
+    while i + 9 < len(head):
+        if head[i] != 0xFF:
+            i += 1
+            continue
+        marker = head[i + 1]
+        if marker == 0xFF:
+            i += 1
+            continue
+        if marker in (0xD8, 0x01) or 0xD0 <= marker <= 0xD7:
+            i += 2
+            continue
+        length = struct.unpack(">H", head[i + 2:i + 4])[0]
+        if 0xC0 <= marker <= 0xCF and marker not in (0xC4, 0xC8, 0xCC):
+            h, w = struct.unpack(">HH", head[i + 5:i + 9])
+            return w, h
+        i += 2 + length
+    return None
+
+
+def audio_duration(path: Path, head: bytes, size: int) -> Optional[float]:
+    """Duration in seconds from an audio header, None if unknown."""
+    try:
+        if head[:4] == b"RIFF" and head[8:12] == b"WAVE":
+            return _wav_duration(head, size)
+        if head[:4] == b"fLaC":
+            x = int.from_bytes(head[18:26], "big")
+            rate, total = x >> 44, x & ((1 << 36) - 1)
+            return total / rate if rate else None
+        if head[:4] == b"OggS":
+            return _ogg_duration(path, head, size)
+        if head[:4] == b"FORM" and head[8:12] in (b"AIFF", b"AIFC"):
+            i = head.find(b"COMM")
+            if i > 0:
+                frames = struct.unpack(">I", head[i + 10:i + 14])[0]
+                rate = _extended_to_float(head[i + 16:i + 26])
+                return frames / rate if rate else None
+        return _mp3_duration(head, size)
+    except (struct.error, ValueError, IndexError, ZeroDivisionError):
+        return None
+
+
+def _wav_duration(head: bytes, size: int) -> Optional[float]:
+    i, byte_rate = 12, None
+    while i + 8 <= len(head):
+        chunk, length = head[i:i + 4], struct.unpack("<I", head[i + 4:i + 8])[0]
+        if chunk == b"fmt ":
+            byte_rate = struct.unpack("<I", head[i + 16:i + 20])[0]
+        elif chunk == b"data":
+            length = min(length, size - i - 8)
+            return length / byte_rate if byte_rate else None
+        i += 8 + length + (length & 1)
+    return None
+
+
+def _ogg_duration(path: Path, head: bytes, size: int) -> Optional[float]:
+    i = head.find(b"\x01vorbis")
+    if i >= 0:
+        rate, skip = struct.unpack("<I", head[i + 12:i + 16])[0], 0
+    else:
+        i = head.find(b"OpusHead")
+        if i < 0:
+            return None
+        rate, skip = 48000, struct.unpack("<H", head[i + 10:i + 12])[0]
+    with open(path, "rb") as f:
+        f.seek(max(0, size - HEAD_BYTES))
+        tail = f.read()
+    j = tail.rfind(b"OggS")
+    if j < 0 or not rate:
+        return None
+    granule = struct.unpack("<q", tail[j + 6:j + 14])[0]
+    return max(0, granule - skip) / rate
+
+
+def _mp3_duration(head: bytes, size: int) -> Optional[float]:
+    offset = 0
+    if head[:3] == b"ID3":
+        if len(head) < 10:
+            return None
+        s = head[6:10]
+        offset = 10 + ((s[0] << 21) | (s[1] << 14) | (s[2] << 7) | s[3])
+    if offset + 4 > len(head):
+        return None
+    # Find the first MPEG Layer III frame header
+    for i in range(offset, min(len(head) - 4, offset + 4096)):
+        b1, b2 = head[i + 1], head[i + 2]
+        if head[i] != 0xFF or (b1 & 0xE0) != 0xE0 or ((b1 >> 1) & 3) != 1:
+            continue
+        version = {3: 1, 2: 2, 0: 25}.get((b1 >> 3) & 3)
+        bitrate_idx, rate_idx = b2 >> 4, (b2 >> 2) & 3
+        if version is None or bitrate_idx in (0, 15) or rate_idx == 3:
+            continue
+        rate = _MP3_RATES[version][rate_idx]
+        bitrate = _MP3_BITRATES[1 if version == 1 else 2][bitrate_idx] * 1000
+        samples = 1152 if version == 1 else 576
+        # VBR files carry the frame count in a Xing/Info header
+        for tag in (b"Xing", b"Info"):
+            x = head.find(tag, i, i + 200)
+            if x > 0 and x + 12 <= len(head) and head[x + 7] & 1:
+                frames = struct.unpack(">I", head[x + 8:x + 12])[0]
+                return frames * samples / rate
+        return (size - i) * 8 / bitrate
+    return None
+
+
+def _extended_to_float(data: bytes) -> float:
+    """80-bit IEEE 754 extended float (AIFF sample rate)."""
+    exponent = ((data[0] & 0x7F) << 8) | data[1]
+    mantissa = int.from_bytes(data[2:10], "big")
+    return mantissa * 2.0 ** (exponent - 16383 - 63)
+
+
+def mesh_polygons(path: Path, head: bytes, ext: str) -> Optional[int]:
+    """Polygon (triangle for glTF) count of a mesh file, None if unknown."""
+    try:
+        if ext == ".obj":
+            count = 0
+            with open(path, "rb") as f:
+                for line in f:
+                    if line.startswith(b"f "):
+                        count += 1
+            return count
+        if ext == ".gltf":
+            return _gltf_triangles(json.loads(path.read_bytes()))
+        if ext == ".glb" and head[:4] == b"glTF":
+            length, kind = struct.unpack("<I4s", head[12:20])
+            if kind == b"JSON":
+                data = head[20:20 + length] if 20 + length <= len(head) else \
+                    path.read_bytes()[20:20 + length]
+                return _gltf_triangles(json.loads(data))
+    except (OSError, ValueError, KeyError, IndexError, TypeError, struct.error):
+        pass
+    return None
+
+
+def _gltf_triangles(doc: dict) -> int:
+    accessors = doc.get("accessors", [])
+    total = 0
+    for mesh in doc.get("meshes", []):
+        for prim in mesh.get("primitives", []):
+            if prim.get("mode", 4) != 4:
+                continue
+            if "indices" in prim:
+                total += accessors[prim["indices"]]["count"] // 3
+            elif "POSITION" in prim.get("attributes", {}):
+                total += accessors[prim["attributes"]["POSITION"]]["count"] // 3
+    return total
+
+
+def animation_info(head: bytes, ext: str) -> Optional[Tuple[str, Optional[int]]]:
+    """(type, frames) of an animation file, None if it is not one.
+
+    Malformed numbers (e.g. "m_SampleRate: 1.2.3") give unknown frames.
+    """
+    if ext in (".aseprite", ".ase"):
+        if len(head) >= 8 and head[4:6] == b"\xe0\xa5":
+            return "Aseprite", struct.unpack("<H", head[6:8])[0]
+        return "Aseprite", None
+    text = head.decode("utf-8", errors="replace")
+    if ext == ".anim":
+        rate = re.search(r"m_SampleRate:\s*([\d.]+)", text)
+        stop = re.search(r"m_StopTime:\s*([\d.]+)", text)
+        try:
+            frames = round(float(rate.group(1)) * float(stop.group(1))) if rate and stop else None
+        except ValueError:
+            frames = None
+        return "Unity clip", frames
+    if ext == ".tres":
+        m = re.match(r'\[gd_resource type="(\w+)"', text)
+        if not m:
+            return None
+        if m.group(1) == "SpriteFrames":
+            return "SpriteFrames", text.count('"texture"') or None
+        if m.group(1) == "Animation":
+            length = re.search(r"^length\s*=\s*([\d.]+)", text, re.MULTILINE)
+            step = re.search(r"^step\s*=\s*([\d.]+)", text, re.MULTILINE)
+            try:
+                frames = (round(float(length.group(1)) / float(step.group(1)))
+                          if length and step and float(step.group(1)) else None)
+            except ValueError:
+                frames = None
+            return "Godot Animation", frames
+    return None
+
+
+# --- Scanning -------------------------------------------------------------
+
+def asset_roots(dest: Path, engine: str) -> List[Path]:
+    if engine == "unity":
+        return [dest / "Assets"]
+    return [dest]
+
+
+def category_of(ext: str) -> Optional[str]:
+    for category, exts in EXTENSIONS.items():
+        if ext in exts:
+            return category
+    return "animations" if ext in GODOT_RESOURCES else None
+
+
+def walk_assets(dest: Path, engine: str) -> Dict[str, os.stat_result]:
+    """Project-relative path -> stat of every candidate asset file."""
+    skip = SKIP_DIRS | EXTRA_SKIP_DIRS
+    found = {}
+    for root in asset_roots(dest, engine):
+        if not root.is_dir():
+            continue
+        stack = [root]
+        while stack:
+            path = stack.pop()
+            try:
+                entries = list(os.scandir(path))
+            except OSError:
+                continue
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in skip and not entry.name.startswith("."):
+                        stack.append(Path(entry.path))
+                elif category_of(os.path.splitext(entry.name)[1].lower()):
+                    rel = Path(entry.path).relative_to(dest).as_posix()
+                    found[rel] = entry.stat(follow_symlinks=False)
+    return found
+
+
+def analyze_file(path: Path, size: int) -> dict:
+    """Hash a file and extract its category metadata."""
+    ext = path.suffix.lower()
+    sha = hashlib.sha256()
+    with open(path, "rb") as f:
+        head = f.read(HEAD_BYTES if ext not in (".jpg", ".jpeg") else 4 * HEAD_BYTES)
+        sha.update(head)
+        for chunk in iter(lambda: f.read(HASH_CHUNK), b""):
+            sha.update(chunk)
+    info = {"sha256": sha.hexdigest(), "category": category_of(ext)}
+    if info["category"] == "sprites":
+        dims = image_size(head, ext)
+        info["width"], info["height"] = dims if dims else (None, None)
+    elif info["category"] == "models":
+        info["polygons"] = mesh_polygons(path, head, ext)
+    elif info["category"] == "audio":
+        duration = audio_duration(path, head, size)
+        info["duration"] = round(duration, 3) if duration is not None else None
+    else:
+        anim = animation_info(head, ext)
+        if anim is None:
+            info["category"] = None
+        else:
+            info["type"], info["frames"] = anim
+    return info
+
+
+def cache_path(dest: Path) -> Path:
+    return dest / ".skgd" / "cache" / CACHE_FILE
+
+
+def load_cache(dest: Path) -> Dict[str, dict]:
+    try:
+        with open(cache_path(dest), "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != CACHE_VERSION:
+        return {}
+    return data.get("files", {})
+
+
+def save_cache(dest: Path, files: Dict[str, dict]) -> None:
+    path = cache_path(dest)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump({"version": CACHE_VERSION, "files": files}, f, separators=(",", ":"))
+    os.replace(tmp, path)
+
+
+def scan_assets(dest: Path, engine: str, jobs: Optional[int] = None, rebuild: bool = False) -> dict:
+    """Scan asset files, reusing cached results for unchanged ones.
+
+    Returns dict with assets ({path: info} for catalogued files),
+    duplicates ([[paths with identical content]]), and scanned, analyzed,
+    removed counts and seconds.
+    """
+    start = time.perf_counter()
+    cache = {} if rebuild else load_cache(dest)
+    found = walk_assets(dest, engine)
+    files, todo = {}, []
+    for rel, st in found.items():
+        cached = cache.get(rel)
+        if cached and cached["mtime_ns"] == st.st_mtime_ns and cached["size"] == st.st_size:
+            files[rel] = cached
+        else:
+            todo.append((rel, st))
+
+    def work(item):
+        rel, st = item
+        try:
+            info = analyze_file(dest / rel, st.st_size)
+        except (OSError, ValueError, IndexError, struct.error):
+            # One unreadable or malformed file must not abort the scan
+            return rel, None
+        info.update(mtime_ns=st.st_mtime_ns, size=st.st_size)
+        return rel, info
+
+    if todo:
+        with ThreadPoolExecutor(max_workers=jobs or default_jobs()) as pool:
+            for rel, info in pool.map(work, todo):
+                if info is not None:
+                    files[rel] = info
+
+    removed = len(set(cache) - set(files))
+    if todo or removed or rebuild:
+        save_cache(dest, files)
+
+    assets = {rel: info for rel, info in sorted(files.items()) if info.get("category")}
+    by_hash: Dict[Tuple[int, str], List[str]] = {}
+    for rel, info in assets.items():
+        by_hash.setdefault((info["size"], info["sha256"]), []).append(rel)
+    duplicates = [paths for paths in by_hash.values() if len(paths) > 1]
+    return {"assets": assets, "duplicates": duplicates, "scanned": len(found),
+            "analyzed": len(todo), "removed": removed,
+            "seconds": time.perf_counter() - start}
+
+
+# --- Catalog --------------------------------------------------------------
+
+TABLE_ORDER = CATEGORIES + ("features",)
+FOOTER_TOTAL_RE = re.compile(r"^(\*Total assets\s*:\s*)\d+(\*)\s*$")
+FOOTER_UPDATED_RE = re.compile(r"^(\*(?:Last updated|Dernière mise à jour)\s*:\s*)[^*]*(\*)\s*$")
+FILE_REF_RE = re.compile(r"[\w.-]+\.[A-Za-z0-9]{2,8}")
+
+# Placeholder rows of empty tables, as in the catalog template
+PLACEHOLDERS = {
+    "en": ("*No assets yet*", "*No features yet*"),
+    "fr": ("*Pas encore d'assets*", "*Pas encore de fonctionnalités*"),
+}
+
+
+def _cells(row: str) -> List[str]:
+    return [c.strip() for c in row.strip().strip("|").split("|")]
+
+
+def _find_tables(lines: List[str]) -> List[Tuple[int, int]]:
+    """(start, end) line ranges of markdown tables, header included."""
+    tables, i = [], 0
+    while i < len(lines):
+        if lines[i].startswith("|"):
+            j = i
+            while j < len(lines) and lines[j].startswith("|"):
+                j += 1
+            tables.append((i, j))
+            i = j
+        else:
+            i += 1
+    return tables
+
+
+def feature_mentions(dest: Path) -> Dict[str, List[str]]:
+    """File name (lowercase) -> features whose spec/plan/tasks mention it."""
+    mentions: Dict[str, set] = {}
+    specs = dest / "docs" / "specs"
+    if specs.is_dir():
+        for feature_dir in sorted(p for p in specs.iterdir() if p.is_dir() and not p.name.startswith("_")):
+            for name in ("spec.md", "plan.md", "tasks.md"):
+                path = feature_dir / name
+                if path.is_file():
+                    text = path.read_text(encoding="utf-8", errors="replace")
+                    for ref in FILE_REF_RE.findall(text):
+                        mentions.setdefault(ref.lower(), set()).add(feature_dir.name)
+    return {k: sorted(v) for k, v in mentions.items()}
+
+
+def _duration(seconds: Optional[float]) -> str:
+    if seconds is None:
+        return "?"
+    if seconds < 60:
+        return f"{seconds:.1f}s"
+    return f"{int(seconds // 60)}:{int(seconds % 60):02d}"
+
+
+def catalog_rows(result: dict, existing: Dict[str, Tuple[str, str]],
+                 mentions: Dict[str, List[str]]) -> Dict[str, List[List[str]]]:
+    """Body rows per table, sorted by path."""
+    dup_of = {}
+    for paths in result["duplicates"]:
+        for rel in paths[1:]:
+            dup_of[rel] = paths[0]
+
+    rows: Dict[str, List[List[str]]] = {name: [] for name in TABLE_ORDER}
+    features: Dict[str, Dict[str, int]] = {}
+    for rel, info in result["assets"].items():
+        name = Path(rel).stem
+        used_by, status = existing.get(rel, ("", ""))
+        if not used_by:
+            used_by = ", ".join(mentions.get(Path(rel).name.lower(), []))
+        if rel in dup_of:
+            status = f"duplicate of `{dup_of[rel]}`"
+        elif status.startswith("duplicate of"):
+            status = ""
+        category = info["category"]
+        size = human_size(info["size"])
+        if category == "sprites":
+            dims = f"{info['width']}×{info['height']}" if info.get("width") else "?"
+            detail = [f"{dims} ({size})"]
+        elif category == "models":
+            polys = info.get("polygons")
+            detail = [f"{polys:,}" if polys is not None else "?"]
+        elif category == "animations":
+            frames = info.get("frames")
+            detail = [info.get("type") or "?", str(frames) if frames is not None else "?"]
+        else:
+            detail = [_duration(info.get("duration"))]
+        rows[category].append([name, f"`{rel}`"] + detail + [used_by, status])
+        for feature in (f.strip() for f in used_by.split(",")):
+            if feature:
+                counts = features.setdefault(feature, dict.fromkeys(CATEGORIES, 0))
+                counts[category] += 1
+    for feature in sorted(features):
+        rows["features"].append([feature] + [str(features[feature][c]) for c in CATEGORIES])
+    return rows
+
+
+def render_catalog(text: str, result: dict, mentions: Dict[str, List[str]], lang: str = "en") -> str:
+    """Catalog text with regenerated tables (other sections unchanged)."""
+    lines = text.splitlines()
+    tables = _find_tables(lines)[:len(TABLE_ORDER)]
+    if len(tables) < len(TABLE_ORDER):
+        raise click.ClickException(f"{CATALOG_FILE} does not have the expected tables; "
+                                   "restore it from the template (skgd upgrade).")
+
+    existing: Dict[str, Tuple[str, str]] = {}
+    for (start, end), name in zip(tables, TABLE_ORDER):
+        if name == "features":
+            continue
+        for row in lines[start + 2:end]:
+            cells = _cells(row)
+            if len(cells) >= 4 and cells[1].strip("`"):
+                existing[cells[1].strip("`")] = (cells[-2], cells[-1])
+
+    rows = catalog_rows(result, existing, mentions)
+    no_assets, no_features = PLACEHOLDERS.get(lang, PLACEHOLDERS["en"])
+    out = list(lines)
+    for (start, end), name in reversed(list(zip(tables, TABLE_ORDER))):
+        body = rows[name]
+        if not body:
+            width = len(_cells(lines[start]))
+            body = [[no_features if name == "features" else no_assets] + [""] * (width - 1)]
+        out[start + 2:end] = ["| " + " | ".join(row) + " |" for row in body]
+
+    for i, line in enumerate(out):
+        m = FOOTER_TOTAL_RE.match(line)
+        if m:
+            out[i] = f"{m.group(1)}{len(result['assets'])}{m.group(2)}"
+    return "\n".join(out) + "\n"
+
+
+def update_catalog(dest: Path, result: dict, lang: str = "en") -> bool:
+    """Rewrite the catalog tables; returns True when the file changed."""
+    path = dest / CATALOG_FILE
+    if not path.is_file():
+        raise click.ClickException(f"{CATALOG_FILE} not found; run skgd upgrade to add it.")
+    text = path.read_text(encoding="utf-8")
+    new = render_catalog(text, result, feature_mentions(dest), lang)
+    if new == text:
+        return False
+    # Only a real change moves the "last updated" date
+    new = "\n".join(
+        FOOTER_UPDATED_RE.sub(lambda m: f"{m.group(1)}{date.today().isoformat()}{m.group(2)}", line)
+        for line in new.splitlines()
+    ) + "\n"
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_text(new, encoding="utf-8")
+    os.replace(tmp, path)
+    return True
+
+
+def update_state_counts(dest: Path, result: dict) -> None:
+    """Record the files found per category in the state.
+
+    Only assets.by_category.<category>.created and assets.total_created
+    are written; the "defined" counts belong to /assets. The update is
+    journaled, so readers see it through ``skgd state get``.
+    """
+    from .state import StateStore
+
+    if not (dest / ".skgd" / "state.yaml").is_file():
+        return
+    counts = {c: 0 for c in CATEGORIES}
+    for info in result["assets"].values():
+        counts[info["category"]] += 1
+    store = StateStore(dest)
+    state = store.get("assets") or {}
+    by_category = state.get("by_category") or {}
+    for category, n in counts.items():
+        entry = by_category.get(category)
+        if not isinstance(entry, dict) or entry.get("created") != n:
+            store.set(f"assets.by_category.{category}.created", n)
+    if state.get("total_created") != sum(counts.values()):
+        store.set("assets.total_created", sum(counts.values()))
+
+
+@click.group()
+def assets():
+    """Scan project assets and maintain assets-catalog.md."""
+
+
+@assets.command("scan")
+@click.option("--jobs", "-j", type=click.IntRange(min=1), help="Worker threads (default: auto)")
+@click.option("--rebuild", is_flag=True, help="Ignore the scan cache")
+@click.option("--no-catalog", is_flag=True, help="Do not rewrite assets-catalog.md")
+@click.option("--json", "as_json", is_flag=True, help="Print the scan result as JSON")
+def assets_scan(jobs: Optional[int], rebuild: bool, no_catalog: bool, as_json: bool):
+    """Scan asset files and regenerate the catalog tables.
+
+    Extracts image dimensions, audio durations, mesh polygon counts and
+    animation frames, flags duplicate files by content hash, and caches
+    results by path, mtime and size.
+
+    Examples:
+        skgd assets scan
+        skgd assets scan --no-catalog --json
+    """
+    dest = require_project_root()
+    lang, engine = detect_project_settings(dest)
+    result = scan_assets(dest, engine, jobs, rebuild)
+    changed = False
+    if not no_catalog:
+        changed = update_catalog(dest, result, lang)
+        update_state_counts(dest, result)
+
+    if as_json:
+        click.echo(json.dumps(result, indent=2))
+        return
+
+    counts = {c: 0 for c in CATEGORIES}
+    for info in result["assets"].values():
+        counts[info["category"]] += 1
+    click.echo(f"Scanned {result['scanned']} files ({result['analyzed']} analyzed, "
+               f"{result['removed']} removed) in {result['seconds']:.2f}s")
+    click.echo("  " + "  ".join(f"{c}: {n}" for c, n in counts.items()))
+    for paths in result["duplicates"]:
+        click.secho(f"  Duplicate: {', '.join(paths)}", fg="yellow")
+    if not no_catalog:
+        click.echo(f"  {CATALOG_FILE} " + ("updated" if changed else "unchanged"))
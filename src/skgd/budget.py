@@ -0,0 +1,256 @@
+"""Context budget - token estimates for memory layers and prompt files.
+
+The Living Memory design gives each layer a budget (constitution ~500
+tokens, learnings-core ~1000, learnings unlimited) and every workflow
+command loads its own prompt plus the layers it references. ``skgd budget``
+measures all of it with a local tokenizer approximation, reports the
+context each command pulls in, exits non-zero when a layer is over budget
+(for CI) and appends totals to ``.skgd/budget-history.json`` so growth can
+be followed over time.
+"""
+
+import json
+import math
+import os
+import re
+import sys
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import click
+
+from .cli import require_project_root
+
+
+# Declared layer budgets in tokens (None: unlimited). Override per project
+# with a `budget:` mapping in .skgd/config.yaml.
+LAYER_BUDGETS = {
+    "constitution": 500,
+    "learnings-core": 1000,
+    "learnings": None,
+    "assets-catalog": None,
+}
+
+MEMORY_DIR = ".skgd/memory"
+HISTORY_FILE = "budget-history.json"
+HISTORY_LIMIT = 200
+
+# Files always in context (project instructions)
+ALWAYS_LOADED = ["CLAUDE.md"]
+
+# Words, runs of digits, and runs of one repeated symbol ("**", "---")
+_TOKEN_RE = re.compile(r"[^\W\d_]+|\d+|([^\w\s])\1*|_+")
+
+
+def estimate_tokens(text: str) -> int:
+    """Approximate BPE token count of a text.
+
+    ASCII words cost one token per ~4 characters (accented words per ~3),
+    digit runs one token per 3 digits and symbol runs one token per 4
+    characters. Tracks real tokenizers closely on English/French markdown
+    and is fully deterministic.
+    """
+    tokens = 0
+    for m in _TOKEN_RE.finditer(text):
+        piece = m.group(0)
+        if piece[0].isdigit():
+            tokens += math.ceil(len(piece) / 3)
+        elif piece[0].isalpha():
+            tokens += math.ceil(len(piece) / (4 if piece.isascii() else 3))
+        else:
+            tokens += math.ceil(len(piece) / 4)
+    return tokens
+
+
+def file_tokens(path: Path) -> int:
+    """Token estimate of a file (0 if unreadable)."""
+    try:
+        return estimate_tokens(path.read_text(encoding="utf-8", errors="replace"))
+    except OSError:
+        return 0
+
+
+def layer_budgets(dest: Path) -> Dict[str, Optional[int]]:
+    """Default budgets merged with the project's `budget:` config section."""
+    from .state import load_yaml
+
+    budgets = dict(LAYER_BUDGETS)
+    overrides = load_yaml(dest / ".skgd" / "config.yaml").get("budget") or {}
+    if isinstance(overrides, dict):
+        for name, value in overrides.items():
+            budgets[name] = int(value) if value else None
+    return budgets
+
+
+def measure_project(dest: Path) -> dict:
+    """Measure every memory layer, command, skill and agent file.
+
+    Returns dict with:
+        - layers: [{name, path, tokens, budget, over}]
+        - commands / skills / agents: [{name, path, tokens}]
+        - workflows: [{command, tokens, files}] context loaded per command
+        - totals: {group: tokens}
+    """
+    budgets = layer_budgets(dest)
+    layers = []
+    memory_dir = dest / MEMORY_DIR
+    names = set(budgets)
+    if memory_dir.is_dir():
+        names.update(p.stem for p in memory_dir.glob("*.md"))
+    for name in sorted(names):
+        path = memory_dir / f"{name}.md"
+        if not path.is_file():
+            continue
+        tokens = file_tokens(path)
+        budget = budgets.get(name)
+        layers.append({"name": name, "path": f"{MEMORY_DIR}/{name}.md", "tokens": tokens,
+                       "budget": budget, "over": budget is not None and tokens > budget})
+
+    def group(pattern_dir: Path, pattern: str, name_of) -> List[dict]:
+        if not pattern_dir.is_dir():
+            return []
+        return [{"name": name_of(p), "path": p.relative_to(dest).as_posix(), "tokens": file_tokens(p)}
+                for p in sorted(pattern_dir.glob(pattern)) if p.is_file()]
+
+    commands = group(dest / ".claude" / "commands", "*.md", lambda p: p.stem)
+    agents = group(dest / ".skgd" / "agents", "*.md", lambda p: p.stem)
+    skills = []
+    skills_dir = dest / ".claude" / "skills"
+    if skills_dir.is_dir():
+        for skill in sorted(p for p in skills_dir.iterdir() if p.is_dir()):
+            skills.append({"name": skill.name, "path": skill.relative_to(dest).as_posix(),
+                           "tokens": sum(file_tokens(p) for p in skill.rglob("*.md"))})
+
+    always = [(rel, file_tokens(dest / rel)) for rel in ALWAYS_LOADED if (dest / rel).is_file()]
+    layer_tokens = {layer["name"] + ".md": layer for layer in layers}
+    workflows = []
+    for command in commands:
+        if command["name"].startswith("_"):
+            continue
+        text = (dest / command["path"]).read_text(encoding="utf-8", errors="replace")
+        files = [(rel, tokens) for rel, tokens in always]
+        files.append((command["path"], command["tokens"]))
+        for filename, layer in layer_tokens.items():
+            if re.search(r"(?<![\w-])" + re.escape(filename), text):
+                files.append((layer["path"], layer["tokens"]))
+        workflows.append({"command": command["name"], "tokens": sum(t for _, t in files),
+                          "files": [rel for rel, _ in files]})
+
+    totals = {
+        "layers": sum(layer["tokens"] for layer in layers),
+        "commands": sum(c["tokens"] for c in commands),
+        "skills": sum(s["tokens"] for s in skills),
+        "agents": sum(a["tokens"] for a in agents),
+    }
+    return {"layers": layers, "commands": commands, "skills": skills, "agents": agents,
+            "workflows": workflows, "totals": totals}
+
+
+def history_path(dest: Path) -> Path:
+    return dest / ".skgd" / HISTORY_FILE
+
+
+def load_history(dest: Path) -> List[dict]:
+    """Budget history entries, oldest first (empty if missing/corrupt)."""
+    try:
+        with open(history_path(dest), "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return []
+    return data if isinstance(data, list) else []
+
+
+def record_history(dest: Path, result: dict) -> Optional[dict]:
+    """Append a history entry when sizes changed since the last one.
+
+    Returns the previous entry (for growth deltas), or None.
+    """
+    history = load_history(dest)
+    entry = {
+        "date": datetime.now().isoformat(timespec="seconds"),
+        "layers": {layer["name"]: layer["tokens"] for layer in result["layers"]},
+        "totals": result["totals"],
+    }
+    previous = history[-1] if history else None
+    if previous and previous.get("layers") == entry["layers"] and previous.get("totals") == entry["totals"]:
+        return history[-2] if len(history) > 1 else None
+    history = (history + [entry])[-HISTORY_LIMIT:]
+    path = history_path(dest)
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(history, f, indent=1)
+    os.replace(tmp, path)
+    return previous
+
+
+def _delta(now: int, before: Optional[int]) -> str:
+    if before is None or now == before:
+        return ""
+    return click.style(f" ({now - before:+d})", fg="yellow" if now > before else "green")
+
+
+def print_budget(result: dict, previous: Optional[dict], top: int) -> None:
+    """Print the budget report."""
+    prev_layers = (previous or {}).get("layers", {})
+    prev_totals = (previous or {}).get("totals", {})
+
+    click.echo()
+    click.secho("  Memory layers", bold=True)
+    for layer in result["layers"]:
+        budget = f"/ {layer['budget']}" if layer["budget"] else "/ unlimited"
+        color = "red" if layer["over"] else "green"
+        click.echo(f"    {layer['name']:<18} " + click.style(f"{layer['tokens']:>6}", fg=color)
+                   + f" {budget:<12}" + _delta(layer["tokens"], prev_layers.get(layer["name"])))
+
+    click.echo()
+    click.secho("  Totals", bold=True)
+    for name, tokens in result["totals"].items():
+        click.echo(f"    {name:<18} {tokens:>6}" + _delta(tokens, prev_totals.get(name)))
+
+    click.echo()
+    click.secho(f"  Context per workflow command (top {top})", bold=True)
+    for wf in sorted(result["workflows"], key=lambda w: -w["tokens"])[:top]:
+        click.echo(f"    /{wf['command']:<17} {wf['tokens']:>6}  "
+                   + click.style(", ".join(Path(f).name for f in wf["files"][1:] or wf["files"]), dim=True))
+    click.echo()
+
+
+@click.command()
+@click.option("--json", "as_json", is_flag=True, help="Print the full measurement as JSON")
+@click.option("--top", default=10, show_default=True, help="Commands to list by context size")
+@click.option("--no-record", is_flag=True, help="Do not append to .skgd/budget-history.json")
+@click.option("--history", "show_history", is_flag=True, help="Print recorded growth and exit")
+def budget(as_json: bool, top: int, no_record: bool, show_history: bool):
+    """Estimate token budgets of memory layers and prompt files.
+
+    Exits with status 1 when a memory layer is over its budget
+    (constitution ~500, learnings-core ~1000 tokens), so it can run in CI.
+
+    Examples:
+        skgd budget                 # Report and record history
+        skgd budget --json --no-record
+        skgd budget --history
+    """
+    dest = require_project_root()
+
+    if show_history:
+        for entry in load_history(dest):
+            layers = "  ".join(f"{k}={v}" for k, v in sorted(entry.get("layers", {}).items()))
+            click.echo(f"  {entry.get('date', '?'):<20} {layers}")
+        return
+
+    result = measure_project(dest)
+    previous = None if no_record else record_history(dest, result)
+    if as_json:
+        click.echo(json.dumps(result, indent=2))
+    else:
+        print_budget(result, previous, top)
+
+    over = [layer for layer in result["layers"] if layer["over"]]
+    if over:
+        for layer in over:
+            hint = " Run /crystallize to compress it." if layer["name"] == "learnings-core" else ""
+            click.secho(f"  Over budget: {layer['path']} is {layer['tokens']} tokens "
+                        f"(budget {layer['budget']}).{hint}", fg="red", err=True)
+        sys.exit(1)
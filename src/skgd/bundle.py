@@ -0,0 +1,194 @@
+"""Template sources - loose template tree or packed, memory-mapped bundles.
+
+Wheels ship one indexed archive per top-level template directory
+(``en.pack``, ``fr.pack``, ``common.pack``) built by the hatch build hook.
+Reading members from a memory-mapped pack avoids the per-file open/stat
+cost of the loose tree, which dominates project creation on network home
+directories and Windows-mounted drives. Source checkouts (or ``SKGD_DEV=1``)
+read the loose tree instead.
+
+Pack layout::
+
+    b"SKGDPACK" | u32 format version | u64 index length | JSON index | data
+
+The index lists members sorted by path, with offsets relative to the start
+of the data section, so extracting a directory is one sequential pass.
+"""
+
+import json
+import mmap
+import os
+import shutil
+import struct
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+PACK_MAGIC = b"SKGDPACK"
+PACK_VERSION = 1
+PACK_SUFFIX = ".pack"
+_HEADER = struct.Struct("<8sIQ")
+
+
+def pack_tree(src: Path, out: Path, prefix: str = "") -> int:
+    """Pack every file under src into out; returns the member count.
+
+    Member names are prefix + path relative to src (posix).
+    """
+    members = []
+    for root, dirs, names in os.walk(src):
+        dirs.sort()
+        for name in sorted(names):
+            path = Path(root) / name
+            members.append((prefix + path.relative_to(src).as_posix(), path))
+    members.sort()
+
+    index = []
+    offset = 0
+    for name, path in members:
+        st = path.stat()
+        index.append({"name": name, "offset": offset, "size": st.st_size,
+                      "mode": st.st_mode & 0o777})
+        offset += st.st_size
+    index_bytes = json.dumps(index, separators=(",", ":")).encode("utf-8")
+
+    with open(out, "wb") as f:
+        f.write(_HEADER.pack(PACK_MAGIC, PACK_VERSION, len(index_bytes)))
+        f.write(index_bytes)
+        for _, path in members:
+            with open(path, "rb") as member:
+                shutil.copyfileobj(member, f)
+    return len(members)
+
+
+class TemplateBundle:
+    """Read-only view of a pack file through mmap."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        with open(path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, index_len = _HEADER.unpack_from(self._mm, 0)
+        if magic != PACK_MAGIC or version != PACK_VERSION:
+            raise ValueError(f"Not a template bundle: {path}")
+        start = _HEADER.size
+        index = json.loads(self._mm[start:start + index_len].decode("utf-8"))
+        self._data_start = start + index_len
+        self.members = {m["name"]: m for m in index}
+
+    def read_bytes(self, name: str) -> bytes:
+        m = self.members[name]
+        start = self._data_start + m["offset"]
+        return self._mm[start:start + m["size"]]
+
+    def extract(self, pairs: Iterable[Tuple[str, Path]]) -> None:
+        """Write members to destination paths (in parallel, see copyengine)."""
+        from .copyengine import write_files
+
+        view = memoryview(self._mm)
+        items = []
+        try:
+            for name, dest in sorted(pairs, key=lambda p: self.members[p[0]]["offset"]):
+                m = self.members[name]
+                start = self._data_start + m["offset"]
+                items.append((dest, view[start:start + m["size"]],
+                              m["mode"] if m["mode"] & 0o111 else 0))
+            write_files(items)
+        finally:
+            for _, data, _ in items:
+                data.release()
+            view.release()
+
+    def close(self) -> None:
+        self._mm.close()
+
+
+class LooseTemplates:
+    """Templates read from the loose directory tree."""
+
+    packed = False
+
+    def __init__(self, root: Path):
+        self.root = root
+
+    def exists(self, rel: str) -> bool:
+        return (self.root / rel).exists()
+
+    def files(self, prefix: str) -> List[str]:
+        """Relative paths of all files under a directory prefix."""
+        base = self.root / prefix
+        if not base.is_dir():
+            return []
+        return sorted(p.relative_to(self.root).as_posix()
+                      for p in base.rglob("*") if p.is_file())
+
+    def read_bytes(self, rel: str) -> bytes:
+        return (self.root / rel).read_bytes()
+
+    def copy_files(self, pairs: Iterable[Tuple[str, Path]]) -> None:
+        from .copyengine import copy_files
+
+        copy_files((self.root / rel, dest) for rel, dest in pairs)
+
+
+class PackedTemplates:
+    """Templates read from memory-mapped packs, one per top-level directory."""
+
+    packed = True
+
+    def __init__(self, root: Path):
+        self.root = root
+        self._bundles: Dict[str, TemplateBundle] = {}
+
+    def _bundle(self, top: str) -> Optional[TemplateBundle]:
+        if top not in self._bundles:
+            path = self.root / (top + PACK_SUFFIX)
+            if not path.exists():
+                return None
+            self._bundles[top] = TemplateBundle(path)
+        return self._bundles[top]
+
+    def exists(self, rel: str) -> bool:
+        bundle = self._bundle(rel.split("/", 1)[0])
+        if bundle is None:
+            return False
+        rel = rel.rstrip("/")
+        return rel in bundle.members or any(
+            name.startswith(rel + "/") for name in bundle.members)
+
+    def files(self, prefix: str) -> List[str]:
+        bundle = self._bundle(prefix.split("/", 1)[0])
+        if bundle is None:
+            return []
+        prefix = prefix.rstrip("/") + "/"
+        return [name for name in bundle.members if name.startswith(prefix)]
+
+    def read_bytes(self, rel: str) -> bytes:
+        return self._bundle(rel.split("/", 1)[0]).read_bytes(rel)
+
+    def copy_files(self, pairs: Iterable[Tuple[str, Path]]) -> None:
+        by_bundle: Dict[str, list] = {}
+        for rel, dest in pairs:
+            by_bundle.setdefault(rel.split("/", 1)[0], []).append((rel, dest))
+        for top, items in by_bundle.items():
+            self._bundle(top).extract(items)
+
+
+def open_template_source(template_dir: Path):
+    """Return the template source for a templates directory.
+
+    Packs are used when present unless SKGD_DEV is set (dev mode reads the
+    loose tree so template edits apply immediately).
+    """
+    has_packs = any(template_dir.glob("*" + PACK_SUFFIX))
+    if has_packs and not os.environ.get("SKGD_DEV"):
+        return PackedTemplates(template_dir)
+    return LooseTemplates(template_dir)
+
+
+def copy_tree(source, prefix: str, dest: Path) -> List[str]:
+    """Copy every template file under prefix into dest; returns the files."""
+    prefix = prefix.rstrip("/") + "/"
+    files = source.files(prefix)
+    source.copy_files((rel, dest / rel[len(prefix):]) for rel in files)
+    return files
@@ -1,17 +1,15 @@
 """Spec Kit Game Dev CLI - Initialize game development projects."""
 
+import copy
 import os
 import sys
-import shutil
-import subprocess
 from pathlib import Path
 from typing import Optional
 
 import click
-import questionary
-import yaml
 
 from . import __version__
+from .trace import span, traced
 
 
 MODELS = {
@@ -78,6 +76,40 @@ def get_template_dir() -> Path:
     return Path(__file__).parent / "templates"
 
 
+_template_source = None
+
+
+def get_template_source():
+    """Get the template source: packed bundles, or the loose tree in dev mode."""
+    global _template_source
+    if _template_source is None:
+        from .bundle import open_template_source
+        _template_source = open_template_source(get_template_dir())
+    return _template_source
+
+
+def find_project_root(start: Optional[Path] = None) -> Optional[Path]:
+    """Find the nearest directory at or above start holding a .skgd/ folder."""
+    path = (start or Path.cwd()).resolve()
+    for candidate in (path, *path.parents):
+        if (candidate / ".skgd").is_dir():
+            return candidate
+    return None
+
+
+def require_project_root() -> Path:
+    """Return the current project root, or exit with an error outside one."""
+    root = find_project_root()
+    if root is None:
+        click.secho("Error: No SKGD project found in current directory.", fg="red")
+        click.echo()
+        click.echo("To create a new project:")
+        click.echo("  skgd init my-game")
+        sys.exit(1)
+    return root
+
+
+@traced("detect_existing_project")
 def detect_existing_project(dest: Path) -> dict:
     """Detect existing Spec Kit project and its version.
 
@@ -89,6 +121,8 @@ def detect_existing_project(dest: Path) -> dict:
         - has_learnings: bool
         - has_v2_templates: bool
     """
+    import yaml
+
     skgd_dir = dest / ".skgd"
 
     if not skgd_dir.exists():
@@ -142,6 +176,90 @@ def detect_existing_project(dest: Path) -> dict:
     return info
 
 
+def managed_groups_for(dest: Path) -> list:
+    """Template groups kept in sync by upgrade for this project."""
+    groups = ["commands", "skills", "data"]
+    if (dest / ".skgd" / "agents").exists():
+        groups.append("agents")
+    return groups
+
+
+_command_renderers = {}
+
+
+def command_renderer_for(dest: Path, lang: str, engine: Optional[str] = None):
+    """Compiler for this project's commands (engine defaults to config.yaml's)."""
+    from .compiler import command_renderer
+
+    if engine is None:
+        engine = detect_project_settings(dest)[1]
+    key = (lang, engine)
+    if key not in _command_renderers:
+        _command_renderers[key] = command_renderer(get_template_source(), lang, engine)
+    return _command_renderers[key]
+
+
+def skill_selector_for(dest: Path):
+    """Filter of the skill files that apply to the project's config.yaml profile."""
+    from .skills import load_project_profile, load_skill_rules, skill_selector
+
+    return skill_selector(load_skill_rules(get_template_source()), load_project_profile(dest))
+
+
+@traced("sync_managed_files")
+def sync_managed_files(dest: Path, lang: str, groups: list, stats: dict,
+                       engine: Optional[str] = None) -> None:
+    """Incrementally sync managed template files and record counts in stats.
+
+    Only files whose content differs from the package (commands: from
+    their compiled form for the project's engine) are written, so
+    unchanged files keep their mtimes. Skills follow the profile in
+    config.yaml (see skills.py), so write it before syncing them.
+    """
+    from .manifest import apply_sync, plan_sync
+
+    include = skill_selector_for(dest) if "skills" in groups else None
+    ops = plan_sync(dest, get_template_dir(), lang, groups,
+                    command_renderer_for(dest, lang, engine), include)
+    result = apply_sync(dest, get_template_source(), ops)
+    written = result["written"]
+
+    stats["commands_updated"] = len(written.get("commands", []))
+    touched_skills = {
+        path.split("/")[2]
+        for path in written.get("skills", []) + result["removed"]
+        if path.startswith(".claude/skills/")
+    }
+    if touched_skills:
+        stats["skills_updated"] = len(touched_skills)
+    if written.get("data"):
+        stats["data_updated"] = len(written["data"])
+    stats["files_unchanged"] = result["unchanged"]
+    stats["files_removed"] = result["removed"]
+
+
+@traced("pending_template_changes")
+def pending_template_changes(dest: Path, lang: str) -> int:
+    """Count managed files that an upgrade would add, replace or delete."""
+    from .manifest import plan_sync
+
+    ops = plan_sync(dest, get_template_dir(), lang, managed_groups_for(dest),
+                    command_renderer_for(dest, lang), skill_selector_for(dest))
+    return sum(1 for op in ops if op["action"] != "keep")
+
+
+def write_yaml_if_changed(path: Path, data: dict, original: dict) -> bool:
+    """Dump data to path unless it equals what was loaded (keeps mtime)."""
+    import yaml
+
+    if path.exists() and data == original:
+        return False
+    with span("yaml.dump", path=path.name), open(path, "w", encoding="utf-8") as f:
+        yaml.dump(data, f, default_flow_style=False, sort_keys=False)
+    return True
+
+
+@traced("upgrade_project")
 def upgrade_project(dest: Path, lang: str, engine: str) -> dict:
     """Upgrade existing project to v2.0.
 
@@ -150,9 +268,12 @@ def upgrade_project(dest: Path, lang: str, engine: str) -> dict:
         - templates_added: list
         - preserved: list
     """
-    template_dir = get_template_dir() / lang
+    import yaml
+    from .bundle import copy_tree
+
+    source = get_template_source()
+    skgd_src = f"{lang}/skgd"
     skgd_dest = dest / ".skgd"
-    commands_dest = dest / ".claude" / "commands"
 
     stats = {
         "commands_updated": 0,
@@ -161,37 +282,30 @@ def upgrade_project(dest: Path, lang: str, engine: str) -> dict:
         "to_version": SKGD_VERSION,
     }
 
-    # 1. Update commands (always overwrite - these are the workflow)
-    commands_src = template_dir / "claude" / "commands"
-    if commands_src.exists():
-        for cmd_file in commands_src.glob("*.md"):
-            shutil.copy2(cmd_file, commands_dest / cmd_file.name)
-            stats["commands_updated"] += 1
-
-    # 2. Add new v2.0 templates (don't overwrite existing)
+    # 1. Add new v2.0 templates (don't overwrite existing)
 
     # i18n directory
     i18n_dest = skgd_dest / "i18n"
     if not i18n_dest.exists():
-        i18n_src = template_dir / "skgd" / "i18n"
-        if i18n_src.exists():
-            shutil.copytree(i18n_src, i18n_dest)
+        i18n_src = f"{skgd_src}/i18n"
+        if source.exists(i18n_src):
+            copy_tree(source, i18n_src, i18n_dest)
             stats["templates_added"].append("i18n/messages.yaml")
 
     # learnings-core.md template
     learnings_core_template = skgd_dest / "templates" / "learnings-core.md"
     if not learnings_core_template.exists():
-        src = template_dir / "skgd" / "templates" / "learnings-core.md"
-        if src.exists():
-            shutil.copy2(src, learnings_core_template)
+        src = f"{skgd_src}/templates/learnings-core.md"
+        if source.exists(src):
+            source.copy_files([(src, learnings_core_template)])
             stats["templates_added"].append("templates/learnings-core.md")
 
     # session-context.md template
     session_context_template = skgd_dest / "templates" / "session-context.md"
     if not session_context_template.exists():
-        src = template_dir / "skgd" / "templates" / "session-context.md"
-        if src.exists():
-            shutil.copy2(src, session_context_template)
+        src = f"{skgd_src}/templates/session-context.md"
+        if source.exists(src):
+            source.copy_files([(src, session_context_template)])
             stats["templates_added"].append("templates/session-context.md")
 
     # Create empty memory files for v2.0 Living Memory System
@@ -201,33 +315,20 @@ def upgrade_project(dest: Path, lang: str, engine: str) -> dict:
     # Empty learnings-core.md (for crystallized learnings)
     learnings_core_memory = memory_dir / "learnings-core.md"
     if not learnings_core_memory.exists():
-        learnings_core_src = template_dir / "skgd" / "templates" / "learnings-core.md"
-        if learnings_core_src.exists():
-            shutil.copy2(learnings_core_src, learnings_core_memory)
+        learnings_core_src = f"{skgd_src}/templates/learnings-core.md"
+        if source.exists(learnings_core_src):
+            source.copy_files([(learnings_core_src, learnings_core_memory)])
             stats["templates_added"].append("memory/learnings-core.md")
 
     # Empty session-context.md
     session_context_memory = memory_dir / "session-context.md"
     if not session_context_memory.exists():
-        session_context_src = template_dir / "skgd" / "templates" / "session-context.md"
-        if session_context_src.exists():
-            shutil.copy2(session_context_src, session_context_memory)
+        session_context_src = f"{skgd_src}/templates/session-context.md"
+        if source.exists(session_context_src):
+            source.copy_files([(session_context_src, session_context_memory)])
             stats["templates_added"].append("memory/session-context.md")
 
-    # 2.5 Copy/update skills (always overwrite for latest patterns)
-    skills_dest = dest / ".claude" / "skills"
-    skills_src = get_template_dir() / "common" / "skills"
-    if skills_src.exists():
-        skills_dest.mkdir(parents=True, exist_ok=True)
-        for skill_dir in skills_src.iterdir():
-            if skill_dir.is_dir():
-                skill_dest = skills_dest / skill_dir.name
-                if skill_dest.exists():
-                    shutil.rmtree(skill_dest)
-                shutil.copytree(skill_dir, skill_dest)
-        stats["skills_updated"] = len(list(skills_src.iterdir()))
-
-    # 3. Track preserved files
+    # 2. Track preserved files
     if (dest / "docs" / "game-brief.md").exists():
         stats["preserved"].append("docs/game-brief.md")
 
@@ -249,13 +350,14 @@ def upgrade_project(dest: Path, lang: str, engine: str) -> dict:
     if (skgd_dest / "roadmap.yaml").exists():
         stats["preserved"].append(".skgd/roadmap.yaml")
 
-    # 4. Update config.yaml with new fields
+    # 3. Update config.yaml with new fields
     config_path = skgd_dest / "config.yaml"
     if config_path.exists():
-        with open(config_path, "r", encoding="utf-8") as f:
+        with span("yaml.load", path="config.yaml"), open(config_path, "r", encoding="utf-8") as f:
             config = yaml.safe_load(f) or {}
     else:
         config = {}
+    original_config = copy.deepcopy(config)
 
     # Add version
     config["version"] = SKGD_VERSION
@@ -280,12 +382,16 @@ def upgrade_project(dest: Path, lang: str, engine: str) -> dict:
     # Add engine field
     config["engine"] = engine
 
-    with open(config_path, "w", encoding="utf-8") as f:
-        yaml.dump(config, f, default_flow_style=False, sort_keys=False)
+    write_yaml_if_changed(config_path, config, original_config)
+
+    # 4. Update commands and the skills matching the engine (only files
+    #    whose content changed)
+    sync_managed_files(dest, lang, ["commands", "skills"], stats, engine)
 
     return stats
 
 
+@traced("upgrade_v2_to_v3")
 def upgrade_v2_to_v3(dest: Path, lang: str, art_style: Optional[str] = None, asset_mcps: Optional[list] = None) -> dict:
     """Upgrade existing v2.0 project to v3.0.
 
@@ -297,9 +403,12 @@ def upgrade_v2_to_v3(dest: Path, lang: str, art_style: Optional[str] = None, ass
 
     Returns dict with upgrade stats.
     """
-    template_dir = get_template_dir() / lang
+    import yaml
+    from .state import StateStore
+
+    source = get_template_source()
+    skgd_src = f"{lang}/skgd"
     skgd_dest = dest / ".skgd"
-    commands_dest = dest / ".claude" / "commands"
     memory_dir = skgd_dest / "memory"
     scripts_dir = skgd_dest / "scripts"
 
@@ -311,71 +420,37 @@ def upgrade_v2_to_v3(dest: Path, lang: str, art_style: Optional[str] = None, ass
         "to_version": SKGD_VERSION,
     }
 
-    # 1. Update commands (always overwrite - these are the workflow)
-    commands_src = template_dir / "claude" / "commands"
-    if commands_src.exists():
-        for cmd_file in commands_src.glob("*.md"):
-            shutil.copy2(cmd_file, commands_dest / cmd_file.name)
-            stats["commands_updated"] += 1
-
-    # 1.5 Copy/update skills (always overwrite for latest patterns)
-    skills_dest = dest / ".claude" / "skills"
-    skills_src = get_template_dir() / "common" / "skills"
-    if skills_src.exists():
-        skills_dest.mkdir(parents=True, exist_ok=True)
-        for skill_dir in skills_src.iterdir():
-            if skill_dir.is_dir():
-                skill_dest_dir = skills_dest / skill_dir.name
-                if skill_dest_dir.exists():
-                    shutil.rmtree(skill_dest_dir)
-                shutil.copytree(skill_dir, skill_dest_dir)
-        stats["skills_updated"] = len(list(skills_src.iterdir()))
-
-    # 1.6 Copy/update data folder (always overwrite for latest reference data)
-    data_dest = dest / ".claude" / "data"
-    data_src = template_dir / "claude" / "data"
-    if data_src.exists():
-        data_dest.mkdir(parents=True, exist_ok=True)
-        for data_file in data_src.glob("*.md"):
-            shutil.copy2(data_file, data_dest / data_file.name)
-        stats["data_updated"] = len(list(data_src.glob("*.md")))
-
-    # 2. Add assets-catalog.md if not exists
+    # 1. Add assets-catalog.md if not exists
     memory_dir.mkdir(exist_ok=True)
     assets_catalog_dest = memory_dir / "assets-catalog.md"
     if not assets_catalog_dest.exists():
-        assets_catalog_src = template_dir / "skgd" / "memory" / "assets-catalog.md"
-        if assets_catalog_src.exists():
-            shutil.copy2(assets_catalog_src, assets_catalog_dest)
+        assets_catalog_src = f"{skgd_src}/memory/assets-catalog.md"
+        if source.exists(assets_catalog_src):
+            source.copy_files([(assets_catalog_src, assets_catalog_dest)])
             stats["templates_added"].append("memory/assets-catalog.md")
 
-    # 3. Add check-asset-mcps scripts
+    # 2. Add check-asset-mcps scripts
     scripts_dir.mkdir(exist_ok=True)
-    scripts_src = template_dir / "skgd" / "scripts"
-    if scripts_src.exists():
-        for script_file in scripts_src.glob("check-asset-mcps.*"):
-            script_dest = scripts_dir / script_file.name
-            if not script_dest.exists():
-                shutil.copy2(script_file, script_dest)
-                # Make shell scripts executable
-                if script_file.suffix == ".sh":
-                    script_dest.chmod(script_dest.stat().st_mode | 0o755)
-                stats["templates_added"].append(f"scripts/{script_file.name}")
-
-    # 4. Update agents with asset MCP references
-    agents_src = template_dir / "skgd" / "agents"
-    agents_dest = skgd_dest / "agents"
-    if agents_src.exists() and agents_dest.exists():
-        for agent_file in agents_src.glob("*.md"):
-            shutil.copy2(agent_file, agents_dest / agent_file.name)
-
-    # 5. Update config.yaml with mcp.assets section
+    for script_src in source.files(f"{skgd_src}/scripts"):
+        script_name = script_src.rsplit("/", 1)[-1]
+        if not script_name.startswith("check-asset-mcps."):
+            continue
+        script_dest = scripts_dir / script_name
+        if not script_dest.exists():
+            source.copy_files([(script_src, script_dest)])
+            # Make shell scripts executable
+            if script_dest.suffix == ".sh":
+                script_dest.chmod(script_dest.stat().st_mode | 0o755)
+            stats["templates_added"].append(f"scripts/{script_name}")
+
+    # 3. Update config.yaml with mcp.assets section
     config_path = skgd_dest / "config.yaml"
     if config_path.exists():
-        with open(config_path, "r", encoding="utf-8") as f:
+        with span("yaml.load", path="config.yaml"), open(config_path, "r", encoding="utf-8") as f:
             config = yaml.safe_load(f) or {}
     else:
         config = {}
+    original_config = copy.deepcopy(config)
 
     # Update version
     config["version"] = SKGD_VERSION
@@ -400,27 +475,27 @@ def upgrade_v2_to_v3(dest: Path, lang: str, art_style: Optional[str] = None, ass
         }
         stats["templates_added"].append("config.yaml (mcp.assets section)")
 
-    with open(config_path, "w", encoding="utf-8") as f:
-        yaml.dump(config, f, default_flow_style=False, sort_keys=False)
-
-    # 6. Update state.yaml with assets section
-    state_path = skgd_dest / "state.yaml"
-    if state_path.exists():
-        with open(state_path, "r", encoding="utf-8") as f:
-            state = yaml.safe_load(f) or {}
-
-        if "assets" not in state:
-            state["assets"] = {
-                "queue": [],
-                "generated": [],
-                "placeholders": []
-            }
-            stats["templates_added"].append("state.yaml (assets section)")
+    write_yaml_if_changed(config_path, config, original_config)
 
-            with open(state_path, "w", encoding="utf-8") as f:
-                yaml.dump(state, f, default_flow_style=False, sort_keys=False)
+    # 4. Update commands, reference data, agents and the skills matching
+    #    the profile just written (only files whose content changed since
+    #    the installed manifest)
+    sync_managed_files(dest, lang, managed_groups_for(dest), stats)
 
-    # 7. Track preserved files
+    # 5. Update state.yaml with assets section
+    if (skgd_dest / "state.yaml").exists():
+        with span("upgrade_v2_to_v3.state"):
+            store = StateStore(dest)
+            if store.get("assets") is None:
+                store.set("assets", {
+                    "queue": [],
+                    "generated": [],
+                    "placeholders": []
+                })
+                stats["templates_added"].append("state.yaml (assets section)")
+            store.compact()
+
+    # 6. Track preserved files
     if (dest / "docs" / "game-brief.md").exists():
         stats["preserved"].append("docs/game-brief.md")
 
@@ -445,8 +520,52 @@ def upgrade_v2_to_v3(dest: Path, lang: str, art_style: Optional[str] = None, ass
     return stats
 
 
+def detect_project_settings(dest: Path) -> tuple:
+    """Read (language, engine) from a project's config.yaml, with defaults."""
+    import yaml
+
+    lang, engine = "en", "unity"
+    config_path = dest / ".skgd" / "config.yaml"
+    if config_path.exists():
+        try:
+            with open(config_path, "r", encoding="utf-8") as f:
+                config = yaml.safe_load(f) or {}
+            lang = config.get("user", {}).get("language", "en")
+            engine = config.get("engine", "unity")
+        except Exception:
+            pass
+    return lang, engine
+
+
+@traced("perform_upgrade")
+def perform_upgrade(dest: Path, existing: dict, lang: str, engine: str) -> dict:
+    """Run the non-interactive upgrade path matching the detected version.
+
+    Returns the upgrade stats of the final step.
+    """
+    if existing["has_v3_templates"]:
+        # v3.x to v3.y (minor/patch upgrade) - still use v2_to_v3 as it updates commands/skills
+        stats = upgrade_v2_to_v3(dest, lang)
+        stats["from_version"] = existing.get("version", "")
+    elif existing["has_v2_templates"]:
+        # v2 to v3
+        stats = upgrade_v2_to_v3(dest, lang)
+    else:
+        # v1 to v2+
+        v2_stats = upgrade_project(dest, lang, engine)
+        # Then upgrade to v3 (files synced by the v2 step are now current)
+        stats = upgrade_v2_to_v3(dest, lang)
+        stats["commands_updated"] += v2_stats["commands_updated"]
+        if v2_stats.get("skills_updated"):
+            stats["skills_updated"] = v2_stats["skills_updated"]
+        stats["templates_added"] = v2_stats["templates_added"] + stats["templates_added"]
+    return stats
+
+
 def print_upgrade_success(stats: dict, lang: str = "en") -> None:
     """Print upgrade success message."""
+    from .i18n import t
+
     # Detect version from stats
     to_version = stats.get("to_version", "2.0")
     is_v3_upgrade = to_version.startswith("3.")
@@ -454,46 +573,48 @@ def print_upgrade_success(stats: dict, lang: str = "en") -> None:
     click.echo()
     click.secho("  ╔═══════════════════════════════════════════════════════════════╗", fg="green")
     click.secho("  ║                                                               ║", fg="green")
-    if lang == "fr":
-        click.secho(f"  ║   ✓  PROJET MIS A JOUR VERS v{to_version} !                           ║", fg="green")
-    else:
-        click.secho(f"  ║   ✓  PROJECT UPGRADED TO v{to_version}!                                ║", fg="green")
+    click.secho("  ║" + box_cell("   ✓  " + t("cli.upgraded", lang, version=to_version), 63) + "║", fg="green")
     click.secho("  ║                                                               ║", fg="green")
     click.secho("  ╚═══════════════════════════════════════════════════════════════╝", fg="green")
     click.echo()
 
     # What was updated
-    if lang == "fr":
-        click.secho("  📦 Modifications:", fg="cyan", bold=True)
-    else:
-        click.secho("  📦 Changes:", fg="cyan", bold=True)
+    click.secho(f"  📦 {t('cli.changes', lang)}:", fg="cyan", bold=True)
     click.echo()
-    click.secho(f"     ✓ Commands updated ({stats['commands_updated']} files)", fg="green")
+    if stats["commands_updated"]:
+        click.secho(f"     ✓ {t('cli.commands_updated', lang, count=stats['commands_updated'])}", fg="green")
+    else:
+        click.secho(f"     ✓ {t('cli.commands_current', lang)}", fg="green")
 
     if stats.get("skills_updated"):
-        click.secho(f"     ✓ Skills added/updated ({stats['skills_updated']} skills)", fg="green")
+        click.secho(f"     ✓ {t('cli.skills_updated', lang, count=stats['skills_updated'])}", fg="green")
 
     if stats.get("data_updated"):
-        click.secho(f"     ✓ Reference data updated ({stats['data_updated']} files)", fg="green")
+        click.secho(f"     ✓ {t('cli.data_updated', lang, count=stats['data_updated'])}", fg="green")
+
+    if stats.get("files_removed"):
+        click.secho(f"     ✓ {t('cli.files_removed', lang)}", fg="green")
+        for p in stats["files_removed"]:
+            click.echo(f"        └─ {p}")
+
+    if stats.get("files_unchanged"):
+        click.secho(f"     ✓ {t('cli.files_unchanged', lang, count=stats['files_unchanged'])}", fg="green")
 
     if stats["templates_added"]:
-        click.secho("     ✓ New templates added:", fg="green")
-        for t in stats["templates_added"]:
-            click.echo(f"        └─ {t}")
+        click.secho(f"     ✓ {t('cli.templates_added', lang)}", fg="green")
+        for tpl in stats["templates_added"]:
+            click.echo(f"        └─ {tpl}")
 
     if is_v3_upgrade:
-        click.secho("     ✓ Asset pipeline added", fg="green")
+        click.secho(f"     ✓ {t('cli.asset_pipeline', lang)}", fg="green")
     else:
-        click.secho("     ✓ i18n support added", fg="green")
-        click.secho("     ✓ Living Memory structure created", fg="green")
+        click.secho(f"     ✓ {t('cli.i18n_added', lang)}", fg="green")
+        click.secho(f"     ✓ {t('cli.living_memory', lang)}", fg="green")
     click.echo()
 
     # What was preserved
     if stats["preserved"]:
-        if lang == "fr":
-            click.secho("  🔒 Preserve:", fg="yellow", bold=True)
-        else:
-            click.secho("  🔒 Preserved:", fg="yellow", bold=True)
+        click.secho(f"  🔒 {t('cli.preserved', lang)}:", fg="yellow", bold=True)
         click.echo()
         for p in stats["preserved"]:
             click.echo(f"     └─ {p}")
@@ -501,10 +622,7 @@ def print_upgrade_success(stats: dict, lang: str = "en") -> None:
 
     # New features
     click.secho("  ┌─────────────────────────────────────────────────────────────┐", fg="cyan")
-    if lang == "fr":
-        click.secho("  │  🆕  Nouvelles fonctionnalites:                             │", fg="cyan")
-    else:
-        click.secho("  │  🆕  New features available:                                │", fg="cyan")
+    click.secho("  │" + box_cell("  🆕  " + t("cli.new_features", lang), 61) + "│", fg="cyan")
     click.secho("  │                                                             │", fg="cyan")
 
     # Detect minor version upgrades (e.g., 3.5 -> 3.6)
@@ -527,28 +645,44 @@ def print_upgrade_success(stats: dict, lang: str = "en") -> None:
     click.secho("  └─────────────────────────────────────────────────────────────┘", fg="cyan")
     click.echo()
 
-    if lang == "fr":
-        click.echo(f"  Executez {click.style('/continue', fg='cyan')} pour reprendre votre projet.")
-    else:
-        click.echo(f"  Run {click.style('/continue', fg='cyan')} to resume your project.")
+    click.echo("  " + t("cli.resume", lang, command=click.style("/continue", fg="cyan")))
     click.echo()
 
 
+@traced("copy_templates")
 def copy_templates(dest: Path, shell: str, model: str, lang: str = "en", engine: str = "unity") -> None:
     """Copy all template files to destination."""
-    template_dir = get_template_dir() / lang
+    from .manifest import record_installed
 
-    # Copy .claude/commands
-    commands_src = template_dir / "claude" / "commands"
-    commands_dest = dest / ".claude" / "commands"
-    if commands_src.exists():
-        shutil.copytree(commands_src, commands_dest, dirs_exist_ok=True)
+    from .copyengine import write_files
 
-    # Copy .skgd
-    skgd_src = template_dir / "skgd"
+    source = get_template_source()
+    commands_dest = dest / ".claude" / "commands"
     skgd_dest = dest / ".skgd"
-    if skgd_src.exists():
-        shutil.copytree(skgd_src, skgd_dest, dirs_exist_ok=True)
+    render = command_renderer_for(dest, lang, engine)
+
+    # Copy .claude/data, .skgd and any non-command files in a single pass
+    # over the templates; commands are compiled for the engine
+    pairs, compiled = [], []
+    commands_src = f"{lang}/claude/commands/"
+    for prefix, target in ((commands_src, commands_dest),
+                           (f"{lang}/claude/data/", dest / ".claude" / "data"),
+                           (f"{lang}/skgd/", skgd_dest)):
+        for rel in source.files(prefix):
+            tail = rel[len(prefix):]
+            if prefix == commands_src and "/" not in tail and tail.endswith(".md"):
+                compiled.append((target / tail, render(rel), 0))
+            else:
+                pairs.append((rel, target / tail))
+    with span("copy_templates.files", files=len(pairs) + len(compiled)):
+        source.copy_files(pairs)
+        write_files(compiled)
+    skgd_dest.mkdir(parents=True, exist_ok=True)
+
+    # Record what was installed so later upgrades only touch changed files
+    # (skills are recorded when init syncs them for the configured profile)
+    with span("manifest.record_installed"):
+        record_installed(dest, get_template_dir(), lang, ["commands", "data", "agents"], render)
 
     # Copy docs structure
     docs_dest = dest / "docs"
@@ -558,11 +692,17 @@ def copy_templates(dest: Path, shell: str, model: str, lang: str = "en", engine:
     # Create snapshots directory
     (skgd_dest / "snapshots").mkdir(exist_ok=True)
 
-    # Create memory directory with v2.0 structure
+    # Create memory directory with v2.0 structure (the files upgrade_project
+    # would otherwise add on the first upgrade)
     memory_dir = skgd_dest / "memory"
     memory_dir.mkdir(exist_ok=True)
+    source.copy_files([(f"{lang}/skgd/templates/{name}", memory_dir / name)
+                       for name in ("learnings-core.md", "session-context.md")
+                       if not (memory_dir / name).exists()
+                       and source.exists(f"{lang}/skgd/templates/{name}")])
 
 
+@traced("update_config")
 def update_config(
     dest: Path,
     project_name: str,
@@ -571,13 +711,20 @@ def update_config(
     lang: str = "en",
     engine: str = "unity",
     art_style: Optional[str] = None,
-    asset_mcps: Optional[list] = None
+    asset_mcps: Optional[list] = None,
+    probes: Optional[dict] = None
 ) -> None:
-    """Update config.yaml with user preferences."""
+    """Update config.yaml with user preferences.
+
+    When probe results are given, MCPs whose launcher is absent are marked
+    "missing" instead of being left "unchecked".
+    """
+    import yaml
+
     config_path = dest / ".skgd" / "config.yaml"
 
     if config_path.exists():
-        with open(config_path, "r", encoding="utf-8") as f:
+        with span("yaml.load", path="config.yaml"), open(config_path, "r", encoding="utf-8") as f:
             config = yaml.safe_load(f) or {}
     else:
         config = {}
@@ -628,79 +775,22 @@ def update_config(
         "status": "unchecked"
     }
 
-    with open(config_path, "w", encoding="utf-8") as f:
+    if probes:
+        from .probes import apply_mcp_status
+        apply_mcp_status(config["mcp"], probes)
+
+    with span("yaml.dump", path="config.yaml"), open(config_path, "w", encoding="utf-8") as f:
         yaml.dump(config, f, default_flow_style=False, sort_keys=False)
 
 
+@traced("get_readme_content")
 def get_readme_content(project_name: str, engine: str, lang: str) -> str:
     """Generate README content based on language and engine."""
+    from .i18n import t
+
     engine_name = "Unity" if engine == "unity" else "Godot"
     mcp_name = "Unity MCP" if engine == "unity" else "GDAI MCP"
-
-    if lang == "fr":
-        return f"""# {project_name}
-
-Un projet de jeu utilisant le workflow **Spec Kit Game Dev** avec {engine_name}.
-
-## Pour commencer
-
-1. Ouvrez l'editeur {engine_name} dans ce dossier
-2. Lancez `claude` pour demarrer Claude Code
-3. Executez `/init` pour initialiser le workflow
-
-## Commandes
-
-| Commande | Description |
-|----------|-------------|
-| `/init` | Initialiser le projet |
-| `/brainstorm` | Ideation creative |
-| `/roadmap` | Feuille de route |
-| `/spec [feature]` | Creer une specification |
-| `/plan [feature]` | Plan d'implementation |
-| `/implement` | Executer via {mcp_name} |
-| `/playtest` | Tester et valider |
-| `/project-status` | Etat actuel |
-| `/continue` | Auto-router l'action suivante |
-| `/crystallize` | Cristalliser les apprentissages |
-
-## Workflow
-
-```
-/init -> /brainstorm -> /roadmap -> [/spec -> /plan -> /implement -> /playtest] (repeter)
-```
-"""
-    else:  # English (default)
-        return f"""# {project_name}
-
-A game project using **Spec Kit Game Dev** workflow with {engine_name}.
-
-## Getting Started
-
-1. Open {engine_name} Editor in this folder
-2. Run `claude` to start Claude Code
-3. Run `/init` to initialize the workflow
-
-## Commands
-
-| Command | Description |
-|---------|-------------|
-| `/init` | Initialize project |
-| `/brainstorm` | Creative ideation |
-| `/roadmap` | Development path |
-| `/spec [feature]` | Create specification |
-| `/plan [feature]` | Implementation plan |
-| `/implement` | Execute via {mcp_name} |
-| `/playtest` | Test and validate |
-| `/project-status` | Current state |
-| `/continue` | Auto-route next action |
-| `/crystallize` | Compress learnings |
-
-## Workflow
-
-```
-/init -> /brainstorm -> /roadmap -> [/spec -> /plan -> /implement -> /playtest] (repeat)
-```
-"""
+    return t("cli.readme", lang, project=project_name, engine=engine_name, mcp=mcp_name)
 
 
 def print_banner() -> None:
@@ -721,72 +811,87 @@ def print_banner() -> None:
     click.echo()
 
 
+def box_cell(text: str, width: int) -> str:
+    """Pad text to width terminal columns (wide characters count double)."""
+    import unicodedata
+
+    columns = sum(2 if unicodedata.east_asian_width(c) in ("W", "F") else 1 for c in text)
+    return text + " " * max(0, width - columns)
+
+
 def print_success(project_name: str, dest: Path, engine: str = "unity", lang: str = "en") -> None:
     """Print success message."""
+    from .i18n import t
+
     engine_name = "Unity" if engine == "unity" else "Godot"
 
     click.echo()
     click.secho("  ╔═══════════════════════════════════════════════════════════════╗", fg="green")
     click.secho("  ║                                                               ║", fg="green")
-    if lang == "fr":
-        click.secho("  ║   ✓  PROJET CREE AVEC SUCCES !                               ║", fg="green")
-    else:
-        click.secho("  ║   ✓  PROJECT CREATED SUCCESSFULLY!                            ║", fg="green")
+    click.secho("  ║" + box_cell("   ✓  " + t("cli.created", lang), 63) + "║", fg="green")
     click.secho("  ║                                                               ║", fg="green")
     click.secho("  ╚═══════════════════════════════════════════════════════════════╝", fg="green")
     click.echo()
 
     # Project info box
+    labels = {key: box_cell(t(f"cli.{key}", lang) + ":", 9) for key in ("project", "engine", "path")}
     click.secho("  ┌─────────────────────────────────────────────────────────────┐", fg="white")
-    click.echo(f"  │  Project: {click.style(project_name, fg='cyan', bold=True):<50}│")
-    click.echo(f"  │  Engine:  {click.style(engine_name, fg='yellow'):<50}│")
-    click.echo(f"  │  Path:    {click.style(str(dest)[:48], fg='white'):<50}│")
+    click.echo(f"  │  {labels['project']}{click.style(project_name, fg='cyan', bold=True):<50}│")
+    click.echo(f"  │  {labels['engine']}{click.style(engine_name, fg='yellow'):<50}│")
+    click.echo(f"  │  {labels['path']}{click.style(str(dest)[:48], fg='white'):<50}│")
     click.secho("  └─────────────────────────────────────────────────────────────┘", fg="white")
     click.echo()
 
-    if lang == "fr":
-        click.secho("  📋 Prochaines etapes:", fg="yellow", bold=True)
-        click.echo()
-        click.echo(f"     1. cd {project_name}")
-        click.echo(f"     2. Ouvrez votre projet {engine_name} ici (ou creez-en un)")
-        click.echo(f"     3. Lancez Claude Code: {click.style('claude', fg='cyan')}")
-        click.echo(f"     4. Executez: {click.style('/init', fg='cyan')}")
-    else:
-        click.secho("  📋 Next steps:", fg="yellow", bold=True)
-        click.echo()
-        click.echo(f"     1. cd {project_name}")
-        click.echo(f"     2. Open your {engine_name} project here (or create new)")
-        click.echo(f"     3. Start Claude Code: {click.style('claude', fg='cyan')}")
-        click.echo(f"     4. Run: {click.style('/init', fg='cyan')}")
+    click.secho(f"  📋 {t('cli.next_steps', lang)}:", fg="yellow", bold=True)
+    click.echo()
+    click.echo(f"     1. cd {project_name}")
+    click.echo(f"     2. {t('cli.step_open', lang, engine=engine_name)}")
+    click.echo(f"     3. {t('cli.step_claude', lang, command=click.style('claude', fg='cyan'))}")
+    click.echo(f"     4. {t('cli.step_run', lang, command=click.style('/init', fg='cyan'))}")
     click.echo()
 
 
-def check_mcp_command() -> bool:
+def check_mcp_command(refresh: bool = False) -> bool:
     """Check if Claude CLI is installed."""
-    try:
-        result = subprocess.run(
-            ["claude", "--version"],
-            capture_output=True,
-            text=True,
-            timeout=5
-        )
-        return result.returncode == 0
-    except (subprocess.TimeoutExpired, FileNotFoundError):
-        return False
+    from .probes import probe_ok, project_cache_dir, run_probes
+
+    results = run_probes(["claude"], project_cache_dir(Path.cwd()), refresh)
+    return probe_ok(results, "claude")
 
 
-def detect_blender() -> bool:
+def detect_blender(refresh: bool = False) -> bool:
     """Check if Blender is installed locally."""
-    try:
-        result = subprocess.run(
-            ["blender", "--version"],
-            capture_output=True,
-            text=True,
-            timeout=5
-        )
-        return result.returncode == 0
-    except (subprocess.TimeoutExpired, FileNotFoundError):
-        return False
+    from .probes import probe_ok, project_cache_dir, run_probes
+
+    results = run_probes(["blender"], project_cache_dir(Path.cwd()), refresh)
+    return probe_ok(results, "blender")
+
+
+def print_probe_results(results: dict) -> None:
+    """Print one line per probed tool with its version."""
+    for name, result in results.items():
+        if result["status"] == "ok":
+            version = result["version"] or result["path"]
+            click.secho(f"   [OK] {name:<10} {version}", fg="green")
+        elif result["status"] == "missing":
+            click.secho(f"   [--] {name:<10} not found", fg="yellow")
+        else:
+            click.secho(f"   [!!] {name:<10} {result['status']} ({result['path']})", fg="red")
+
+
+def update_mcp_status(dest: Path, results: dict) -> None:
+    """Fill mcp status fields of an existing project's config from probes."""
+    import yaml
+    from .probes import apply_mcp_status
+
+    config_path = dest / ".skgd" / "config.yaml"
+    if not config_path.exists():
+        return
+    with open(config_path, "r", encoding="utf-8") as f:
+        config = yaml.safe_load(f) or {}
+    original_config = copy.deepcopy(config)
+    apply_mcp_status(config.get("mcp", {}), results)
+    write_yaml_if_changed(config_path, config, original_config)
 
 
 def recommend_asset_mcps(art_style: str, has_blender: bool) -> list:
@@ -803,11 +908,127 @@ def recommend_asset_mcps(art_style: str, has_blender: bool) -> list:
     return recommendations
 
 
-@click.group()
+# Subcommands living in their own modules, imported only when invoked
+# (or when --help lists them). Maps command name -> "module:attribute".
+LAZY_COMMANDS = {
+    "scan": "skgd.fleet:scan",
+    "index": "skgd.index:index",
+    "tasks": "skgd.index:tasks",
+    "scout": "skgd.scout:scout",
+    "budget": "skgd.budget:budget",
+    "state": "skgd.state:state",
+    "snapshot": "skgd.snapshot:snapshot",
+    "learnings": "skgd.learnings:learnings",
+    "search": "skgd.search:search_command",
+    "assets": "skgd.assets:assets",
+    "status": "skgd.status:status",
+    "watch": "skgd.watch:watch",
+    "msg": "skgd.i18n:msg",
+    "commands": "skgd.compiler:commands",
+    "skills": "skgd.skills:skills",
+    "mcp": "skgd.mcp:mcp",
+}
+
+# Import-time budget for `skgd version` (see --startup-profile)
+STARTUP_BUDGET_MS = 150
+
+
+class LazyGroup(click.Group):
+    """Click group that imports registered subcommands on first use."""
+
+    def __init__(self, *args, lazy_commands: Optional[dict] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lazy_commands = lazy_commands or {}
+
+    def list_commands(self, ctx):
+        return sorted(set(super().list_commands(ctx)) | set(self.lazy_commands))
+
+    def get_command(self, ctx, cmd_name):
+        if cmd_name in self.lazy_commands and cmd_name not in self.commands:
+            import importlib
+            module_name, attr = self.lazy_commands[cmd_name].split(":")
+            self.add_command(getattr(importlib.import_module(module_name), attr), cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+
+def parse_importtime(stderr: str) -> list:
+    """Parse `python -X importtime` output into (module, self_us, cumulative_us, depth)."""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        depth = (len(name) - len(name.lstrip())) // 2
+        rows.append((name.strip(), int(self_us), int(cumulative_us), depth))
+    return rows
+
+
+def run_startup_profile(ctx, param, value) -> None:
+    """Re-run the CLI under `python -X importtime` and report per-module cost."""
+    if not value or ctx.resilient_parsing:
+        return
+    import subprocess
+
+    args = [a for a in sys.argv[1:] if a != "--startup-profile"] or ["version"]
+    cmd = [sys.executable, "-X", "importtime", "-c",
+           "from skgd.cli import main; main()", *args]
+    result = subprocess.run(cmd, capture_output=True, text=True)
+    rows = parse_importtime(result.stderr)
+    total_ms = sum(r[1] for r in rows) / 1000
+    skgd_ms = next((r[2] for r in rows if r[0] == "skgd.cli"), 0) / 1000
+
+    click.echo()
+    click.secho(f"  Startup profile: skgd {' '.join(args)}", fg="cyan", bold=True)
+    click.echo()
+    click.echo(f"  {'Module':<40} {'Self':>9} {'Cumulative':>11}")
+    click.echo(f"  {'-' * 40} {'-' * 9} {'-' * 11}")
+    top = sorted((r for r in rows if r[3] == 0), key=lambda r: r[2], reverse=True)[:15]
+    for name, self_us, cumulative_us, _ in top:
+        click.echo(f"  {name[:40]:<40} {self_us / 1000:>7.1f}ms {cumulative_us / 1000:>9.1f}ms")
+    click.echo()
+    click.echo(f"  Modules imported: {len(rows)}")
+    click.echo(f"  Total import time: {total_ms:.1f}ms (skgd.cli: {skgd_ms:.1f}ms)")
+
+    over = total_ms > STARTUP_BUDGET_MS
+    color = "red" if over else "green"
+    status = "OVER BUDGET" if over else "within budget"
+    click.secho(f"  Budget: {STARTUP_BUDGET_MS}ms - {status}", fg=color)
+    click.echo()
+    ctx.exit(1 if over or result.returncode else 0)
+
+
+@click.group(cls=LazyGroup, lazy_commands=LAZY_COMMANDS)
 @click.version_option(version=__version__, prog_name="skgd")
-def main():
+@click.option(
+    "--startup-profile",
+    is_flag=True,
+    is_eager=True,
+    expose_value=False,
+    callback=run_startup_profile,
+    help="Report import time per module for a command (default: version)"
+)
+@click.option(
+    "--trace",
+    is_flag=True,
+    help="Write a Chrome trace of the command (skgd-trace.json, or SKGD_TRACE=path) "
+         "and print a per-phase summary"
+)
+@click.pass_context
+def main(ctx, trace: bool):
     """Spec Kit Game Dev - AI-first workflow for game development."""
-    pass
+    from . import trace as tracing
+
+    path = tracing.env_trace_path() or (tracing.DEFAULT_TRACE_FILE if trace else None)
+    if path:
+        tracing.start(path)
+        root = span(f"skgd {ctx.invoked_subcommand}")
+        root.__enter__()
+
+        def finish():
+            root.__exit__(None, None, None)
+            tracing.finish()
+
+        ctx.call_on_close(finish)
 
 
 @main.command()
@@ -842,7 +1063,17 @@ def main():
     type=click.Choice(list(ENGINES.keys())),
     help="Game engine (unity or godot)"
 )
-def init(project_name: Optional[str], model: Optional[str], shell: Optional[str], no_interactive: bool, here: bool, lang: Optional[str], engine: Optional[str]):
+@click.option(
+    "--refresh",
+    is_flag=True,
+    help="Re-probe installed tools instead of using cached results"
+)
+@click.option(
+    "--dry-run",
+    is_flag=True,
+    help="Show the files that would be written without changing anything"
+)
+def init(project_name: Optional[str], model: Optional[str], shell: Optional[str], no_interactive: bool, here: bool, lang: Optional[str], engine: Optional[str], refresh: bool, dry_run: bool):
     """Initialize a new Spec Kit Game Dev project.
 
     Creates a new directory with the complete workflow structure
@@ -853,9 +1084,21 @@ def init(project_name: Optional[str], model: Optional[str], shell: Optional[str]
         skgd init --here                    # Initialize in current folder
         skgd init --here --engine godot     # Upgrade existing project for Godot
         skgd init -H -e unity               # Short form
+        skgd init --here --dry-run          # Show planned changes only
     """
+    import questionary
+    from .copyengine import STATS as COPY_STATS
+    from .probes import probe_ok, project_cache_dir, save_cached_probes, start_probes
+    from .transaction import Transaction, print_plan
+
     print_banner()
 
+    # Probe tools in the background while the user answers prompts
+    probe_future = start_probes(
+        cache_dir=project_cache_dir(Path.cwd()) if here else None,
+        refresh=refresh
+    )
+
     # Determine destination
     if here:
         dest = Path.cwd()
@@ -893,7 +1136,7 @@ def init(project_name: Optional[str], model: Optional[str], shell: Optional[str]
             click.echo()
 
             # Ask for upgrade confirmation in interactive mode
-            if not no_interactive:
+            if not no_interactive and not dry_run:
                 upgrade_msg = f"Upgrade to v{SKGD_VERSION}?"
                 if not questionary.confirm(upgrade_msg, default=True).ask():
                     click.echo("Upgrade cancelled.")
@@ -947,7 +1190,7 @@ def init(project_name: Optional[str], model: Optional[str], shell: Optional[str]
 
                     # Detect tools and recommend MCPs
                     click.echo("  +-- Detecting asset tools...")
-                    has_blender = detect_blender()
+                    has_blender = probe_ok(probe_future.result(), "blender")
                     if has_blender:
                         click.secho("      [OK] Blender detected", fg="green")
                     else:
@@ -971,29 +1214,32 @@ def init(project_name: Optional[str], model: Optional[str], shell: Optional[str]
             click.echo()
 
             try:
-                if is_v1_to_v2:
-                    # First upgrade v1→v2
-                    stats = upgrade_project(dest, lang, engine)
-                    print_upgrade_success(stats, lang)
-                    click.echo()
-                    click.secho("Now upgrading v2.0→v3.0...", fg="cyan")
-                    click.echo()
-
-                    # Then upgrade v2→v3
-                    stats = upgrade_v2_to_v3(dest, lang, art_style, asset_mcps)
-                    print_upgrade_success(stats, lang)
-                elif is_v2_to_v3:
-                    # Direct v2→v3 upgrade
-                    stats = upgrade_v2_to_v3(dest, lang, art_style, asset_mcps)
-                    print_upgrade_success(stats, lang)
-                else:
-                    # Fallback to v1→v2 upgrade
-                    stats = upgrade_project(dest, lang, engine)
-                    print_upgrade_success(stats, lang)
+                with Transaction(dest, dry_run=dry_run) as txn:
+                    if is_v1_to_v2:
+                        # First upgrade v1→v2, then v2→v3
+                        results = [upgrade_project(txn.root, lang, engine),
+                                   upgrade_v2_to_v3(txn.root, lang, art_style, asset_mcps)]
+                    elif is_v2_to_v3:
+                        # Direct v2→v3 upgrade
+                        results = [upgrade_v2_to_v3(txn.root, lang, art_style, asset_mcps)]
+                    else:
+                        # Fallback to v1→v2 upgrade
+                        results = [upgrade_project(txn.root, lang, engine)]
+                    if dry_run:
+                        print_plan(txn.plan())
+                        return
             except Exception as e:
                 click.secho(f"Error during upgrade: {e}", fg="red")
+                click.echo("No files were changed.")
                 sys.exit(1)
 
+            for i, stats in enumerate(results):
+                if i:
+                    click.echo()
+                    click.secho("Now upgrading v2.0→v3.0...", fg="cyan")
+                    click.echo()
+                print_upgrade_success(stats, lang)
+
             return  # Exit after upgrade
 
         # New project in existing directory
@@ -1077,7 +1323,7 @@ def init(project_name: Optional[str], model: Optional[str], shell: Optional[str]
 
         # Detect available tools and recommend MCPs
         click.echo("  +-- Detecting asset tools...")
-        has_blender = detect_blender()
+        has_blender = probe_ok(probe_future.result(), "blender")
         if has_blender:
             click.secho("      [OK] Blender detected", fg="green")
         else:
@@ -1114,43 +1360,58 @@ def init(project_name: Optional[str], model: Optional[str], shell: Optional[str]
     click.echo()
 
     try:
-        # Only create directory for new projects
-        if not here:
-            dest.mkdir(parents=True, exist_ok=True)
-
-        # Copy templates
-        click.echo("  +-- Copying workflow templates...")
-        copy_templates(dest, shell, model, lang, engine)
-        click.secho("  |   [OK] .claude/commands/", fg="green")
-        click.secho("  |   [OK] .skgd/", fg="green")
-        click.secho("  |   [OK] docs/", fg="green")
-
-        # Update config
-        click.echo("  +-- Configuring project...")
-        update_config(dest, project_name, model, shell, lang, engine, art_style, asset_mcps)
-        click.secho("  |   [OK] config.yaml updated", fg="green")
-
-        # Show asset MCP status if configured
-        if asset_mcps:
-            click.echo("  +-- Asset MCPs configured:")
-            for mcp_key in asset_mcps:
-                mcp_info = ASSET_MCPS[mcp_key]
-                click.secho(f"  |   [OK] {mcp_info['name']} enabled", fg="green")
+        # All writes go to a staging copy, committed at the end of the block
+        with Transaction(dest, dry_run=dry_run) as txn:
+            # Copy templates
+            click.echo("  +-- Copying workflow templates...")
+            COPY_STATS.reset()
+            copy_templates(txn.root, shell, model, lang, engine)
+            click.secho("  |   [OK] .claude/commands/", fg="green")
+            click.secho("  |   [OK] .skgd/", fg="green")
+            click.secho("  |   [OK] docs/", fg="green")
+            click.secho(f"  |   {COPY_STATS.describe()}", dim=True)
+
+            # Update config
+            click.echo("  +-- Configuring project...")
+            with span("probes.wait"):
+                probes = probe_future.result()
+            update_config(txn.root, project_name, model, shell, lang, engine, art_style, asset_mcps, probes)
+            click.secho("  |   [OK] config.yaml updated", fg="green")
+
+            # Skills matching the engine and asset profile just configured
+            sync_managed_files(txn.root, lang, ["skills"], {}, engine)
+            click.secho("  |   [OK] .claude/skills/", fg="green")
+
+            # Show asset MCP status if configured
+            if asset_mcps:
+                click.echo("  +-- Asset MCPs configured:")
+                for mcp_key in asset_mcps:
+                    mcp_info = ASSET_MCPS[mcp_key]
+                    click.secho(f"  |   [OK] {mcp_info['name']} enabled", fg="green")
+
+            # Create or skip README
+            readme_path = txn.root / "README.md"
+            if readme_path.exists() and here:
+                # Don't overwrite existing README for existing projects
+                click.secho("  |   [--] README.md exists, skipped", fg="yellow")
+            else:
+                readme_content = get_readme_content(project_name, engine, lang)
+                with span("readme.write"), open(readme_path, "w", encoding="utf-8") as f:
+                    f.write(readme_content)
+                click.secho("  |   [OK] README.md created", fg="green")
 
-        # Create or skip README
-        readme_path = dest / "README.md"
-        if readme_path.exists() and here:
-            # Don't overwrite existing README for existing projects
-            click.secho("  |   [--] README.md exists, skipped", fg="yellow")
-        else:
-            readme_content = get_readme_content(project_name, engine, lang)
-            with open(readme_path, "w", encoding="utf-8") as f:
-                f.write(readme_content)
-            click.secho("  |   [OK] README.md created", fg="green")
+            if dry_run:
+                click.echo()
+                print_plan(txn.plan())
+                return
+
+        cache_dir = project_cache_dir(dest)
+        if cache_dir and not (cache_dir / "probes.json").exists():
+            save_cached_probes(cache_dir, probes)
 
         # Check Claude CLI
         click.echo("  +-- Checking prerequisites...")
-        if check_mcp_command():
+        if probe_ok(probes, "claude"):
             click.secho("      [OK] Claude CLI detected", fg="green")
         else:
             click.secho("      [!!] Claude CLI not found", fg="yellow")
@@ -1159,40 +1420,60 @@ def init(project_name: Optional[str], model: Optional[str], shell: Optional[str]
         print_success(project_name, dest, engine, lang)
 
     except Exception as e:
+        # Staged writes were discarded; the destination is untouched
         click.secho(f"Error creating project: {e}", fg="red")
-        # Cleanup on failure
-        if dest.exists():
-            shutil.rmtree(dest)
+        click.echo("No files were changed.")
         sys.exit(1)
 
 
 @main.command("check-mcp")
-def check_mcp():
+@click.option(
+    "--refresh",
+    is_flag=True,
+    help="Re-probe installed tools instead of using cached results"
+)
+def check_mcp(refresh: bool):
     """Check MCP installation status.
 
     Verifies that Claude CLI and Unity MCP are properly configured.
     """
+    from .probes import probe_ok, project_cache_dir, run_probes
+
     print_banner()
 
     click.echo("Checking MCP setup...")
     click.echo()
 
+    # Probe every tool at once (cached in .skgd/cache/ inside a project)
+    results = run_probes(cache_dir=project_cache_dir(Path.cwd()), refresh=refresh)
+    update_mcp_status(Path.cwd(), results)
+
     # Check Claude CLI
     click.echo("1. Claude Code CLI")
-    if check_mcp_command():
+    if probe_ok(results, "claude"):
         click.secho("   [OK] Installed", fg="green")
     else:
         click.secho("   [X] Not found", fg="red")
         click.echo("       Install: npm install -g @anthropic-ai/claude-code")
 
     click.echo()
-    click.echo("2. Unity MCP")
+    click.echo("2. Tools")
+    print_probe_results(results)
+
+    click.echo()
+    click.echo("3. Unity MCP")
     click.echo("   Run this in Claude Code to check:")
     click.secho("   mcp__UnityMCP__manage_editor with action: \"get_state\"", fg="cyan")
     click.echo()
     click.echo("   If not installed:")
     click.secho("   claude mcp add unity-mcp -- uvx --from git+https://github.com/SirLorrence/unity-mcp unity-mcp", fg="cyan")
     click.echo()
+    click.echo("   Or behind the caching proxy (repeated read-only calls skip the editor):")
+    click.secho("   claude mcp add unity-mcp -- skgd mcp proxy -- uvx --from git+https://github.com/SirLorrence/unity-mcp unity-mcp", fg="cyan")
+    click.echo()
+    click.echo("   Measure its round trips (or try the bundled fake server):")
+    click.secho("   skgd mcp bench            skgd mcp bench --fake unity", fg="cyan")
+    click.echo()
 
 
 @main.command()
@@ -1202,26 +1483,32 @@ def version():
 
 
 @main.command("check-assets")
-def check_assets():
+@click.option(
+    "--refresh",
+    is_flag=True,
+    help="Re-probe installed tools instead of using cached results"
+)
+def check_assets(refresh: bool):
     """Check asset MCP installation status.
 
     Verifies that asset creation tools (Blender, PixelLab) are available.
     """
+    from .probes import probe_ok, project_cache_dir, run_probes
+
     print_banner()
 
     click.echo("Checking Asset Pipeline Setup...")
     click.echo()
 
-    # Check local tools
+    # Check local tools (probed concurrently, cached inside a project)
     click.secho("1. Local Tools", bold=True)
     click.echo()
 
-    has_blender = detect_blender()
-    if has_blender:
-        click.secho("   [OK] Blender installed", fg="green")
-    else:
-        click.secho("   [--] Blender not found", fg="yellow")
-        click.echo("        Install from: https://www.blender.org/download/")
+    results = run_probes(["blender", "uvx", "npx"], project_cache_dir(Path.cwd()), refresh)
+    update_mcp_status(Path.cwd(), results)
+    print_probe_results(results)
+    if not probe_ok(results, "blender"):
+        click.echo("        Install Blender from: https://www.blender.org/download/")
     click.echo()
 
     # Check MCPs
@@ -1271,6 +1558,7 @@ def list_templates():
 
 
 @main.command()
+@click.argument("root", required=False, type=click.Path(exists=True, file_okay=False))
 @click.option(
     "--lang", "-l",
     type=click.Choice(list(LANGUAGES.keys())),
@@ -1281,22 +1569,45 @@ def list_templates():
     is_flag=True,
     help="Skip interactive prompts, use defaults"
 )
-def upgrade(lang: Optional[str], no_interactive: bool):
+@click.option(
+    "--recursive", "-r",
+    is_flag=True,
+    help="Upgrade every SKGD project found under ROOT (fleet mode)"
+)
+@click.option(
+    "--jobs", "-j",
+    type=click.IntRange(min=1),
+    help="Parallel workers for --recursive (default: CPU count)"
+)
+@click.option(
+    "--dry-run",
+    is_flag=True,
+    help="Show the files that would change without changing anything"
+)
+def upgrade(root: Optional[str], lang: Optional[str], no_interactive: bool, recursive: bool, jobs: Optional[int], dry_run: bool):
     """Upgrade existing project to latest SKGD version.
 
     Updates slash commands, adds new skills, and preserves your
     existing game-brief, specs, and learnings.
 
-    Must be run from within an existing SKGD project directory.
+    Must be run from within an existing SKGD project directory,
+    or with --recursive to upgrade every project under ROOT.
 
     Examples:
         skgd upgrade              # Interactive upgrade
         skgd upgrade -y           # Non-interactive, use defaults
         skgd upgrade --lang fr    # Upgrade with French templates
+        skgd upgrade -r ~/games   # Upgrade all projects under ~/games
+        skgd upgrade --dry-run    # Show planned changes only
     """
     print_banner()
 
-    dest = Path.cwd()
+    if recursive:
+        from .fleet import upgrade_fleet
+        upgrade_fleet(Path(root or Path.cwd()).resolve(), lang, no_interactive, jobs, dry_run)
+        return
+
+    dest = Path(root).resolve() if root else Path.cwd()
 
     # Detect existing project
     existing = detect_existing_project(dest)
@@ -1313,23 +1624,11 @@ def upgrade(lang: Optional[str], no_interactive: bool):
     current_version = existing.get("version", "1.x")
 
     # Detect language and engine from existing config first
-    detected_lang = "en"
-    detected_engine = "unity"
-    config_path = dest / ".skgd" / "config.yaml"
-    if config_path.exists():
-        try:
-            import yaml
-            with open(config_path) as f:
-                config = yaml.safe_load(f)
-            detected_lang = config.get("user", {}).get("language", "en")
-            detected_engine = config.get("engine", "unity")
-        except Exception:
-            pass
+    detected_lang, engine = detect_project_settings(dest)
 
     # Use provided lang or detected
     if lang is None:
         lang = detected_lang
-    engine = detected_engine
 
     # Display detected configuration
     click.secho(f"Detected SKGD project (v{current_version})", fg="yellow")
@@ -1337,10 +1636,14 @@ def upgrade(lang: Optional[str], no_interactive: bool):
     click.echo(f"  Language: {click.style(lang, fg='cyan')}")
     click.echo()
 
-    # Check if already at latest version
+    # Check if already at latest version (and template files are current)
     if existing["has_v3_templates"] and current_version == SKGD_VERSION:
-        click.secho(f"Project is already at v{SKGD_VERSION}. Nothing to upgrade.", fg="green")
-        sys.exit(0)
+        pending = pending_template_changes(dest, lang)
+        if not pending:
+            click.secho(f"Project is already at v{SKGD_VERSION}. Nothing to upgrade.", fg="green")
+            sys.exit(0)
+        click.secho(f"Project is at v{SKGD_VERSION}, {pending} template files changed.", fg="yellow")
+        click.echo()
 
     # Show what will be preserved
     click.echo("Will preserve:")
@@ -1357,36 +1660,36 @@ def upgrade(lang: Optional[str], no_interactive: bool):
     click.echo()
 
     # Confirm upgrade
-    if not no_interactive:
+    if not no_interactive and not dry_run:
+        import questionary
         if not questionary.confirm(f"Upgrade to v{SKGD_VERSION}?", default=True).ask():
             click.echo("Upgrade cancelled.")
             sys.exit(0)
 
-    # Perform upgrade
+    # Perform upgrade against a staged copy, committed atomically
+    from .copyengine import STATS as COPY_STATS
+    from .transaction import Transaction, print_plan
+
     click.echo()
     click.echo("Upgrading...")
+    COPY_STATS.reset()
 
     try:
-        # Determine upgrade path
-        if existing["has_v3_templates"]:
-            # v3.x to v3.y (minor/patch upgrade) - still use v2_to_v3 as it updates commands/skills
-            stats = upgrade_v2_to_v3(dest, lang)
-            stats["from_version"] = current_version
-        elif existing["has_v2_templates"]:
-            # v2 to v3
-            stats = upgrade_v2_to_v3(dest, lang)
-        else:
-            # v1 to v2+
-            stats = upgrade_project(dest, lang, engine)
-            # Then upgrade to v3
-            stats = upgrade_v2_to_v3(dest, lang)
-
-        print_upgrade_success(stats, lang)
-
+        with Transaction(dest, dry_run=dry_run) as txn:
+            stats = perform_upgrade(txn.root, existing, lang, engine)
+            if dry_run:
+                print_plan(txn.plan())
+                return
     except Exception as e:
         click.secho(f"Error during upgrade: {e}", fg="red")
+        click.echo("No files were changed.")
         sys.exit(1)
 
+    print_upgrade_success(stats, lang)
+    if COPY_STATS.files:
+        click.secho(f"  Copied {COPY_STATS.describe()}", dim=True)
+        click.echo()
+
 
 if __name__ == "__main__":
     main()
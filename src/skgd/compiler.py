@@ -0,0 +1,176 @@
+"""Command template compiler - engine-specific command files at install time.
+
+Command templates carry Unity and Godot instructions side by side and
+share boilerplate sections, but a project's ``config.yaml`` fixes its
+engine, and every byte of an installed command is loaded into the model's
+context on each invocation. ``copy_templates`` and upgrade therefore
+install compiled commands. Templates mark engine-specific blocks and
+shared sections with HTML comments (invisible when the raw template is
+rendered)::
+
+    <!-- @engine unity -->
+    ...Unity-only instructions...
+    <!-- @end -->
+
+    <!-- @include language section=implement -->
+
+``@engine`` blocks are kept only for the project's engine. ``@include``
+inserts ``{lang}/claude/partials/<name>.md``, replacing ``{{key}}`` with
+the given ``key=value`` arguments; partials may use directives too.
+
+``skgd commands`` reports the bytes and estimated tokens saved per command.
+"""
+
+import json
+import re
+from typing import Callable, Dict, List, Optional
+
+import click
+
+from .cli import require_project_root
+
+PARTIALS_PREFIX = "{lang}/claude/partials/"
+DIRECTIVE_RE = re.compile(r"^<!--\s*@(engine|end|include)\b\s*(.*?)\s*-->\s*$")
+ENGINES = ("unity", "godot")
+MAX_INCLUDE_DEPTH = 5
+
+
+class TemplateError(ValueError):
+    """Malformed directive in a command template."""
+
+
+def compile_text(text: str, engine: Optional[str], include: Callable[[str], str],
+                 name: str = "template", depth: int = 0) -> str:
+    """Resolve @engine blocks and @include directives for one engine.
+
+    engine None keeps every block (the engine-agnostic command). A blank
+    line left on both sides of a dropped block is collapsed, so compiled
+    files keep the template's paragraph spacing.
+    """
+    out: List[str] = []
+    block: Optional[str] = None
+    skip_blank = False
+    for number, line in enumerate(text.split("\n"), 1):
+        m = DIRECTIVE_RE.match(line)
+        keep = block is None or engine is None or block == engine
+        if m is None:
+            if not keep:
+                continue
+            if skip_blank and not line.strip():
+                skip_blank = False
+                continue
+            skip_blank = False
+            out.append(line)
+            continue
+
+        directive, args = m.groups()
+        if directive == "engine":
+            if args not in ENGINES:
+                raise TemplateError(f"{name}:{number}: unknown engine {args!r}")
+            if block is not None:
+                raise TemplateError(f"{name}:{number}: @engine inside an @engine block")
+            block = args
+        elif directive == "end":
+            if block is None:
+                raise TemplateError(f"{name}:{number}: @end without @engine")
+            dropped = not keep
+            block = None
+            # Dropping a block between two blank lines would leave two in a row
+            skip_blank = dropped and bool(out) and not out[-1].strip()
+        elif keep:
+            if depth >= MAX_INCLUDE_DEPTH:
+                raise TemplateError(f"{name}:{number}: includes nested too deeply")
+            parts = args.split()
+            if not parts:
+                raise TemplateError(f"{name}:{number}: @include needs a partial name")
+            values = dict(part.split("=", 1) for part in parts[1:] if "=" in part)
+            partial = compile_text(include(parts[0]), engine, include, parts[0], depth + 1)
+            for key, value in values.items():
+                partial = partial.replace("{{" + key + "}}", value)
+            out.extend(partial.rstrip("\n").split("\n"))
+    if block is not None:
+        raise TemplateError(f"{name}: @engine {block} block is never closed")
+    return "\n".join(out)
+
+
+def command_renderer(source, lang: str, engine: Optional[str]) -> Callable[[str], bytes]:
+    """Template path -> compiled bytes, reading partials from source once.
+
+    Results are memoized, so one renderer can serve many projects (fleet
+    upgrades) at the cost of a single compile per command.
+    """
+    partials: Dict[str, str] = {}
+    rendered: Dict[str, bytes] = {}
+    prefix = PARTIALS_PREFIX.format(lang=lang)
+
+    def include(name: str) -> str:
+        if name not in partials:
+            rel = f"{prefix}{name}.md"
+            if not source.exists(rel):
+                raise TemplateError(f"partial {name!r} not found ({rel})")
+            partials[name] = source.read_bytes(rel).decode("utf-8")
+        return partials[name]
+
+    def render(rel: str) -> bytes:
+        if rel not in rendered:
+            text = source.read_bytes(rel).decode("utf-8")
+            rendered[rel] = compile_text(text, engine, include, rel).encode("utf-8")
+        return rendered[rel]
+
+    return render
+
+
+def compile_report(source, lang: str, engine: str) -> List[dict]:
+    """Per-command size for all engines vs for one, in bytes and estimated tokens."""
+    from .budget import estimate_tokens
+
+    render_all = command_renderer(source, lang, None)
+    render = command_renderer(source, lang, engine)
+    rows = []
+    prefix = f"{lang}/claude/commands/"
+    for rel in source.files(prefix):
+        tail = rel[len(prefix):]
+        if "/" in tail or not tail.endswith(".md"):
+            continue
+        full, compiled = render_all(rel), render(rel)
+        full_tokens = estimate_tokens(full.decode("utf-8"))
+        tokens = estimate_tokens(compiled.decode("utf-8"))
+        rows.append({"command": tail[:-3], "all_engines_bytes": len(full), "bytes": len(compiled),
+                     "saved_bytes": len(full) - len(compiled), "all_engines_tokens": full_tokens,
+                     "tokens": tokens, "saved_tokens": full_tokens - tokens})
+    return rows
+
+
+@click.command("commands")
+@click.option("--engine", "-e", type=click.Choice(ENGINES), help="Engine to compile for (default: project engine)")
+@click.option("--json", "as_json", is_flag=True, help="Print the report as JSON")
+def commands(engine: Optional[str], as_json: bool):
+    """Show how much compiling commands for the engine saves.
+
+    Lists each slash command's size with every engine's instructions next
+    to the engine-specific file installed by skgd init/upgrade, in bytes
+    and estimated tokens.
+
+    Examples:
+        skgd commands
+        skgd commands --engine godot --json
+    """
+    from .cli import detect_project_settings, get_template_source
+
+    dest = require_project_root()
+    lang, project_engine = detect_project_settings(dest)
+    engine = engine or project_engine
+    rows = compile_report(get_template_source(), lang, engine)
+    if as_json:
+        click.echo(json.dumps({"engine": engine, "lang": lang, "commands": rows}, indent=2))
+        return
+
+    width = max([len(r["command"]) for r in rows] + [7])
+    click.echo(f"  {'command':<{width}}  {'all':>9}  {engine:>9}  {'saved':>8}  {'tokens saved':>12}")
+    for r in sorted(rows, key=lambda r: r["saved_bytes"], reverse=True):
+        click.echo(f"  {r['command']:<{width}}  {r['all_engines_bytes']:>9}  {r['bytes']:>9}  "
+                   f"{r['saved_bytes']:>8}  {r['saved_tokens']:>12}")
+    saved = sum(r["saved_bytes"] for r in rows)
+    total = sum(r["all_engines_bytes"] for r in rows) or 1
+    click.echo(f"  {'total':<{width}}  {total:>9}  {total - saved:>9}  {saved:>8}  "
+               f"{sum(r['saved_tokens'] for r in rows):>12}  ({100 * saved / total:.1f}% smaller for {engine})")
@@ -0,0 +1,260 @@
+"""Copy engine - parallel file copies for project materialization.
+
+Template installs, upgrades and transaction staging copy hundreds of small
+files. The engine creates destination directories once, then runs the
+copies on a thread pool (file I/O releases the GIL). Each copy tries, in
+order:
+
+1. a reflink (``FICLONE``; Btrfs, XFS, APFS-style copy-on-write clones),
+2. ``os.copy_file_range`` (in-kernel copy, no user-space buffers),
+3. ``shutil.copyfile`` (sendfile or a buffered loop).
+
+A method the destination filesystem rejects is remembered per device and
+not tried again. Every run updates the process-wide ``STATS`` so callers
+can report files/s and bytes/s.
+"""
+
+import errno
+import os
+import shutil
+import stat
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Iterable, List, Optional, Set, Tuple
+
+from .trace import span
+
+# Linux FICLONE ioctl (_IOW(0x94, 9, int))
+FICLONE = 0x40049409
+
+# Batches smaller than this are copied inline; a pool costs more than it saves
+MIN_PARALLEL = 8
+
+# Errors meaning "this method is not supported here", not "the copy failed"
+_UNSUPPORTED_ERRNOS = {
+    errno.EXDEV, errno.EINVAL, errno.ENOSYS, errno.ENOTTY, errno.EBADF,
+    getattr(errno, "EOPNOTSUPP", errno.EINVAL), getattr(errno, "ENOTSUP", errno.EINVAL),
+}
+
+# Kernel copy methods available on this platform, in preference order
+_KERNEL_METHODS = tuple(
+    (["reflink"] if sys.platform.startswith("linux") else [])
+    + (["copy_file_range"] if hasattr(os, "copy_file_range") else [])
+)
+
+# (method, st_dev) pairs known not to work
+_unsupported: Set[Tuple[str, int]] = set()
+
+
+def default_jobs() -> int:
+    """Worker threads (SKGD_COPY_JOBS, else the ThreadPoolExecutor default)."""
+    env = os.environ.get("SKGD_COPY_JOBS", "")
+    if env.isdigit() and int(env) > 0:
+        return int(env)
+    return min(32, (os.cpu_count() or 1) + 4)
+
+
+class CopyStats:
+    """Thread-safe counters of copied files, bytes and wall time."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        self.files = 0
+        self.bytes = 0
+        self.seconds = 0.0
+        self.methods = {}
+
+    def add(self, size: int, method: str) -> None:
+        with self._lock:
+            self.files += 1
+            self.bytes += size
+            self.methods[method] = self.methods.get(method, 0) + 1
+
+    def add_time(self, seconds: float) -> None:
+        with self._lock:
+            self.seconds += seconds
+
+    def files_per_second(self) -> float:
+        return self.files / self.seconds if self.seconds else 0.0
+
+    def bytes_per_second(self) -> float:
+        return self.bytes / self.seconds if self.seconds else 0.0
+
+    def to_dict(self) -> dict:
+        return {"files": self.files, "bytes": self.bytes, "seconds": round(self.seconds, 4),
+                "files_per_second": round(self.files_per_second(), 1),
+                "bytes_per_second": round(self.bytes_per_second()),
+                "methods": dict(self.methods)}
+
+    def describe(self) -> str:
+        """One-line summary, e.g. "312 files, 1.4 MB (5200 files/s, 23.1 MB/s)"."""
+        return (f"{self.files} files, {human_size(self.bytes)} "
+                f"({self.files_per_second():.0f} files/s, {human_size(self.bytes_per_second())}/s)")
+
+
+# Process-wide totals, reset by callers that report them
+STATS = CopyStats()
+
+
+def human_size(size: float) -> str:
+    for unit in ("B", "KB", "MB", "GB"):
+        if size < 1024 or unit == "GB":
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GB"
+
+
+def _reflink(src_fd: int, dst_fd: int) -> None:
+    import fcntl
+
+    fcntl.ioctl(dst_fd, FICLONE, src_fd)
+
+
+def _copy_range(src_fd: int, dst_fd: int, size: int) -> bool:
+    """copy_file_range until size bytes are copied; False on an early EOF.
+
+    Some files (procfs, network mounts, a file shrinking mid-copy) report a
+    size copy_file_range cannot deliver; the caller falls back to copyfile
+    rather than keep a truncated copy.
+    """
+    remaining = size
+    while remaining > 0:
+        n = os.copy_file_range(src_fd, dst_fd, remaining)
+        if n == 0:
+            return False
+        remaining -= n
+    return True
+
+
+def _kernel_copy(src: Path, dst: Path, size: int) -> Optional[str]:
+    """Copy with a reflink or copy_file_range; None if neither applies."""
+    methods = _KERNEL_METHODS
+    if not methods:
+        return None
+
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        dev = os.fstat(fdst.fileno()).st_dev
+        for method in methods:
+            if (method, dev) in _unsupported:
+                continue
+            try:
+                if method == "reflink":
+                    _reflink(fsrc.fileno(), fdst.fileno())
+                elif not _copy_range(fsrc.fileno(), fdst.fileno(), size):
+                    # Stopped short: this file, not the device, is the problem
+                    fdst.truncate(0)
+                    return None
+                return method
+            except OSError as e:
+                if e.errno not in _UNSUPPORTED_ERRNOS:
+                    raise
+                _unsupported.add((method, dev))
+                fsrc.seek(0)
+                fdst.seek(0)
+                fdst.truncate()
+    return None
+
+
+def copy_file(src: Path, dst: Path, stats: CopyStats = STATS) -> int:
+    """Copy one file with its mode and timestamps (like shutil.copy2).
+
+    The destination directory must exist. Symlinks are recreated, not
+    followed. Returns the bytes copied.
+    """
+    st = os.lstat(src)
+    if stat.S_ISLNK(st.st_mode):
+        if os.path.lexists(dst):
+            os.unlink(dst)
+        os.symlink(os.readlink(src), dst)
+        stats.add(0, "symlink")
+        return 0
+    method = _kernel_copy(src, dst, st.st_size) if st.st_size else None
+    if method is None:
+        shutil.copyfile(src, dst)
+        method = "copyfile"
+    shutil.copystat(src, dst)
+    stats.add(st.st_size, method)
+    return st.st_size
+
+
+def _make_dirs(paths: Iterable[Path]) -> None:
+    for parent in sorted({p.parent for p in paths}):
+        parent.mkdir(parents=True, exist_ok=True)
+
+
+def run_parallel(func: Callable, items: List, jobs: Optional[int] = None,
+                 stats: CopyStats = STATS) -> None:
+    """Call func(item) for every item on a thread pool, timing the batch.
+
+    The first exception is re-raised after all submitted work finished.
+    """
+    start = time.perf_counter()
+    try:
+        jobs = jobs or default_jobs()
+        if jobs == 1 or len(items) < MIN_PARALLEL:
+            for item in items:
+                func(item)
+            return
+        with ThreadPoolExecutor(max_workers=min(jobs, len(items))) as pool:
+            for future in [pool.submit(func, item) for item in items]:
+                future.result()
+    finally:
+        stats.add_time(time.perf_counter() - start)
+
+
+def copy_files(pairs: Iterable[Tuple[Path, Path]], jobs: Optional[int] = None,
+               stats: CopyStats = STATS) -> None:
+    """Copy (src, dst) pairs in parallel, creating destination directories."""
+    pairs = list(pairs)
+    with span("copyengine.copy_files", files=len(pairs)):
+        _make_dirs(dst for _, dst in pairs)
+        run_parallel(lambda pair: copy_file(pair[0], pair[1], stats), pairs, jobs, stats)
+
+
+def write_files(items: Iterable[Tuple[Path, bytes, int]], jobs: Optional[int] = None,
+                stats: CopyStats = STATS) -> None:
+    """Write (dst, data, mode) items in parallel; mode 0 keeps the default."""
+    items = list(items)
+
+    def write(item):
+        dst, data, mode = item
+        with open(dst, "wb") as f:
+            f.write(data)
+        if mode:
+            os.chmod(dst, mode)
+        stats.add(len(data), "write")
+
+    with span("copyengine.write_files", files=len(items)):
+        _make_dirs(dst for dst, _, _ in items)
+        run_parallel(write, items, jobs, stats)
+
+
+def copy_tree(src: Path, dst: Path, ignore: Optional[Callable[[str], bool]] = None,
+              jobs: Optional[int] = None, stats: CopyStats = STATS) -> int:
+    """Copy a directory tree (symlinks preserved) in parallel.
+
+    ignore receives paths relative to src (posix) and prunes matches.
+    Returns the number of files copied.
+    """
+    pairs = []
+    for dirpath, dirs, names in os.walk(src):
+        rel_dir = Path(dirpath).relative_to(src)
+        target = dst / rel_dir
+        prefix = "" if rel_dir == Path(".") else rel_dir.as_posix() + "/"
+        if ignore:
+            dirs[:] = [d for d in dirs if not ignore(prefix + d)]
+            names = [n for n in names if not ignore(prefix + n)]
+        target.mkdir(parents=True, exist_ok=True)
+        for d in dirs:
+            if os.path.islink(os.path.join(dirpath, d)):
+                names.append(d)
+        dirs[:] = [d for d in dirs if not os.path.islink(os.path.join(dirpath, d))]
+        pairs.extend((Path(dirpath) / n, target / n) for n in names)
+    copy_files(pairs, jobs, stats)
+    return len(pairs)
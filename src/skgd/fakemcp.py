@@ -0,0 +1,387 @@
+"""Stand-in Unity MCP / GDAI MCP server for offline runs.
+
+Speaks MCP over stdio (newline-delimited JSON-RPC 2.0) and implements the
+tools the slash commands and skills call (``mcp__UnityMCP__*`` and
+``mcp__gdai__*``) against a small in-memory editor: objects created with
+``manage_gameobject``/``add_node`` show up in the hierarchy, play mode
+toggles, scripts validate. Latency, jitter and an error rate can be
+injected, so ``skgd mcp bench`` and the commands' MCP usage can be
+exercised without an editor::
+
+    python -m skgd.fakemcp --engine unity --latency 20
+    claude mcp add UnityMCP -- skgd mcp fake --engine unity
+"""
+
+import json
+import random
+import sys
+import time
+from typing import Callable, Dict, Optional, Tuple
+
+PROTOCOL_VERSION = "2024-11-05"
+ENGINES = ("unity", "godot")
+
+
+class ToolError(Exception):
+    """Tool-level failure, returned as a result with isError set."""
+
+
+class Editor:
+    """In-memory editor state shared by the tools of one server."""
+
+    def __init__(self, engine: str):
+        self.engine = engine
+        self.playing = False
+        self.paused = False
+        self.scene = "Assets/Scenes/Main.unity" if engine == "unity" else "res://main.tscn"
+        self.objects: Dict[str, dict] = {"Main Camera": {"components": ["Transform", "Camera"]},
+                                         "Directional Light": {"components": ["Transform", "Light"]}}
+        if engine == "godot":
+            self.objects = {"Main": {"type": "Node2D", "parent": None, "properties": {}}}
+        self.scripts: Dict[str, str] = {}
+        self.assets: Dict[str, dict] = {}
+        self.console: list = []
+
+    def log(self, kind: str, message: str) -> None:
+        self.console.append({"type": kind, "message": message})
+
+
+def _action(args: dict, *allowed: str) -> str:
+    action = args.get("action")
+    if action not in allowed:
+        raise ToolError(f"Unknown action {action!r} (expected one of: {', '.join(allowed)})")
+    return action
+
+
+def _name(args: dict, *keys: str) -> str:
+    for key in keys:
+        if args.get(key):
+            return str(args[key])
+    raise ToolError(f"Missing required argument: {keys[0]}")
+
+
+# --- Unity MCP ---------------------------------------------------------------
+
+def unity_manage_editor(ed: Editor, args: dict):
+    action = _action(args, "get_state", "play", "pause", "stop", "get_project_root", "get_tags", "get_layers")
+    if action == "play":
+        ed.playing, ed.paused = True, False
+    elif action == "pause":
+        ed.paused = ed.playing and not ed.paused
+    elif action == "stop":
+        ed.playing = ed.paused = False
+    elif action == "get_project_root":
+        return {"projectRoot": "/fake/UnityProject"}
+    elif action == "get_tags":
+        return {"tags": ["Untagged", "Player", "MainCamera", "EditorOnly"]}
+    elif action == "get_layers":
+        return {"layers": ["Default", "UI", "Water"]}
+    return {"isPlaying": ed.playing, "isPaused": ed.paused, "isCompiling": False,
+            "activeScene": ed.scene, "unityVersion": "2022.3.0f1 (fake)"}
+
+
+def unity_manage_scene(ed: Editor, args: dict):
+    action = _action(args, "get_active", "get_hierarchy", "save", "create", "load", "get_build_settings")
+    if action in ("create", "load"):
+        path = args.get("path") or "Assets/Scenes"
+        ed.scene = f"{path.rstrip('/')}/{_name(args, 'name')}.unity"
+        if action == "create":
+            ed.objects = {"Main Camera": {"components": ["Transform", "Camera"]}}
+    elif action == "get_hierarchy":
+        return {"scene": ed.scene, "objects": [{"name": name, "components": obj.get("components", [])}
+                                               for name, obj in ed.objects.items()]}
+    elif action == "get_build_settings":
+        return {"scenes": [{"path": ed.scene, "enabled": True}]}
+    return {"scene": ed.scene, "saved": action == "save", "rootCount": len(ed.objects)}
+
+
+def unity_manage_gameobject(ed: Editor, args: dict):
+    action = _action(args, "create", "modify", "delete", "find", "get_components", "add_component",
+                     "remove_component", "set_component_property")
+    if action == "find":
+        term = str(args.get("search_term") or args.get("name") or "")
+        return {"found": [name for name in ed.objects if term.lower() in name.lower()]}
+    name = _name(args, "name", "target")
+    if action == "create":
+        components = ["Transform"] + list(args.get("components_to_add") or [])
+        ed.objects[name] = {"components": components, "position": args.get("position") or [0, 0, 0]}
+        return {"created": name, "instanceID": 10000 + len(ed.objects)}
+    if name not in ed.objects:
+        raise ToolError(f"GameObject '{name}' not found")
+    obj = ed.objects[name]
+    if action == "delete":
+        del ed.objects[name]
+        return {"deleted": name}
+    if action == "add_component":
+        obj["components"] += list(args.get("components_to_add") or [args.get("component_name")])
+    elif action == "remove_component":
+        obj["components"] = [c for c in obj["components"] if c not in (args.get("components_to_remove") or [])]
+    elif action in ("modify", "set_component_property"):
+        obj.update({k: v for k, v in args.items() if k not in ("action", "name", "target")})
+    return {"name": name, "components": obj["components"]}
+
+
+def unity_manage_asset(ed: Editor, args: dict):
+    action = _action(args, "search", "get_info", "create", "modify", "delete", "import",
+                     "create_folder", "move", "duplicate")
+    if action == "search":
+        pattern = str(args.get("search_pattern") or args.get("path") or "")
+        return {"assets": [path for path in ed.assets if pattern.strip("*") in path]}
+    path = _name(args, "path")
+    if action in ("create", "import", "create_folder"):
+        ed.assets[path] = {"type": args.get("asset_type") or "Folder"}
+        return {"path": path, "created": True}
+    if path not in ed.assets:
+        raise ToolError(f"Asset not found: {path}")
+    if action == "delete":
+        del ed.assets[path]
+        return {"path": path, "deleted": True}
+    return {"path": path, **ed.assets[path]}
+
+
+def unity_manage_prefabs(ed: Editor, args: dict):
+    action = _action(args, "create", "open_stage", "save_open_stage", "close_stage", "create_from_gameobject")
+    path = args.get("prefab_path") or args.get("path")
+    if action.startswith("create"):
+        target = _name(args, "target", "name")
+        if target not in ed.objects:
+            raise ToolError(f"GameObject '{target}' not found")
+        path = path or f"Assets/Prefabs/{target}.prefab"
+        ed.assets[path] = {"type": "Prefab", "source": target}
+    return {"action": action, "prefab": path}
+
+
+def unity_read_console(ed: Editor, args: dict):
+    if args.get("action") == "clear":
+        ed.console.clear()
+        return {"cleared": True}
+    types = args.get("types") or ["error", "warning", "log"]
+    entries = [e for e in ed.console if e["type"] in types]
+    return {"entries": entries[-int(args.get("count") or 50):], "total": len(entries)}
+
+
+def unity_run_tests(ed: Editor, args: dict):
+    mode = args.get("mode") or args.get("test_mode") or "EditMode"
+    count = 3 + len(ed.scripts)
+    return {"mode": mode, "passed": count, "failed": 0, "skipped": 0, "durationSeconds": 0.4}
+
+
+def unity_script(ed: Editor, args: dict):
+    name = _name(args, "name", "path", "uri")
+    if args.get("action") == "read":
+        if name not in ed.scripts:
+            raise ToolError(f"Script not found: {name}")
+        return {"path": name, "contents": ed.scripts[name]}
+    ed.scripts[name] = args.get("contents") or ed.scripts.get(name) or f"public class {name} {{ }}\n"
+    return {"path": name, "written": True}
+
+
+def unity_validate_script(ed: Editor, args: dict):
+    name = _name(args, "name", "path", "uri")
+    if name not in ed.scripts:
+        raise ToolError(f"Script not found: {name}")
+    return {"path": name, "diagnostics": [], "errors": 0, "warnings": 0}
+
+
+# --- GDAI MCP ------------------------------------------------------------------
+
+def godot_project_info(ed: Editor, args: dict):
+    return {"name": "FakeGodotProject", "godotVersion": "4.3.stable (fake)", "mainScene": ed.scene,
+            "openScene": ed.scene, "running": ed.playing}
+
+
+def godot_errors(ed: Editor, args: dict):
+    return {"errors": [e["message"] for e in ed.console if e["type"] == "error"]}
+
+
+def godot_create_scene(ed: Editor, args: dict):
+    ed.scene = _name(args, "scene_path", "path")
+    ed.objects = {args.get("root_node_name") or "Root": {"type": args.get("root_node_type") or "Node2D",
+                                                         "parent": None, "properties": {}}}
+    return {"scene": ed.scene, "created": True}
+
+
+def godot_open_scene(ed: Editor, args: dict):
+    ed.scene = _name(args, "scene_path", "path")
+    return {"scene": ed.scene, "opened": True}
+
+
+def godot_play(ed: Editor, args: dict):
+    ed.playing = True
+    return {"running": True, "scene": ed.scene}
+
+
+def godot_stop(ed: Editor, args: dict):
+    ed.playing = False
+    return {"running": False}
+
+
+def godot_screenshot(ed: Editor, args: dict):
+    if not ed.playing:
+        raise ToolError("No scene is running")
+    return {"screenshot": "fake-screenshot.png", "width": 1152, "height": 648}
+
+
+def godot_add_node(ed: Editor, args: dict):
+    name = _name(args, "node_name", "name")
+    parent = args.get("parent_node_path") or args.get("parent") or "."
+    ed.objects[name] = {"type": args.get("node_type") or "Node", "parent": parent, "properties": {}}
+    return {"node": name, "type": ed.objects[name]["type"], "parent": parent}
+
+
+def godot_update_property(ed: Editor, args: dict):
+    name = _name(args, "node_path", "node_name").rsplit("/", 1)[-1]
+    if name not in ed.objects:
+        raise ToolError(f"Node not found: {name}")
+    ed.objects[name]["properties"][_name(args, "property")] = args.get("value")
+    return {"node": name, "properties": ed.objects[name]["properties"]}
+
+
+def godot_create_script(ed: Editor, args: dict):
+    path = _name(args, "script_path", "path")
+    ed.scripts[path] = args.get("content") or "extends Node\n"
+    return {"script": path, "created": True}
+
+
+def godot_attach_script(ed: Editor, args: dict):
+    name = _name(args, "node_path", "node_name").rsplit("/", 1)[-1]
+    script = _name(args, "script_path", "path")
+    if name not in ed.objects:
+        raise ToolError(f"Node not found: {name}")
+    if script not in ed.scripts:
+        raise ToolError(f"Script not found: {script}")
+    ed.objects[name]["script"] = script
+    return {"node": name, "script": script}
+
+
+Handler = Callable[[Editor, dict], dict]
+
+# Tool name -> (description, read-only, handler)
+TOOLS: Dict[str, Dict[str, Tuple[str, bool, Handler]]] = {
+    "unity": {
+        "manage_editor": ("Editor state and play mode (get_state, play, pause, stop)", False, unity_manage_editor),
+        "manage_scene": ("Scenes (get_active, get_hierarchy, save, create, load)", False, unity_manage_scene),
+        "manage_gameobject": ("GameObjects (create, modify, delete, find, components)", False,
+                              unity_manage_gameobject),
+        "manage_asset": ("Assets (search, get_info, create, modify, delete, import)", False, unity_manage_asset),
+        "manage_prefabs": ("Prefabs (create, open_stage, save_open_stage, close_stage)", False,
+                           unity_manage_prefabs),
+        "read_console": ("Read or clear the Unity console", False, unity_read_console),
+        "run_tests": ("Run EditMode or PlayMode tests", True, unity_run_tests),
+        "create_script": ("Create a C# script", False, unity_script),
+        "manage_script": ("Create, read or update a C# script", False, unity_script),
+        "apply_text_edits": ("Apply text edits to a script", False, unity_script),
+        "script_apply_edits": ("Apply structured edits to a script", False, unity_script),
+        "validate_script": ("Compile-check a script", True, unity_validate_script),
+    },
+    "godot": {
+        "get_project_info": ("Project name, Godot version, main scene", True, godot_project_info),
+        "get_godot_errors": ("Current editor and runtime errors", True, godot_errors),
+        "create_scene": ("Create a scene with a root node", False, godot_create_scene),
+        "open_scene": ("Open a scene in the editor", False, godot_open_scene),
+        "play_scene": ("Run the current scene", False, godot_play),
+        "stop_running_scene": ("Stop the running scene", False, godot_stop),
+        "get_running_scene_screenshot": ("Screenshot of the running scene", True, godot_screenshot),
+        "add_node": ("Add a node to the open scene", False, godot_add_node),
+        "update_property": ("Set a property of a node", False, godot_update_property),
+        "create_script": ("Create a GDScript file", False, godot_create_script),
+        "attach_script": ("Attach a script to a node", False, godot_attach_script),
+    },
+}
+
+
+class FakeServer:
+    """JSON-RPC message handling for one fake engine MCP server."""
+
+    def __init__(self, engine: str, latency_ms: float = 0.0, jitter_ms: float = 0.0,
+                 error_rate: float = 0.0, seed: Optional[int] = None):
+        self.engine = engine
+        self.tools = TOOLS[engine]
+        self.editor = Editor(engine)
+        self.latency = latency_ms / 1000
+        self.jitter = jitter_ms / 1000
+        self.error_rate = error_rate
+        self.random = random.Random(seed)
+
+    def tool_list(self) -> list:
+        return [{"name": name, "description": description,
+                 "inputSchema": {"type": "object", "additionalProperties": True},
+                 "annotations": {"readOnlyHint": read_only}}
+                for name, (description, read_only, _) in self.tools.items()]
+
+    def call_tool(self, params: dict) -> dict:
+        name = params.get("name")
+        if name not in self.tools:
+            raise KeyError(name)
+        delay = self.latency + self.random.uniform(-self.jitter, self.jitter)
+        if delay > 0:
+            time.sleep(delay)
+        try:
+            if self.error_rate and self.random.random() < self.error_rate:
+                raise ToolError(f"Simulated {self.engine} editor failure")
+            payload = self.tools[name][2](self.editor, params.get("arguments") or {})
+        except ToolError as e:
+            return {"content": [{"type": "text", "text": str(e)}], "isError": True}
+        return {"content": [{"type": "text", "text": json.dumps(payload)}], "isError": False}
+
+    def handle(self, message: dict) -> Optional[dict]:
+        """Response to one message (None for notifications and responses)."""
+        if "method" not in message or "id" not in message:
+            return None
+        method, params = message["method"], message.get("params") or {}
+        response = {"jsonrpc": "2.0", "id": message["id"]}
+        if method == "initialize":
+            response["result"] = {
+                "protocolVersion": params.get("protocolVersion") or PROTOCOL_VERSION,
+                "capabilities": {"tools": {"listChanged": False}},
+                "serverInfo": {"name": f"skgd-fake-{self.engine}", "version": "1.0"},
+            }
+        elif method == "ping":
+            response["result"] = {}
+        elif method == "tools/list":
+            response["result"] = {"tools": self.tool_list()}
+        elif method == "tools/call":
+            try:
+                response["result"] = self.call_tool(params)
+            except KeyError:
+                response["error"] = {"code": -32602, "message": f"Unknown tool: {params.get('name')}"}
+        else:
+            response["error"] = {"code": -32601, "message": f"Method not found: {method}"}
+        return response
+
+    def serve(self, stdin=None, stdout=None) -> None:
+        """Answer newline-delimited JSON-RPC messages until stdin closes."""
+        stdin = stdin or sys.stdin.buffer
+        stdout = stdout or sys.stdout.buffer
+        for line in stdin:
+            if not line.strip():
+                continue
+            try:
+                message = json.loads(line)
+            except ValueError:
+                reply = {"jsonrpc": "2.0", "id": None, "error": {"code": -32700, "message": "Parse error"}}
+            else:
+                reply = self.handle(message) if isinstance(message, dict) else None
+            if reply is not None:
+                stdout.write(json.dumps(reply).encode("utf-8") + b"\n")
+                stdout.flush()
+
+
+def main(argv=None) -> None:
+    import argparse
+
+    parser = argparse.ArgumentParser(prog="python -m skgd.fakemcp", description=__doc__.split("\n\n")[0])
+    parser.add_argument("--engine", choices=ENGINES, default="unity")
+    parser.add_argument("--latency", type=float, default=0.0, help="Mean tool call latency in ms")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Latency jitter (+/- ms)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of tool calls that fail")
+    parser.add_argument("--seed", type=int, help="Random seed for jitter and errors")
+    args = parser.parse_args(argv)
+    try:
+        FakeServer(args.engine, args.latency, args.jitter, args.error_rate, args.seed).serve()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
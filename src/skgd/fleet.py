@@ -0,0 +1,211 @@
+"""Fleet mode - inspect or upgrade many SKGD projects under one root.
+
+Projects are discovered with ``detect_existing_project`` and processed in a
+process pool. Each project runs in isolation: a failure is reported in the
+combined table and never aborts the others.
+"""
+
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import List, Optional
+
+import click
+
+from .cli import (
+    SKGD_VERSION,
+    detect_existing_project,
+    detect_project_settings,
+    pending_template_changes,
+    perform_upgrade,
+)
+from .copyengine import human_size
+
+
+# Directories never worth descending into (VCS, engine caches, build output)
+SKIP_DIRS = {
+    ".git", ".hg", ".svn", ".godot", ".import", ".venv", "venv",
+    "node_modules", "__pycache__", "Library", "Temp", "Logs", "obj",
+    "Build", "Builds", "UserSettings", ".skgd-txn",
+}
+
+
+def discover_projects(root: Path, max_depth: int = 6) -> List[Path]:
+    """Find SKGD projects (directories holding a .skgd/ folder) under root.
+
+    Does not descend into a project once found.
+    """
+    projects = []
+    stack = [(root, 0)]
+    while stack:
+        path, depth = stack.pop()
+        if (path / ".skgd").is_dir():
+            projects.append(path)
+            continue
+        if depth >= max_depth:
+            continue
+        try:
+            entries = list(os.scandir(path))
+        except OSError:
+            continue
+        for entry in entries:
+            if entry.name in SKIP_DIRS or entry.name.startswith("."):
+                continue
+            if entry.is_dir(follow_symlinks=False):
+                stack.append((Path(entry.path), depth + 1))
+    return sorted(projects)
+
+
+def scan_one(dest: Path) -> dict:
+    """Inspect one project (runs in a worker process)."""
+    start = time.perf_counter()
+    result = {"path": str(dest), "version": None, "outcome": "", "error": None}
+    try:
+        existing = detect_existing_project(dest)
+        lang, engine = detect_project_settings(dest)
+        result.update(version=existing.get("version"), lang=lang, engine=engine,
+                      specs=existing.get("specs_count", 0))
+        if existing.get("has_v3_templates") and existing.get("version") == SKGD_VERSION:
+            pending = pending_template_changes(dest, lang)
+            result["outcome"] = f"{pending} files outdated" if pending else "up to date"
+        else:
+            result["outcome"] = "upgrade available"
+    except Exception as e:
+        result["outcome"] = "error"
+        result["error"] = str(e)
+    result["seconds"] = time.perf_counter() - start
+    return result
+
+
+def upgrade_one(dest: Path, lang: Optional[str] = None, dry_run: bool = False) -> dict:
+    """Upgrade one project non-interactively (runs in a worker process)."""
+    from .copyengine import STATS as COPY_STATS
+    from .transaction import Transaction
+
+    start = time.perf_counter()
+    result = {"path": str(dest), "version": None, "outcome": "", "error": None}
+    COPY_STATS.reset()
+    try:
+        existing = detect_existing_project(dest)
+        result["version"] = existing.get("version")
+        detected_lang, engine = detect_project_settings(dest)
+        lang = lang or detected_lang
+        if (existing["has_v3_templates"] and existing["version"] == SKGD_VERSION
+                and not pending_template_changes(dest, lang)):
+            result["outcome"] = "up to date"
+        else:
+            with Transaction(dest, dry_run=dry_run) as txn:
+                stats = perform_upgrade(txn.root, existing, lang, engine)
+                if dry_run:
+                    result["outcome"] = f"would change {len(txn.plan())} files"
+            if not dry_run:
+                written = stats["commands_updated"] + stats.get("data_updated", 0)
+                result["outcome"] = f"upgraded to v{SKGD_VERSION} ({written} files)"
+    except Exception as e:
+        result["outcome"] = "error"
+        result["error"] = str(e)
+    result["seconds"] = time.perf_counter() - start
+    result["copied"] = {"files": COPY_STATS.files, "bytes": COPY_STATS.bytes}
+    return result
+
+
+def run_fleet(worker, projects: List[Path], jobs: Optional[int] = None, **kwargs) -> List[dict]:
+    """Run worker over projects in a process pool, preserving input order."""
+    jobs = jobs or os.cpu_count() or 1
+    if jobs == 1 or len(projects) <= 1:
+        return [worker(p, **kwargs) for p in projects]
+    with ProcessPoolExecutor(max_workers=min(jobs, len(projects))) as pool:
+        futures = [pool.submit(worker, p, **kwargs) for p in projects]
+        results = []
+        for project, future in zip(projects, futures):
+            try:
+                results.append(future.result())
+            except Exception as e:  # worker process died
+                results.append({"path": str(project), "version": None,
+                                "outcome": "error", "error": str(e), "seconds": 0.0})
+        return results
+
+
+def print_report(results: List[dict], root: Path, elapsed: float) -> None:
+    """Print the combined per-project report."""
+    width = max([len(_display_path(r["path"], root)) for r in results] + [7])
+    click.echo()
+    click.secho(f"  {'Project':<{width}}  {'Version':<8}  {'Time':>7}  Outcome", bold=True)
+    click.echo(f"  {'-' * width}  {'-' * 8}  {'-' * 7}  {'-' * 24}")
+    for r in results:
+        color = "red" if r["error"] else ("green" if r["outcome"] == "up to date" else "yellow")
+        outcome = f"error: {r['error'].splitlines()[0]}" if r["error"] else r["outcome"]
+        click.echo(
+            f"  {_display_path(r['path'], root):<{width}}  {str(r['version'] or '-'):<8}  "
+            f"{r['seconds']:>6.2f}s  " + click.style(outcome, fg=color)
+        )
+    failed = sum(1 for r in results if r["error"])
+    click.echo()
+    click.echo(f"  {len(results)} projects, {failed} failed, {elapsed:.2f}s total")
+    copied = [r["copied"] for r in results if r.get("copied")]
+    files = sum(c["files"] for c in copied)
+    if files:
+        size = sum(c["bytes"] for c in copied)
+        click.secho(f"  Copied {files} files, {human_size(size)} "
+                    f"({files / elapsed:.0f} files/s, {human_size(size / elapsed)}/s)", dim=True)
+    click.echo()
+
+
+def _display_path(path: str, root: Path) -> str:
+    try:
+        rel = Path(path).relative_to(root).as_posix()
+    except ValueError:
+        return path
+    return rel if rel != "." else root.name
+
+
+def upgrade_fleet(root: Path, lang: Optional[str], no_interactive: bool, jobs: Optional[int],
+                  dry_run: bool = False) -> None:
+    """Upgrade every project under root in parallel and print a report."""
+    projects = discover_projects(root)
+    if not projects:
+        click.secho(f"No SKGD projects found under {root}", fg="yellow")
+        sys.exit(0)
+
+    click.echo(f"Found {len(projects)} SKGD projects under {root}")
+    if not no_interactive and not dry_run:
+        import questionary
+        if not questionary.confirm(f"Upgrade all to v{SKGD_VERSION}?", default=True).ask():
+            click.echo("Upgrade cancelled.")
+            sys.exit(0)
+
+    start = time.perf_counter()
+    results = run_fleet(upgrade_one, projects, jobs, lang=lang, dry_run=dry_run)
+    print_report(results, root, time.perf_counter() - start)
+    if any(r["error"] for r in results):
+        sys.exit(1)
+
+
+@click.command()
+@click.argument("root", required=False, type=click.Path(exists=True, file_okay=False))
+@click.option(
+    "--jobs", "-j",
+    type=click.IntRange(min=1),
+    help="Parallel workers (default: CPU count)"
+)
+def scan(root: Optional[str], jobs: Optional[int]):
+    """Inspect every SKGD project under ROOT (default: current directory).
+
+    Reports each project's version and whether an upgrade is pending,
+    without modifying anything.
+
+    Examples:
+        skgd scan                 # Scan below the current directory
+        skgd scan ~/games -j 8    # Scan with 8 workers
+    """
+    root_path = Path(root or Path.cwd()).resolve()
+    projects = discover_projects(root_path)
+    if not projects:
+        click.secho(f"No SKGD projects found under {root_path}", fg="yellow")
+        return
+
+    start = time.perf_counter()
+    results = run_fleet(scan_one, projects, jobs)
+    print_report(results, root_path, time.perf_counter() - start)
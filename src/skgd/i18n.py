@@ -0,0 +1,235 @@
+"""Message catalogs - one source of user-facing text for the CLI and commands.
+
+``messages.yaml`` holds every language side by side (``en:``, ``fr:``).
+It is compiled into one flat ``{"dotted.key": text}`` table per language,
+so a lookup is a dict access and only the languages actually used are
+loaded: the requested one first, English only when a key is missing.
+
+The CLI reads the catalog shipped with the package templates. Workflow
+commands fetch strings with ``skgd msg <key>`` instead of loading the whole
+YAML into context; that reads the project's ``.skgd/i18n/messages.yaml``,
+whose compiled tables are cached in ``.skgd/cache/i18n/<lang>.json`` and
+recompiled when the source hash changes. Keys missing from an older
+project file fall back to the package catalog.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+import click
+
+MESSAGES_FILE = ".skgd/i18n/messages.yaml"
+TEMPLATE_MESSAGES = "en/skgd/i18n/messages.yaml"
+CACHE_DIR = ".skgd/cache/i18n"
+DEFAULT_LANG = "en"
+
+
+def flatten(data: dict, prefix: str = "") -> Dict[str, str]:
+    """Nested sections -> {"section.key": text}."""
+    flat = {}
+    for key, value in data.items():
+        name = f"{prefix}{key}"
+        if isinstance(value, dict):
+            flat.update(flatten(value, name + "."))
+        elif value is not None:
+            flat[name] = str(value)
+    return flat
+
+
+def compile_messages(data: bytes) -> Dict[str, Dict[str, str]]:
+    """Parse messages.yaml into {lang: {dotted key: text}}."""
+    import yaml
+
+    doc = yaml.safe_load(data) or {}
+    if not isinstance(doc, dict):
+        raise ValueError("messages.yaml must map languages to messages")
+    return {lang: flatten(section) for lang, section in doc.items() if isinstance(section, dict)}
+
+
+class Catalog:
+    """Compiled messages of one messages.yaml, loaded a language at a time.
+
+    With a cache_dir, each language's table is stored as JSON tagged with
+    the source SHA-256 and reused until the source changes.
+    """
+
+    def __init__(self, read_source: Callable[[], bytes], cache_dir: Optional[Path] = None):
+        self._read_source = read_source
+        self._cache_dir = cache_dir
+        self._source_sha: Optional[str] = None
+        self._compiled: Optional[Dict[str, Dict[str, str]]] = None
+        self._langs: Dict[str, Dict[str, str]] = {}
+
+    def _sha(self) -> str:
+        if self._source_sha is None:
+            self._source_sha = hashlib.sha256(self._read_source()).hexdigest()
+        return self._source_sha
+
+    def _compile(self) -> Dict[str, Dict[str, str]]:
+        if self._compiled is None:
+            data = self._read_source()
+            self._source_sha = hashlib.sha256(data).hexdigest()
+            self._compiled = compile_messages(data)
+            if self._cache_dir is not None:
+                self._save()
+        return self._compiled
+
+    def _save(self) -> None:
+        try:
+            self._cache_dir.mkdir(parents=True, exist_ok=True)
+            for lang, messages in self._compiled.items():
+                path = self._cache_dir / f"{lang}.json"
+                tmp = path.with_name(path.name + ".tmp")
+                with open(tmp, "w", encoding="utf-8") as f:
+                    json.dump({"source": self._source_sha, "messages": messages}, f,
+                              ensure_ascii=False, separators=(",", ":"))
+                os.replace(tmp, path)
+        except OSError:
+            pass  # Read-only project: compile again next time
+
+    def _load_cached(self, lang: str) -> Optional[Dict[str, str]]:
+        if self._cache_dir is None:
+            return None
+        try:
+            with open(self._cache_dir / f"{lang}.json", "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if data.get("source") != self._sha():
+            return None
+        return data.get("messages") or {}
+
+    def messages(self, lang: str) -> Dict[str, str]:
+        """All messages of one language ({} if the catalog lacks it)."""
+        if lang not in self._langs:
+            cached = None if self._compiled is not None else self._load_cached(lang)
+            self._langs[lang] = cached if cached is not None else self._compile().get(lang, {})
+        return self._langs[lang]
+
+    def get(self, key: str, lang: str) -> Optional[str]:
+        """Text for key in lang, falling back to English."""
+        text = self.messages(lang).get(key)
+        if text is None and lang != DEFAULT_LANG:
+            text = self.messages(DEFAULT_LANG).get(key)
+        return text
+
+    def section(self, prefix: str, lang: str) -> Dict[str, str]:
+        """Messages under a section ("playtest" -> {"passed": ..., ...})."""
+        found = {}
+        langs = [DEFAULT_LANG, lang] if lang != DEFAULT_LANG else [lang]
+        for name in langs:
+            for key, text in self.messages(name).items():
+                if key.startswith(prefix + "."):
+                    found[key[len(prefix) + 1:]] = text
+        return found
+
+
+_package_catalog: Optional[Catalog] = None
+
+
+def package_catalog() -> Catalog:
+    """Catalog shipped with the installed templates (compiled in memory)."""
+    global _package_catalog
+    if _package_catalog is None:
+        from .cli import get_template_source
+
+        _package_catalog = Catalog(lambda: get_template_source().read_bytes(TEMPLATE_MESSAGES))
+    return _package_catalog
+
+
+def project_catalog(dest: Path) -> Optional[Catalog]:
+    """Catalog of a project's messages.yaml, or None if it has none."""
+    source = dest / MESSAGES_FILE
+    if not source.is_file():
+        return None
+    return Catalog(source.read_bytes, dest / CACHE_DIR)
+
+
+class _Placeholders(dict):
+    def __missing__(self, key):
+        return "{" + key + "}"
+
+
+def t(key: str, lang: str = DEFAULT_LANG, **values) -> str:
+    """CLI text for key from the package catalog, formatted with values."""
+    text = package_catalog().get(key, lang)
+    if text is None:
+        raise KeyError(key)
+    return text.format_map(_Placeholders(values)) if values else text
+
+
+def lookup(key: str, lang: str, catalogs: List[Catalog]) -> Tuple[Optional[str], Dict[str, str]]:
+    """(text, {}) for a message key, or (None, section) for a section prefix."""
+    for catalog in catalogs:
+        text = catalog.get(key, lang)
+        if text is not None:
+            return text, {}
+    section: Dict[str, str] = {}
+    for catalog in reversed(catalogs):
+        section.update(catalog.section(key, lang))
+    return None, section
+
+
+@click.command()
+@click.argument("keys", nargs=-1, required=True)
+@click.option("--lang", "-l", help="Language (default: the project's user.language)")
+@click.option("--set", "-s", "values", multiple=True, metavar="NAME=VALUE",
+              help="Fill a {placeholder} in the text (repeatable)")
+@click.option("--json", "as_json", is_flag=True, help="Print {key: text} as JSON")
+def msg(keys: Tuple[str, ...], lang: Optional[str], values: Tuple[str, ...], as_json: bool):
+    """Print user-facing text from the message catalog.
+
+    KEY is a dotted key (playtest.passed) or a section (playtest), which
+    prints every message in it as "key: text" lines. Reads the project's
+    .skgd/i18n/messages.yaml in the project language, falling back to
+    English and then to the messages shipped with skgd.
+
+    Examples:
+        skgd msg implement.complete
+        skgd msg playtest --lang fr
+        skgd msg cli.resume --set command=/continue
+    """
+    from .cli import detect_project_settings, find_project_root
+
+    dest = find_project_root()
+    catalogs = [package_catalog()]
+    if dest is not None:
+        lang = lang or detect_project_settings(dest)[0]
+        project = project_catalog(dest)
+        if project is not None:
+            catalogs.insert(0, project)
+    lang = lang or DEFAULT_LANG
+
+    fill = {}
+    for item in values:
+        name, sep, value = item.partition("=")
+        if not sep:
+            raise click.BadParameter(f"expected NAME=VALUE, got {item!r}", param_hint="--set")
+        fill[name] = value
+
+    found: Dict[str, str] = {}
+    for key in keys:
+        text, section = lookup(key, lang, catalogs)
+        if text is not None:
+            found[key] = text
+        elif section:
+            found.update((f"{key}.{sub}", text) for sub, text in section.items())
+        else:
+            raise click.ClickException(f"Unknown message key: {key}")
+    if fill:
+        found = {key: text.format_map(_Placeholders(fill)) for key, text in found.items()}
+
+    if as_json:
+        click.echo(json.dumps(found, indent=2, ensure_ascii=False))
+    elif len(keys) == 1 and keys[0] in found:
+        click.echo(found[keys[0]].rstrip("\n"))
+    else:
+        for key, text in found.items():
+            text = text.rstrip("\n")
+            if "\n" in text:
+                click.echo(f"{key}: |\n" + "\n".join("  " + line for line in text.splitlines()))
+            else:
+                click.echo(f"{key}: {text}")
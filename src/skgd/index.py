@@ -0,0 +1,377 @@
+"""Project index - SQLite index of specs, tasks and acceptance criteria.
+
+Every workflow command needs the same facts: which features exist, how many
+tasks each has, which ``- [ ] T0xx`` lines are still open, which tasks are
+``[MVP]``/``[POLISH]``/``[P]``/``[US1]``. The index parses
+``docs/specs/*/{spec,plan,tasks}.md`` and the project state once and
+stores the result in ``.skgd/cache/index.db``. Files are only reparsed when
+their mtime/size changed *and* their content hash differs.
+"""
+
+import hashlib
+import json
+import re
+import sqlite3
+import time
+from pathlib import Path
+from typing import List, Optional
+
+import click
+
+from .cli import LazyGroup, require_project_root
+
+
+INDEX_FILE = "index.db"
+SCHEMA_VERSION = 1
+SPEC_FILES = ("spec.md", "plan.md", "tasks.md")
+STATE_FILES = (".skgd/state.yaml", ".skgd/state.journal")
+
+TASK_RE = re.compile(r"^\s*[-*]\s+\[([ xX])\]\s+(T\d+|T0XX)\b\s*(.*)$")
+TAG_RE = re.compile(r"^\[([^\]]+)\]\s*")
+CRITERION_RE = re.compile(r"^\s*[-*]\s+\[([ xX])\]\s+(AC-?\d+)\s*:\s*(.*)$")
+CRITERION_ROW_RE = re.compile(r"^\s*\|\s*(AC-?\d+)\s*\|\s*([^|]*)\|")
+PHASE_RE = re.compile(r"^##\s+(Phase\s+[^:]+?)\s*:\s*(.*)$", re.IGNORECASE)
+POLISH_WORDS = ("polish", "finition")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY, mtime_ns INTEGER, size INTEGER, sha256 TEXT
+);
+CREATE TABLE IF NOT EXISTS tasks (
+    feature TEXT, task_id TEXT, phase TEXT, description TEXT,
+    checked INTEGER, tags TEXT, tier TEXT, line INTEGER,
+    PRIMARY KEY (feature, line)
+);
+CREATE TABLE IF NOT EXISTS criteria (
+    feature TEXT, file TEXT, ac_id TEXT, description TEXT,
+    checked INTEGER, line INTEGER,
+    PRIMARY KEY (feature, file, line)
+);
+CREATE TABLE IF NOT EXISTS state (key TEXT PRIMARY KEY, value TEXT);
+CREATE INDEX IF NOT EXISTS tasks_open ON tasks (feature, checked);
+"""
+
+
+def parse_tasks(text: str) -> List[dict]:
+    """Parse checkbox task lines of a tasks.md.
+
+    Returns dicts with task_id, phase, description, checked, tags, tier, line.
+    Tier is "mvp" or "polish" from an explicit [MVP]/[POLISH] tag, "polish"
+    for tasks in a Polish phase, and "core" otherwise.
+    """
+    tasks = []
+    phase = ""
+    for lineno, line in enumerate(text.splitlines(), 1):
+        heading = PHASE_RE.match(line)
+        if heading:
+            phase = f"{heading.group(1)}: {heading.group(2)}".strip()
+            continue
+        m = TASK_RE.match(line)
+        if not m:
+            continue
+        rest = m.group(3)
+        tags = []
+        while True:
+            tag = TAG_RE.match(rest)
+            if not tag:
+                break
+            tags.append(tag.group(1).strip())
+            rest = rest[tag.end():]
+        upper = [t.upper() for t in tags]
+        if "MVP" in upper:
+            tier = "mvp"
+        elif "POLISH" in upper or any(w in phase.lower() for w in POLISH_WORDS):
+            tier = "polish"
+        else:
+            tier = "core"
+        tasks.append({
+            "task_id": m.group(2),
+            "phase": phase,
+            "description": rest.strip(),
+            "checked": m.group(1) != " ",
+            "tags": tags,
+            "tier": tier,
+            "line": lineno,
+        })
+    return tasks
+
+
+def parse_criteria(text: str) -> List[dict]:
+    """Parse acceptance criteria (checkbox "- [ ] AC-1: ..." or table rows)."""
+    criteria = []
+    for lineno, line in enumerate(text.splitlines(), 1):
+        m = CRITERION_RE.match(line)
+        if m:
+            criteria.append({"ac_id": m.group(2), "description": m.group(3).strip(),
+                             "checked": m.group(1) != " ", "line": lineno})
+            continue
+        m = CRITERION_ROW_RE.match(line)
+        if m:
+            criteria.append({"ac_id": m.group(1), "description": m.group(2).strip(),
+                             "checked": False, "line": lineno})
+    return criteria
+
+
+def index_path(dest: Path) -> Path:
+    return dest / ".skgd" / "cache" / INDEX_FILE
+
+
+def open_index(dest: Path, rebuild: bool = False) -> sqlite3.Connection:
+    """Open (creating if needed) the project index."""
+    path = index_path(dest)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if rebuild and path.exists():
+        path.unlink()
+    conn = sqlite3.connect(str(path))
+    conn.row_factory = sqlite3.Row
+    conn.executescript(SCHEMA)
+    row = conn.execute("SELECT value FROM meta WHERE key = 'schema'").fetchone()
+    if row is None or int(row["value"]) != SCHEMA_VERSION:
+        conn.executescript("DELETE FROM files; DELETE FROM tasks; "
+                           "DELETE FROM criteria; DELETE FROM state;")
+        conn.execute("INSERT OR REPLACE INTO meta VALUES ('schema', ?)", (str(SCHEMA_VERSION),))
+        conn.commit()
+    return conn
+
+
+def indexed_files(dest: Path) -> List[Path]:
+    """Files covered by the index."""
+    files = []
+    specs_dir = dest / "docs" / "specs"
+    if specs_dir.is_dir():
+        for feature_dir in sorted(p for p in specs_dir.iterdir() if p.is_dir()):
+            files.extend(feature_dir / name for name in SPEC_FILES
+                         if (feature_dir / name).is_file())
+    files.extend(dest / rel for rel in STATE_FILES if (dest / rel).is_file())
+    return files
+
+
+def update_index(dest: Path, conn: sqlite3.Connection) -> dict:
+    """Bring the index up to date with the project files.
+
+    Returns dict with scanned, reindexed, removed counts and seconds.
+    """
+    start = time.perf_counter()
+    stats = {"scanned": 0, "reindexed": 0, "removed": 0}
+    known = {r["path"]: r for r in conn.execute("SELECT * FROM files")}
+    seen = set()
+    state_dirty = False
+
+    for path in indexed_files(dest):
+        rel = path.relative_to(dest).as_posix()
+        seen.add(rel)
+        stats["scanned"] += 1
+        st = path.stat()
+        row = known.get(rel)
+        if row and row["mtime_ns"] == st.st_mtime_ns and row["size"] == st.st_size:
+            continue
+        data = path.read_bytes()
+        sha = hashlib.sha256(data).hexdigest()
+        if not row or row["sha256"] != sha:
+            if rel in STATE_FILES:
+                state_dirty = True
+            else:
+                _reindex_file(conn, rel, data.decode("utf-8", errors="replace"))
+            stats["reindexed"] += 1
+        conn.execute("INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?)",
+                     (rel, st.st_mtime_ns, st.st_size, sha))
+
+    for rel in set(known) - seen:
+        if rel in STATE_FILES:
+            state_dirty = True
+        else:
+            _forget_file(conn, rel)
+        conn.execute("DELETE FROM files WHERE path = ?", (rel,))
+        stats["removed"] += 1
+
+    if state_dirty:
+        _reindex_state(conn, dest)
+
+    conn.commit()
+    stats["seconds"] = time.perf_counter() - start
+    return stats
+
+
+def _feature_of(rel: str) -> Optional[str]:
+    parts = rel.split("/")
+    return parts[2] if len(parts) == 4 and parts[:2] == ["docs", "specs"] else None
+
+
+def _forget_file(conn: sqlite3.Connection, rel: str) -> None:
+    feature = _feature_of(rel)
+    if feature and rel.endswith("/tasks.md"):
+        conn.execute("DELETE FROM tasks WHERE feature = ?", (feature,))
+    if feature:
+        conn.execute("DELETE FROM criteria WHERE feature = ? AND file = ?",
+                     (feature, rel.rsplit("/", 1)[1]))
+
+
+def _reindex_state(conn: sqlite3.Connection, dest: Path) -> None:
+    """Replace the state table with state.yaml plus its pending journal."""
+    from .state import load_state
+
+    try:
+        state = load_state(dest)
+    except click.ClickException:
+        state = {}
+    conn.execute("DELETE FROM state")
+    conn.executemany("INSERT OR REPLACE INTO state VALUES (?, ?)",
+                     [(k, json.dumps(v, default=str)) for k, v in _flatten(state)])
+
+
+def _reindex_file(conn: sqlite3.Connection, rel: str, text: str) -> None:
+    _forget_file(conn, rel)
+    feature = _feature_of(rel)
+    name = rel.rsplit("/", 1)[1]
+    if name == "tasks.md":
+        conn.executemany(
+            "INSERT OR REPLACE INTO tasks VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            [(feature, t["task_id"], t["phase"], t["description"], int(t["checked"]),
+              " ".join(t["tags"]), t["tier"], t["line"]) for t in parse_tasks(text)]
+        )
+    conn.executemany(
+        "INSERT OR REPLACE INTO criteria VALUES (?, ?, ?, ?, ?, ?)",
+        [(feature, name, c["ac_id"], c["description"], int(c["checked"]), c["line"])
+         for c in parse_criteria(text)]
+    )
+
+
+def _flatten(data, prefix: str = ""):
+    """Yield (dotted key, value) for every leaf and list of a mapping."""
+    if isinstance(data, dict):
+        for key, value in data.items():
+            yield from _flatten(value, f"{prefix}{key}.")
+    else:
+        yield prefix[:-1], data
+
+
+def query_tasks(
+    conn: sqlite3.Connection,
+    feature: Optional[str] = None,
+    remaining: bool = False,
+    tier: Optional[str] = None,
+    tag: Optional[str] = None
+) -> List[sqlite3.Row]:
+    """Select tasks, ordered by feature and position in tasks.md."""
+    sql = "SELECT * FROM tasks WHERE 1=1"
+    args = []
+    if feature:
+        sql += " AND feature = ?"
+        args.append(feature)
+    if remaining:
+        sql += " AND checked = 0"
+    if tier:
+        sql += " AND tier = ?"
+        args.append(tier)
+    if tag:
+        sql += " AND (' ' || tags || ' ') LIKE ?"
+        args.append(f"% {tag} %")
+    return conn.execute(sql + " ORDER BY feature, line", args).fetchall()
+
+
+def feature_summary(conn: sqlite3.Connection, dest: Path) -> List[dict]:
+    """Per-feature task and criteria counts (features without tasks included)."""
+    summary = {}
+    specs_dir = dest / "docs" / "specs"
+    if specs_dir.is_dir():
+        for feature_dir in sorted(p for p in specs_dir.iterdir() if p.is_dir()):
+            summary[feature_dir.name] = {
+                "feature": feature_dir.name,
+                "files": [n for n in SPEC_FILES if (feature_dir / n).is_file()],
+                "tasks": 0, "done": 0, "mvp_remaining": 0, "criteria": 0,
+            }
+    for row in conn.execute(
+        "SELECT feature, COUNT(*) AS tasks, SUM(checked) AS done, "
+        "SUM(CASE WHEN checked = 0 AND tier != 'polish' THEN 1 ELSE 0 END) AS mvp_remaining "
+        "FROM tasks GROUP BY feature"
+    ):
+        if row["feature"] in summary:
+            summary[row["feature"]].update(tasks=row["tasks"], done=row["done"] or 0,
+                                           mvp_remaining=row["mvp_remaining"] or 0)
+    # tasks.md and plan.md repeat spec.md's criteria: count each AC id once
+    for row in conn.execute("SELECT feature, COUNT(DISTINCT ac_id) AS n FROM criteria GROUP BY feature"):
+        if row["feature"] in summary:
+            summary[row["feature"]]["criteria"] = row["n"]
+    return list(summary.values())
+
+
+def get_state(conn: sqlite3.Connection, key: str):
+    """Value of a dotted state.yaml key from the index (None if absent)."""
+    row = conn.execute("SELECT value FROM state WHERE key = ?", (key,)).fetchone()
+    return json.loads(row["value"]) if row else None
+
+
+@click.command()
+@click.option("--rebuild", is_flag=True, help="Drop the index and parse everything again")
+@click.option("--json", "as_json", is_flag=True, help="Print the feature summary as JSON")
+def index(rebuild: bool, as_json: bool):
+    """Build or refresh the project index (.skgd/cache/index.db).
+
+    Only spec, plan, tasks and state files whose content changed are
+    parsed again. Other commands refresh the index automatically.
+
+    Examples:
+        skgd index              # Incremental update
+        skgd index --rebuild    # Full reindex
+    """
+    dest = require_project_root()
+    conn = open_index(dest, rebuild=rebuild)
+    stats = update_index(dest, conn)
+    summary = feature_summary(conn, dest)
+
+    if as_json:
+        click.echo(json.dumps({"stats": stats, "features": summary}, indent=2))
+        return
+
+    click.echo(f"Indexed {stats['scanned']} files "
+               f"({stats['reindexed']} reparsed, {stats['removed']} removed) "
+               f"in {stats['seconds'] * 1000:.1f}ms")
+    click.echo()
+    for f in summary:
+        click.echo(f"  {click.style(f['feature'], fg='cyan'):<40} "
+                   f"{f['done']}/{f['tasks']} tasks  "
+                   f"{f['mvp_remaining']} MVP remaining  "
+                   f"{f['criteria']} criteria")
+
+
+@click.group(cls=LazyGroup, lazy_commands={"graph": "skgd.taskgraph:graph"},
+             invoke_without_command=True)
+@click.option("--feature", "-f", help="Only this feature (docs/specs/<feature>)")
+@click.option("--remaining", "-r", is_flag=True, help="Only unchecked tasks")
+@click.option("--tier", type=click.Choice(["mvp", "core", "polish"]), help="Only tasks of this tier")
+@click.option("--tag", "-t", help="Only tasks with this tag (e.g. P, US1)")
+@click.option("--json", "as_json", is_flag=True, help="Print tasks as JSON")
+@click.pass_context
+def tasks(ctx, feature: Optional[str], remaining: bool, tier: Optional[str], tag: Optional[str], as_json: bool):
+    """Query tasks from the project index.
+
+    Examples:
+        skgd tasks --remaining                  # All open tasks
+        skgd tasks -r --feature player-movement # Open tasks of one feature
+        skgd tasks --tag US1 --json             # Tasks of user story 1
+        skgd tasks graph player-movement        # Dependency waves
+    """
+    if ctx.invoked_subcommand is not None:
+        return
+    dest = require_project_root()
+    conn = open_index(dest)
+    update_index(dest, conn)
+    rows = query_tasks(conn, feature, remaining, tier, tag)
+
+    if as_json:
+        click.echo(json.dumps([
+            {"feature": r["feature"], "id": r["task_id"], "phase": r["phase"],
+             "description": r["description"], "done": bool(r["checked"]),
+             "tags": r["tags"].split(), "tier": r["tier"], "line": r["line"]}
+            for r in rows
+        ], indent=2))
+        return
+
+    for r in rows:
+        box = "[x]" if r["checked"] else "[ ]"
+        tags = " ".join(f"[{t}]" for t in r["tags"].split())
+        click.echo(f"  {r['feature']}  {box} {click.style(r['task_id'], fg='cyan')} "
+                   f"{tags + ' ' if tags else ''}{r['description']}")
+    click.echo()
+    click.echo(f"  {len(rows)} tasks")
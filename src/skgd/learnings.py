@@ -0,0 +1,291 @@
+"""Learnings digest - near-duplicate clustering of ``learnings.md``.
+
+``learnings.md`` is append-only: every ``/playtest`` and ``/pivot`` adds
+``- YYYY-MM-DD feature: observation`` lines under fixed subsections, and
+the same observation tends to come back in different words. ``skgd
+learnings cluster`` streams the file entry by entry and groups
+near-duplicates so ``/crystallize`` can start from a short digest (count,
+first/last seen, section) instead of the raw file.
+
+Similarity is estimated with one-permutation MinHash over character
+shingles: each entry's shingle hashes are spread over ``SIG_BINS`` bins
+keeping the minimum per bin (empty bins borrow from their neighbour), and
+the fraction of agreeing bins estimates the Jaccard similarity.
+Signatures are split into bands for locality sensitive hashing; an entry
+is only checked against the few clusters sharing the most bands with it,
+and band buckets are capped, so runtime stays linear in the number of
+entries.
+"""
+
+import json
+import operator
+import re
+import unicodedata
+import zlib
+from collections import Counter
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import click
+
+from .cli import require_project_root
+
+
+LEARNINGS_FILE = ".skgd/memory/learnings.md"
+
+SHINGLE_SIZE = 4
+SIG_BINS = 32
+BAND_ROWS = 2
+DEFAULT_THRESHOLD = 0.5
+
+# Clusters remembered per band bucket, and candidates verified per entry
+BUCKET_CAP = 8
+MAX_CANDIDATES = 3
+
+# Offset separating borrowed values from real minima in densified bins
+_ROTATION = 1 << 28
+
+# Canonical sections, matched against the H2 heading (en/fr)
+SECTIONS = [
+    ("Technical", ("technical", "technique")),
+    ("Design", ("design",)),
+    ("Process", ("process", "processus")),
+    ("Bug Patterns", ("bug",)),
+]
+OTHER_SECTION = "Other"
+
+ENTRY_RE = re.compile(r"^[-*]\s+(.*)$")
+META_RE = re.compile(r"^\[?(\d{4}-\d{2}-\d{2})\]?\s*(?:([\w][\w./-]*):\s+)?(.*)$")
+WORD_RE = re.compile(r"\w+")
+
+
+def section_of(heading: str) -> str:
+    """Canonical section for an H2 heading."""
+    lowered = heading.lower()
+    for name, keywords in SECTIONS:
+        if any(k in lowered for k in keywords):
+            return name
+    return OTHER_SECTION
+
+
+def iter_entries(path: Path) -> Iterator[dict]:
+    """Stream learnings entries: {section, subsection, date, feature, text, line}.
+
+    Entries are top-level bullets; indented lines that follow are folded
+    into the entry text.
+    """
+    section, subsection = OTHER_SECTION, None
+    entry = None
+    with open(path, "r", encoding="utf-8", errors="replace") as f:
+        for number, raw in enumerate(f, 1):
+            line = raw.rstrip()
+            if entry and line[:1] in (" ", "\t") and line.strip():
+                entry["text"] += " " + line.strip().lstrip("-* ")
+                continue
+            if entry:
+                yield entry
+                entry = None
+            if line.startswith("## "):
+                section, subsection = section_of(line[3:]), None
+            elif line.startswith("### "):
+                subsection = line[4:].strip()
+            else:
+                m = ENTRY_RE.match(line)
+                if not m:
+                    continue
+                body = m.group(1).strip()
+                meta = META_RE.match(body)
+                date, feature = (meta.group(1), meta.group(2)) if meta else (None, None)
+                text = meta.group(3) if meta else body
+                if text:
+                    entry = {"section": section, "subsection": subsection, "date": date,
+                             "feature": feature, "text": text, "line": number}
+    if entry:
+        yield entry
+
+
+def fold(text: str) -> str:
+    """Casefold and strip accents (shared with ``skgd search``)."""
+    text = text.casefold()
+    if not text.isascii():
+        text = unicodedata.normalize("NFKD", text)
+        text = "".join(c for c in text if not unicodedata.combining(c))
+    return text
+
+
+def normalize(text: str) -> str:
+    """Casefolded words without accents or punctuation."""
+    return " ".join(WORD_RE.findall(fold(text)))
+
+
+def signature(text: str) -> Tuple[int, ...]:
+    """Densified one-permutation MinHash signature of a normalized text."""
+    k = SHINGLE_SIZE
+    encoded = text.encode("utf-8")
+    sig = [-1] * SIG_BINS
+    for i in range(max(1, len(encoded) - k + 1)):
+        h = zlib.crc32(encoded[i:i + k])
+        b, v = h % SIG_BINS, h // SIG_BINS
+        if sig[b] < 0 or v < sig[b]:
+            sig[b] = v
+    if -1 in sig:
+        filled = [i for i, v in enumerate(sig) if v >= 0]
+        if not filled:
+            return tuple(sig)
+        for i in range(SIG_BINS):
+            if sig[i] < 0:
+                j = next((f for f in filled if f > i), filled[0] + SIG_BINS)
+                sig[i] = sig[j % SIG_BINS] + (j - i) * _ROTATION
+    return tuple(sig)
+
+
+def similarity(a: Tuple[int, ...], b: Tuple[int, ...]) -> float:
+    """Estimated Jaccard similarity of two signatures."""
+    return sum(map(operator.eq, a, b)) / SIG_BINS
+
+
+def _bands(section: str, sig: Tuple[int, ...]) -> List[tuple]:
+    return [(section, i) + sig[i:i + BAND_ROWS] for i in range(0, SIG_BINS, BAND_ROWS)]
+
+
+def cluster_entries(entries: Iterator[dict], threshold: float = DEFAULT_THRESHOLD) -> dict:
+    """Group near-duplicate entries within each section.
+
+    Each cluster keeps the signature of its first entry; a new entry joins
+    the most similar candidate cluster at or above threshold, otherwise it
+    starts a new one. Candidates are the clusters sharing the most bands
+    with the entry. Returns {"entries": int, "clusters": [cluster]}.
+    """
+    clusters: List[dict] = []
+    exact: Dict[tuple, int] = {}
+    buckets: Dict[tuple, List[int]] = {}
+    total = 0
+    for entry in entries:
+        total += 1
+        norm = normalize(entry["text"])
+        key = (entry["section"], norm)
+        cid = exact.get(key)
+        sig = None
+        if cid is None:
+            sig = signature(norm)
+            bands = _bands(entry["section"], sig)
+            hits = Counter()
+            for band in bands:
+                hits.update(buckets.get(band, ()))
+            best, best_score = None, threshold
+            for candidate, _ in hits.most_common(MAX_CANDIDATES):
+                score = similarity(sig, clusters[candidate]["sig"])
+                if score >= best_score:
+                    best, best_score = candidate, score
+            cid = best
+            if cid is None:
+                cid = len(clusters)
+                clusters.append({"section": entry["section"], "sig": sig, "text": entry["text"],
+                                 "count": 0, "first_seen": None, "last_seen": None,
+                                 "first_line": entry["line"], "subsections": Counter(),
+                                 "features": Counter(), "variants": []})
+            # Members index their bands too, so later variants find the cluster
+            for band in bands:
+                bucket = buckets.setdefault(band, [])
+                if len(bucket) < BUCKET_CAP and cid not in bucket:
+                    bucket.append(cid)
+            exact[key] = cid
+
+        cluster = clusters[cid]
+        cluster["count"] += 1
+        if entry["subsection"]:
+            cluster["subsections"][entry["subsection"]] += 1
+        if entry["feature"]:
+            cluster["features"][entry["feature"]] += 1
+        if entry["date"]:
+            if not cluster["first_seen"] or entry["date"] < cluster["first_seen"]:
+                cluster["first_seen"] = entry["date"]
+            if not cluster["last_seen"] or entry["date"] > cluster["last_seen"]:
+                cluster["last_seen"] = entry["date"]
+        if (sig is not None and entry["text"] != cluster["text"]
+                and len(cluster["variants"]) < 2):
+            cluster["variants"].append(entry["text"])
+
+    section_order = {name: i for i, (name, _) in enumerate(SECTIONS)}
+    result = []
+    for c in clusters:
+        result.append({
+            "section": c["section"],
+            "subsection": c["subsections"].most_common(1)[0][0] if c["subsections"] else None,
+            "count": c["count"],
+            "first_seen": c["first_seen"],
+            "last_seen": c["last_seen"],
+            "features": [f for f, _ in c["features"].most_common(5)],
+            "text": c["text"],
+            "variants": c["variants"],
+            "line": c["first_line"],
+        })
+    result.sort(key=lambda c: (section_order.get(c["section"], len(SECTIONS)), -c["count"], c["line"]))
+    return {"entries": total, "clusters": result}
+
+
+def render_digest(result: dict, source: str, min_count: int) -> str:
+    """Markdown digest of clusters with at least min_count entries."""
+    shown = [c for c in result["clusters"] if c["count"] >= min_count]
+    recurring = sum(1 for c in result["clusters"] if c["count"] > 1)
+    lines = ["# Learnings Digest", "",
+             f"*{result['entries']} entries in {source} → {len(result['clusters'])} clusters "
+             f"({recurring} recurring)*"]
+    section = None
+    for c in shown:
+        if c["section"] != section:
+            section = c["section"]
+            lines += ["", f"## {section}", ""]
+        seen = c["first_seen"] or "?"
+        if c["last_seen"] and c["last_seen"] != c["first_seen"]:
+            seen += f" → {c['last_seen']}"
+        context = "; ".join(x for x in [c["subsection"], ", ".join(c["features"])] if x)
+        lines.append(f"- **×{c['count']}** ({seen}) {c['text']}" + (f" _[{context}]_" if context else ""))
+        for variant in c["variants"]:
+            lines.append(f"  - ~ {variant}")
+    hidden = len(result["clusters"]) - len(shown)
+    if hidden:
+        lines += ["", f"*{hidden} clusters below {min_count} entries not shown "
+                      f"(--min-count 1 to list them)*"]
+    return "\n".join(lines) + "\n"
+
+
+@click.group()
+def learnings():
+    """Inspect .skgd/memory/learnings.md."""
+
+
+@learnings.command("cluster")
+@click.option("--file", "-f", "path", type=click.Path(exists=True, dir_okay=False),
+              help="Learnings file (default: .skgd/memory/learnings.md)")
+@click.option("--threshold", "-t", default=DEFAULT_THRESHOLD, show_default=True,
+              type=click.FloatRange(0.05, 1.0), help="Similarity needed to join a cluster")
+@click.option("--min-count", "-m", default=2, show_default=True, type=click.IntRange(min=1),
+              help="Only list clusters with at least this many entries")
+@click.option("--json", "as_json", is_flag=True, help="Print all clusters as JSON")
+def learnings_cluster(path: Optional[str], threshold: float, min_count: int, as_json: bool):
+    """Group near-duplicate learnings into a compact digest.
+
+    Each cluster shows how often the observation was recorded, when it
+    was first and last seen, and its section (Technical, Design, Process,
+    Bug Patterns). /crystallize starts from this digest.
+
+    Examples:
+        skgd learnings cluster
+        skgd learnings cluster --min-count 1 --threshold 0.6
+        skgd learnings cluster --file .skgd/memory/learnings-archive/2025-01-01.md --json
+    """
+    if path:
+        source = Path(path)
+        label = path
+    else:
+        source = require_project_root() / LEARNINGS_FILE
+        label = LEARNINGS_FILE
+        if not source.is_file():
+            raise click.ClickException(f"{LEARNINGS_FILE} not found.")
+
+    result = cluster_entries(iter_entries(source), threshold)
+    if as_json:
+        click.echo(json.dumps(result, indent=2, ensure_ascii=False))
+    else:
+        click.echo(render_digest(result, label, min_count), nl=False)
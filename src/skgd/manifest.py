@@ -0,0 +1,292 @@
+"""Content-addressed template manifests for incremental upgrades.
+
+The package ships a manifest of every template file and its SHA-256. Each
+project records what was installed in ``.skgd/manifest.json``. Upgrades diff
+the two and only copy, replace or delete files whose content changed, so an
+upgrade that changes nothing touches no files (and no mtimes).
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+
+PACKAGE_MANIFEST = "manifest.json"
+INSTALLED_MANIFEST = "manifest.json"
+
+# Managed template groups: (source prefix, destination prefix, recursive)
+# Non-recursive groups only track top-level *.md files, like the upgrade
+# functions always did.
+MANAGED_GROUPS = {
+    "commands": ("{lang}/claude/commands/", ".claude/commands/", False),
+    "data": ("{lang}/claude/data/", ".claude/data/", False),
+    "agents": ("{lang}/skgd/agents/", ".skgd/agents/", False),
+    "skills": ("common/skills/", ".claude/skills/", True),
+}
+
+# Groups installed through the command compiler (see compiler.py): their
+# expected content is the compiled template, not the template itself.
+COMPILED_GROUPS = {"commands"}
+
+_CHUNK = 1024 * 1024
+
+
+def file_digest(path: Path) -> str:
+    """Return the SHA-256 hex digest of a file."""
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(_CHUNK), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def build_manifest(template_dir: Path) -> dict:
+    """Hash every file under the templates directory.
+
+    Returns dict with:
+        - files: {relative posix path: {"sha256": str, "size": int}}
+    """
+    files = {}
+    for root, dirs, names in os.walk(template_dir):
+        dirs.sort()
+        for name in sorted(names):
+            path = Path(root) / name
+            rel = path.relative_to(template_dir).as_posix()
+            if rel == PACKAGE_MANIFEST:
+                continue
+            files[rel] = {"sha256": file_digest(path), "size": path.stat().st_size}
+    return {"files": files}
+
+
+def load_package_manifest(template_dir: Path) -> dict:
+    """Load the manifest shipped with the package.
+
+    Falls back to hashing the loose template tree (source checkouts and
+    editable installs have no prebuilt manifest).
+    """
+    path = template_dir / PACKAGE_MANIFEST
+    if path.exists():
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            pass
+    return build_manifest(template_dir)
+
+
+def installed_manifest_path(dest: Path) -> Path:
+    """Path of the per-project installed manifest."""
+    return dest / ".skgd" / INSTALLED_MANIFEST
+
+
+def load_installed_manifest(dest: Path) -> dict:
+    """Load the installed manifest of a project (empty if missing/corrupt)."""
+    path = installed_manifest_path(dest)
+    if not path.exists():
+        return {"files": {}}
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {"files": {}}
+    data.setdefault("files", {})
+    return data
+
+
+def save_installed_manifest(dest: Path, manifest: dict) -> None:
+    """Write the installed manifest atomically."""
+    path = installed_manifest_path(dest)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=1, sort_keys=True)
+    os.replace(tmp, path)
+
+
+def group_targets(package: dict, lang: str, groups: List[str]) -> Dict[str, dict]:
+    """Map destination paths to their template source for the given groups.
+
+    Returns {dest relative path: {"src": str, "sha256": str, "group": str}}.
+    """
+    targets = {}
+    for group in groups:
+        src_prefix, dest_prefix, recursive = MANAGED_GROUPS[group]
+        src_prefix = src_prefix.format(lang=lang)
+        for rel, entry in package["files"].items():
+            if not rel.startswith(src_prefix):
+                continue
+            tail = rel[len(src_prefix):]
+            if not recursive and ("/" in tail or not tail.endswith(".md")):
+                continue
+            targets[dest_prefix + tail] = {
+                "src": rel,
+                "sha256": entry["sha256"],
+                "group": group,
+            }
+    return targets
+
+
+def _stat_key(path: Path) -> Optional[tuple]:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return (st.st_size, st.st_mtime_ns)
+
+
+def _matches_record(path: Path, record: Optional[dict], sha: str) -> bool:
+    """Check if the file at path has content sha, trusting a fresh record."""
+    if record and record.get("sha256") == sha:
+        key = _stat_key(path)
+        if key is not None and key == (record.get("size"), record.get("mtime_ns")):
+            return True
+    return path.is_file() and file_digest(path) == sha
+
+
+def plan_sync(dest: Path, template_dir: Path, lang: str, groups: List[str],
+              render: Optional[Callable[[str], bytes]] = None,
+              include: Optional[Callable[[str], bool]] = None) -> List[dict]:
+    """Compute the operations needed to bring managed files up to date.
+
+    render maps a template path of a COMPILED_GROUPS group to the bytes to
+    install; without it templates are installed verbatim. include filters
+    template paths (see skills.py): excluded files are planned like files
+    the package no longer ships, and unmodified copies already in the
+    project are removed even when no manifest recorded them.
+
+    Each operation is a dict with:
+        - action: "add" | "update" | "remove" | "keep"
+        - path: destination path relative to the project
+        - src: template-relative source path (None for removals)
+        - sha256: expected content hash (None for removals)
+        - group: managed group name
+        - data: compiled content (compiled groups only)
+    """
+    package = load_package_manifest(template_dir)
+    installed = load_installed_manifest(dest)["files"]
+    targets = group_targets(package, lang, groups)
+    excluded = {}
+    if include is not None:
+        excluded = {rel: t for rel, t in targets.items() if not include(t["src"])}
+        targets = {rel: t for rel, t in targets.items() if rel not in excluded}
+    if render is not None:
+        for target in targets.values():
+            if target["group"] in COMPILED_GROUPS:
+                target["data"] = render(target["src"])
+                target["sha256"] = hashlib.sha256(target["data"]).hexdigest()
+
+    ops = []
+    for rel, target in sorted(targets.items()):
+        path = dest / rel
+        if not path.exists():
+            action = "add"
+        elif _matches_record(path, installed.get(rel), target["sha256"]):
+            action = "keep"
+        else:
+            action = "update"
+        ops.append({"action": action, "path": rel, **target})
+
+    # Stale files: previously installed by us, or leftovers inside a skill
+    # directory we own (skills used to be replaced wholesale).
+    stale = set()
+    prefixes = [MANAGED_GROUPS[g][1] for g in groups]
+    for rel in installed:
+        if rel not in targets and any(rel.startswith(p) for p in prefixes):
+            stale.add(rel)
+    if "skills" in groups:
+        dest_prefix = MANAGED_GROUPS["skills"][1]
+        owned = {rel[len(dest_prefix):].split("/", 1)[0]
+                 for rel, t in targets.items() if t["group"] == "skills"}
+        for skill in owned:
+            skill_dir = dest / dest_prefix / skill
+            if not skill_dir.is_dir():
+                continue
+            for path in skill_dir.rglob("*"):
+                if path.is_file():
+                    rel = path.relative_to(dest).as_posix()
+                    if rel not in targets:
+                        stale.add(rel)
+    for rel, target in excluded.items():
+        if rel not in stale and (dest / rel).is_file() and file_digest(dest / rel) == target["sha256"]:
+            stale.add(rel)
+
+    for rel in sorted(stale):
+        if (dest / rel).exists():
+            group = next(g for g in groups if rel.startswith(MANAGED_GROUPS[g][1]))
+            ops.append({"action": "remove", "path": rel, "src": None,
+                        "sha256": None, "group": group})
+    return ops
+
+
+def apply_sync(dest: Path, source, ops: List[dict]) -> dict:
+    """Apply planned operations and record them in the installed manifest.
+
+    New and changed files are copied from the template source (see
+    ``bundle.open_template_source``) in a single batch; compiled ones are
+    written from their planned data.
+
+    Returns dict with:
+        - written: {group: [paths added or updated]}
+        - removed: [paths deleted]
+        - unchanged: int
+    """
+    manifest = load_installed_manifest(dest)
+    files = manifest["files"]
+    result = {"written": {}, "removed": [], "unchanged": 0}
+    dirty = False
+
+    copies = [op for op in ops if op["action"] in ("add", "update")]
+    writes = [op for op in copies if "data" in op]
+    copies = [op for op in copies if "data" not in op]
+    if copies:
+        source.copy_files((op["src"], dest / op["path"]) for op in copies)
+    if writes:
+        from .copyengine import write_files
+
+        write_files((dest / op["path"], op["data"], 0) for op in writes)
+
+    for op in ops:
+        path = dest / op["path"]
+        if op["action"] == "remove":
+            path.unlink()
+            files.pop(op["path"], None)
+            result["removed"].append(op["path"])
+            dirty = True
+            _prune_empty_dirs(path.parent, dest / MANAGED_GROUPS[op["group"]][1])
+            continue
+        if op["action"] in ("add", "update"):
+            result["written"].setdefault(op["group"], []).append(op["path"])
+        else:
+            result["unchanged"] += 1
+        st = path.stat()
+        record = {
+            "sha256": op["sha256"],
+            "size": st.st_size,
+            "mtime_ns": st.st_mtime_ns,
+        }
+        if files.get(op["path"]) != record:
+            files[op["path"]] = record
+            dirty = True
+
+    if dirty:
+        save_installed_manifest(dest, manifest)
+    return result
+
+
+def record_installed(dest: Path, template_dir: Path, lang: str, groups: List[str],
+                     render: Optional[Callable[[str], bytes]] = None) -> None:
+    """Record freshly copied template files in the installed manifest."""
+    apply_sync(dest, None, [
+        op for op in plan_sync(dest, template_dir, lang, groups, render)
+        if op["action"] == "keep"
+    ])
+
+
+def _prune_empty_dirs(path: Path, stop: Path) -> None:
+    """Remove empty directories left behind by deletions, up to stop."""
+    while path != stop and path.is_dir() and not any(path.iterdir()):
+        path.rmdir()
+        path = path.parent
+
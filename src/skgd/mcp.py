@@ -0,0 +1,561 @@
+"""MCP server tooling - ``skgd mcp bench``, ``proxy``, ``stats`` and ``fake``.
+
+``skgd mcp bench`` launches an MCP server over stdio, as Claude Code
+would, and measures it: ``initialize``, ``tools/list``, then a script of
+tool calls repeated a number of times (optionally several in flight at
+once). It reports latency percentiles per tool, throughput and error
+rate. The server is an explicit command, an entry configured for Claude
+Code (``.mcp.json``, ``~/.claude.json``) or the stand-in server of
+``fakemcp.py``.
+
+A script is a YAML/JSON list of tool calls::
+
+    - tool: manage_editor
+      arguments: {action: get_state}
+    - tool: read_console
+      arguments: {types: [error]}
+      repeat: 3
+
+The default scripts only use read-only calls, so benchmarking a real
+editor does not change the open project.
+
+``skgd mcp proxy`` (mcpproxy.py) caches the engine server's read-only
+calls for Claude Code; ``skgd mcp stats`` shows how much it saved.
+"""
+
+import json
+import os
+import subprocess
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeout
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import click
+
+PROTOCOL_VERSION = "2024-11-05"
+
+# Read-only calls the commands make at the start of every MCP session
+DEFAULT_SCRIPTS = {
+    "unity": [
+        {"tool": "manage_editor", "arguments": {"action": "get_state"}},
+        {"tool": "manage_scene", "arguments": {"action": "get_active"}},
+        {"tool": "manage_scene", "arguments": {"action": "get_hierarchy"}},
+        {"tool": "read_console", "arguments": {"types": ["error"]}},
+    ],
+    "godot": [
+        {"tool": "get_project_info", "arguments": {}},
+        {"tool": "get_godot_errors", "arguments": {}},
+    ],
+}
+
+# Names the engine servers are usually registered under (first wins)
+ENGINE_SERVERS = {
+    "unity": ["UnityMCP", "unity-mcp", "unity"],
+    "godot": ["gdai", "gdai-mcp", "godot"],
+}
+
+
+class McpError(RuntimeError):
+    """The server exited, timed out or broke the protocol."""
+
+
+class StdioClient:
+    """JSON-RPC client for an MCP server speaking newline-delimited JSON on stdio.
+
+    Requests may be issued from several threads; responses are matched
+    to them by id on a reader thread.
+    """
+
+    def __init__(self, argv: List[str], env: Optional[dict] = None, cwd: Optional[str] = None):
+        self.argv = argv
+        try:
+            self.proc = subprocess.Popen(argv, stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                                         stderr=subprocess.PIPE, env=env, cwd=cwd)
+        except OSError as e:
+            raise McpError(f"cannot start the server ({e.strerror or e})")
+        self.stderr: deque = deque(maxlen=20)
+        self._pending: Dict[int, Future] = {}
+        self._next_id = 0
+        self._lock = threading.Lock()
+        self._closed: Optional[str] = None
+        threading.Thread(target=self._read, name="mcp-reader", daemon=True).start()
+        self._stderr_thread = threading.Thread(target=self._drain_stderr, name="mcp-stderr", daemon=True)
+        self._stderr_thread.start()
+
+    def _write(self, message: dict) -> None:
+        self.proc.stdin.write(json.dumps(message).encode("utf-8") + b"\n")
+        self.proc.stdin.flush()
+
+    def _read(self) -> None:
+        for line in self.proc.stdout:
+            try:
+                message = json.loads(line)
+            except ValueError:
+                continue  # Servers sometimes log to stdout
+            if not isinstance(message, dict):
+                continue
+            if "method" in message:
+                if "id" in message:
+                    self._answer_server_request(message)
+                continue
+            with self._lock:
+                future = self._pending.pop(message.get("id"), None)
+            if future is not None:
+                future.set_result(message)
+        code = self.proc.wait()
+        with self._lock:
+            self._closed = f"server exited with code {code}"
+            pending, self._pending = self._pending, {}
+        for future in pending.values():
+            future.set_exception(McpError(self._closed))
+
+    def _answer_server_request(self, message: dict) -> None:
+        reply = {"jsonrpc": "2.0", "id": message["id"]}
+        if message["method"] == "ping":
+            reply["result"] = {}
+        else:
+            reply["error"] = {"code": -32601, "message": "Method not found"}
+        with self._lock:
+            try:
+                self._write(reply)
+            except OSError:
+                pass
+
+    def _drain_stderr(self) -> None:
+        for line in self.proc.stderr:
+            self.stderr.append(line.decode("utf-8", "replace").rstrip())
+
+    def send(self, method: str, params: Optional[dict] = None) -> Future:
+        """Issue a request; the future resolves to the response message."""
+        future: Future = Future()
+        with self._lock:
+            if self._closed:
+                raise McpError(self._closed)
+            self._next_id += 1
+            request_id = self._next_id
+            self._pending[request_id] = future
+            message = {"jsonrpc": "2.0", "id": request_id, "method": method}
+            if params is not None:
+                message["params"] = params
+            try:
+                self._write(message)
+            except OSError:
+                self._pending.pop(request_id, None)
+                raise McpError("server closed its input")
+        future.request_id = request_id
+        return future
+
+    def request(self, method: str, params: Optional[dict] = None, timeout: float = 30.0) -> dict:
+        """Send a request and wait for its response message."""
+        future = self.send(method, params)
+        try:
+            return future.result(timeout)
+        except FutureTimeout:
+            with self._lock:
+                self._pending.pop(future.request_id, None)
+            raise McpError(f"{method} timed out after {timeout:g}s")
+
+    def notify(self, method: str, params: Optional[dict] = None) -> None:
+        message = {"jsonrpc": "2.0", "method": method}
+        if params is not None:
+            message["params"] = params
+        with self._lock:
+            self._write(message)
+
+    def initialize(self, timeout: float = 30.0) -> dict:
+        """MCP handshake; returns the server's initialize result."""
+        from . import __version__
+
+        response = self.request("initialize", {
+            "protocolVersion": PROTOCOL_VERSION,
+            "capabilities": {},
+            "clientInfo": {"name": "skgd", "version": __version__},
+        }, timeout)
+        if "error" in response:
+            raise McpError(f"initialize failed: {response['error'].get('message')}")
+        self.notify("notifications/initialized")
+        return response.get("result") or {}
+
+    def close(self) -> None:
+        """Close stdin and wait for the server, killing it if it lingers."""
+        try:
+            self.proc.stdin.close()
+        except OSError:
+            pass
+        try:
+            self.proc.wait(timeout=3)
+        except subprocess.TimeoutExpired:
+            self.proc.kill()
+            self.proc.wait()
+        self._stderr_thread.join(1)
+
+
+def fake_server_argv(engine: str, *options: str) -> List[str]:
+    """Command line of the bundled fake server."""
+    import sys
+
+    return [sys.executable, "-m", "skgd.fakemcp", "--engine", engine, *options]
+
+
+def configured_servers(dest: Optional[Path]) -> Dict[str, dict]:
+    """MCP servers registered for Claude Code: user, local and project scope.
+
+    Later scopes win, like in Claude Code: ~/.claude.json (user), its
+    entry for the project (local), then the project's .mcp.json.
+    """
+    servers: Dict[str, dict] = {}
+    sources = []
+    try:
+        with open(Path.home() / ".claude.json", "r", encoding="utf-8") as f:
+            user = json.load(f)
+        sources.append(user.get("mcpServers"))
+        if dest is not None:
+            sources.append(((user.get("projects") or {}).get(str(dest)) or {}).get("mcpServers"))
+    except (OSError, ValueError, AttributeError):
+        pass
+    if dest is not None:
+        try:
+            with open(dest / ".mcp.json", "r", encoding="utf-8") as f:
+                sources.append(json.load(f).get("mcpServers"))
+        except (OSError, ValueError, AttributeError):
+            pass
+    for entries in sources:
+        if isinstance(entries, dict):
+            servers.update((name, entry) for name, entry in entries.items() if isinstance(entry, dict))
+    return servers
+
+
+def server_launch(entry: dict) -> tuple:
+    """(argv, env) of a configured stdio server entry."""
+    if entry.get("type", "stdio") != "stdio" or not entry.get("command"):
+        raise click.ClickException("only stdio MCP servers (with a command) can be benchmarked")
+    env = dict(os.environ)
+    env.update({k: str(v) for k, v in (entry.get("env") or {}).items()})
+    return [entry["command"], *map(str, entry.get("args") or [])], env
+
+
+def resolve_server(dest: Optional[Path], command: tuple, server_name: Optional[str],
+                   fake: Optional[str]) -> tuple:
+    """(argv, env, label, engine) of the server picked by the CLI options.
+
+    In order: the bundled fake server, an explicit command, a server
+    registered for Claude Code (by name, else the project engine's).
+    """
+    from .cli import detect_project_settings
+
+    engine = detect_project_settings(dest)[1] if dest is not None else "unity"
+    if fake:
+        return fake_server_argv(fake), None, f"fake-{fake}", fake
+    if command:
+        return list(command), None, Path(command[0]).name, engine
+    servers = configured_servers(dest)
+    name = server_name or next((n for n in ENGINE_SERVERS[engine] if n in servers), None)
+    if name is None or name not in servers:
+        raise click.ClickException(
+            (f"MCP server {server_name!r} is not configured" if server_name else
+             f"no {engine} MCP server configured for Claude Code")
+            + "; pass a command after --, or --fake unity|godot")
+    argv, env = server_launch(servers[name])
+    return argv, env, name, engine
+
+
+def load_script(path: Path) -> List[dict]:
+    """Tool calls of a bench script file (YAML or JSON)."""
+    import yaml
+
+    with open(path, "r", encoding="utf-8") as f:
+        doc = yaml.safe_load(f)
+    if isinstance(doc, dict):
+        doc = doc.get("calls")
+    if not isinstance(doc, list) or not doc:
+        raise click.ClickException(f"{path}: expected a list of tool calls")
+    for number, step in enumerate(doc, 1):
+        if not isinstance(step, dict) or not step.get("tool"):
+            raise click.ClickException(f"{path}: call {number} has no tool name")
+    return doc
+
+
+def expand_script(script: List[dict], iterations: int) -> List[dict]:
+    """Flatten repeats and iterations into the ordered list of calls."""
+    once = [step for step in script for _ in range(int(step.get("repeat", 1)))]
+    return once * iterations
+
+
+def percentile(values: List[float], q: float) -> float:
+    """q-th percentile (0-100) of sorted values, linearly interpolated."""
+    if not values:
+        return 0.0
+    k = (len(values) - 1) * q / 100
+    low = int(k)
+    high = min(low + 1, len(values) - 1)
+    return values[low] + (values[high] - values[low]) * (k - low)
+
+
+def latency_stats(samples: List[float]) -> dict:
+    """Count and latency percentiles (ms) of one group of calls."""
+    values = sorted(samples)
+    return {
+        "count": len(values),
+        "mean_ms": sum(values) / len(values) if values else 0.0,
+        "p50_ms": percentile(values, 50),
+        "p90_ms": percentile(values, 90),
+        "p99_ms": percentile(values, 99),
+        "max_ms": values[-1] if values else 0.0,
+    }
+
+
+def call_tool(client: StdioClient, step: dict, timeout: float) -> tuple:
+    """(latency ms, error kind or None) of one tools/call."""
+    start = time.perf_counter()
+    try:
+        response = client.request("tools/call", {"name": step["tool"],
+                                                 "arguments": step.get("arguments") or {}}, timeout)
+    except McpError as e:
+        kind = "timeout" if "timed out" in str(e) else "closed"
+        return (time.perf_counter() - start) * 1000, kind
+    elapsed = (time.perf_counter() - start) * 1000
+    if "error" in response:
+        return elapsed, "rpc"
+    if (response.get("result") or {}).get("isError"):
+        return elapsed, "tool"
+    return elapsed, None
+
+
+def default_script(tools: List[str], engine: str) -> List[dict]:
+    """Default script of the engine whose tools the server offers."""
+    for name in [engine] + [e for e in DEFAULT_SCRIPTS if e != engine]:
+        if {step["tool"] for step in DEFAULT_SCRIPTS[name]} <= set(tools):
+            return DEFAULT_SCRIPTS[name]
+    return DEFAULT_SCRIPTS[engine]
+
+
+def run_bench(client: StdioClient, script: Optional[List[dict]], engine: str, iterations: int,
+              warmup: int, concurrency: int, timeout: float) -> dict:
+    """Handshake, tools/list and the script against a started client.
+
+    Without a script, the default one matching the server's tools is used.
+    """
+    start = time.perf_counter()
+    init = client.initialize(timeout)
+    init_ms = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    listing = client.request("tools/list", {}, timeout)
+    list_ms = (time.perf_counter() - start) * 1000
+    tools = [tool.get("name") for tool in (listing.get("result") or {}).get("tools") or []]
+    script = script or default_script(tools, engine)
+
+    for step in expand_script(script, warmup):
+        call_tool(client, step, timeout)
+
+    calls = expand_script(script, iterations)
+    start = time.perf_counter()
+    if concurrency > 1:
+        with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="mcp-bench") as pool:
+            results = list(pool.map(lambda step: call_tool(client, step, timeout), calls))
+    else:
+        results = [call_tool(client, step, timeout) for step in calls]
+    wall = time.perf_counter() - start
+
+    by_tool: Dict[str, dict] = {}
+    errors: Dict[str, int] = {}
+    for step, (ms, error) in zip(calls, results):
+        entry = by_tool.setdefault(step["tool"], {"samples": [], "errors": 0})
+        entry["samples"].append(ms)
+        if error:
+            entry["errors"] += 1
+            errors[error] = errors.get(error, 0) + 1
+    total_errors = sum(errors.values())
+    return {
+        "server": (init.get("serverInfo") or {}),
+        "protocol_version": init.get("protocolVersion"),
+        "initialize_ms": init_ms,
+        "tools_list_ms": list_ms,
+        "tools": len(tools),
+        "missing_tools": sorted({step["tool"] for step in script} - set(tools)) if tools else [],
+        "calls": len(calls),
+        "concurrency": concurrency,
+        "wall_s": wall,
+        "throughput_per_s": len(calls) / wall if wall else 0.0,
+        "errors": total_errors,
+        "error_rate": total_errors / len(calls) if calls else 0.0,
+        "errors_by_kind": errors,
+        "latency": latency_stats([ms for ms, _ in results]),
+        "by_tool": {name: {**latency_stats(entry["samples"]), "errors": entry["errors"]}
+                    for name, entry in by_tool.items()},
+    }
+
+
+def print_report(report: dict, label: str) -> None:
+    server = report["server"]
+    name = server.get("name") or label
+    click.echo(f"MCP server: {name} {server.get('version') or ''}".rstrip())
+    click.echo(f"  initialize  {report['initialize_ms']:8.1f} ms   "
+               f"tools/list {report['tools_list_ms']:8.1f} ms ({report['tools']} tools)")
+    if report["missing_tools"]:
+        click.secho(f"  not offered by the server: {', '.join(report['missing_tools'])}", fg="yellow")
+    click.echo()
+    width = max([len(tool) for tool in report["by_tool"]] + [5])
+    click.echo(f"  {'tool':<{width}}  {'calls':>5}  {'p50 ms':>8}  {'p90 ms':>8}  "
+               f"{'p99 ms':>8}  {'max ms':>8}  {'errors':>6}")
+    rows = list(report["by_tool"].items()) + [("all", {**report["latency"], "errors": report["errors"]})]
+    for tool, s in rows:
+        click.echo(f"  {tool:<{width}}  {s['count']:>5}  {s['p50_ms']:>8.2f}  {s['p90_ms']:>8.2f}  "
+                   f"{s['p99_ms']:>8.2f}  {s['max_ms']:>8.2f}  {s['errors']:>6}")
+    click.echo()
+    kinds = ", ".join(f"{count} {kind}" for kind, count in sorted(report["errors_by_kind"].items()))
+    click.echo(f"  {report['calls']} calls in {report['wall_s']:.2f}s "
+               f"({report['throughput_per_s']:.1f} calls/s, concurrency {report['concurrency']}), "
+               f"error rate {100 * report['error_rate']:.1f}%" + (f" ({kinds})" if kinds else ""))
+
+
+@click.group()
+def mcp():
+    """Benchmark, proxy and stand in for engine MCP servers."""
+
+
+@mcp.command(context_settings={"ignore_unknown_options": True})
+@click.argument("command", nargs=-1, type=click.UNPROCESSED)
+@click.option("--server", "-s", "server_name", help="Server registered for Claude Code (.mcp.json, ~/.claude.json)")
+@click.option("--fake", type=click.Choice(["unity", "godot"]), help="Benchmark the bundled fake server")
+@click.option("--script", "script_path", type=click.Path(exists=True, dir_okay=False, path_type=Path),
+              help="YAML/JSON list of tool calls (default: read-only calls for the engine)")
+@click.option("--iterations", "-n", default=20, show_default=True, help="Times to run the script")
+@click.option("--warmup", default=1, show_default=True, help="Untimed script runs first")
+@click.option("--concurrency", "-c", default=1, show_default=True, help="Tool calls in flight at once")
+@click.option("--timeout", default=30.0, show_default=True, help="Seconds to wait for each response")
+@click.option("--json", "as_json", is_flag=True, help="Print the report as JSON")
+def bench(command, server_name, fake, script_path, iterations, warmup, concurrency, timeout, as_json):
+    """Measure MCP round trips: handshake, tools/list and tool calls.
+
+    The server is COMMAND (after --), a server registered for Claude Code
+    (--server, default: the project engine's) or the bundled fake server
+    (--fake). Reports p50/p90/p99 latency per tool, throughput and error
+    rate.
+
+    Examples:
+        skgd mcp bench --fake unity
+        skgd mcp bench --server UnityMCP -n 50
+        skgd mcp bench --script calls.yaml -- skgd mcp fake --engine godot --latency 20
+    """
+    from .cli import find_project_root
+
+    dest = find_project_root()
+    argv, env, label, engine = resolve_server(dest, command, server_name, fake)
+    script = load_script(script_path) if script_path else None
+
+    try:
+        client = StdioClient(argv, env=env, cwd=str(dest) if dest else None)
+    except McpError as e:
+        raise click.ClickException(f"{label}: {e}")
+    try:
+        report = run_bench(client, script, engine, iterations, warmup, max(1, concurrency), timeout)
+    except McpError as e:
+        client.close()
+        stderr = "\n".join(client.stderr)
+        raise click.ClickException(f"{label}: {e}" + (f"\n{stderr}" if stderr else ""))
+    client.close()
+
+    report["command"] = argv
+    if as_json:
+        click.echo(json.dumps(report, indent=2))
+    else:
+        print_report(report, label)
+
+
+@mcp.command()
+@click.option("--engine", "-e", type=click.Choice(["unity", "godot"]), default="unity", show_default=True)
+@click.option("--latency", default=0.0, help="Mean tool call latency in ms")
+@click.option("--jitter", default=0.0, help="Latency jitter (+/- ms)")
+@click.option("--error-rate", default=0.0, help="Fraction of tool calls that fail")
+@click.option("--seed", type=int, help="Random seed for jitter and errors")
+def fake(engine, latency, jitter, error_rate, seed):
+    """Run the bundled fake Unity MCP / GDAI MCP server on stdio.
+
+    Implements the tools the slash commands call against an in-memory
+    editor, so commands can run without Unity or Godot.
+
+    Examples:
+        claude mcp add UnityMCP -- skgd mcp fake --engine unity
+        claude mcp add gdai -- skgd mcp fake --engine godot --latency 15
+    """
+    from .fakemcp import FakeServer
+
+    FakeServer(engine, latency, jitter, error_rate, seed).serve()
+
+
+@mcp.command(context_settings={"ignore_unknown_options": True})
+@click.argument("command", nargs=-1, type=click.UNPROCESSED)
+@click.option("--server", "-s", "server_name", help="Server registered for Claude Code to put the proxy in front of")
+@click.option("--fake", type=click.Choice(["unity", "godot"]), help="Proxy the bundled fake server")
+@click.option("--ttl", default=5.0, show_default=True,
+              help="Seconds to cache tools the server marks read-only (known engine tools have their own TTLs)")
+@click.option("--name", help="Stats file name (default: the server name)")
+def proxy(command, server_name, fake, ttl, name):
+    """Caching stdio proxy in front of an engine MCP server.
+
+    Register it with Claude Code instead of the server itself. Read-only
+    calls (editor state, hierarchy, find, asset search) are answered from
+    a short-lived cache, identical calls in flight are coalesced, and any
+    mutating call empties the cache. Statistics: skgd mcp stats.
+
+    Examples:
+        claude mcp add UnityMCP -- skgd mcp proxy -- uvx --from git+https://github.com/SirLorrence/unity-mcp unity-mcp
+        claude mcp add gdai -- skgd mcp proxy --name gdai -- <gdai server command>
+    """
+    import sys
+
+    from .cli import find_project_root
+    from .mcpproxy import PROXY_ENV, CachingProxy, stats_file
+
+    if os.environ.get(PROXY_ENV):
+        raise click.ClickException("the upstream server is itself an skgd mcp proxy; "
+                                   "pass the real server command after --")
+    dest = find_project_root()
+    argv, env, label, _ = resolve_server(dest, command, server_name, fake)
+    stats_path = stats_file(dest, name or label) if dest is not None else None
+    try:
+        code = CachingProxy(argv, env, ttl, stats_path, name or label).run()
+    except OSError as e:
+        raise click.ClickException(f"{label}: cannot start the server ({e.strerror or e})")
+    sys.exit(code)
+
+
+@mcp.command()
+@click.option("--json", "as_json", is_flag=True, help="Print the statistics as JSON")
+def stats(as_json):
+    """Show cache hit rates and latencies of the project's MCP proxies.
+
+    Examples:
+        skgd mcp stats
+    """
+    from .cli import require_project_root
+    from .mcpproxy import load_stats
+
+    found = load_stats(require_project_root())
+    if as_json:
+        click.echo(json.dumps(found, indent=2))
+        return
+    if not found:
+        click.echo("No MCP proxy statistics yet (register the server through skgd mcp proxy).")
+        return
+    for s in found:
+        updated = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(s["updated"]))
+        click.echo(f"MCP proxy: {s['server']} (updated {updated})")
+        click.echo(f"  {s['calls']} calls: {s['hits']} hits, {s['coalesced']} coalesced, "
+                   f"{s['misses']} misses, {s['mutations']} mutations "
+                   f"({100 * s['hit_rate']:.1f}% of reads served by the proxy), "
+                   f"{s['invalidations']} invalidations, {s['errors']} errors")
+        click.echo(f"  upstream p50 {s['upstream']['p50_ms']:.1f} ms, p90 {s['upstream']['p90_ms']:.1f} ms; "
+                   f"served p50 {s['served']['p50_ms']:.1f} ms, p90 {s['served']['p90_ms']:.1f} ms")
+        width = max([len(tool) for tool in s["by_tool"]] + [4])
+        click.echo(f"    {'tool':<{width}}  {'calls':>5}  {'hits':>5}  {'coal.':>5}  {'miss':>5}  "
+                   f"{'mut.':>5}  {'upstream p50':>12}")
+        for tool, t in s["by_tool"].items():
+            click.echo(f"    {tool:<{width}}  {t['calls']:>5}  {t['hits']:>5}  {t['coalesced']:>5}  "
+                       f"{t['misses']:>5}  {t['mutations']:>5}  {t['upstream']['p50_ms']:>9.1f} ms")
+        click.echo()
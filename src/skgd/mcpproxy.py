@@ -0,0 +1,364 @@
+"""Caching MCP proxy - ``skgd mcp proxy`` between Claude and the engine server.
+
+During /implement the model keeps asking the editor the same questions
+(editor state, scene hierarchy, find-gameobject, asset listings), and each
+one is a round trip into Unity or Godot. The proxy is registered with
+Claude Code in place of the engine server and relays everything to it,
+except that:
+
+- read-only tool calls are answered from a cache until their TTL expires
+  (``CACHE_TTLS``, or ``--ttl`` for tools the server annotates with
+  ``readOnlyHint``);
+- any other tool call is a mutation: it empties the cache, and responses
+  to reads issued before it are not cached;
+- identical read-only calls already in flight are coalesced into one
+  upstream request.
+
+TTLs are short because the model also edits files directly, which the
+proxy cannot see. Hit/miss counts and latencies are written to
+``.skgd/cache/mcp-proxy/<name>.json`` (see ``skgd mcp stats``).
+"""
+
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+from collections import OrderedDict, deque
+from pathlib import Path
+from typing import Dict, List, Optional
+
+STATS_DIR = ".skgd/cache/mcp-proxy"
+STATS_INTERVAL = 2.0
+MAX_ENTRIES = 512
+SAMPLES = 1000
+PROXY_ENV = "SKGD_MCP_PROXY"
+
+# Read-only engine tool calls and how long their results stay fresh
+# (seconds): tool -> TTL, or tool -> {action: TTL} for action-dispatched
+# tools (actions not listed are mutations). TTL 0 is read-only but never
+# cached, so identical calls are still coalesced.
+CACHE_TTLS = {
+    # Unity MCP
+    "manage_editor": {"get_state": 2, "get_project_root": 300, "get_tags": 60, "get_layers": 60},
+    "manage_scene": {"get_active": 5, "get_hierarchy": 5, "get_build_settings": 60},
+    "manage_gameobject": {"find": 5, "get_components": 5},
+    "manage_asset": {"search": 15, "get_info": 15},
+    "read_console": {None: 1, "get": 1},
+    "validate_script": 0,
+    "run_tests": 0,
+    # GDAI MCP
+    "get_project_info": 60,
+    "get_godot_errors": 1,
+    "get_running_scene_screenshot": 0,
+}
+
+# Server notifications after which cached results may be wrong
+INVALIDATING_NOTIFICATIONS = ("notifications/tools/list_changed", "notifications/resources/updated",
+                              "notifications/resources/list_changed")
+
+
+class Flight:
+    """A request forwarded upstream, plus the identical ones waiting on it."""
+
+    __slots__ = ("key", "tool", "ttl", "generation", "started", "waiters")
+
+    def __init__(self, key: Optional[str], tool: str, ttl: Optional[float], generation: int):
+        self.key = key
+        self.tool = tool
+        self.ttl = ttl
+        self.generation = generation
+        self.started = time.perf_counter()
+        self.waiters: List[tuple] = []  # (request id, received at)
+
+
+class ProxyStats:
+    """Counters and latency samples, per tool and overall."""
+
+    COUNTERS = ("calls", "hits", "misses", "coalesced", "mutations", "errors")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.started = time.time()
+        self.invalidations = 0
+        self.tools: Dict[str, dict] = {}
+        self.upstream: deque = deque(maxlen=SAMPLES)
+        self.served: deque = deque(maxlen=SAMPLES)
+
+    def tool(self, name: str) -> dict:
+        if name not in self.tools:
+            self.tools[name] = {**{c: 0 for c in self.COUNTERS}, "upstream": deque(maxlen=SAMPLES)}
+        return self.tools[name]
+
+    def count(self, tool: str, counter: str) -> None:
+        self.tool(tool)[counter] += 1
+
+    def upstream_latency(self, tool: str, ms: float) -> None:
+        self.tool(tool)["upstream"].append(ms)
+        self.upstream.append(ms)
+
+    def snapshot(self) -> dict:
+        from .mcp import latency_stats
+
+        totals = {c: sum(t[c] for t in self.tools.values()) for c in self.COUNTERS}
+        reads = totals["hits"] + totals["misses"] + totals["coalesced"]
+        return {
+            "server": self.name,
+            "pid": os.getpid(),
+            "started": self.started,
+            "updated": time.time(),
+            **totals,
+            "invalidations": self.invalidations,
+            "hit_rate": (totals["hits"] + totals["coalesced"]) / reads if reads else 0.0,
+            "upstream": latency_stats(list(self.upstream)),
+            "served": latency_stats(list(self.served)),
+            "by_tool": {name: {**{c: t[c] for c in self.COUNTERS},
+                               "upstream": latency_stats(list(t["upstream"]))}
+                        for name, t in sorted(self.tools.items())},
+        }
+
+
+class CachingProxy:
+    """Relays MCP between a client on stdin/stdout and an upstream server."""
+
+    def __init__(self, argv: List[str], env: Optional[dict] = None, default_ttl: float = 5.0,
+                 stats_path: Optional[Path] = None, name: str = "mcp", client_in=None, client_out=None):
+        self.argv = argv
+        self.env = dict(env if env is not None else os.environ)
+        self.env[PROXY_ENV] = "1"
+        self.default_ttl = default_ttl
+        self.stats_path = stats_path
+        self.stats = ProxyStats(name)
+        self.client_in = client_in or sys.stdin.buffer
+        self.client_out = client_out or sys.stdout.buffer
+        self.read_only: Dict[str, bool] = {}
+        self.cache: "OrderedDict[str, tuple]" = OrderedDict()  # key -> (expires, result)
+        self.inflight: Dict[str, Flight] = {}
+        self.pending: Dict[object, Flight] = {}
+        self.tool_lists: set = set()
+        self.generation = 0
+        self.lock = threading.Lock()
+        self.out_lock = threading.Lock()
+        self.done = threading.Event()
+        self.last_save = 0.0
+
+    # --- classification ---------------------------------------------------
+
+    def ttl_for(self, tool: str, arguments: dict) -> Optional[float]:
+        """Cache TTL of a read-only call, None for a mutation."""
+        rule = CACHE_TTLS.get(tool)
+        if isinstance(rule, dict):
+            return rule.get(arguments.get("action"))
+        if rule is not None:
+            return rule
+        return self.default_ttl if self.read_only.get(tool) else None
+
+    def invalidate(self) -> None:
+        """Forget cached results and detach in-flight reads (caller holds lock)."""
+        self.generation += 1
+        if self.cache or self.inflight:
+            self.stats.invalidations += 1
+        self.cache.clear()
+        self.inflight.clear()
+
+    # --- I/O ----------------------------------------------------------------
+
+    def to_client(self, message: dict) -> None:
+        data = json.dumps(message).encode("utf-8") + b"\n"
+        with self.out_lock:
+            try:
+                self.client_out.write(data)
+                self.client_out.flush()
+            except (OSError, ValueError):
+                self.done.set()
+
+    def to_upstream(self, line: bytes) -> None:
+        try:
+            self.proc.stdin.write(line if line.endswith(b"\n") else line + b"\n")
+            self.proc.stdin.flush()
+        except (OSError, ValueError):
+            self.done.set()
+
+    # --- client -> upstream ---------------------------------------------------
+
+    def from_client(self, line: bytes) -> None:
+        try:
+            message = json.loads(line)
+        except ValueError:
+            message = None
+        if not isinstance(message, dict) or "id" not in message or "method" not in message:
+            self.to_upstream(line)  # Notifications, responses to server requests
+            return
+        if message["method"] == "tools/list":
+            with self.lock:
+                self.tool_lists.add(message["id"])
+        elif message["method"] == "tools/call" and self.call(message):
+            return
+        self.to_upstream(line)
+
+    def call(self, message: dict) -> bool:
+        """Handle a tools/call; True if it was answered without forwarding it."""
+        params = message.get("params") or {}
+        tool = str(params.get("name"))
+        arguments = params.get("arguments") or {}
+        received = time.perf_counter()
+        request_id = message["id"]
+        ttl = self.ttl_for(tool, arguments if isinstance(arguments, dict) else {})
+        with self.lock:
+            self.stats.count(tool, "calls")
+            if ttl is None:
+                self.stats.count(tool, "mutations")
+                self.invalidate()
+                self.pending[request_id] = Flight(None, tool, None, self.generation)
+                return False
+            key = tool + "\0" + json.dumps(arguments, sort_keys=True)
+            cached = self.cache.get(key)
+            if cached is not None and cached[0] > time.monotonic():
+                self.stats.count(tool, "hits")
+                result = cached[1]
+            else:
+                flight = self.inflight.get(key)
+                if flight is not None:
+                    self.stats.count(tool, "coalesced")
+                    flight.waiters.append((request_id, received))
+                    return True
+                self.stats.count(tool, "misses")
+                flight = self.inflight[key] = Flight(key, tool, ttl, self.generation)
+                self.pending[request_id] = flight
+                return False
+        self.to_client({"jsonrpc": "2.0", "id": request_id, "result": result})
+        self.stats.served.append((time.perf_counter() - received) * 1000)
+        return True
+
+    # --- upstream -> client ---------------------------------------------------
+
+    def from_upstream(self, line: bytes) -> None:
+        try:
+            message = json.loads(line)
+        except ValueError:
+            return  # Log output on stdout; Claude would reject it too
+        if not isinstance(message, dict):
+            return
+        if "method" in message:
+            if message["method"] in INVALIDATING_NOTIFICATIONS:
+                with self.lock:
+                    self.invalidate()
+            self.to_client(message)
+            return
+
+        request_id = message.get("id")
+        with self.lock:
+            flight = self.pending.pop(request_id, None)
+            if request_id in self.tool_lists:
+                self.tool_lists.discard(request_id)
+                for tool in (message.get("result") or {}).get("tools") or []:
+                    hints = tool.get("annotations") or {}
+                    self.read_only[tool.get("name")] = bool(hints.get("readOnlyHint"))
+            if flight is not None:
+                self.complete(flight, message)
+        self.to_client(message)
+        if flight is not None:
+            for waiter_id, received in flight.waiters:
+                self.to_client({**message, "id": waiter_id})
+                self.stats.served.append((time.perf_counter() - received) * 1000)
+            self.save_stats()
+
+    def complete(self, flight: Flight, message: dict) -> None:
+        """Record a finished upstream call and cache it if still valid (lock held)."""
+        ms = (time.perf_counter() - flight.started) * 1000
+        self.stats.upstream_latency(flight.tool, ms)
+        self.stats.served.append(ms)
+        result = message.get("result")
+        failed = "error" in message or not isinstance(result, dict) or result.get("isError")
+        if failed:
+            self.stats.count(flight.tool, "errors")
+        if flight.key is None:
+            self.invalidate()  # Reads sent while it ran may predate it
+            return
+        if self.inflight.get(flight.key) is flight:
+            del self.inflight[flight.key]
+        if not failed and flight.ttl and flight.generation == self.generation:
+            self.cache[flight.key] = (time.monotonic() + flight.ttl, result)
+            self.cache.move_to_end(flight.key)
+            while len(self.cache) > MAX_ENTRIES:
+                self.cache.popitem(last=False)
+
+    def fail_pending(self, reason: str) -> None:
+        """Answer every request still waiting on the upstream server."""
+        with self.lock:
+            flights, self.pending = self.pending, {}
+        for request_id, flight in flights.items():
+            for waiter_id in [request_id] + [w for w, _ in flight.waiters]:
+                self.to_client({"jsonrpc": "2.0", "id": waiter_id,
+                                "error": {"code": -32603, "message": reason}})
+
+    # --- lifecycle --------------------------------------------------------------
+
+    def save_stats(self, force: bool = False) -> None:
+        if self.stats_path is None:
+            return
+        now = time.monotonic()
+        if not force and now - self.last_save < STATS_INTERVAL:
+            return
+        self.last_save = now
+        with self.lock:
+            data = self.stats.snapshot()
+        try:
+            self.stats_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.stats_path.with_name(self.stats_path.name + f".{os.getpid()}.tmp")
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=1)
+            os.replace(tmp, self.stats_path)
+        except OSError:
+            pass
+
+    def _pump_client(self) -> None:
+        for line in self.client_in:
+            if line.strip():
+                self.from_client(line)
+        self.done.set()
+
+    def _pump_upstream(self) -> None:
+        for line in self.proc.stdout:
+            if line.strip():
+                self.from_upstream(line)
+        self.fail_pending(f"upstream MCP server exited with code {self.proc.wait()}")
+        self.done.set()
+
+    def run(self) -> int:
+        """Relay until either side closes; returns the upstream exit code."""
+        self.proc = subprocess.Popen(self.argv, stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                                     env=self.env)  # stderr passes through to Claude's log
+        threading.Thread(target=self._pump_upstream, name="mcp-upstream", daemon=True).start()
+        threading.Thread(target=self._pump_client, name="mcp-client", daemon=True).start()
+        self.done.wait()
+        try:
+            self.proc.stdin.close()
+        except OSError:
+            pass
+        try:
+            code = self.proc.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            self.proc.kill()
+            code = self.proc.wait()
+        self.save_stats(force=True)
+        return code
+
+
+def stats_file(dest: Path, name: str) -> Path:
+    """Stats file of the proxy for a server name in a project."""
+    safe = "".join(c if c.isalnum() or c in "-_." else "_" for c in name)
+    return dest / STATS_DIR / f"{safe}.json"
+
+
+def load_stats(dest: Path) -> List[dict]:
+    """Stats written by the project's proxies, most recently updated first."""
+    found = []
+    for path in sorted((dest / STATS_DIR).glob("*.json")):
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                found.append(json.load(f))
+        except (OSError, ValueError):
+            continue
+    return sorted(found, key=lambda s: s.get("updated") or 0, reverse=True)
@@ -0,0 +1,203 @@
+"""Prerequisite probes - detect external tools concurrently, with a cache.
+
+Each probe resolves a binary on PATH and, when found, runs its version
+command. All probes run in parallel threads, so the slowest tool bounds the
+total time instead of the sum. Results are cached in
+``.skgd/cache/probes.json`` and reused until the TTL expires, PATH changes
+or a probed binary is replaced (mtime).
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from .trace import span, traced
+
+
+PROBE_TIMEOUT = 5
+CACHE_TTL = 24 * 60 * 60
+CACHE_FILE = "probes.json"
+
+# Tool name -> candidate executables and version arguments (None: presence only)
+PROBES = {
+    "claude": {"candidates": ["claude"], "version_args": ["--version"]},
+    "blender": {"candidates": ["blender"], "version_args": ["--version"]},
+    "godot": {"candidates": ["godot", "godot4"], "version_args": ["--version"]},
+    "unity-hub": {"candidates": ["unityhub", "Unity Hub", "unity-hub"], "version_args": None},
+    "uvx": {"candidates": ["uvx"], "version_args": ["--version"]},
+    "npx": {"candidates": ["npx"], "version_args": ["--version"]},
+}
+
+# MCP config entry -> tools it needs to launch
+MCP_REQUIREMENTS = {
+    ("engine", "unity"): ["uvx"],
+    ("engine", "gdai"): ["godot"],
+    ("assets", "blender"): ["blender", "uvx"],
+    ("assets", "pixellab"): ["npx"],
+}
+
+
+def _traced_probe(name: str) -> dict:
+    with span(f"probe.{name}"):
+        return probe_tool(name)
+
+
+def probe_tool(name: str) -> dict:
+    """Probe a single tool.
+
+    Returns dict with:
+        - name: str
+        - found: bool
+        - path: str or None
+        - version: str or None
+        - status: "ok" | "missing" | "error" | "timeout"
+        - mtime: float or None (binary mtime, for cache invalidation)
+        - checked_at: float (when it was probed, for the cache TTL)
+    """
+    import subprocess
+
+    spec = PROBES[name]
+    result = {"name": name, "found": False, "path": None, "version": None,
+              "status": "missing", "mtime": None, "checked_at": time.time()}
+    path = next((p for p in map(shutil.which, spec["candidates"]) if p), None)
+    if path is None:
+        return result
+
+    result.update(found=True, path=path, mtime=_mtime(path), status="ok")
+    if spec["version_args"] is None:
+        return result
+    try:
+        proc = subprocess.run(
+            [path, *spec["version_args"]],
+            capture_output=True,
+            text=True,
+            timeout=PROBE_TIMEOUT
+        )
+    except subprocess.TimeoutExpired:
+        result["status"] = "timeout"
+        return result
+    except OSError:
+        result["status"] = "error"
+        return result
+
+    if proc.returncode != 0:
+        result["status"] = "error"
+    output = (proc.stdout or proc.stderr).strip()
+    result["version"] = output.splitlines()[0] if output else None
+    return result
+
+
+@traced("probes.run")
+def run_probes(
+    names: Optional[List[str]] = None,
+    cache_dir: Optional[Path] = None,
+    refresh: bool = False
+) -> Dict[str, dict]:
+    """Probe tools concurrently, reusing cached results when still valid.
+
+    Returns {tool name: probe result}.
+    """
+    names = names or list(PROBES)
+    cached = {} if refresh else load_cached_probes(cache_dir)
+    results = {n: cached[n] for n in names if n in cached}
+    missing = [n for n in names if n not in results]
+
+    if missing:
+        with ThreadPoolExecutor(max_workers=len(missing)) as pool:
+            for result in pool.map(_traced_probe, missing):
+                results[result["name"]] = result
+        if cache_dir is not None:
+            save_cached_probes(cache_dir, {**cached, **results})
+    return results
+
+
+def start_probes(
+    names: Optional[List[str]] = None,
+    cache_dir: Optional[Path] = None,
+    refresh: bool = False
+):
+    """Run probes in the background; returns a Future of run_probes()."""
+    executor = ThreadPoolExecutor(max_workers=1)
+    future = executor.submit(run_probes, names, cache_dir, refresh)
+    executor.shutdown(wait=False)
+    return future
+
+
+def probe_ok(results: Dict[str, dict], name: str) -> bool:
+    """True if the tool was found and its version command succeeded."""
+    result = results.get(name)
+    return bool(result and result["found"] and result["status"] == "ok")
+
+
+def load_cached_probes(cache_dir: Optional[Path]) -> Dict[str, dict]:
+    """Return cached probe results that are still valid (empty if none)."""
+    if cache_dir is None:
+        return {}
+    try:
+        with open(cache_dir / CACHE_FILE, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if data.get("path_hash") != _path_hash():
+        return {}
+    now = time.time()
+    valid = {}
+    for name, result in data.get("results", {}).items():
+        # Each result ages on its own: re-probing one tool must not
+        # extend the lifetime of the others
+        if name not in PROBES or now - result.get("checked_at", 0) > CACHE_TTL:
+            continue
+        if result.get("found") and _mtime(result["path"]) != result.get("mtime"):
+            continue
+        valid[name] = result
+    return valid
+
+
+def save_cached_probes(cache_dir: Path, results: Dict[str, dict]) -> None:
+    """Write probe results to the cache."""
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    data = {"path_hash": _path_hash(), "results": results}
+    tmp = cache_dir / (CACHE_FILE + ".tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=1, sort_keys=True)
+    os.replace(tmp, cache_dir / CACHE_FILE)
+
+
+def project_cache_dir(dest: Path) -> Optional[Path]:
+    """Cache directory of a project, or None outside a project."""
+    skgd_dir = dest / ".skgd"
+    return skgd_dir / "cache" if skgd_dir.is_dir() else None
+
+
+def apply_mcp_status(mcp_config: dict, results: Dict[str, dict]) -> None:
+    """Mark MCPs "missing" when a tool needed to launch them is absent.
+
+    A launcher on PATH (npx, uvx) does not mean the MCP is registered with
+    Claude Code, so otherwise the configured status is kept; an earlier
+    "missing" becomes "unchecked" again once its tools are back.
+    """
+    for (section, key), tools in MCP_REQUIREMENTS.items():
+        entry = mcp_config.get(section, {}).get(key)
+        if not isinstance(entry, dict) or any(t not in results for t in tools):
+            continue
+        ok = all(results[t]["found"] and results[t]["status"] == "ok" for t in tools)
+        if not ok:
+            entry["status"] = "missing"
+        elif entry.get("status") == "missing":
+            entry["status"] = "unchecked"
+
+
+def _path_hash() -> str:
+    return hashlib.sha256(os.environ.get("PATH", "").encode("utf-8")).hexdigest()[:16]
+
+
+def _mtime(path: str) -> Optional[float]:
+    try:
+        return os.stat(path).st_mtime
+    except OSError:
+        return None
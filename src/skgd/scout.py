@@ -0,0 +1,380 @@
+"""Native scout - mechanical Scout Reports without a sub-agent.
+
+Workflow commands start with a Phase 0 that gathers context (engine,
+language, current feature, task counts, checkpoint...) before the main
+model does any creative work. Most of that is plain extraction from
+config.yaml, state.yaml and the project index, so ``skgd scout <command>``
+produces the Scout Report directly, in the format documented in
+``.claude/commands/_scout.md``. Commands only fall back to a sub-agent for
+the parts that need judgement.
+"""
+
+import json
+import re
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+import click
+
+from .budget import estimate_tokens
+from .cli import detect_project_settings, require_project_root
+from .index import open_index, query_tasks, update_index
+from .state import load_state, load_yaml
+
+
+# Report labels by language (the report format itself is fixed)
+LABELS = {
+    "en": {
+        "engine": "Engine", "feature": "Feature", "language": "Language",
+        "session": "Session", "state": "State", "new": "new",
+        "resume_from": "resume from", "checkpoint": "Checkpoint", "none": "none",
+        "tasks": "Tasks", "done": "Done", "remaining": "Remaining",
+        "mvp_remaining": "MVP remaining", "polish_remaining": "Polish remaining",
+        "current_phase": "Current Phase", "learnings": "Learnings to Apply",
+        "blockers": "Blockers", "missing": "Missing", "pillars": "Pillar Progress",
+        "completed": "Completed Pillars", "questions": "Target Pillar Questions",
+        "documents": "Documents", "mvp_features": "MVP Features",
+        "specs": "Spec Files", "criteria": "Acceptance Criteria",
+        "token_estimate": "Token Estimate",
+    },
+    "fr": {
+        "engine": "Engine", "feature": "Feature", "language": "Language",
+        "session": "Session", "state": "État", "new": "nouveau",
+        "resume_from": "reprise depuis", "checkpoint": "Checkpoint", "none": "aucun",
+        "tasks": "Tâches", "done": "Faites", "remaining": "Restantes",
+        "mvp_remaining": "MVP restants", "polish_remaining": "Polish restants",
+        "current_phase": "Phase Actuelle", "learnings": "Learnings à Appliquer",
+        "blockers": "Bloqueurs", "missing": "Manquant", "pillars": "Progression Piliers",
+        "completed": "Piliers Complétés", "questions": "Questions du Pilier",
+        "documents": "Documents", "mvp_features": "Features MVP",
+        "specs": "Fichiers Spec", "criteria": "Critères d'Acceptation",
+        "token_estimate": "Estimation Tokens",
+    },
+}
+
+MAX_LIST = 8
+PILLAR_ROW_RE = re.compile(r"^\|\s*([a-z0-9][\w-]*)\s*\|\s*([^|]*)\|")
+QUESTION_RE = re.compile(r"^\s*[-*]\s+\[[ xX]\]\s+(.+\?)\s*$")
+PLAN_PHASE_RE = re.compile(r"^#{2,4}\s+(Phase\s+\d+)\b", re.IGNORECASE)
+BULLET_RE = re.compile(r"^\s*[-*]\s+(?!\[)(.+)$")
+
+PROFILES: Dict[str, Callable] = {}
+
+
+def profile(name: str):
+    """Register a scout profile for a workflow command."""
+    def register(func):
+        PROFILES[name] = func
+        return func
+    return register
+
+
+def _rel_missing(dest: Path, paths: List[str]) -> List[str]:
+    return [p for p in paths if not (dest / p).exists()]
+
+
+def current_feature(state: dict, override: Optional[str] = None) -> Optional[str]:
+    """Feature to scout: explicit argument, active implementation, then current_spec."""
+    if override:
+        return override
+    impl = state.get("implementation") or {}
+    production = state.get("production") or {}
+    return impl.get("feature") or production.get("current_spec") or None
+
+
+def pillar_status(dest: Path) -> List[dict]:
+    """Pillar rows of docs/pillars/_index.md: name and completion."""
+    index = dest / "docs" / "pillars" / "_index.md"
+    if not index.is_file():
+        return []
+    pillars = []
+    for line in index.read_text(encoding="utf-8").splitlines():
+        m = PILLAR_ROW_RE.match(line)
+        if m and m.group(1).lower() not in ("pillar", "pilier"):
+            pillars.append({"name": m.group(1), "complete": "✅" in m.group(2)})
+    return pillars
+
+
+def plan_phase_points(plan_text: str, phase: str, limit: int = 3) -> List[str]:
+    """First bullet points under the plan.md heading of a task phase."""
+    m = re.match(r"Phase\s+(\d+)", phase, re.IGNORECASE)
+    if not m:
+        return []
+    points, inside = [], False
+    for line in plan_text.splitlines():
+        heading = PLAN_PHASE_RE.match(line)
+        if heading:
+            inside = heading.group(1).split()[-1] == m.group(1)
+            continue
+        if inside and line.startswith("#"):
+            if points:
+                break
+            continue
+        if inside:
+            bullet = BULLET_RE.match(line)
+            if bullet:
+                points.append(bullet.group(1).strip())
+                if len(points) >= limit:
+                    break
+    return points
+
+
+def learnings_patterns(text: str, engine: str, limit: int = 5) -> List[str]:
+    """Validated patterns for the engine, then anti-patterns, from learnings-core.md."""
+    patterns, anti = [], []
+    section = ""
+    for line in text.splitlines():
+        if line.startswith("#"):
+            section = line.lower()
+            continue
+        m = re.match(r"^\|\s*([^|]+?)\s*\|", line)
+        if not m or set(m.group(1)) <= set("-: ") or m.group(1).startswith("["):
+            continue
+        cell = m.group(1)
+        if cell.lower() in ("pattern", "don't do", "mechanic", "decision", "ne pas faire"):
+            continue
+        if "anti" in section:
+            anti.append(f"Avoid: {cell}")
+        elif engine in section:
+            patterns.append(cell)
+    return (patterns + anti)[:limit]
+
+
+@profile("implement")
+def scout_implement(dest: Path, report: dict, arg: Optional[str]) -> None:
+    state = load_state(dest)
+    feature = current_feature(state, arg)
+    report["feature"] = feature
+    impl = state.get("implementation") or {}
+
+    if not feature:
+        report["status"] = "blocked"
+        report["blockers"].append("no current feature (run /spec or pass a feature name)")
+        return
+    spec_dir = f"docs/specs/{feature}"
+    report["missing"] += _rel_missing(dest, [f"{spec_dir}/tasks.md", f"{spec_dir}/plan.md",
+                                             ".skgd/memory/learnings-core.md"])
+    if f"{spec_dir}/tasks.md" in report["missing"]:
+        report["status"] = "blocked"
+        report["blockers"].append(f"{spec_dir}/tasks.md not found (run /tasks)")
+        return
+
+    conn = open_index(dest)
+    update_index(dest, conn)
+    tasks = query_tasks(conn, feature)
+    conn.close()
+    remaining = [t for t in tasks if not t["checked"]]
+    mvp = [t for t in remaining if t["tier"] != "polish"]
+    report["tasks"] = {
+        "total": len(tasks),
+        "done": len(tasks) - len(remaining),
+        "remaining": len(remaining),
+        "mvp_remaining": [f"{t['task_id']} {t['description']}" for t in mvp],
+        "polish_remaining": len(remaining) - len(mvp),
+    }
+
+    resume_from = impl.get("next_task") if impl.get("active") else None
+    if resume_from is None and remaining and len(remaining) < len(tasks):
+        resume_from = remaining[0]["task_id"]
+    report["session"] = {"resume_from": resume_from, "checkpoint": impl.get("last_checkpoint")}
+    if not remaining:
+        report["status"] = "ready"
+        report["blockers"].append("all tasks checked (run /playtest)")
+    else:
+        report["status"] = "resume" if resume_from else "ready"
+
+    phase = remaining[0]["phase"] if remaining else ""
+    plan = dest / spec_dir / "plan.md"
+    report["phase"] = {
+        "name": phase or None,
+        "points": plan_phase_points(plan.read_text(encoding="utf-8"), phase) if plan.is_file() else [],
+    }
+    core = dest / ".skgd" / "memory" / "learnings-core.md"
+    report["learnings"] = (learnings_patterns(core.read_text(encoding="utf-8"), report["engine"])
+                           if core.is_file() else [])
+
+
+@profile("deep-dive")
+def scout_deep_dive(dest: Path, report: dict, arg: Optional[str]) -> None:
+    pillars = pillar_status(dest)
+    report["missing"] += _rel_missing(dest, ["docs/pillars/_index.md", "docs/game-brief.md",
+                                             ".skgd/memory/constitution.md"])
+    if not pillars:
+        report["status"] = "blocked"
+        report["blockers"].append("docs/pillars/_index.md has no pillars (run /pillars)")
+        return
+    report["pillars"] = {
+        "complete": sum(p["complete"] for p in pillars),
+        "total": len(pillars),
+        "completed": [p["name"] for p in pillars if p["complete"]],
+    }
+    if arg:
+        target = dest / "docs" / "pillars" / f"{arg}.md"
+        if target.is_file():
+            report["questions"] = [m.group(1) for m in map(QUESTION_RE.match,
+                                   target.read_text(encoding="utf-8").splitlines()) if m]
+        else:
+            report["missing"].append(f"docs/pillars/{arg}.md")
+    report["status"] = "partial" if report["missing"] else "ready"
+
+
+@profile("gdd")
+def scout_gdd(dest: Path, report: dict, arg: Optional[str]) -> None:
+    docs = ["docs/game-brief.md", "docs/pillars/_index.md", "docs/architecture.md",
+            ".skgd/roadmap.yaml", ".skgd/memory/constitution.md"]
+    report["missing"] += _rel_missing(dest, docs)
+    report["documents"] = [d for d in docs if d not in report["missing"]]
+    pillars = pillar_status(dest)
+    report["pillars"] = {
+        "complete": sum(p["complete"] for p in pillars),
+        "total": len(pillars),
+        "completed": [p["name"] for p in pillars if p["complete"]],
+    }
+    roadmap = load_yaml(dest / ".skgd" / "roadmap.yaml")
+    cycles = ((roadmap.get("phases") or {}).get("production") or {}).get("cycles") or []
+    features = [f for c in cycles if isinstance(c, dict) for f in (c.get("features") or [])
+                if isinstance(f, dict) and f.get("id")]
+    report["mvp_features"] = [f["id"] for f in features if f.get("priority") == "critical"]
+    if "docs/game-brief.md" in report["missing"]:
+        report["status"] = "blocked"
+        report["blockers"].append("docs/game-brief.md not found (run /brainstorm)")
+    else:
+        report["status"] = "partial" if report["missing"] else "ready"
+
+
+@profile("analyze")
+def scout_analyze(dest: Path, report: dict, arg: Optional[str]) -> None:
+    state = load_state(dest)
+    feature = current_feature(state, arg)
+    report["feature"] = feature
+    if not feature:
+        report["status"] = "blocked"
+        report["blockers"].append("no current feature (pass a feature name)")
+        return
+    spec_dir = f"docs/specs/{feature}"
+    required = [f"{spec_dir}/spec.md", f"{spec_dir}/plan.md", f"{spec_dir}/tasks.md"]
+    report["missing"] += _rel_missing(dest, required + [".skgd/memory/constitution.md",
+                                                        ".skgd/memory/learnings-core.md"])
+    report["documents"] = [p for p in required if p not in report["missing"]]
+
+    conn = open_index(dest)
+    update_index(dest, conn)
+    tasks = query_tasks(conn, feature)
+    criteria = conn.execute("SELECT COUNT(*) AS n FROM criteria WHERE feature = ?",
+                            (feature,)).fetchone()["n"]
+    conn.close()
+    done = sum(1 for t in tasks if t["checked"])
+    report["tasks"] = {"total": len(tasks), "done": done, "remaining": len(tasks) - done,
+                       "mvp_remaining": [], "polish_remaining": 0}
+    report["criteria"] = criteria
+    if any(p in report["missing"] for p in required):
+        report["status"] = "blocked"
+        report["blockers"] += [f"{p} not found" for p in required if p in report["missing"]]
+    else:
+        report["status"] = "ready"
+
+
+def run_scout(dest: Path, command: str, arg: Optional[str] = None) -> dict:
+    """Build the scout report of a command as a dict."""
+    lang, engine = detect_project_settings(dest)
+    report = {
+        "command": command,
+        "arg": arg,
+        "status": "ready",
+        "engine": engine,
+        "language": lang,
+        "feature": None,
+        "missing": _rel_missing(dest, [".skgd/config.yaml", ".skgd/state.yaml"]),
+        "blockers": [],
+    }
+    PROFILES[command](dest, report, arg)
+    return report
+
+
+def _bullets(items: List[str], limit: int = MAX_LIST) -> List[str]:
+    lines = [f"- {item}" for item in items[:limit]]
+    if len(items) > limit:
+        lines.append(f"- ... (+{len(items) - limit})")
+    return lines
+
+
+def render_report(report: dict) -> str:
+    """Render a scout report in the _scout.md Scout Report format."""
+    t = LABELS.get(report["language"], LABELS["en"])
+    title = report["command"] + (f" {report['arg']}" if report.get("arg") else "")
+    lines = [f"## Scout Report: {title}", f"**Status:** {report['status']}",
+             f"**{t['engine']}:** {report['engine']}"]
+    if report.get("feature"):
+        lines.append(f"**{t['feature']}:** {report['feature']}")
+    lines.append(f"**{t['language']}:** {report['language']}")
+
+    session = report.get("session")
+    if session:
+        state = f"{t['resume_from']} {session['resume_from']}" if session["resume_from"] else t["new"]
+        lines += ["", f"**{t['session']}:**", f"- {t['state']}: {state}",
+                  f"- {t['checkpoint']}: {session['checkpoint'] or t['none']}"]
+
+    tasks = report.get("tasks")
+    if tasks:
+        lines += ["", f"**{t['tasks']}:**",
+                  f"- Total: {tasks['total']} | {t['done']}: {tasks['done']} | "
+                  f"{t['remaining']}: {tasks['remaining']}"]
+        if report["command"] == "implement":
+            mvp = tasks["mvp_remaining"]
+            lines.append(f"- {t['mvp_remaining']}: {len(mvp)}")
+            lines += ["  " + b for b in _bullets(mvp)]
+            lines.append(f"- {t['polish_remaining']}: {tasks['polish_remaining']}")
+
+    if "criteria" in report:
+        lines.append(f"**{t['criteria']}:** {report['criteria']}")
+
+    phase = report.get("phase")
+    if phase and phase["name"]:
+        lines += ["", f"**{t['current_phase']}:** {phase['name']}"] + _bullets(phase["points"])
+
+    if "learnings" in report:
+        lines += ["", f"**{t['learnings']}:**"] + (_bullets(report["learnings"]) or [f"- {t['none']}"])
+
+    pillars = report.get("pillars")
+    if pillars is not None:
+        lines += ["", f"**{t['pillars']}:** {pillars['complete']}/{pillars['total']}"]
+        if pillars["completed"]:
+            lines.append(f"**{t['completed']}:** {', '.join(pillars['completed'])}")
+    if report.get("questions"):
+        lines += [f"**{t['questions']}:**"] + _bullets(report["questions"], 12)
+    if report.get("documents"):
+        lines += [f"**{t['documents']}:** {', '.join(report['documents'])}"]
+    if "mvp_features" in report:
+        lines.append(f"**{t['mvp_features']}:** {', '.join(report['mvp_features']) or t['none']}")
+
+    lines += ["", f"**{t['blockers']}:** {'; '.join(report['blockers']) or t['none']}",
+              f"**{t['missing']}:** {', '.join(report['missing']) or t['none']}"]
+    text = "\n".join(lines)
+    return text + f"\n**{t['token_estimate']}:** ~{estimate_tokens(text) + 8} tokens"
+
+
+@click.command()
+@click.argument("command", type=click.Choice(sorted(PROFILES)))
+@click.argument("arg", required=False)
+@click.option("--json", "as_json", is_flag=True, help="Print the report as JSON")
+def scout(command: str, arg: Optional[str], as_json: bool):
+    """Print the Scout Report for a workflow COMMAND.
+
+    ARG is the command argument (feature or pillar name). Reads config
+    and state; the only file it writes is the project index cache
+    (.skgd/cache/index.db), refreshed before the report.
+
+    Examples:
+        skgd scout implement            # Current feature from state.yaml
+        skgd scout deep-dive game-loop
+        skgd scout analyze 001-player-movement --json
+    """
+    dest = require_project_root()
+    start = time.perf_counter()
+    report = run_scout(dest, command, arg)
+    if as_json:
+        report["seconds"] = round(time.perf_counter() - start, 4)
+        click.echo(json.dumps(report, indent=2, ensure_ascii=False))
+    else:
+        click.echo(render_report(report))
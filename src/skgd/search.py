@@ -0,0 +1,372 @@
+"""Design document search - BM25 over an incremental inverted index.
+
+``skgd search`` answers "where did we decide X?" across the game brief,
+GDD, architecture, pillars, every ``docs/specs/<feature>/*.md``, pivot
+analyses and the memory files. Documents are split into sections at their
+markdown headings; each section is indexed as a bag of normalized terms in
+``.skgd/cache/search.db`` (terms -> postings with term frequencies). Like
+the project index, files are only reparsed when their mtime/size changed
+and their content hash differs, and results are ranked with Okapi BM25.
+"""
+
+import hashlib
+import json
+import math
+import os
+import re
+import sqlite3
+import time
+from collections import Counter, defaultdict
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import click
+
+from .cli import require_project_root
+from .learnings import fold
+
+
+SEARCH_FILE = "search.db"
+SCHEMA_VERSION = 1
+
+# Trees searched, relative to the project root
+SEARCH_ROOTS = ("docs", ".skgd/memory")
+
+# BM25 parameters, and how many times heading terms count
+BM25_K1 = 1.2
+BM25_B = 0.75
+HEADING_WEIGHT = 2
+
+DOC_TYPES = ("brief", "gdd", "architecture", "pillar", "spec", "plan", "tasks",
+             "playtest", "pivot", "memory", "doc")
+
+HEADING_RE = re.compile(r"^(#{1,6})\s+(.*?)\s*#*\s*$")
+FENCE_RE = re.compile(r"^\s*(```|~~~)")
+WORD_RE = re.compile(r"\w+")
+
+STOPWORDS = frozenset("""
+a an and are as at be but by for from has have in is it its of on or that the
+this to was were will with we our not no if then than so do does
+au aux avec ce ces dans de des du elle en est et il ils la le les leur mais ne
+nous ou par pas pour qu que qui sa se ses son sont sur un une vous
+""".split())
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE IF NOT EXISTS docs (
+    path TEXT PRIMARY KEY, mtime_ns INTEGER, size INTEGER, sha256 TEXT,
+    doc_type TEXT, feature TEXT
+);
+CREATE TABLE IF NOT EXISTS sections (
+    id INTEGER PRIMARY KEY, path TEXT, doc_type TEXT, feature TEXT,
+    heading TEXT, start_line INTEGER, end_line INTEGER, length INTEGER
+);
+CREATE TABLE IF NOT EXISTS postings (
+    term TEXT, section_id INTEGER, tf INTEGER,
+    PRIMARY KEY (term, section_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS sections_path ON sections (path);
+CREATE INDEX IF NOT EXISTS postings_section ON postings (section_id);
+"""
+
+
+def tokenize(text: str) -> List[str]:
+    """Casefolded, accent-free terms without stopwords or 1-letter words.
+
+    A trailing plural "s" is dropped so "pillars" matches "pillar".
+    """
+    terms = []
+    for word in WORD_RE.findall(fold(text)):
+        if len(word) < 2 or word in STOPWORDS:
+            continue
+        if len(word) > 3 and word.endswith("s") and not word.endswith("ss"):
+            word = word[:-1]
+        terms.append(word)
+    return terms
+
+
+def classify(rel: str) -> Tuple[str, Optional[str]]:
+    """(document type, feature) of a project-relative path."""
+    parts = rel.split("/")
+    name = parts[-1]
+    if parts[0] == ".skgd":
+        return "memory", None
+    if rel == "docs/game-brief.md":
+        return "brief", None
+    if rel == "docs/gdd.md":
+        return "gdd", None
+    if rel == "docs/architecture.md":
+        return "architecture", None
+    if parts[1:2] == ["pillars"]:
+        return "pillar", None
+    if parts[1:2] == ["pivots"]:
+        return "pivot", None
+    if parts[1:2] == ["specs"] and len(parts) >= 4:
+        feature = parts[3] if parts[2] == "_archived" and len(parts) >= 5 else parts[2]
+        stem = name[:-3]
+        return (stem if stem in ("spec", "plan", "tasks", "playtest") else "doc"), feature
+    return "doc", None
+
+
+def split_sections(text: str) -> List[dict]:
+    """Split markdown at headings (outside code fences).
+
+    Returns dicts with heading (path joined by " > "), start_line,
+    end_line (1-based, inclusive) and the section text.
+    """
+    lines = text.splitlines()
+    sections = []
+    stack: List[Tuple[int, str]] = []
+    start, heading, in_fence = 1, "", False
+
+    def close(end: int) -> None:
+        body = "\n".join(lines[start - 1:end])
+        if body.strip():
+            sections.append({"heading": heading, "start_line": start,
+                             "end_line": end, "text": body})
+
+    for lineno, line in enumerate(lines, 1):
+        if FENCE_RE.match(line):
+            in_fence = not in_fence
+            continue
+        m = None if in_fence else HEADING_RE.match(line)
+        if not m:
+            continue
+        close(lineno - 1)
+        level, title = len(m.group(1)), m.group(2)
+        while stack and stack[-1][0] >= level:
+            stack.pop()
+        stack.append((level, title))
+        start, heading = lineno, " > ".join(t for _, t in stack)
+    close(len(lines))
+    return sections
+
+
+def search_path(dest: Path) -> Path:
+    return dest / ".skgd" / "cache" / SEARCH_FILE
+
+
+def open_search_index(dest: Path, rebuild: bool = False) -> sqlite3.Connection:
+    """Open (creating if needed) the search index."""
+    path = search_path(dest)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if rebuild and path.exists():
+        path.unlink()
+    conn = sqlite3.connect(str(path))
+    conn.row_factory = sqlite3.Row
+    conn.executescript(SCHEMA)
+    row = conn.execute("SELECT value FROM meta WHERE key = 'schema'").fetchone()
+    if row is None or int(row["value"]) != SCHEMA_VERSION:
+        conn.executescript("DELETE FROM docs; DELETE FROM sections; DELETE FROM postings;")
+        conn.execute("INSERT OR REPLACE INTO meta VALUES ('schema', ?)", (str(SCHEMA_VERSION),))
+        conn.commit()
+    return conn
+
+
+def searchable_files(dest: Path) -> List[str]:
+    """Project-relative paths of all markdown files under SEARCH_ROOTS."""
+    files = []
+    for top in SEARCH_ROOTS:
+        base = dest / top
+        if not base.is_dir():
+            continue
+        for dirpath, dirs, names in os.walk(base):
+            dirs[:] = sorted(d for d in dirs if not d.startswith("."))
+            rel_dir = Path(dirpath).relative_to(dest).as_posix()
+            files.extend(f"{rel_dir}/{n}" for n in sorted(names) if n.endswith(".md"))
+    return files
+
+
+def update_search_index(dest: Path, conn: sqlite3.Connection) -> dict:
+    """Bring the search index up to date with the project documents.
+
+    Returns dict with scanned, reindexed, removed counts and seconds.
+    """
+    start = time.perf_counter()
+    stats = {"scanned": 0, "reindexed": 0, "removed": 0}
+    known = {r["path"]: r for r in conn.execute("SELECT * FROM docs")}
+    seen = set()
+
+    for rel in searchable_files(dest):
+        seen.add(rel)
+        stats["scanned"] += 1
+        path = dest / rel
+        st = path.stat()
+        row = known.get(rel)
+        if row and row["mtime_ns"] == st.st_mtime_ns and row["size"] == st.st_size:
+            continue
+        data = path.read_bytes()
+        sha = hashlib.sha256(data).hexdigest()
+        doc_type, feature = classify(rel)
+        if not row or row["sha256"] != sha:
+            _reindex_doc(conn, rel, doc_type, feature, data.decode("utf-8", errors="replace"))
+            stats["reindexed"] += 1
+        conn.execute("INSERT OR REPLACE INTO docs VALUES (?, ?, ?, ?, ?, ?)",
+                     (rel, st.st_mtime_ns, st.st_size, sha, doc_type, feature))
+
+    for rel in set(known) - seen:
+        _forget_doc(conn, rel)
+        conn.execute("DELETE FROM docs WHERE path = ?", (rel,))
+        stats["removed"] += 1
+
+    conn.commit()
+    stats["seconds"] = time.perf_counter() - start
+    return stats
+
+
+def _forget_doc(conn: sqlite3.Connection, rel: str) -> None:
+    conn.execute("DELETE FROM postings WHERE section_id IN "
+                 "(SELECT id FROM sections WHERE path = ?)", (rel,))
+    conn.execute("DELETE FROM sections WHERE path = ?", (rel,))
+
+
+def _reindex_doc(conn: sqlite3.Connection, rel: str, doc_type: str,
+                 feature: Optional[str], text: str) -> None:
+    _forget_doc(conn, rel)
+    postings = []
+    for section in split_sections(text):
+        heading_terms = tokenize(section["heading"].rsplit(" > ", 1)[-1])
+        terms = Counter(tokenize(section["text"]))
+        for term in heading_terms:
+            terms[term] += HEADING_WEIGHT - 1
+        if not terms:
+            continue
+        cur = conn.execute(
+            "INSERT INTO sections (path, doc_type, feature, heading, start_line, end_line, length) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (rel, doc_type, feature, section["heading"], section["start_line"],
+             section["end_line"], sum(terms.values())))
+        postings.extend((term, cur.lastrowid, tf) for term, tf in terms.items())
+    conn.executemany("INSERT INTO postings VALUES (?, ?, ?)", postings)
+
+
+def search(
+    conn: sqlite3.Connection,
+    query: str,
+    doc_types: Optional[List[str]] = None,
+    feature: Optional[str] = None,
+    limit: int = 10
+) -> List[dict]:
+    """Rank sections for a query with BM25.
+
+    A term ending in "*" matches every indexed term with that prefix.
+    Returns dicts with path, heading, start_line, end_line, doc_type,
+    feature, score and the matched terms.
+    """
+    filters, args = "", []
+    if doc_types:
+        filters += f" AND s.doc_type IN ({','.join('?' * len(doc_types))})"
+        args.extend(doc_types)
+    if feature:
+        filters += " AND s.feature = ?"
+        args.append(feature)
+
+    totals = conn.execute("SELECT COUNT(*) AS n, AVG(length) AS avgdl FROM sections").fetchone()
+    n_sections, avgdl = totals["n"], totals["avgdl"] or 1.0
+    if not n_sections:
+        return []
+
+    scores: Dict[int, float] = defaultdict(float)
+    matched: Dict[int, set] = defaultdict(set)
+    # (SQL condition, args) per query term, deduplicated
+    conditions = {}
+    for raw in query.split():
+        if raw.endswith("*"):
+            words = WORD_RE.findall(fold(raw))
+            if words:
+                conditions[("p.term >= ? AND p.term < ?", words[0], words[0] + "\uffff")] = None
+        else:
+            for term in tokenize(raw):
+                conditions[("p.term = ?", term)] = None
+
+    for where, *term_args in conditions:
+        postings: Dict[str, list] = defaultdict(list)
+        for row in conn.execute(
+            "SELECT p.term, p.section_id, p.tf, s.length FROM postings p "
+            f"JOIN sections s ON s.id = p.section_id WHERE {where}", term_args
+        ):
+            postings[row["term"]].append(row)
+        for term, rows in postings.items():
+            df = len(rows)
+            idf = math.log(1 + (n_sections - df + 0.5) / (df + 0.5))
+            for row in rows:
+                tf = row["tf"]
+                norm = BM25_K1 * (1 - BM25_B + BM25_B * row["length"] / avgdl)
+                scores[row["section_id"]] += idf * tf * (BM25_K1 + 1) / (tf + norm)
+                matched[row["section_id"]].add(term)
+    if not scores:
+        return []
+
+    # Filters restrict the hits, not the corpus statistics
+    if filters:
+        allowed = {r["id"] for r in conn.execute(
+            f"SELECT s.id FROM sections s WHERE 1=1{filters}", args)}
+        scores = {k: v for k, v in scores.items() if k in allowed}
+
+    results = []
+    for section_id, score in sorted(scores.items(), key=lambda kv: -kv[1])[:limit]:
+        row = conn.execute("SELECT * FROM sections WHERE id = ?", (section_id,)).fetchone()
+        results.append({
+            "path": row["path"], "heading": row["heading"],
+            "start_line": row["start_line"], "end_line": row["end_line"],
+            "doc_type": row["doc_type"], "feature": row["feature"],
+            "score": round(score, 3), "terms": sorted(matched[section_id]),
+        })
+    return results
+
+
+def snippet(dest: Path, hit: dict, width: int = 100) -> str:
+    """First body line of a hit containing one of its matched terms."""
+    try:
+        with open(dest / hit["path"], "r", encoding="utf-8", errors="replace") as f:
+            lines = f.read().splitlines()[hit["start_line"] - 1:hit["end_line"]]
+    except OSError:
+        return ""
+    for line in lines[1:] + lines[:1]:
+        if set(tokenize(line)) & set(hit["terms"]):
+            line = line.strip()
+            return line if len(line) <= width else line[:width - 1] + "…"
+    return ""
+
+
+@click.command("search")
+@click.argument("query", nargs=-1, required=True)
+@click.option("--type", "-t", "doc_types", multiple=True, type=click.Choice(DOC_TYPES),
+              help="Only this document type (repeatable)")
+@click.option("--feature", "-f", help="Only documents of this feature (docs/specs/<feature>)")
+@click.option("--limit", "-n", default=10, show_default=True, help="Maximum hits")
+@click.option("--json", "as_json", is_flag=True, help="Print hits as JSON")
+@click.option("--rebuild", is_flag=True, help="Drop the search index and rebuild it")
+def search_command(query: Tuple[str, ...], doc_types: Tuple[str, ...], feature: Optional[str],
+                   limit: int, as_json: bool, rebuild: bool):
+    """Search design documents, specs and memory files.
+
+    Hits are sections (heading path and line range) ranked with BM25.
+    End a word with * to match a prefix.
+
+    Examples:
+        skgd search double jump
+        skgd search "coyote time" --type spec --type plan
+        skgd search inventor* -f 003-inventory --json
+    """
+    dest = require_project_root()
+    conn = open_search_index(dest, rebuild=rebuild)
+    update_search_index(dest, conn)
+    hits = search(conn, " ".join(query), list(doc_types), feature, limit)
+
+    if as_json:
+        click.echo(json.dumps(hits, indent=2, ensure_ascii=False))
+        return
+    if not hits:
+        click.secho("No matches.", fg="yellow")
+        return
+    for hit in hits:
+        location = f"{hit['path']}:{hit['start_line']}-{hit['end_line']}"
+        click.echo(f"{click.style(location, fg='cyan')}  "
+                   f"{click.style(hit['doc_type'], dim=True)}  {hit['score']:.2f}")
+        if hit["heading"]:
+            click.secho(f"  {hit['heading']}", bold=True)
+        text = snippet(dest, hit)
+        if text:
+            click.echo(f"  {text}")
+        click.echo()
@@ -0,0 +1,159 @@
+"""Skill selection - install only the skills a project's profile needs.
+
+``common/skills.yaml`` declares which engine, art-style profile and asset
+MCP each skill (and any file inside it) applies to. init, upgrade and
+``skgd skills`` pass the resulting selector to the manifest sync, so a
+Godot project never gets ``unity-gamedev`` and ``pixellab-assets`` only
+appears once PixelLab is enabled. Changing ``config.yaml`` and running
+``skgd skills`` adds or removes just the files whose rules changed.
+"""
+
+import fnmatch
+import json
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+import click
+
+from .cli import require_project_root
+
+SKILL_MANIFEST = "common/skills.yaml"
+SKILLS_PREFIX = "common/skills/"
+ACTION_LABELS = {"add": ("Would add", "Added"), "update": ("Would update", "Updated"),
+                 "remove": ("Would remove", "Removed")}
+
+
+def load_skill_rules(source) -> Dict[str, dict]:
+    """{skill: rule} from the skill manifest of a template source."""
+    import yaml
+
+    if not source.exists(SKILL_MANIFEST):
+        return {}
+    doc = yaml.safe_load(source.read_bytes(SKILL_MANIFEST)) or {}
+    skills = doc.get("skills") if isinstance(doc, dict) else None
+    return {name: rule or {} for name, rule in (skills or {}).items()}
+
+
+def project_profile(config: dict) -> dict:
+    """Engine, art-style profile and enabled asset MCPs of a config.yaml."""
+    assets = (config.get("mcp") or {}).get("assets") or {}
+    return {
+        "engine": config.get("engine") or "unity",
+        "profile": assets.get("profile"),
+        "asset_mcps": sorted(name for name, entry in assets.items()
+                             if isinstance(entry, dict) and entry.get("enabled")),
+    }
+
+
+def load_project_profile(dest: Path) -> dict:
+    """project_profile() of a project's .skgd/config.yaml."""
+    from .state import load_yaml
+
+    return project_profile(load_yaml(dest / ".skgd" / "config.yaml"))
+
+
+def mismatch(rule: dict, profile: dict) -> Optional[str]:
+    """Why a rule excludes the profile, or None if it applies."""
+    engines = rule.get("engine")
+    if engines and profile["engine"] not in engines:
+        return f"engine is {profile['engine']} (needs {', '.join(engines)})"
+    profiles = rule.get("profile")
+    if profiles and profile["profile"] and profile["profile"] not in profiles:
+        return f"art style is {profile['profile']} (needs {', '.join(profiles)})"
+    mcps = rule.get("asset_mcp")
+    if mcps and not set(mcps) & set(profile["asset_mcps"]):
+        return f"asset MCP {' or '.join(mcps)} not enabled"
+    return None
+
+
+def file_mismatch(rule: dict, tail: str, profile: dict) -> Optional[str]:
+    """mismatch() for one file of a skill (path relative to the skill)."""
+    reason = mismatch(rule, profile)
+    if reason is None:
+        for pattern, file_rule in (rule.get("files") or {}).items():
+            if fnmatch.fnmatchcase(tail, pattern):
+                reason = mismatch(file_rule or {}, profile)
+                if reason is not None:
+                    break
+    return reason
+
+
+def skill_selector(rules: Dict[str, dict], profile: dict) -> Callable[[str], bool]:
+    """Template path -> whether to install it (paths outside skills pass)."""
+    def include(rel: str) -> bool:
+        if not rel.startswith(SKILLS_PREFIX):
+            return True
+        skill, _, tail = rel[len(SKILLS_PREFIX):].partition("/")
+        rule = rules.get(skill)
+        return rule is None or file_mismatch(rule, tail, profile) is None
+    return include
+
+
+def skill_report(source, rules: Dict[str, dict], profile: dict) -> List[dict]:
+    """Per shipped skill: files selected, files skipped and why."""
+    skills: Dict[str, dict] = {}
+    for rel in source.files(SKILLS_PREFIX):
+        skill, _, tail = rel[len(SKILLS_PREFIX):].partition("/")
+        entry = skills.setdefault(skill, {"skill": skill, "files": 0, "skipped": {}})
+        reason = file_mismatch(rules.get(skill) or {}, tail, profile)
+        if reason is None:
+            entry["files"] += 1
+        else:
+            entry["skipped"][tail] = reason
+    return [skills[name] for name in sorted(skills)]
+
+
+@click.command()
+@click.option("--dry-run", is_flag=True, help="Show what would be added or removed")
+@click.option("--json", "as_json", is_flag=True, help="Print the selection as JSON")
+def skills(dry_run: bool, as_json: bool):
+    """Install the skills that match the project profile.
+
+    Reads engine, mcp.assets.profile and the enabled asset MCPs from
+    .skgd/config.yaml and syncs .claude/skills/ to match: skills that now
+    apply are added, ones that no longer do are removed. Run it after
+    changing the profile (e.g. enabling PixelLab).
+
+    Examples:
+        skgd skills
+        skgd skills --dry-run
+    """
+    from .cli import detect_project_settings, get_template_dir, get_template_source
+    from .manifest import apply_sync, plan_sync
+
+    dest = require_project_root()
+    lang = detect_project_settings(dest)[0]
+    source = get_template_source()
+    rules = load_skill_rules(source)
+    profile = load_project_profile(dest)
+    report = skill_report(source, rules, profile)
+
+    ops = plan_sync(dest, get_template_dir(), lang, ["skills"],
+                    include=skill_selector(rules, profile))
+    changes = [op for op in ops if op["action"] != "keep"]
+    if not dry_run and changes:
+        apply_sync(dest, source, ops)
+
+    if as_json:
+        click.echo(json.dumps({"profile": profile, "skills": report,
+                               "changes": [{"action": op["action"], "path": op["path"]} for op in changes],
+                               "applied": not dry_run}, indent=2))
+        return
+
+    style = profile["profile"] or "no art style"
+    mcps = ", ".join(profile["asset_mcps"]) or "no asset MCPs"
+    click.echo(f"Profile: {profile['engine']}, {style}, {mcps}")
+    for entry in report:
+        skipped = entry["skipped"]
+        if not entry["files"]:
+            click.echo(f"  - {entry['skill']}: {next(iter(skipped.values()))}")
+            continue
+        click.secho(f"  ✓ {entry['skill']} ({entry['files']} files)", fg="green")
+        for tail, reason in skipped.items():
+            click.echo(f"      - {tail}: {reason}")
+    if not changes:
+        click.echo("Skills are up to date.")
+        return
+    for op in changes:
+        label = ACTION_LABELS[op["action"]][0 if dry_run else 1]
+        click.echo(f"  {label} {op['path']}")
@@ -0,0 +1,369 @@
+"""Snapshot store - deduplicated project snapshots for /snapshot.
+
+Each snapshot is a small manifest (``.skgd/snapshots/<version>/snapshot.json``)
+mapping project paths to SHA-256 digests. File contents live once in a
+content-addressed object store (``.skgd/snapshots/objects/ab/cdef...``), so
+a spec unchanged across ten milestones is stored once. Files whose size and
+mtime match the previous snapshot reuse its digest without being read, so
+creating a snapshot costs time proportional to what changed.
+"""
+
+import difflib
+import json
+import os
+import re
+import shutil
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import click
+
+from .cli import require_project_root
+from .copyengine import human_size
+from .manifest import file_digest
+
+
+SNAPSHOTS_DIR = ".skgd/snapshots"
+OBJECTS_DIR = "objects"
+SNAPSHOT_MANIFEST = "snapshot.json"
+
+# Project paths captured by a snapshot (directories are recursive)
+SNAPSHOT_PATHS = [".skgd/state.yaml", ".skgd/config.yaml", ".skgd/roadmap.yaml", "docs"]
+
+_VERSION_RE = re.compile(r"^[\w.+-]+$")
+
+
+def snapshots_root(dest: Path) -> Path:
+    return dest / SNAPSHOTS_DIR
+
+
+def object_path(dest: Path, sha: str) -> Path:
+    return snapshots_root(dest) / OBJECTS_DIR / sha[:2] / sha[2:]
+
+
+def collect_files(dest: Path) -> List[str]:
+    """Project-relative posix paths of every file a snapshot captures."""
+    files = []
+    for rel in SNAPSHOT_PATHS:
+        path = dest / rel
+        if path.is_file():
+            files.append(rel)
+        elif path.is_dir():
+            for root, dirs, names in os.walk(path):
+                dirs[:] = sorted(d for d in dirs if not d.startswith("."))
+                files.extend(Path(root, n).relative_to(dest).as_posix()
+                             for n in sorted(names) if not n.startswith("."))
+    return sorted(files)
+
+
+def list_snapshots(dest: Path) -> List[dict]:
+    """Snapshot manifests sorted by creation time.
+
+    Legacy snapshots (plain copied directories) are listed with
+    legacy=True and no file table.
+    """
+    root = snapshots_root(dest)
+    if not root.is_dir():
+        return []
+    snapshots = []
+    for entry in root.iterdir():
+        if not entry.is_dir() or entry.name == OBJECTS_DIR:
+            continue
+        manifest = entry / SNAPSHOT_MANIFEST
+        if manifest.is_file():
+            with open(manifest, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            data["legacy"] = False
+            mtime = manifest.stat().st_mtime_ns
+        else:
+            created = datetime.fromtimestamp(entry.stat().st_mtime).isoformat(timespec="seconds")
+            data = {"version": entry.name, "created": created, "files": {}, "legacy": True}
+            mtime = entry.stat().st_mtime_ns
+        snapshots.append((data.get("created") or "", mtime, data))
+    return [data for _, _, data in sorted(snapshots, key=lambda s: s[:2])]
+
+
+def load_snapshot(dest: Path, version: str) -> dict:
+    """Load one snapshot manifest, raising ClickException if unknown."""
+    manifest = snapshots_root(dest) / version / SNAPSHOT_MANIFEST
+    if not manifest.is_file():
+        if (snapshots_root(dest) / version).is_dir():
+            raise click.ClickException(f"Snapshot {version} is a legacy copy (no manifest); "
+                                       f"compare it with git instead.")
+        raise click.ClickException(f"Unknown snapshot: {version}")
+    with open(manifest, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def next_version(snapshots: List[dict]) -> str:
+    """Increment the last number of the latest version (v0.1 -> v0.2)."""
+    if not snapshots:
+        return "v0.1"
+    latest = snapshots[-1]["version"]
+    m = re.search(r"(\d+)(?!.*\d)", latest)
+    if not m:
+        return latest + ".1"
+    return latest[:m.start()] + str(int(m.group(1)) + 1) + latest[m.end():]
+
+
+def hash_tree(dest: Path, previous: Optional[dict] = None) -> Dict[str, dict]:
+    """Record sha256/size/mtime of every captured file.
+
+    Files whose (size, mtime_ns) match the previous record reuse its hash.
+    """
+    known = (previous or {}).get("files", {})
+    files = {}
+    for rel in collect_files(dest):
+        st = (dest / rel).stat()
+        record = known.get(rel)
+        if record and record.get("size") == st.st_size and record.get("mtime_ns") == st.st_mtime_ns:
+            sha = record["sha256"]
+        else:
+            sha = file_digest(dest / rel)
+        files[rel] = {"sha256": sha, "size": st.st_size, "mtime_ns": st.st_mtime_ns,
+                      "mode": st.st_mode & 0o777}
+    return files
+
+
+def store_objects(dest: Path, files: Dict[str, dict]) -> Tuple[int, int]:
+    """Copy missing file contents into the object store.
+
+    Returns (objects written, bytes written).
+    """
+    written = size = 0
+    for rel, record in files.items():
+        target = object_path(dest, record["sha256"])
+        if target.exists():
+            continue
+        target.parent.mkdir(parents=True, exist_ok=True)
+        tmp = target.with_name(target.name + ".tmp")
+        shutil.copyfile(dest / rel, tmp)
+        os.replace(tmp, target)
+        written += 1
+        size += record["size"]
+    return written, size
+
+
+def _git_head(dest: Path) -> Optional[str]:
+    import subprocess
+
+    try:
+        result = subprocess.run(["git", "rev-parse", "HEAD"], cwd=dest,
+                                capture_output=True, text=True, timeout=5)
+    except (OSError, subprocess.TimeoutExpired):
+        return None
+    return result.stdout.strip() if result.returncode == 0 else None
+
+
+def create_snapshot(dest: Path, version: Optional[str] = None, notes: Optional[str] = None) -> dict:
+    """Create a snapshot of the project; returns its manifest plus stats."""
+    from .state import StateStore
+
+    start = time.perf_counter()
+    store = StateStore(dest)
+    store.compact()
+    snapshots = [s for s in list_snapshots(dest) if not s["legacy"]]
+    version = version or next_version(list_snapshots(dest))
+    if not _VERSION_RE.match(version):
+        raise click.ClickException(f"Invalid snapshot version: {version!r}")
+    if (snapshots_root(dest) / version).exists():
+        raise click.ClickException(f"Snapshot {version} already exists")
+
+    previous = snapshots[-1] if snapshots else None
+    files = hash_tree(dest, previous)
+    objects, stored = store_objects(dest, files)
+    state = store.load()
+    manifest = {
+        "version": version,
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "git_commit": _git_head(dest),
+        "parent": previous["version"] if previous else None,
+        "phase": state.get("phase"),
+        "specs_completed": (state.get("design") or {}).get("specs_completed") or [],
+        "notes": notes,
+        "files": files,
+    }
+    snap_dir = snapshots_root(dest) / version
+    snap_dir.mkdir(parents=True)
+    tmp = snap_dir / (SNAPSHOT_MANIFEST + ".tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=1, sort_keys=True)
+    os.replace(tmp, snap_dir / SNAPSHOT_MANIFEST)
+
+    store.set("snapshots.count", (store.get("snapshots.count") or 0) + 1)
+    store.set("snapshots.latest", version)
+    manifest["stats"] = {"objects_written": objects, "bytes_written": stored,
+                         "seconds": time.perf_counter() - start}
+    return manifest
+
+
+def diff_trees(old: Dict[str, dict], new: Dict[str, dict]) -> Dict[str, List[str]]:
+    """Compare two file tables by hash: added, removed, modified paths."""
+    return {
+        "added": sorted(set(new) - set(old)),
+        "removed": sorted(set(old) - set(new)),
+        "modified": sorted(p for p in set(old) & set(new)
+                           if old[p]["sha256"] != new[p]["sha256"]),
+    }
+
+
+def _read_version(dest: Path, files: Dict[str, dict], rel: str, working: bool) -> List[str]:
+    if rel not in files:
+        return []
+    path = dest / rel if working else object_path(dest, files[rel]["sha256"])
+    try:
+        return path.read_text(encoding="utf-8").splitlines(keepends=True)
+    except (OSError, UnicodeDecodeError):
+        return ["<binary or unreadable>\n"]
+
+
+def restore_snapshot(dest: Path, manifest: dict, delete: bool = False) -> Dict[str, List[str]]:
+    """Write snapshot files that differ from the working tree.
+
+    With delete=True, captured files absent from the snapshot are removed.
+    Returns the applied diff (working tree -> snapshot).
+    """
+    current = hash_tree(dest, manifest)
+    changes = diff_trees(current, manifest["files"])
+    for rel in changes["added"] + changes["modified"]:
+        record = manifest["files"][rel]
+        source = object_path(dest, record["sha256"])
+        if not source.exists():
+            raise click.ClickException(f"Snapshot object missing for {rel} ({record['sha256'][:12]})")
+        target = dest / rel
+        target.parent.mkdir(parents=True, exist_ok=True)
+        tmp = target.with_name(target.name + ".skgd-restore")
+        shutil.copyfile(source, tmp)
+        os.chmod(tmp, record.get("mode", 0o644))
+        os.replace(tmp, target)
+    if delete:
+        for rel in changes["removed"]:
+            (dest / rel).unlink()
+    else:
+        changes["removed"] = []
+    if ".skgd/state.yaml" in changes["added"] + changes["modified"]:
+        # The restored state supersedes pending journal entries, but the
+        # snapshot bookkeeping must keep describing the store
+        from .state import JOURNAL_FILE, StateStore
+
+        journal = dest / ".skgd" / JOURNAL_FILE
+        if journal.exists():
+            journal.unlink()
+        snapshots = list_snapshots(dest)
+        store = StateStore(dest)
+        store.set("snapshots.count", len(snapshots))
+        store.set("snapshots.latest", snapshots[-1]["version"] if snapshots else None)
+    return changes
+
+
+@click.group()
+def snapshot():
+    """Create, compare and restore deduplicated project snapshots.
+
+    Snapshots capture state.yaml, config.yaml, roadmap.yaml and docs/.
+    Unchanged files are stored once in .skgd/snapshots/objects.
+    """
+
+
+@snapshot.command("create")
+@click.argument("version", required=False)
+@click.option("--notes", "-n", help="Notes stored with the snapshot")
+def snapshot_create(version: Optional[str], notes: Optional[str]):
+    """Snapshot the project as VERSION (default: increment the latest)."""
+    dest = require_project_root()
+    manifest = create_snapshot(dest, version, notes)
+    stats = manifest["stats"]
+    changes = diff_trees(load_snapshot(dest, manifest["parent"])["files"], manifest["files"]) \
+        if manifest["parent"] else None
+
+    click.secho(f"Snapshot created: {manifest['version']}", fg="green", bold=True)
+    click.echo(f"  Files: {len(manifest['files'])}, new objects: {stats['objects_written']} "
+               f"({human_size(stats['bytes_written'])}) in {stats['seconds'] * 1000:.0f}ms")
+    if changes:
+        click.echo(f"  Since {manifest['parent']}: +{len(changes['added'])} "
+                   f"~{len(changes['modified'])} -{len(changes['removed'])}")
+    if manifest["git_commit"]:
+        click.echo(f"  Git commit: {manifest['git_commit'][:12]}")
+
+
+@snapshot.command("list")
+@click.option("--json", "as_json", is_flag=True, help="Print snapshots as JSON")
+def snapshot_list(as_json: bool):
+    """List snapshots, oldest first."""
+    dest = require_project_root()
+    snapshots = list_snapshots(dest)
+    if as_json:
+        click.echo(json.dumps([{k: v for k, v in s.items() if k != "files"} for s in snapshots],
+                              indent=2))
+        return
+    if not snapshots:
+        click.echo("No snapshots yet. Create one with: skgd snapshot create")
+        return
+    for s in snapshots:
+        if s["legacy"]:
+            detail = click.style("legacy copy", dim=True)
+        else:
+            size = sum(r["size"] for r in s["files"].values())
+            detail = f"{len(s['files'])} files, {human_size(size)}"
+            if s.get("phase"):
+                detail += f", phase {s['phase']}"
+        click.echo(f"  {click.style(s['version'], fg='cyan'):<24} {s.get('created') or '':<20} {detail}")
+        if s.get("notes"):
+            click.echo(f"      {s['notes']}")
+
+
+@snapshot.command("diff")
+@click.argument("old")
+@click.argument("new", required=False)
+@click.option("--patch", "-p", is_flag=True, help="Show unified diffs of changed text files")
+def snapshot_diff(old: str, new: Optional[str], patch: bool):
+    """Show what changed between snapshot OLD and NEW (default: working tree)."""
+    dest = require_project_root()
+    old_manifest = load_snapshot(dest, old)
+    if new:
+        new_files, working = load_snapshot(dest, new)["files"], False
+    else:
+        new_files, working = hash_tree(dest, old_manifest), True
+    changes = diff_trees(old_manifest["files"], new_files)
+
+    for label, color, sign in (("added", "green", "+"), ("modified", "yellow", "~"),
+                               ("removed", "red", "-")):
+        for rel in changes[label]:
+            click.secho(f"  {sign} {rel}", fg=color)
+            if patch and label == "modified":
+                lines = difflib.unified_diff(
+                    _read_version(dest, old_manifest["files"], rel, False),
+                    _read_version(dest, new_files, rel, working),
+                    fromfile=f"{old}/{rel}", tofile=f"{new or 'working'}/{rel}")
+                click.echo("".join(lines), nl=False)
+    total = sum(len(v) for v in changes.values())
+    click.echo(f"\n  {total} changed: +{len(changes['added'])} "
+               f"~{len(changes['modified'])} -{len(changes['removed'])}")
+
+
+@snapshot.command("restore")
+@click.argument("version")
+@click.option("--delete", is_flag=True, help="Also remove captured files absent from the snapshot")
+@click.option("--no-interactive", "-y", is_flag=True, help="Skip the confirmation prompt")
+def snapshot_restore(version: str, delete: bool, no_interactive: bool):
+    """Restore state, config, roadmap and docs/ from snapshot VERSION."""
+    dest = require_project_root()
+    manifest = load_snapshot(dest, version)
+    preview = diff_trees(hash_tree(dest, manifest), manifest["files"])
+    count = len(preview["added"]) + len(preview["modified"]) + (len(preview["removed"]) if delete else 0)
+    if count == 0:
+        click.echo(f"Working tree already matches {version}.")
+        return
+    if not no_interactive:
+        import questionary
+
+        if not questionary.confirm(f"Overwrite {count} files with snapshot {version}?",
+                                   default=False).ask():
+            click.echo("Restore cancelled.")
+            sys.exit(0)
+    changes = restore_snapshot(dest, manifest, delete)
+    click.secho(f"Restored {version}: {len(changes['added']) + len(changes['modified'])} files written"
+                + (f", {len(changes['removed'])} removed" if changes["removed"] else ""), fg="green")
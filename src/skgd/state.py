@@ -0,0 +1,589 @@
+"""State store - journaled, atomic updates of ``.skgd/state.yaml``.
+
+Single-key updates are appended to ``.skgd/state.journal`` (one JSON object
+per line) instead of reserializing the whole document. Readers replay the
+journal on top of state.yaml (``load_state``, ``skgd state get``). Once the
+journal grows past a threshold, or on ``skgd state compact``, it is folded
+in: only the lines of changed values are rewritten, so the comments and
+layout of state.yaml survive, and the result is written to a temp file,
+fsynced and swapped in with ``os.replace``. The applied entries are then
+dropped from the journal.
+
+state.yaml carries a ``# journal-seq: N`` header line recording the last
+journal entry folded into it, so a crash between the swap and the journal
+trim never applies an entry twice. Sequence numbers are a counter (one past
+the highest already written), never clock values. Appends and compaction
+hold ``.skgd/state.lock``, so an entry written by another process (e.g.
+``skgd watch``) during a compaction is never dropped by the journal trim.
+Unbounded history lists are capped at compaction time; older entries move
+to ``.skgd/state-archive.jsonl``.
+"""
+
+import contextlib
+import copy
+import json
+import os
+import re
+from pathlib import Path
+from typing import Any, List, Optional, Tuple
+
+import click
+
+from .cli import require_project_root
+
+
+STATE_FILE = "state.yaml"
+JOURNAL_FILE = "state.journal"
+LOCK_FILE = "state.lock"
+ARCHIVE_FILE = "state-archive.jsonl"
+
+# Compact once the journal holds this many entries or bytes
+COMPACT_ENTRIES = 64
+COMPACT_BYTES = 64 * 1024
+
+# History lists kept in state.yaml (older entries are archived)
+HISTORY_LIMITS = {
+    "implementation.sessions.history": 20,
+    "pivots.history": 20,
+}
+
+STATE_HEADER = ("# Spec Kit Game Dev - Project State",
+                "# Automatically managed by workflow commands")
+
+_SEQ_RE = re.compile(r"^#\s*journal-seq:\s*(\d+)\s*$")
+_MISSING = object()
+
+
+def yaml_loader():
+    """The C-accelerated safe loader when libyaml is available."""
+    import yaml
+
+    return getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def yaml_dumper():
+    import yaml
+
+    return getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+
+def load_yaml(path: Path) -> dict:
+    """Load a YAML mapping, empty if missing or invalid."""
+    import yaml
+
+    if not path.is_file():
+        return {}
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = yaml.load(f, Loader=yaml_loader())
+    except (OSError, yaml.YAMLError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def dump_yaml(data: Any) -> str:
+    import yaml
+
+    return yaml.dump(data, Dumper=yaml_dumper(), default_flow_style=False,
+                     sort_keys=False, allow_unicode=True)
+
+
+def parse_value(text: str) -> Any:
+    """Parse a CLI value as a YAML scalar/flow value ("3", "true", "[a, b]")."""
+    import yaml
+
+    try:
+        return yaml.load(text, Loader=yaml_loader())
+    except yaml.YAMLError:
+        return text
+
+
+def split_key(key: str) -> List[str]:
+    parts = key.split(".")
+    if not all(parts):
+        raise ValueError(f"Invalid state key: {key!r}")
+    return parts
+
+
+def get_key(data: dict, key: str, default: Any = None) -> Any:
+    """Value at a dotted key of a nested mapping."""
+    node = data
+    for part in split_key(key):
+        if not isinstance(node, dict) or part not in node:
+            return default
+        node = node[part]
+    return node
+
+
+def apply_entry(data: dict, entry: dict) -> None:
+    """Apply one journal entry (set, append, delete) to a state mapping."""
+    parts = split_key(entry["key"])
+    node = data
+    for part in parts[:-1]:
+        child = node.get(part)
+        if not isinstance(child, dict):
+            if entry["op"] == "delete":
+                return
+            child = node[part] = {}
+        node = child
+    leaf = parts[-1]
+    if entry["op"] == "set":
+        node[leaf] = entry["value"]
+    elif entry["op"] == "append":
+        current = node.get(leaf)
+        if not isinstance(current, list):
+            current = node[leaf] = [] if current is None else [current]
+        current.append(entry["value"])
+    elif entry["op"] == "delete":
+        node.pop(leaf, None)
+    else:
+        raise ValueError(f"Unknown journal operation: {entry['op']!r}")
+
+
+# In-place patching of state.yaml: compaction rewrites only the lines of
+# values that changed, so the schema comments of the template survive.
+
+_KEY_RE = re.compile(r"""^ *(?P<key>"[^"]*"|'[^']*'|[^\s#'"\-][^:#]*?) *:(?:\s+(?P<rest>.*))?$""")
+
+
+class _Unpatchable(Exception):
+    pass
+
+
+def _split_comment(rest: str) -> Tuple[str, str]:
+    """Split the text after "key:" into (value, inline comment)."""
+    quote = None
+    for i, ch in enumerate(rest):
+        if quote:
+            if ch == quote:
+                quote = None
+        elif ch in "'\"" and (i == 0 or rest[i - 1] in " [{,"):
+            quote = ch
+        elif ch == "#" and (i == 0 or rest[i - 1] in " \t"):
+            return rest[:i].rstrip(), rest[i:]
+    return rest.rstrip(), ""
+
+
+def _index_yaml(lines: List[str]) -> dict:
+    """Tree of the block mapping keys in lines, with their line spans.
+
+    Each node has start/end (line range), indent, value (text after the
+    colon), comment and comment_col, and children (for block mappings).
+    Sequences, flow collections and multi-line scalars are opaque leaves.
+    """
+    root = {"start": -1, "end": 0, "indent": -1, "value": "", "children": {}, "opaque": False}
+    stack = [root]
+    for i, line in enumerate(lines):
+        stripped = line.strip()
+        if not stripped or stripped.startswith("#"):
+            continue
+        indent = len(line) - len(line.lstrip(" "))
+        item = stripped == "-" or stripped.startswith("- ")
+        while len(stack) > 1 and (indent < stack[-1]["indent"] or indent == stack[-1]["indent"]
+                                  and not (item and stack[-1]["value"] == "")):
+            stack.pop()
+        for node in stack:
+            node["end"] = i + 1
+        top = stack[-1]
+        if top["opaque"] or (top is not root and top["value"]):
+            continue
+        if item:
+            if top is root:
+                raise _Unpatchable("top-level sequence")
+            top["opaque"] = True
+            continue
+        m = _KEY_RE.match(line)
+        if not m or top.setdefault("child_indent", indent) != indent:
+            raise _Unpatchable(f"line {i + 1}")
+        key_text = m.group("key")
+        key = key_text[1:-1] if key_text[0] in "'\"" else key_text
+        value, comment = _split_comment(m.group("rest") or "")
+        node = {"start": i, "end": i + 1, "indent": indent, "key_text": key_text,
+                "value": value, "comment": comment,
+                "comment_col": len(line) - len(comment) if comment else 0,
+                "children": {}, "opaque": False}
+        top["children"][key] = node
+        stack.append(node)
+    return root
+
+
+def _flow(value: Any) -> str:
+    """value as a single-line YAML flow scalar or collection."""
+    import yaml
+
+    text = yaml.dump([value], Dumper=yaml_dumper(), default_flow_style=True,
+                     sort_keys=False, width=2 ** 31 - 1, allow_unicode=True)
+    return text.strip()[1:-1]
+
+
+def _render_key(key_text: str, value: Any, indent: int, node: Optional[dict] = None) -> List[str]:
+    """Lines for "key: value", keeping the style and comment of node."""
+    pad = " " * indent
+    old_value = node["value"] if node else ""
+    nested = isinstance(value, (dict, list)) and any(
+        isinstance(v, (dict, list)) for v in (value.values() if isinstance(value, dict) else value))
+    # Block style for new keys and for records (e.g. history: [] -> entries);
+    # flow style where the file already used it (sprites: { defined: 0, ... })
+    if value and (old_value == "" or nested and old_value in ("[]", "{}")):
+        head = [f"{pad}{key_text}:"]
+        body = [f"{pad}  {line}" for line in dump_yaml(value).splitlines()]
+    else:
+        flow = _flow(value)
+        if old_value.startswith("{ ") and flow.startswith("{") and len(flow) > 2:
+            flow = "{ " + flow[1:-1] + " }"
+        head, body = [f"{pad}{key_text}: {flow}"], []
+    if node and node["comment"]:
+        head[0] = head[0].ljust(node["comment_col"] - 1) + " " + node["comment"]
+    return head + body
+
+
+def _diff(node: dict, old: dict, new: dict, edits: list) -> None:
+    """Collect (start, end, lines) edits turning old into new under node."""
+    children = node["children"]
+    indent = node.get("child_indent", node["indent"] + 2)
+    for key, value in new.items():
+        child = children.get(key)
+        if key not in old:
+            if child is not None or not isinstance(key, str):
+                raise _Unpatchable(key)
+            edits.append((node["end"], node["end"], _render_key(_flow(key), value, indent)))
+        elif old[key] == value:
+            continue
+        elif child is None:
+            raise _Unpatchable(key)
+        elif (isinstance(value, dict) and isinstance(old[key], dict)
+              and child["children"] and not child["opaque"]):
+            _diff(child, old[key], value, edits)
+        else:
+            edits.append((child["start"], child["end"],
+                          _render_key(child["key_text"], value, child["indent"], child)))
+    for key in old:
+        if key not in new:
+            child = children.get(key)
+            if child is None:
+                raise _Unpatchable(key)
+            edits.append((child["start"], child["end"], []))
+
+
+def patch_yaml(text: str, old: dict, new: dict) -> Optional[str]:
+    """text (the YAML of old) with only the values that differ in new rewritten.
+
+    Comments and layout of untouched lines are kept. Returns None when the
+    document cannot be patched safely (the caller then dumps it whole).
+    """
+    import yaml
+
+    lines = text.splitlines()
+    edits: list = []
+    try:
+        _diff(_index_yaml(lines), old, new, edits)
+    except _Unpatchable:
+        return None
+    # Apply bottom-up; insertions at one line keep the order they were made
+    for _, (start, end, repl) in sorted(enumerate(edits), key=lambda e: (e[1][0], e[0]), reverse=True):
+        lines[start:end] = repl
+    patched = "\n".join(lines) + "\n"
+    try:
+        if (yaml.load(patched, Loader=yaml_loader()) or {}) != new:
+            return None
+    except yaml.YAMLError:
+        return None
+    return patched
+
+
+class StateStore:
+    """Journaled view of a project's state.yaml."""
+
+    def __init__(self, dest: Path):
+        self.dest = dest
+        self.state_path = dest / ".skgd" / STATE_FILE
+        self.journal_path = dest / ".skgd" / JOURNAL_FILE
+        self.archive_path = dest / ".skgd" / ARCHIVE_FILE
+        self.lock_path = dest / ".skgd" / LOCK_FILE
+
+    @contextlib.contextmanager
+    def _locked(self):
+        """Exclusive lock on the journal across processes."""
+        self.lock_path.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(str(self.lock_path), os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            if os.name == "nt":
+                import msvcrt
+
+                msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+            else:
+                import fcntl
+
+                fcntl.flock(fd, fcntl.LOCK_EX)
+            yield
+        finally:
+            os.close(fd)  # Releases the lock
+
+    def _last_seq(self) -> int:
+        """Highest sequence number in the journal or folded into state.yaml."""
+        entries, _ = self._read_journal()
+        if entries:
+            return max(e.get("seq", 0) for e in entries)
+        try:
+            with open(self.state_path, "r", encoding="utf-8") as f:
+                for line in f:
+                    if not line.startswith("#"):
+                        break
+                    m = _SEQ_RE.match(line)
+                    if m:
+                        return int(m.group(1))
+        except FileNotFoundError:
+            pass
+        return 0
+
+    def _read_state(self) -> Tuple[dict, int, str]:
+        """Return (state mapping, folded journal seq, raw text)."""
+        import yaml
+
+        if not self.state_path.is_file():
+            return {}, 0, ""
+        text = self.state_path.read_text(encoding="utf-8")
+        seq = 0
+        for line in text.splitlines():
+            if not line.startswith("#"):
+                break
+            m = _SEQ_RE.match(line)
+            if m:
+                seq = int(m.group(1))
+        try:
+            data = yaml.load(text, Loader=yaml_loader()) or {}
+        except yaml.YAMLError as e:
+            raise click.ClickException(f"{self.state_path} is not valid YAML: {e}")
+        return (data if isinstance(data, dict) else {}), seq, text
+
+    def _read_journal(self) -> Tuple[List[dict], int]:
+        """Return (journal entries, byte length of the complete lines read).
+
+        A torn final line (crash mid-append) is ignored.
+        """
+        try:
+            raw = self.journal_path.read_bytes()
+        except FileNotFoundError:
+            return [], 0
+        entries, consumed = [], 0
+        for line in raw.splitlines(keepends=True):
+            if not line.endswith(b"\n"):
+                break
+            consumed += len(line)
+            try:
+                entries.append(json.loads(line))
+            except ValueError:
+                continue
+        return entries, consumed
+
+    def load(self) -> dict:
+        """Current state: state.yaml with pending journal entries applied."""
+        data, seq, _ = self._read_state()
+        entries, _ = self._read_journal()
+        for entry in entries:
+            if entry.get("seq", 0) > seq:
+                apply_entry(data, entry)
+        return data
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return get_key(self.load(), key, default)
+
+    def _append(self, op: str, key: str, value: Any = None) -> None:
+        split_key(key)
+        with self._locked():
+            entry = {"seq": self._last_seq() + 1, "op": op, "key": key}
+            if op != "delete":
+                entry["value"] = value
+            line = (json.dumps(entry, ensure_ascii=False, default=str) + "\n").encode("utf-8")
+            fd = os.open(str(self.journal_path), os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            try:
+                os.write(fd, line)
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+            self._maybe_compact()
+
+    def set(self, key: str, value: Any) -> None:
+        self._append("set", key, value)
+
+    def append(self, key: str, value: Any) -> None:
+        self._append("append", key, value)
+
+    def delete(self, key: str) -> None:
+        self._append("delete", key)
+
+    def update(self, values: dict) -> None:
+        """Set several dotted keys at once."""
+        for key, value in values.items():
+            self._append("set", key, value)
+
+    def maybe_compact(self) -> bool:
+        """Compact when the journal passed its size threshold."""
+        with self._locked():
+            return self._maybe_compact()
+
+    def _maybe_compact(self) -> bool:
+        try:
+            size = self.journal_path.stat().st_size
+        except FileNotFoundError:
+            return False
+        if size < COMPACT_BYTES:
+            entries, _ = self._read_journal()
+            if len(entries) < COMPACT_ENTRIES:
+                return False
+        self._compact()
+        return True
+
+    def compact(self) -> dict:
+        """Fold the journal into state.yaml atomically.
+
+        Returns dict with entries (folded) and archived (history items moved).
+        """
+        with self._locked():
+            return self._compact()
+
+    def _compact(self) -> dict:
+        data, seq, text = self._read_state()
+        folded = copy.deepcopy(data)
+        entries, consumed = self._read_journal()
+        pending = [e for e in entries if e.get("seq", 0) > seq]
+        for entry in pending:
+            apply_entry(data, entry)
+        last_seq = max([seq] + [e.get("seq", 0) for e in entries])
+        archived = self._archive_history(data)
+
+        if pending or archived or not self.state_path.is_file():
+            text = render_state(text, folded, data, last_seq)
+            _atomic_write(self.state_path, text.encode("utf-8"))
+
+        if consumed:
+            self._trim_journal(consumed)
+        return {"entries": len(pending), "archived": archived}
+
+    def _archive_history(self, data: dict) -> int:
+        moved = []
+        for key, limit in HISTORY_LIMITS.items():
+            items = get_key(data, key)
+            if isinstance(items, list) and len(items) > limit:
+                moved += [{"key": key, "entry": item} for item in items[:-limit]]
+                del items[:-limit]
+        if moved:
+            with open(self.archive_path, "a", encoding="utf-8") as f:
+                for item in moved:
+                    f.write(json.dumps(item, ensure_ascii=False, default=str) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+        return len(moved)
+
+    def _trim_journal(self, consumed: int) -> None:
+        """Drop the first consumed bytes, keeping entries appended since."""
+        with open(self.journal_path, "rb") as f:
+            f.seek(consumed)
+            rest = f.read()
+        if rest:
+            _atomic_write(self.journal_path, rest)
+        else:
+            self.journal_path.unlink()
+
+
+def _atomic_write(path: Path, data: bytes) -> None:
+    """Write data to path via a fsynced temp file and os.replace."""
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+    if hasattr(os, "O_DIRECTORY"):
+        fd = os.open(str(path.parent), os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+
+def render_state(text: str, old: dict, new: dict, seq: int) -> str:
+    """state.yaml text for new, given the current text (parsing to old).
+
+    Changed values are patched in place so the template's comments and
+    layout survive; the document is only dumped whole when it cannot be
+    patched. The ``# journal-seq`` header line is set to seq.
+    """
+    lines = text.splitlines()
+    n = 0
+    while n < len(lines) and lines[n].startswith("#"):
+        n += 1
+    header = [line for line in lines[:n] if not _SEQ_RE.match(line)] or list(STATE_HEADER)
+    body = patch_yaml("\n".join(lines[n:]), old, new) if text else None
+    if body is None:
+        body = "\n" + dump_yaml(new)
+    return "\n".join(header + [f"# journal-seq: {seq}"]) + "\n" + body
+
+
+def load_state(dest: Path) -> dict:
+    """Current project state including pending journal entries."""
+    return StateStore(dest).load()
+
+
+@click.group()
+def state():
+    """Read and update .skgd/state.yaml one key at a time.
+
+    Updates are journaled and folded into state.yaml periodically, so
+    scripts and commands never rewrite the whole history.
+
+    Examples:
+        skgd state get production.current_spec
+        skgd state set implementation.next_task T016
+        skgd state set pivots.history '{date: 2025-01-01, reason: scope}' --append
+        skgd state compact
+    """
+
+
+@state.command("get")
+@click.argument("key", required=False)
+@click.option("--json", "as_json", is_flag=True, help="Print the value as JSON")
+def state_get(key: Optional[str], as_json: bool):
+    """Print the value at KEY (dotted path; whole state if omitted)."""
+    data = load_state(require_project_root())
+    value = get_key(data, key, _MISSING) if key else data
+    if value is _MISSING:
+        raise click.ClickException(f"Key not found: {key}")
+    if as_json:
+        click.echo(json.dumps(value, indent=2, ensure_ascii=False, default=str))
+    elif isinstance(value, (dict, list)):
+        click.echo(dump_yaml(value), nl=False)
+    else:
+        click.echo("null" if value is None else value)
+
+
+@state.command("set")
+@click.argument("key")
+@click.argument("value", required=False)
+@click.option("--append", "-a", is_flag=True, help="Append VALUE to the list at KEY")
+@click.option("--delete", "-d", is_flag=True, help="Remove KEY")
+@click.option("--string", "-s", "as_string", is_flag=True, help="Store VALUE as a string, unparsed")
+def state_set(key: str, value: Optional[str], append: bool, delete: bool, as_string: bool):
+    """Set KEY to VALUE (parsed as YAML: 3, true, null, [a, b], {k: v})."""
+    store = StateStore(require_project_root())
+    try:
+        if delete:
+            store.delete(key)
+        elif value is None:
+            raise click.UsageError("Missing argument 'VALUE'.")
+        else:
+            parsed = value if as_string else parse_value(value)
+            if append:
+                store.append(key, parsed)
+            else:
+                store.set(key, parsed)
+    except ValueError as e:
+        raise click.ClickException(str(e))
+
+
+@state.command("compact")
+def state_compact():
+    """Fold the journal into state.yaml now."""
+    result = StateStore(require_project_root()).compact()
+    click.echo(f"Compacted {result['entries']} journal entries"
+               + (f", archived {result['archived']} history entries" if result["archived"] else ""))
@@ -0,0 +1,252 @@
+"""Native status dashboard - ``skgd status`` instead of a model-drawn box.
+
+``/project-status`` used to have the model read state.yaml, config.yaml
+and roadmap.yaml and hand-draw the dashboard. All of it is plain data:
+``skgd status`` collects the same facts (phase, stage progress, specs and
+task counts from the project index, engine MCP status, snapshots, pivots)
+and renders the box in the project language, or prints them as JSON. The
+slash command only adds recommendations on top.
+"""
+
+import json
+import unicodedata
+from pathlib import Path
+from typing import Optional
+
+import click
+
+from .cli import require_project_root
+
+
+PHASES = ["uninitialized", "concept", "design", "architecture", "production"]
+WIDTH = 62
+
+LABELS = {
+    "en": {
+        "title": "🎮 SPEC KIT GAME DEV - STATUS",
+        "project": "Project", "type": "Type", "engine": "Engine", "phase": "Phase",
+        "progress": "PROGRESS", "concept": "Concept", "design": "Design",
+        "architecture": "Architecture", "production": "Production",
+        "done": "✓ Done", "in_progress": "○ In Progress", "pending": "· Pending",
+        "cycle": "Cycle {cycle} - {step}", "not_started": "Not started",
+        "specs": "SPECS", "completed": "Completed", "current": "In Progress", "total": "Total",
+        "tasks": "Tasks", "tasks_value": "{done}/{total} done ({mvp} MVP remaining)",
+        "implementing": "Implementing", "next_task": "next {task}",
+        "connections": "CONNECTIONS", "mcp": "{name} MCP",
+        "snapshots": "SNAPSHOTS", "latest": "Latest", "pivots": "PIVOTS",
+        "next_action": "NEXT ACTION", "none": "None",
+    },
+    "fr": {
+        "title": "🎮 SPEC KIT GAME DEV - ÉTAT",
+        "project": "Projet", "type": "Type", "engine": "Moteur", "phase": "Phase",
+        "progress": "PROGRESSION", "concept": "Concept", "design": "Design",
+        "architecture": "Architecture", "production": "Production",
+        "done": "✓ Fait", "in_progress": "○ En Cours", "pending": "· En Attente",
+        "cycle": "Cycle {cycle} - {step}", "not_started": "Pas commencée",
+        "specs": "SPECS", "completed": "Terminées", "current": "En Cours", "total": "Total",
+        "tasks": "Tâches", "tasks_value": "{done}/{total} faites ({mvp} MVP restantes)",
+        "implementing": "Implémentation", "next_task": "suivante {task}",
+        "connections": "CONNEXIONS", "mcp": "MCP {name}",
+        "snapshots": "SNAPSHOTS", "latest": "Dernier", "pivots": "PIVOTS",
+        "next_action": "PROCHAINE ACTION", "none": "Aucun",
+    },
+}
+
+# MCP status (config.yaml) -> marker
+MCP_MARKERS = {"connected": "🟢", "installed": "🟢", "missing": "🔴", "error": "🔴"}
+
+
+def stage_status(state: dict, stage: str) -> str:
+    """"done", "in_progress" or "pending" for a workflow stage."""
+    phase = state.get("phase") or "uninitialized"
+    current = PHASES.index(phase) if phase in PHASES else 0
+    index = PHASES.index(stage)
+    section = state.get(stage) or {}
+    if stage == "concept" and section.get("game_brief_done"):
+        return "done"
+    if stage == "architecture" and section.get("technical_doc_done"):
+        return "done"
+    if index < current:
+        return "done"
+    if index == current:
+        return "in_progress"
+    return "pending"
+
+
+def next_action(state: dict, roadmap: dict) -> str:
+    """Suggested next command, following the /project-status rules."""
+    phase = state.get("phase") or "uninitialized"
+    impl = state.get("implementation") or {}
+    production = state.get("production") or {}
+    concept = state.get("concept") or {}
+    if phase == "uninitialized":
+        return "/init"
+    if phase == "concept":
+        return "/roadmap" if concept.get("brainstorm_done") else "/brainstorm"
+    if impl.get("active") and impl.get("feature"):
+        return f"/implement {impl['feature']}"
+    if phase == "production":
+        step = production.get("current_step")
+        spec = production.get("current_spec")
+        if step and spec and step in ("plan", "tasks", "implement", "playtest"):
+            return f"/{step} {spec}"
+        return "/continue"
+    recommended = (roadmap.get("next_recommended") or {}).get("command")
+    if recommended and "[" not in recommended:
+        return recommended
+    return "/spec [next-feature]" if phase == "design" else "/continue"
+
+
+def collect_status(dest: Path) -> dict:
+    """Everything the dashboard shows, as plain data."""
+    from .index import feature_summary, open_index, update_index
+    from .snapshot import list_snapshots
+    from .state import load_state, load_yaml
+
+    state = load_state(dest)
+    config = load_yaml(dest / ".skgd" / "config.yaml")
+    roadmap = load_yaml(dest / ".skgd" / "roadmap.yaml")
+    project = config.get("project") or {}
+    production = state.get("production") or {}
+    impl = state.get("implementation") or {}
+
+    conn = open_index(dest)
+    update_index(dest, conn)
+    features = feature_summary(conn, dest)
+    conn.close()
+
+    specs_state = state.get("specs") or {}
+    completed = len((state.get("design") or {}).get("specs_completed") or []) or specs_state.get("completed") or 0
+    current = production.get("current_spec") or specs_state.get("in_progress")
+
+    engine = config.get("engine") or "unity"
+    mcp_engine = (config.get("mcp") or {}).get("engine") or {}
+    mcp_key = "gdai" if engine == "godot" else "unity"
+    mcp_status = (mcp_engine.get(mcp_key) or {}).get("status") or "unchecked"
+
+    snapshots = list_snapshots(dest)
+    pivots = state.get("pivots") or {}
+    return {
+        "project": project.get("name") or dest.name,
+        "game_type": project.get("game_type") or (roadmap.get("game_type") or None),
+        "engine": engine,
+        "language": (config.get("user") or {}).get("language") or "en",
+        "phase": state.get("phase") or "uninitialized",
+        "stages": {s: stage_status(state, s) for s in PHASES[1:4]},
+        "production": {"cycle": production.get("current_cycle") or 0,
+                       "step": production.get("current_step"),
+                       "spec": production.get("current_spec")},
+        "implementation": {"active": bool(impl.get("active")), "feature": impl.get("feature"),
+                           "completed_tasks": impl.get("completed_tasks") or 0,
+                           "total_tasks": impl.get("total_tasks") or 0,
+                           "next_task": impl.get("next_task")},
+        "specs": {"total": len(features), "completed": completed, "in_progress": current,
+                  "features": features},
+        "tasks": {"total": sum(f["tasks"] for f in features),
+                  "done": sum(f["done"] for f in features),
+                  "mvp_remaining": sum(f["mvp_remaining"] for f in features)},
+        "mcp": {"name": "Godot" if engine == "godot" else "Unity", "key": mcp_key,
+                "status": mcp_status},
+        "snapshots": {"count": len(snapshots),
+                      "latest": snapshots[-1]["version"] if snapshots else None},
+        "pivots": {"count": pivots.get("count") or len(pivots.get("history") or [])},
+        "next_action": next_action(state, roadmap),
+    }
+
+
+def _width(text: str) -> int:
+    """Terminal columns of text (wide characters and emoji count double)."""
+    return sum(2 if unicodedata.east_asian_width(c) in ("W", "F") else 0 if unicodedata.combining(c) else 1
+               for c in text if c != "\ufe0f")
+
+
+def _row(text: str) -> str:
+    text = "  " + text
+    pad = WIDTH - _width(text)
+    if pad < 0:
+        while _width(text) > WIDTH - 1:
+            text = text[:-1]
+        text += "…"
+        pad = WIDTH - _width(text)
+    return "║" + text + " " * pad + "║"
+
+
+def render_dashboard(status: dict) -> str:
+    """The /project-status box, in the project language."""
+    t = LABELS.get(status["language"], LABELS["en"])
+    rule = "╠" + "═" * WIDTH + "╣"
+    none = t["none"]
+
+    production = status["production"]
+    if status["phase"] == "production" or production["cycle"]:
+        prod = t["cycle"].format(cycle=production["cycle"], step=production["step"] or "-")
+    else:
+        prod = t["not_started"]
+    labels = [t["concept"], t["design"], t["architecture"], t["production"]]
+    pad = max(_width(label) for label in labels) + 2
+
+    def tree(items):
+        return [("└─ " if i == len(items) - 1 else "├─ ") + item for i, item in enumerate(items)]
+
+    def field(label, value):
+        return f"{label}:" + " " * (pad - _width(label) - 1) + str(value)
+
+    progress = [field(t[s], t[status["stages"][s]]) for s in ("concept", "design", "architecture")]
+    progress.append(field(t["production"], prod))
+
+    specs = status["specs"]
+    spec_rows = [f"{t['completed']}: {specs['completed']}",
+                 f"{t['current']}: {specs['in_progress'] or none}",
+                 f"{t['total']}: {specs['total']}"]
+    tasks = status["tasks"]
+    if tasks["total"]:
+        spec_rows.insert(2, f"{t['tasks']}: " + t["tasks_value"].format(
+            done=tasks["done"], total=tasks["total"], mvp=tasks["mvp_remaining"]))
+    impl = status["implementation"]
+    if impl["active"] and impl["feature"]:
+        value = f"{impl['feature']} {impl['completed_tasks']}/{impl['total_tasks']}"
+        if impl["next_task"]:
+            value += ", " + t["next_task"].format(task=impl["next_task"])
+        spec_rows.insert(2, f"{t['implementing']}: {value}")
+
+    mcp = status["mcp"]
+    marker = MCP_MARKERS.get(mcp["status"], "⚪")
+    snapshots = status["snapshots"]
+
+    lines = ["╔" + "═" * WIDTH + "╗", _row(t["title"]), rule,
+             _row(f"{t['project']}: {status['project']}"),
+             _row(f"{t['type']}: {status['game_type'] or '-'}  |  {t['engine']}: {status['engine']}"),
+             _row(f"{t['phase']}: {status['phase']}"),
+             rule, _row(t["progress"]), *map(_row, tree(progress)),
+             rule, _row(t["specs"]), *map(_row, tree(spec_rows)),
+             rule, _row(t["connections"]),
+             *map(_row, tree([f"{t['mcp'].format(name=mcp['name'])}: {marker} {mcp['status']}"])),
+             rule,
+             _row(f"{t['snapshots']}: {snapshots['count']} | {t['latest']}: {snapshots['latest'] or none}"),
+             _row(f"{t['pivots']}: {status['pivots']['count']}"),
+             rule, _row(t["next_action"]), _row(f"→ {status['next_action']}"),
+             "╚" + "═" * WIDTH + "╝"]
+    return "\n".join(lines) + "\n"
+
+
+@click.command()
+@click.option("--json", "as_json", is_flag=True, help="Print the status as JSON")
+@click.option("--lang", "-l", type=click.Choice(sorted(LABELS)), help="Dashboard language (default: project language)")
+def status(as_json: bool, lang: Optional[str]):
+    """Show the project dashboard (phase, progress, specs, snapshots).
+
+    Reads state.yaml, config.yaml, roadmap.yaml, the spec directories and
+    snapshots directly; /project-status builds on this output.
+
+    Examples:
+        skgd status
+        skgd status --json
+    """
+    dest = require_project_root()
+    data = collect_status(dest)
+    if lang:
+        data["language"] = lang
+    if as_json:
+        click.echo(json.dumps(data, indent=2, ensure_ascii=False))
+        return
+    click.echo(render_dashboard(data), nl=False)
@@ -0,0 +1,457 @@
+"""Task graph - dependency DAG, critical path and parallel waves of a tasks.md.
+
+``/tasks`` writes ordering information in several places: phases run in
+sequence, ``[P]`` tasks may run alongside their neighbours, story phases
+(``[US1]``, ``[US2]``) only wait for the foundation unless a
+``*Depends on: US1*`` line says otherwise, and dependency notes spell out
+extra edges (``T004 → T005``, vertical ``↓`` diagrams in code blocks,
+"depends on T004" in a task description). ``skgd tasks graph`` combines
+them into one graph, checks it for cycles and unknown task IDs, and
+schedules it:
+
+- a *wave* is every task whose dependencies all sit in earlier waves, so
+  the tasks of one wave can be handed to concurrent sessions;
+- the *critical path* is the longest dependency chain, i.e. the minimum
+  number of sequential steps left.
+"""
+
+import json
+import re
+import textwrap
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
+
+import click
+
+from .cli import require_project_root
+from .index import PHASE_RE, parse_tasks
+
+TASK_ID_RE = re.compile(r"\bT\d{2,}\b")
+ARROW_RE = re.compile(r"(→|->|⟶|=>|←|<-)")
+BACK_ARROWS = ("←", "<-")
+DOWN_RE = re.compile(r"^[\s│|]*[↓⬇][\s│|]*$")
+PAREN_RE = re.compile(r"\([^)]*\)")
+AFTER_RE = re.compile(
+    r"\b(?:depends on|after|requires|blocked by|dépend de|après|requiert)\s+"
+    r"(T\d{2,}(?:\s*(?:,|&|and|et)\s*T\d{2,})*)",
+    re.IGNORECASE,
+)
+STORY_RE = re.compile(r"^US\d+$", re.IGNORECASE)
+STORY_HEADING_RE = re.compile(r"(?:user story|histoire utilisateur)\s*(\d+)", re.IGNORECASE)
+DEPENDS_LINE_RE = re.compile(r"^\*?\s*(?:depends on|dépend de)\s*:\s*(.*?)\*?\s*$", re.IGNORECASE)
+FENCE_RE = re.compile(r"^\s*(```|~~~)")
+CHECKBOX_RE = re.compile(r"^\s*[-*]\s+\[[ xX]\]")
+
+# DOT palette, shared with docs/diagrams/*.dot
+PHASE_COLORS = ["#3498db", "#27ae60", "#f39c12", "#9b59b6", "#e74c3c", "#95a5a6"]
+FILL_OPEN = "#fef3cd"
+FILL_PARALLEL = "#d5e8f7"
+FILL_DONE = "#d4edda"
+CRITICAL_COLOR = "#e74c3c"
+
+
+def _phases(tasks: List[dict], text: str) -> List[dict]:
+    """Phases in file order with their tasks, story tag and story dependencies."""
+    depends: Dict[str, str] = {}
+    phase = ""
+    for line in text.splitlines():
+        heading = PHASE_RE.match(line)
+        if heading:
+            phase = f"{heading.group(1)}: {heading.group(2)}".strip()
+            continue
+        m = DEPENDS_LINE_RE.match(line.strip())
+        if m and phase not in depends:
+            depends[phase] = m.group(1)
+
+    phases: List[dict] = []
+    for task in tasks:
+        if not phases or phases[-1]["name"] != task["phase"]:
+            phases.append({"name": task["phase"], "tasks": []})
+        phases[-1]["tasks"].append(task)
+
+    for p in phases:
+        stories = Counter(t.upper() for task in p["tasks"] for t in task["tags"] if STORY_RE.match(t))
+        story = stories.most_common(1)[0][0] if stories else None
+        if not story:
+            m = STORY_HEADING_RE.search(p["name"])
+            story = f"US{m.group(1)}" if m else None
+        p["story"] = story
+        p["story_deps"] = [s.upper() for s in re.findall(r"\bUS\d+\b", depends.get(p["name"], ""),
+                                                         re.IGNORECASE) if s.upper() != story]
+    return phases
+
+
+def _groups(tasks: List[dict]) -> List[List[str]]:
+    """Sequential groups of a phase: single tasks, or runs of consecutive [P] tasks."""
+    groups: List[List[str]] = []
+    previous_parallel = False
+    for task in tasks:
+        parallel = "P" in task["tags"]
+        if parallel and previous_parallel:
+            groups[-1].append(task["task_id"])
+        else:
+            groups.append([task["task_id"]])
+        previous_parallel = parallel
+    return groups
+
+
+def _ids(fragment: str) -> List[str]:
+    return TASK_ID_RE.findall(PAREN_RE.sub("", fragment))
+
+
+def explicit_edges(text: str) -> List[Tuple[str, str, int]]:
+    """(before, after, line) edges written out in tasks.md.
+
+    Recognizes arrow chains on one line (``T004 → T005``, ``T002, T003 ->
+    T006``, ``T008 ← T007``), vertical ``↓`` diagrams inside code blocks,
+    and "depends on/after T004" in task descriptions.
+    """
+    edges = []
+    in_fence = False
+    last_ids: List[str] = []
+    pending_down = False
+    for lineno, line in enumerate(text.splitlines(), 1):
+        if FENCE_RE.match(line):
+            in_fence = not in_fence
+            last_ids, pending_down = [], False
+            continue
+
+        if CHECKBOX_RE.match(line):
+            ids = TASK_ID_RE.findall(line)
+            if ids:
+                for m in AFTER_RE.finditer(line):
+                    edges.extend((dep, ids[0], lineno) for dep in TASK_ID_RE.findall(m.group(1)))
+            continue
+
+        parts = ARROW_RE.split(line)
+        if len(parts) > 1:
+            segments = [_ids(part) for part in parts[0::2]]
+            arrows = parts[1::2]
+            for i, arrow in enumerate(arrows):
+                left, right = segments[i], segments[i + 1]
+                if arrow in BACK_ARROWS:
+                    left, right = right, left
+                edges.extend((a, b, lineno) for a in left for b in right)
+
+        if not in_fence:
+            continue
+        if DOWN_RE.match(line):
+            pending_down = True
+            continue
+        ids = _ids(ARROW_RE.split(line)[-1] if len(parts) > 1 else line)
+        if ids:
+            if pending_down:
+                first = _ids(parts[0]) if len(parts) > 1 else ids
+                edges.extend((a, b, lineno) for a in last_ids for b in first)
+            last_ids = ids
+        elif line.strip():
+            last_ids = []
+        pending_down = False
+    return edges
+
+
+def build_graph(text: str) -> dict:
+    """Parse tasks.md into {"tasks", "phases", "edges", "problems"}.
+
+    tasks maps task ID -> task dict (index.parse_tasks); edges maps
+    (before, after) -> "order" (implied by phases and [P] markers) or
+    "explicit" (written in the file). Problems are duplicate IDs and
+    explicit references to unknown tasks.
+    """
+    tasks: Dict[str, dict] = {}
+    problems: List[dict] = []
+    placeholders = 0
+    ordered = []
+    for task in parse_tasks(text):
+        tid = task["task_id"]
+        if tid == "T0XX":
+            placeholders += 1
+        elif tid in tasks:
+            problems.append({"kind": "duplicate", "task": tid, "line": task["line"],
+                             "message": f"{tid} on line {task['line']} duplicates line {tasks[tid]['line']}"})
+        else:
+            tasks[tid] = task
+            ordered.append(task)
+    if placeholders:
+        problems.append({"kind": "placeholder", "task": "T0XX", "line": None,
+                         "message": f"{placeholders} placeholder task(s) T0XX ignored"})
+
+    edges: Dict[Tuple[str, str], str] = {}
+    phases = _phases(ordered, text)
+    exits: List[List[str]] = []
+    base: Optional[int] = None
+    for i, phase in enumerate(phases):
+        groups = _groups(phase["tasks"])
+        for before, after in zip(groups, groups[1:]):
+            edges.update(((a, b), "order") for a in before for b in after)
+
+        if phase["story"]:
+            # Story phases wait for the last shared phase and the stories they name
+            requires = [base] if base is not None else []
+            requires += [j for j in range(i) if phases[j]["story"] in phase["story_deps"]]
+        else:
+            # Shared phases wait for everything since the previous shared phase
+            start = base if base is not None else 0
+            requires = list(range(start, i))
+            base = i
+        for j in requires:
+            edges.update(((a, b), "order") for a in exits[j] for b in groups[0])
+        exits.append(groups[-1])
+
+    for a, b, lineno in explicit_edges(text):
+        missing = [t for t in (a, b) if t not in tasks]
+        if missing:
+            problems.extend({"kind": "missing", "task": t, "line": lineno,
+                             "message": f"line {lineno}: {t} is not a task in this file"}
+                            for t in missing)
+        else:
+            edges[(a, b)] = "explicit"
+    return {"tasks": tasks, "phases": phases, "edges": edges, "problems": problems}
+
+
+def find_cycle(nodes: List[str], edges) -> Optional[List[str]]:
+    """One dependency cycle as [a, b, ..., a], or None if the graph is acyclic."""
+    succ: Dict[str, List[str]] = {n: [] for n in nodes}
+    for a, b in edges:
+        succ[a].append(b)
+    color = dict.fromkeys(nodes, 0)
+    for root in nodes:
+        if color[root]:
+            continue
+        path = [root]
+        stack = [iter(succ[root])]
+        color[root] = 1
+        while stack:
+            nxt = next(stack[-1], None)
+            if nxt is None:
+                color[path.pop()] = 2
+                stack.pop()
+            elif color[nxt] == 1:
+                return path[path.index(nxt):] + [nxt]
+            elif color[nxt] == 0:
+                color[nxt] = 1
+                path.append(nxt)
+                stack.append(iter(succ[nxt]))
+    return None
+
+
+def schedule(graph: dict, remaining: bool = False) -> dict:
+    """Waves and critical path of an acyclic task graph.
+
+    With remaining, completed tasks take no time: they stay in the graph
+    (so their own dependencies still order what follows) but are left out
+    of the waves and the critical path.
+    """
+    tasks = graph["tasks"]
+    preds: Dict[str, List[str]] = {t: [] for t in tasks}
+    succ: Dict[str, List[str]] = {t: [] for t in tasks}
+    for a, b in graph["edges"]:
+        preds[b].append(a)
+        succ[a].append(b)
+
+    weight = {t: 0 if remaining and task["checked"] else 1 for t, task in tasks.items()}
+    indegree = {t: len(p) for t, p in preds.items()}
+    queue = [t for t in tasks if not indegree[t]]
+    start: Dict[str, int] = {}
+    via: Dict[str, Optional[str]] = {}
+    for node in queue:
+        # Latest-finishing predecessor; ties prefer tasks that take time
+        best = max(preds[node], key=lambda p: (start[p] + weight[p], weight[p]), default=None)
+        start[node] = start[best] + weight[best] if best else 0
+        via[node] = best
+        for nxt in succ[node]:
+            indegree[nxt] -= 1
+            if not indegree[nxt]:
+                queue.append(nxt)
+
+    waves: List[List[str]] = []
+    for t in tasks:
+        if weight[t]:
+            while len(waves) <= start[t]:
+                waves.append([])
+            waves[start[t]].append(t)
+
+    critical: List[str] = []
+    end = max((t for t in tasks if weight[t]), key=lambda t: start[t], default=None)
+    while end is not None:
+        if weight[end]:
+            critical.append(end)
+        end = via[end]
+    critical.reverse()
+    return {"waves": waves, "critical_path": critical}
+
+
+def _dot_escape(text: str) -> str:
+    return text.replace("\\", "\\\\").replace('"', '\\"')
+
+
+def render_dot(feature: str, graph: dict, plan: dict) -> str:
+    """Graphviz source in the style of docs/diagrams/*.dot."""
+    tasks = graph["tasks"]
+    critical = set(plan["critical_path"])
+    critical_edges = set(zip(plan["critical_path"], plan["critical_path"][1:]))
+    name = re.sub(r"\W", "_", feature)
+    lines = [
+        f"// Task Graph - {feature}",
+        f"// Generated by: skgd tasks graph {feature} --dot",
+        f"// Render with: dot -Tpng tasks.dot -o tasks.png",
+        "",
+        f"digraph Tasks_{name} {{",
+        "    // Graph settings",
+        "    rankdir=TB;",
+        "    splines=true;",
+        "    nodesep=0.5;",
+        "    ranksep=0.6;",
+        '    fontname="Arial";',
+        "",
+        "    // Node defaults",
+        "    node [",
+        "        shape=box,",
+        '        style="rounded,filled",',
+        '        fontname="Arial",',
+        "        fontsize=10,",
+        '        margin="0.2,0.1"',
+        "    ];",
+        "",
+        "    // Edge defaults",
+        "    edge [",
+        '        fontname="Arial",',
+        "        fontsize=8,",
+        '        color="#666666"',
+        "    ];",
+    ]
+    for i, phase in enumerate(graph["phases"]):
+        color = PHASE_COLORS[i % len(PHASE_COLORS)]
+        label = phase["name"] or "Tasks"
+        lines += [
+            "",
+            "    // ============================================",
+            f"    // {label.upper()}",
+            "    // ============================================",
+            f"    subgraph cluster_phase{i + 1} {{",
+            f'        label="{_dot_escape(label)}";',
+            '        labeljust="l";',
+            '        style="rounded,dashed";',
+            f'        color="{color}";',
+            f'        fontcolor="{color}";',
+            '        fontname="Arial Bold";',
+        ]
+        for task in phase["tasks"]:
+            tid = task["task_id"]
+            summary = "\\n".join(textwrap.wrap(_dot_escape(task["description"]), 28, break_long_words=False)[:2])
+            tags = " ".join(f"[{t}]" for t in task["tags"])
+            if task["checked"]:
+                fill = FILL_DONE
+            elif "P" in task["tags"]:
+                fill = FILL_PARALLEL
+            else:
+                fill = FILL_OPEN
+            attrs = [f'label="{tid}{" " + tags if tags else ""}\\n{summary}"',
+                     f'fillcolor="{fill}"',
+                     f'tooltip="{_dot_escape(task["description"])}"']
+            if tid in critical:
+                attrs += [f'color="{CRITICAL_COLOR}"', "penwidth=2"]
+            lines += ["", f"        {tid} [", *(f"            {a}," for a in attrs[:-1]),
+                      f"            {attrs[-1]}", "        ];"]
+        lines.append("    }")
+
+    lines += ["", "    // ============================================",
+              "    // DEPENDENCIES", "    // ============================================"]
+    for (a, b), kind in sorted(graph["edges"].items(), key=lambda e: (tasks[e[0][0]]["line"],
+                                                                        tasks[e[0][1]]["line"])):
+        attrs = []
+        if (a, b) in critical_edges:
+            attrs += [f'color="{CRITICAL_COLOR}"', "penwidth=2"]
+        if kind == "order":
+            attrs.append("style=dashed")
+        lines.append(f"    {a} -> {b}" + (f" [{', '.join(attrs)}]" if attrs else "") + ";")
+    lines.append("}")
+    return "\n".join(lines) + "\n"
+
+
+@click.command("graph")
+@click.argument("feature", required=False)
+@click.option("--remaining", "-r", is_flag=True, help="Schedule only unchecked tasks")
+@click.option("--dot", "as_dot", is_flag=True, help="Print the graph as Graphviz DOT")
+@click.option("--json", "as_json", is_flag=True, help="Print graph, waves and critical path as JSON")
+def graph(feature: Optional[str], remaining: bool, as_dot: bool, as_json: bool):
+    """Dependency graph, critical path and parallel waves of a feature's tasks.
+
+    Dependencies come from phase order, [P] markers, story phases and
+    their "Depends on" lines, and explicit notes such as T004 → T005.
+    Tasks in the same wave can be given to concurrent sessions. Exits
+    with status 1 on cycles, duplicate IDs or references to unknown tasks.
+
+    FEATURE defaults to the feature in progress (state.yaml).
+
+    Examples:
+        skgd tasks graph 001-player-movement
+        skgd tasks graph -r                          # Waves of the open tasks
+        skgd tasks graph --dot > tasks.dot && dot -Tpng tasks.dot -o tasks.png
+    """
+    from .scout import current_feature
+    from .state import load_state
+
+    dest = require_project_root()
+    feature = current_feature(load_state(dest), feature)
+    if not feature:
+        raise click.ClickException("No current feature; pass one (e.g. skgd tasks graph 001-player-movement).")
+    path = dest / "docs" / "specs" / feature / "tasks.md"
+    if not path.is_file():
+        raise click.ClickException(f"{path.relative_to(dest).as_posix()} not found (run /tasks {feature}).")
+
+    g = build_graph(path.read_text(encoding="utf-8"))
+    cycle = find_cycle(list(g["tasks"]), g["edges"])
+    if cycle:
+        g["problems"].append({"kind": "cycle", "task": cycle[0], "line": g["tasks"][cycle[0]]["line"],
+                              "message": "dependency cycle: " + " → ".join(cycle)})
+        plan = {"waves": [], "critical_path": []}
+    else:
+        plan = schedule(g, remaining)
+    failed = any(p["kind"] != "placeholder" for p in g["problems"])
+
+    if as_dot:
+        click.echo(render_dot(feature, g, plan), nl=False)
+    elif as_json:
+        wave_of = {t: i + 1 for i, wave in enumerate(plan["waves"]) for t in wave}
+        click.echo(json.dumps({
+            "feature": feature,
+            "tasks": [{"id": t, "phase": task["phase"], "description": task["description"],
+                       "done": task["checked"], "tags": task["tags"], "wave": wave_of.get(t),
+                       "depends_on": [a for (a, b) in g["edges"] if b == t]}
+                      for t, task in g["tasks"].items()],
+            "edges": [{"from": a, "to": b, "kind": kind} for (a, b), kind in g["edges"].items()],
+            "waves": plan["waves"],
+            "critical_path": plan["critical_path"],
+            "problems": g["problems"],
+        }, indent=2, ensure_ascii=False))
+    else:
+        _print_plan(feature, g, plan)
+    if failed:
+        raise SystemExit(1)
+
+
+def _print_plan(feature: str, g: dict, plan: dict) -> None:
+    explicit = sum(1 for kind in g["edges"].values() if kind == "explicit")
+    click.secho(f"  {feature}: {len(g['tasks'])} tasks, {len(g['edges'])} dependencies "
+                f"({explicit} explicit)", bold=True)
+    for problem in g["problems"]:
+        color = "yellow" if problem["kind"] == "placeholder" else "red"
+        click.secho(f"  ✗ {problem['message']}", fg=color)
+    if not plan["waves"]:
+        return
+
+    critical = plan["critical_path"]
+    click.echo()
+    click.echo(f"  Critical path ({len(critical)} tasks): "
+               + click.style(" → ".join(critical), fg="red"))
+    for i, wave in enumerate(plan["waves"], 1):
+        click.echo()
+        click.secho(f"  Wave {i}" + (f"  ({len(wave)} in parallel)" if len(wave) > 1 else ""), fg="cyan")
+        for tid in wave:
+            task = g["tasks"][tid]
+            box = "[x]" if task["checked"] else "[ ]"
+            marker = click.style("*", fg="red") if tid in critical else " "
+            tags = " ".join(f"[{t}]" for t in task["tags"])
+            click.echo(f"   {marker}{box} {click.style(tid, fg='cyan')} "
+                       f"{tags + ' ' if tags else ''}{task['description']}")
@@ -0,0 +1,188 @@
+"""Span tracing - where the time of a CLI run goes.
+
+``skgd --trace <command>`` (or ``SKGD_TRACE=1``/``SKGD_TRACE=out.json``)
+records a span around each phase of init and upgrade: template copies,
+YAML round-trips, README generation, manifest sync, transaction staging
+and commit, and every tool probe (probes run in worker threads, so they
+show up on their own tracks). At exit the spans are written as Chrome
+trace JSON, loadable in https://ui.perfetto.dev or chrome://tracing, and
+a per-span summary is printed to stderr.
+
+When tracing is off ``span()`` returns a shared no-op context manager and
+``@traced`` functions call straight through, so instrumented code pays one
+global check per span.
+"""
+
+import functools
+import os
+import threading
+import time
+from typing import Dict, List, Optional
+
+import click
+
+DEFAULT_TRACE_FILE = "skgd-trace.json"
+
+
+class _NullSpan:
+    """No-op span used while tracing is disabled."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+    def set(self, **args) -> None:
+        pass
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    __slots__ = ("tracer", "name", "args", "start", "child_ns")
+
+    def __init__(self, tracer: "Tracer", name: str, args: dict):
+        self.tracer = tracer
+        self.name = name
+        self.args = args
+        self.child_ns = 0
+
+    def __enter__(self):
+        self.tracer._stack().append(self)
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        end = time.perf_counter_ns()
+        stack = self.tracer._stack()
+        stack.pop()
+        duration = end - self.start
+        if stack:
+            stack[-1].child_ns += duration
+        if exc_type is not None:
+            self.args["error"] = exc_type.__name__
+        self.tracer._record(self, duration)
+        return False
+
+    def set(self, **args) -> None:
+        """Attach arguments (counts, paths) shown with the span."""
+        self.args.update(args)
+
+
+class Tracer:
+    """Collects spans from all threads of the process."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.origin = time.perf_counter_ns()
+        self.events: List[dict] = []
+        self.totals: Dict[str, list] = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._threads: Dict[int, str] = {}
+
+    def _stack(self) -> list:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def _record(self, span: _Span, duration: int) -> None:
+        thread = threading.current_thread()
+        event = {
+            "name": span.name, "cat": span.name.split(".", 1)[0], "ph": "X",
+            "ts": (span.start - self.origin) / 1000, "dur": duration / 1000,
+            "pid": os.getpid(), "tid": thread.ident,
+        }
+        if span.args:
+            event["args"] = span.args
+        with self._lock:
+            self.events.append(event)
+            self._threads.setdefault(thread.ident, thread.name)
+            total = self.totals.setdefault(span.name, [0, 0, 0])
+            total[0] += 1
+            total[1] += duration
+            total[2] += duration - span.child_ns
+
+    def write(self) -> None:
+        """Write the Chrome trace file."""
+        import json
+
+        pid = os.getpid()
+        meta = [{"name": "process_name", "ph": "M", "pid": pid, "args": {"name": "skgd"}}]
+        meta += [{"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": name}}
+                 for tid, name in self._threads.items()]
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": meta + sorted(self.events, key=lambda e: e["ts"]),
+                       "displayTimeUnit": "ms"}, f)
+
+    def summary(self, limit: int = 25) -> str:
+        """Table of spans by total time: calls, total ms, self ms, share of the run.
+
+        Self time excludes child spans of the same thread; spans waiting on
+        worker threads (probes) keep the wait as self time.
+        """
+        wall = (time.perf_counter_ns() - self.origin) or 1
+        rows = sorted(self.totals.items(), key=lambda item: item[1][1], reverse=True)
+        width = max([len(name) for name, _ in rows[:limit]] + [4])
+        lines = [f"  {'span':<{width}}  {'calls':>5}  {'total ms':>9}  {'self ms':>9}  {'run %':>6}"]
+        for name, (calls, total, own) in rows[:limit]:
+            lines.append(f"  {name:<{width}}  {calls:>5}  {total / 1e6:>9.1f}  {own / 1e6:>9.1f}  "
+                         f"{100 * total / wall:>5.1f}%")
+        if len(rows) > limit:
+            lines.append(f"  ... {len(rows) - limit} more spans in the trace file")
+        return "\n".join(lines)
+
+
+_tracer: Optional[Tracer] = None
+
+
+def span(name: str, **args):
+    """Context manager timing one phase; a no-op unless tracing is enabled."""
+    if _tracer is None:
+        return _NULL_SPAN
+    return _Span(_tracer, name, args)
+
+
+def traced(name: str):
+    """Decorator recording a span around every call of the function."""
+    def decorate(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if _tracer is None:
+                return func(*args, **kwargs)
+            with _Span(_tracer, name, {}):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+def env_trace_path() -> Optional[str]:
+    """Trace file requested by SKGD_TRACE ("1"/"true" select the default name)."""
+    value = os.environ.get("SKGD_TRACE", "").strip()
+    if not value or value.lower() in ("0", "false", "no", "off"):
+        return None
+    if value.lower() in ("1", "true", "yes", "on"):
+        return DEFAULT_TRACE_FILE
+    return value
+
+
+def start(path: str) -> Tracer:
+    """Enable tracing for the rest of the process."""
+    global _tracer
+    if _tracer is None:
+        _tracer = Tracer(os.path.abspath(path))
+    return _tracer
+
+
+def finish() -> None:
+    """Write the trace file and print the summary, then disable tracing."""
+    global _tracer
+    tracer, _tracer = _tracer, None
+    if tracer is None or not tracer.events:
+        return
+    tracer.write()
+    click.echo(f"\nTrace: {len(tracer.events)} spans written to {tracer.path}", err=True)
+    click.echo(tracer.summary(), err=True)
@@ -0,0 +1,319 @@
+"""Transactional project writes for init and upgrade.
+
+Installers never write into a live project directly. A ``Transaction``
+stages a copy of the managed paths (``.claude/``, ``.skgd/``, README.md) in
+a sibling directory, the installer runs against the staged copy, and the
+result is either printed as a plan (``--dry-run``), discarded, or committed:
+
+- New projects are built in ``.<name>.skgd-txn`` next to the destination and
+  moved into place with a single rename.
+- Existing projects are committed file by file, only for the files the
+  installer added, changed or removed in the stage. A rollback journal
+  (``.skgd-txn/journal.json``) is written first and each original is moved
+  aside before its replacement is renamed in, so an interrupted commit is
+  rolled back by the next transaction on that project.
+
+Files the installer did not write are never touched, so edits made while
+it runs (by the user or ``skgd watch``) survive; a file the installer wrote
+that also changed in the project meanwhile aborts the commit. Nothing
+outside the managed paths is ever modified or deleted.
+"""
+
+import filecmp
+import json
+import os
+import shutil
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import click
+
+from .copyengine import CopyStats, copy_files, copy_tree
+from .trace import traced
+
+TXN_DIR = ".skgd-txn"
+JOURNAL = "journal.json"
+
+# Top-level project paths installers may write
+STAGED_ROOTS = (".claude", ".skgd", "README.md")
+
+# Children of staged roots that installers never write; not staged, never
+# committed (project history and caches can be large)
+UNSTAGED = {".skgd/snapshots", ".skgd/cache"}
+
+# Growing project files installers only test for existence: staged as
+# empty placeholders instead of copies
+PLACEHOLDERS = {".skgd/memory/learnings.md", ".skgd/state-archive.jsonl",
+                ".skgd/budget-history.json"}
+
+Signature = Optional[Tuple[int, int]]
+
+
+def _copy_tree(src: Path, dst: Path, stats: CopyStats) -> None:
+    """Copy a managed path into the stage, skipping UNSTAGED children."""
+    if src.is_file() or src.is_symlink():
+        copy_files([(src, dst)], stats=stats)
+        return
+    skip = UNSTAGED | PLACEHOLDERS
+    copy_tree(src, dst, ignore=lambda rel: f"{src.name}/{rel}" in skip, stats=stats)
+
+
+def _files(root: Path, rel: str = "") -> Dict[str, Path]:
+    """Map project-relative paths of all files under root/rel."""
+    base = root / rel if rel else root
+    if base.is_file() or base.is_symlink():
+        return {rel: base}
+    files = {}
+    if base.is_dir():
+        for dirpath, dirs, names in os.walk(base):
+            dir_rel = Path(dirpath).relative_to(root).as_posix()
+            prefix = "" if dir_rel == "." else dir_rel + "/"
+            dirs[:] = sorted(d for d in dirs if prefix + d not in UNSTAGED)
+            for name in names:
+                files[prefix + name] = Path(dirpath) / name
+    return files
+
+
+def _signature(path: Path) -> Signature:
+    """(size, mtime_ns) of a file, None if it does not exist."""
+    try:
+        st = os.lstat(path)
+    except FileNotFoundError:
+        return None
+    return st.st_size, st.st_mtime_ns
+
+
+def _remove(path: Path) -> None:
+    if path.is_dir() and not path.is_symlink():
+        shutil.rmtree(path)
+    elif path.exists() or path.is_symlink():
+        path.unlink()
+
+
+class Transaction:
+    """Stage installer writes for a project and commit them atomically.
+
+    Use as a context manager: the body writes into ``txn.root``; the
+    staged changes are committed on success and discarded on error.
+    """
+
+    def __init__(self, dest: Path, dry_run: bool = False):
+        self.dest = dest
+        self.dry_run = dry_run
+        self.fresh = not dest.exists()
+        if self.fresh:
+            self.work = dest.parent / f".{dest.name}.skgd-txn"
+            self.root = self.work
+        else:
+            self.work = dest / TXN_DIR
+            self.root = self.work / "stage"
+        self.committed = False
+        # Staged path -> (project signature, staged signature) at stage time
+        self.baseline: Dict[str, Tuple[Signature, Signature]] = {}
+        # Staging copies are counted apart from the installer's own copies
+        self.stats = CopyStats()
+
+    @traced("transaction.stage")
+    def __enter__(self) -> "Transaction":
+        if self.work.exists():
+            if self.fresh:
+                shutil.rmtree(self.work)
+            else:
+                recover(self.dest)
+        self.root.mkdir(parents=True)
+        if not self.fresh:
+            for rel in STAGED_ROOTS:
+                if (self.dest / rel).exists():
+                    _copy_tree(self.dest / rel, self.root / rel, self.stats)
+            for rel in PLACEHOLDERS:
+                if (self.dest / rel).is_file():
+                    (self.root / rel).parent.mkdir(parents=True, exist_ok=True)
+                    (self.root / rel).touch()
+            for top in STAGED_ROOTS:
+                for rel, path in _files(self.root, top).items():
+                    self.baseline[rel] = (_signature(self.dest / rel), _signature(path))
+            # Installers only create docs directories; mirror the skeleton
+            # so existence checks see the real project
+            docs = self.dest / "docs"
+            if docs.is_dir():
+                for dirpath, dirs, _ in os.walk(docs):
+                    for d in dirs:
+                        rel = (Path(dirpath) / d).relative_to(self.dest)
+                        (self.root / rel).mkdir(parents=True, exist_ok=True)
+                if (docs / "game-brief.md").is_file():
+                    copy_files([(docs / "game-brief.md", self.root / "docs" / "game-brief.md")],
+                               stats=self.stats)
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        if exc_type is not None or self.dry_run:
+            self.discard()
+        elif not self.committed:
+            self.commit()
+        return False
+
+    @traced("transaction.plan")
+    def plan(self) -> List[dict]:
+        """Operations the commit would apply: add, update or remove."""
+        if self.fresh:
+            return [{"action": "add", "path": rel}
+                    for rel in sorted(_files(self.root))]
+        staged = {}
+        for top in STAGED_ROOTS:
+            staged.update(_files(self.root, top))
+        ops = []
+        # Only paths the installer wrote: files it did not touch in the
+        # stage are left alone even if the project changed them meanwhile
+        for rel in sorted(set(staged) | set(self.baseline)):
+            base = self.baseline.get(rel)
+            target = self.dest / rel
+            if rel not in staged:
+                if _signature(target) is not None:
+                    ops.append({"action": "remove", "path": rel})
+            elif base is not None and _signature(staged[rel]) == base[1]:
+                continue
+            elif not target.is_file():
+                ops.append({"action": "add", "path": rel})
+            elif not filecmp.cmp(staged[rel], target, shallow=False):
+                ops.append({"action": "update", "path": rel})
+        return ops
+
+    @traced("transaction.commit")
+    def commit(self) -> List[dict]:
+        """Move staged changes into the project; returns the applied plan."""
+        ops = self.plan()
+        if self.fresh:
+            os.replace(self.root, self.dest)
+            self.committed = True
+            return ops
+
+        conflicts = [op["path"] for op in ops if self._changed(op["path"])]
+        if conflicts:
+            self.discard()
+            raise click.ClickException(
+                "Changed while installing, nothing was written (run it again): "
+                + ", ".join(conflicts[:5]) + (" ..." if len(conflicts) > 5 else ""))
+
+        for rel in self._new_dirs():
+            (self.dest / rel).mkdir(parents=True, exist_ok=True)
+        if ops:
+            backup = self.work / "backup"
+            journal = {"status": "committing", "files": [
+                {"path": op["path"], "had_original": op["action"] != "add"} for op in ops
+            ]}
+            _write_journal(self.work, journal)
+            try:
+                for entry in journal["files"]:
+                    target = self.dest / entry["path"]
+                    staged = self.root / entry["path"]
+                    if entry["had_original"]:
+                        (backup / entry["path"]).parent.mkdir(parents=True, exist_ok=True)
+                        os.replace(target, backup / entry["path"])
+                    if staged.exists() or staged.is_symlink():
+                        target.parent.mkdir(parents=True, exist_ok=True)
+                        os.replace(staged, target)
+            except BaseException:
+                recover(self.dest)
+                raise
+            journal["status"] = "committed"
+            _write_journal(self.work, journal)
+            _prune_dirs(self.dest, [op["path"] for op in ops if op["action"] == "remove"])
+        shutil.rmtree(self.work, ignore_errors=True)
+        self.committed = True
+        return ops
+
+    def _changed(self, rel: str) -> bool:
+        """Whether the project file changed since it was staged."""
+        base = self.baseline.get(rel)
+        return _signature(self.dest / rel) != (base[0] if base else None)
+
+    def _new_dirs(self) -> List[str]:
+        """Directories created in the stage that the project lacks (parents first)."""
+        new = []
+        for top in STAGED_ROOTS + ("docs",):
+            base = self.root / top
+            if not base.is_dir() or base.is_symlink():
+                continue
+            if not (self.dest / top).exists():
+                new.append(top)
+            for dirpath, dirs, _ in os.walk(base):
+                dirs[:] = sorted(d for d in dirs
+                                 if (Path(dirpath) / d).relative_to(self.root).as_posix() not in UNSTAGED)
+                for d in dirs:
+                    rel = (Path(dirpath) / d).relative_to(self.root).as_posix()
+                    if not (self.dest / rel).exists():
+                        new.append(rel)
+        return new
+
+    def discard(self) -> None:
+        """Drop the staged writes; the project is left untouched."""
+        if self.work.exists():
+            shutil.rmtree(self.work, ignore_errors=True)
+
+
+def _write_journal(work: Path, journal: dict) -> None:
+    path = work / JOURNAL
+    tmp = path.with_name(JOURNAL + ".tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(journal, f, indent=1)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+def recover(dest: Path) -> Optional[str]:
+    """Finish or roll back an interrupted transaction in dest.
+
+    Returns "rolled back", "cleaned" or None when there was nothing to do.
+    """
+    work = dest / TXN_DIR
+    if not work.exists():
+        return None
+    try:
+        with open(work / JOURNAL, "r", encoding="utf-8") as f:
+            journal = json.load(f)
+    except (OSError, ValueError):
+        journal = {"status": "staging", "units": []}
+
+    outcome = "cleaned"
+    if journal.get("status") == "committing":
+        backup = work / "backup"
+        # "units" is the journal format of older versions (whole directories)
+        for unit in reversed(journal.get("files", journal.get("units", []))):
+            target = dest / unit["path"]
+            saved = backup / unit["path"]
+            if unit["had_original"]:
+                if saved.exists() or saved.is_symlink():
+                    _remove(target)
+                    os.replace(saved, target)
+            else:
+                _remove(target)
+        outcome = "rolled back"
+    shutil.rmtree(work, ignore_errors=True)
+    return outcome
+
+
+def _prune_dirs(dest: Path, removed: List[str]) -> None:
+    """Remove directories left empty by removed files (staged roots stay)."""
+    for rel in removed:
+        parent = (dest / rel).parent
+        while parent != dest and parent.relative_to(dest).as_posix() not in STAGED_ROOTS:
+            try:
+                parent.rmdir()
+            except OSError:
+                break
+            parent = parent.parent
+
+
+def print_plan(ops: List[dict], limit: int = 50) -> None:
+    """Print a dry-run plan."""
+    counts = {a: sum(1 for op in ops if op["action"] == a) for a in ("add", "update", "remove")}
+    click.secho(f"Planned changes: {counts['add']} added, {counts['update']} updated, "
+                f"{counts['remove']} removed", bold=True)
+    styles = {"add": ("+", "green"), "update": ("~", "yellow"), "remove": ("-", "red")}
+    for op in ops[:limit]:
+        sign, color = styles[op["action"]]
+        click.secho(f"  {sign} {op['path']}", fg=color)
+    if len(ops) > limit:
+        click.echo(f"  ... and {len(ops) - limit} more")
+    click.echo("(dry run, nothing written)")
@@ -0,0 +1,450 @@
+"""Watch mode - ``skgd watch`` keeps derived project data fresh.
+
+The project index (spec counts, task progress, state summaries), the
+search index, the asset scan cache with assets-catalog.md, and the
+budget history all go stale as files change; commands reading them then
+pay for a rescan. ``skgd watch`` watches ``docs/``, ``.skgd/``,
+``.claude/`` and the engine asset roots and refreshes only what a change
+touches, so readers always find current data.
+
+Changes come from inotify on Linux (through ctypes, no extra dependency)
+and from stat-polling elsewhere or when the inotify watch limit is hit.
+Bursts are debounced: a Unity reimport rewrites thousands of ``.meta``
+files, which are ignored outright, and the asset changes around them are
+handled in one batch once the tree has been quiet for ``--debounce``
+seconds. Every refresher is incremental and only writes when something
+changed, so the watcher's own writes settle after one extra pass.
+"""
+
+import os
+import select
+import struct
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+import click
+
+from .cli import detect_project_settings, require_project_root
+from .fleet import SKIP_DIRS
+from .index import SPEC_FILES, STATE_FILES
+
+# Top-level directories watched in Unity projects; Godot assets live
+# anywhere under the project root, so the whole tree is watched there.
+UNITY_TOP_DIRS = {"docs", ".skgd", ".claude", "Assets"}
+WATCHED_DOT_DIRS = {".skgd", ".claude"}
+IGNORED_NAMES = SKIP_DIRS | {"addons"}
+# Written by skgd itself
+IGNORED_DIRS = {".skgd/cache", ".skgd/snapshots"}
+IGNORED_SUFFIXES = (".meta", ".tmp", ".swp", "~")
+
+BUDGET_PREFIXES = (".skgd/memory/", ".skgd/agents/", ".claude/")
+BUDGET_FILES = ("CLAUDE.md", ".skgd/config.yaml")
+
+# Directory created, deleted or moved -> refreshers that may care
+DIR_ROUTES = [
+    ("docs/specs", {"index", "search", "assets"}),
+    ("docs", {"search"}),
+    (".skgd/memory", {"search", "budget"}),
+    (".skgd/agents", {"budget"}),
+    (".claude", {"budget"}),
+]
+
+REFRESHERS = ("index", "search", "assets", "budget")
+
+# Refresh a burst after this long even if it has not settled
+MAX_DELAY = 10.0
+
+
+def watched_dir(rel: str, engine: str) -> bool:
+    """Whether the project-relative directory rel is watched."""
+    parts = rel.split("/")
+    name = parts[-1]
+    if len(parts) == 1:
+        if engine == "unity":
+            return name in UNITY_TOP_DIRS
+        if name in WATCHED_DOT_DIRS:
+            return True
+    if rel in IGNORED_DIRS:
+        return False
+    return not (name.startswith(".") or name in IGNORED_NAMES)
+
+
+def _is_asset(rel: str, engine: str) -> bool:
+    from .assets import EXTRA_SKIP_DIRS, category_of
+
+    parts = rel.split("/")
+    if engine == "unity":
+        if parts[0] != "Assets":
+            return False
+    elif parts[0] in ("docs", ".skgd", ".claude"):
+        return False
+    if any(p in EXTRA_SKIP_DIRS for p in parts[:-1]):
+        return False
+    return category_of(os.path.splitext(parts[-1])[1].lower()) is not None
+
+
+def route(rel: str, is_dir: bool, engine: str) -> Set[str]:
+    """Refreshers affected by a change to the project-relative path rel."""
+    if rel.endswith(IGNORED_SUFFIXES):
+        return set()
+    targets = set()
+    if is_dir:
+        for prefix, names in DIR_ROUTES:
+            if rel == prefix or rel.startswith(prefix + "/") or prefix.startswith(rel + "/"):
+                targets |= names
+        top = rel.split("/", 1)[0]
+        if (engine == "unity" and top == "Assets") or (
+                engine != "unity" and top not in ("docs", ".skgd", ".claude")):
+            targets.add("assets")
+        return targets
+
+    parts = rel.split("/")
+    in_specs = len(parts) > 2 and parts[:2] == ["docs", "specs"]
+    if rel in STATE_FILES or (in_specs and len(parts) == 4 and parts[3] in SPEC_FILES):
+        targets.add("index")
+    if in_specs and parts[-1] in SPEC_FILES:
+        # The catalog's "Used By" column comes from spec mentions
+        targets.add("assets")
+    if rel.endswith(".md") and (rel.startswith("docs/") or rel.startswith(".skgd/memory/")):
+        targets.add("search")
+    if rel.startswith(BUDGET_PREFIXES) or rel in BUDGET_FILES:
+        targets.add("budget")
+    if _is_asset(rel, engine):
+        targets.add("assets")
+    return targets
+
+
+class PollingWatcher:
+    """Detects changes by comparing stat snapshots of the watched tree.
+
+    Only files some refresher cares about are stat'ed (``.meta`` files and
+    other noise are skipped by name), and directory type comes from the
+    scandir entry, so a poll costs one stat per relevant file.
+    """
+
+    name = "polling"
+
+    def __init__(self, dest: Path, engine: str, interval: float = 1.0):
+        self.dest = dest
+        self.engine = engine
+        self.interval = interval
+        self.snapshot = self._scan()
+
+    def _scan(self) -> Dict[str, Tuple[int, int]]:
+        found = {}
+        stack = [(str(self.dest), "")]
+        while stack:
+            path, rel_dir = stack.pop()
+            try:
+                entries = list(os.scandir(path))
+            except OSError:
+                continue
+            for entry in entries:
+                rel = f"{rel_dir}{entry.name}"
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if watched_dir(rel, self.engine):
+                            stack.append((entry.path, rel + "/"))
+                    elif route(rel, False, self.engine):
+                        st = entry.stat(follow_symlinks=False)
+                        found[rel] = (st.st_mtime_ns, st.st_size)
+                except OSError:
+                    continue
+        return found
+
+    def wait(self, timeout: Optional[float]) -> Optional[Set[Tuple[str, bool]]]:
+        """Changed (path, is_dir) pairs; empty when timeout passes quietly."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            delay = self.interval
+            if deadline is not None:
+                delay = min(delay, max(0.0, deadline - time.monotonic()))
+            time.sleep(delay)
+            current = self._scan()
+            changed = {(rel, False) for rel in set(current) | set(self.snapshot)
+                       if current.get(rel) != self.snapshot.get(rel)}
+            self.snapshot = current
+            if changed or (deadline is not None and time.monotonic() >= deadline):
+                return changed
+
+    def close(self) -> None:
+        pass
+
+
+# <sys/inotify.h>
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_ISDIR = 0x40000000
+IN_CLOEXEC = 0o2000000
+WATCH_MASK = (IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+              | IN_DELETE_SELF | IN_ONLYDIR)
+EVENT_HEADER = struct.Struct("iIII")
+
+
+class InotifyWatcher:
+    """Linux inotify watcher: one watch per directory of the watched tree.
+
+    Returns None from wait() when the kernel queue overflowed and changes
+    were lost; the caller then refreshes everything.
+    """
+
+    name = "inotify"
+
+    def __init__(self, dest: Path, engine: str):
+        import ctypes
+        import ctypes.util
+
+        self.dest = dest
+        self.engine = engine
+        self._libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self._ctypes = ctypes
+        self.fd = self._libc.inotify_init1(IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self.dirs: Dict[int, str] = {}
+        try:
+            self._add_tree("")
+        except OSError:
+            self.close()
+            raise
+
+    def _add_tree(self, rel: str) -> None:
+        """Watch rel and its watched subdirectories (raises OSError when the
+        watch limit is reached)."""
+        stack = [rel]
+        while stack:
+            rel_dir = stack.pop()
+            path = os.path.join(str(self.dest), rel_dir) if rel_dir else str(self.dest)
+            wd = self._libc.inotify_add_watch(self.fd, os.fsencode(path), WATCH_MASK)
+            if wd < 0:
+                errno = self._ctypes.get_errno()
+                if errno == 28:  # ENOSPC: fs.inotify.max_user_watches reached
+                    raise OSError(errno, "inotify watch limit reached")
+                continue  # Directory vanished meanwhile
+            self.dirs[wd] = rel_dir
+            try:
+                entries = list(os.scandir(path))
+            except OSError:
+                continue
+            for entry in entries:
+                sub = f"{rel_dir}/{entry.name}" if rel_dir else entry.name
+                if entry.is_dir(follow_symlinks=False) and watched_dir(sub, self.engine):
+                    stack.append(sub)
+
+    def wait(self, timeout: Optional[float]) -> Optional[Set[Tuple[str, bool]]]:
+        """Changed (path, is_dir) pairs; empty on timeout, None on overflow."""
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return set()
+        data = os.read(self.fd, 1 << 16)
+        changed: Set[Tuple[str, bool]] = set()
+        overflow = False
+        offset = 0
+        while offset < len(data):
+            wd, mask, _cookie, length = EVENT_HEADER.unpack_from(data, offset)
+            offset += EVENT_HEADER.size
+            name = data[offset:offset + length].rstrip(b"\0").decode("utf-8", errors="surrogateescape")
+            offset += length
+            if mask & IN_Q_OVERFLOW:
+                overflow = True
+                continue
+            if mask & IN_IGNORED:
+                self.dirs.pop(wd, None)
+                continue
+            parent = self.dirs.get(wd)
+            if parent is None or not name:
+                continue
+            rel = f"{parent}/{name}" if parent else name
+            is_dir = bool(mask & IN_ISDIR)
+            if is_dir:
+                if not watched_dir(rel, self.engine):
+                    continue
+                if mask & (IN_CREATE | IN_MOVED_TO):
+                    # Files written before the watch was added are covered
+                    # by the directory event itself
+                    self._add_tree(rel)
+            changed.add((rel, is_dir))
+        return None if overflow else changed
+
+    def close(self) -> None:
+        if self.fd >= 0:
+            os.close(self.fd)
+            self.fd = -1
+
+
+def open_watcher(dest: Path, engine: str, poll: bool = False, interval: float = 1.0):
+    """inotify watcher when available, else a polling one."""
+    if not poll and sys.platform.startswith("linux"):
+        try:
+            return InotifyWatcher(dest, engine)
+        except (OSError, AttributeError) as e:
+            click.secho(f"inotify unavailable ({e}); falling back to polling", fg="yellow", err=True)
+    return PollingWatcher(dest, engine, interval)
+
+
+class Refresher:
+    """Runs the incremental updaters, keeping their indexes open."""
+
+    def __init__(self, dest: Path):
+        self.dest = dest
+        self._index = None
+        self._search = None
+
+    def refresh(self, names: Set[str]) -> List[str]:
+        """Run the named refreshers; returns one note per changed artifact."""
+        notes = []
+        for name in REFRESHERS:
+            if name not in names:
+                continue
+            try:
+                note = getattr(self, f"_refresh_{name}")()
+            except Exception as e:  # Keep watching; the next change retries
+                note = f"{name} failed: {e}"
+            if note:
+                notes.append(note)
+        return notes
+
+    def _refresh_index(self) -> Optional[str]:
+        from .index import open_index, update_index
+
+        if self._index is None:
+            self._index = open_index(self.dest)
+        stats = update_index(self.dest, self._index)
+        if stats["reindexed"] or stats["removed"]:
+            return f"index: {stats['reindexed']} reindexed, {stats['removed']} removed"
+        return None
+
+    def _refresh_search(self) -> Optional[str]:
+        from .search import open_search_index, update_search_index
+
+        if self._search is None:
+            self._search = open_search_index(self.dest)
+        stats = update_search_index(self.dest, self._search)
+        if stats["reindexed"] or stats["removed"]:
+            return f"search: {stats['reindexed']} reindexed, {stats['removed']} removed"
+        return None
+
+    def _refresh_assets(self) -> Optional[str]:
+        from .assets import CATALOG_FILE, scan_assets, update_catalog, update_state_counts
+
+        lang, engine = detect_project_settings(self.dest)
+        result = scan_assets(self.dest, engine)
+        updated = False
+        if (self.dest / CATALOG_FILE).is_file():
+            updated = update_catalog(self.dest, result, lang)
+            update_state_counts(self.dest, result)
+        if result["analyzed"] or result["removed"] or updated:
+            note = f"assets: {result['analyzed']} analyzed, {result['removed']} removed"
+            return note + (", catalog updated" if updated else "")
+        return None
+
+    def _refresh_budget(self) -> Optional[str]:
+        from .budget import load_history, measure_project, record_history
+
+        before = len(load_history(self.dest))
+        result = measure_project(self.dest)
+        record_history(self.dest, result)
+        if len(load_history(self.dest)) != before:
+            return f"budget: {sum(result['totals'].values())} tokens"
+        return None
+
+    def close(self) -> None:
+        for conn in (self._index, self._search):
+            if conn is not None:
+                conn.close()
+
+
+def collect(watcher, first: Optional[Set[Tuple[str, bool]]], debounce: float
+            ) -> Optional[Set[Tuple[str, bool]]]:
+    """Extend a batch of changes until the tree is quiet for debounce seconds.
+
+    Returns None when changes may have been lost (inotify overflow).
+    """
+    if first is None:
+        return None
+    changes = set(first)
+    deadline = time.monotonic() + MAX_DELAY
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return changes
+        more = watcher.wait(min(debounce, remaining))
+        if more is None:
+            return None
+        if not more:
+            return changes
+        changes |= more
+
+
+def _log(message: str) -> None:
+    click.echo(f"[{datetime.now().strftime('%H:%M:%S')}] {message}")
+
+
+@click.command()
+@click.option("--poll", is_flag=True, help="Use stat-polling even where inotify is available")
+@click.option("--interval", type=click.FloatRange(min=0.1), default=1.0, show_default=True,
+              help="Polling interval in seconds")
+@click.option("--debounce", type=click.FloatRange(min=0.0), default=0.5, show_default=True,
+              help="Quiet time before a burst of changes is processed")
+@click.option("--once", is_flag=True, help="Refresh everything once and exit")
+def watch(poll: bool, interval: float, debounce: float, once: bool):
+    """Keep indexes, the asset catalog and budget history up to date.
+
+    Watches docs/, .skgd/, .claude/ and the engine asset roots, and after
+    each burst of changes refreshes only the affected artifacts: the
+    project index (specs, tasks, state), the search index, the asset scan
+    and assets-catalog.md, and the memory budget history. Stop with Ctrl+C.
+
+    Examples:
+        skgd watch
+        skgd watch --poll --interval 2
+        skgd watch --once
+    """
+    dest = require_project_root()
+    _, engine = detect_project_settings(dest)
+    refresher = Refresher(dest)
+    try:
+        start = time.perf_counter()
+        notes = refresher.refresh(set(REFRESHERS))
+        _log(f"Initial refresh in {time.perf_counter() - start:.2f}s"
+             + (": " + "; ".join(notes) if notes else ", everything up to date"))
+        if once:
+            return
+
+        watcher = open_watcher(dest, engine, poll, interval)
+        try:
+            _log(f"Watching {dest} ({watcher.name}); Ctrl+C to stop")
+            while True:
+                changes = collect(watcher, watcher.wait(None), debounce)
+                if changes is None:
+                    names = set(REFRESHERS)
+                    summary = "event queue overflowed"
+                else:
+                    names, relevant = set(), 0
+                    for rel, is_dir in changes:
+                        targets = route(rel, is_dir, engine)
+                        names |= targets
+                        relevant += bool(targets)
+                    summary = f"{relevant} change(s)"
+                if not names:
+                    continue
+                start = time.perf_counter()
+                notes = refresher.refresh(names)
+                if notes:
+                    _log(f"{summary} in {time.perf_counter() - start:.2f}s: " + "; ".join(notes))
+        except KeyboardInterrupt:
+            _log("Stopped")
+        finally:
+            watcher.close()
+    finally:
+        refresher.close()
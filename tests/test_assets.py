@@ -0,0 +1,96 @@
+"""Asset scanner: header parsers, scan robustness, catalog and state counts."""
+
+import struct
+import wave
+from pathlib import Path
+
+from skgd.assets import (animation_info, audio_duration, image_size, render_catalog,
+                         scan_assets, update_state_counts)
+from skgd.state import StateStore
+
+TEMPLATES = Path(__file__).resolve().parent.parent / "src" / "skgd" / "templates" / "en" / "skgd"
+
+
+def png(width: int, height: int) -> bytes:
+    return b"\x89PNG\r\n\x1a\n" + struct.pack(">I4sII", 13, b"IHDR", width, height) + b"\x08\x06\0\0\0"
+
+
+def write_wav(path: Path, seconds: float, rate: int = 8000) -> None:
+    with wave.open(str(path), "wb") as w:
+        w.setnchannels(1)
+        w.setsampwidth(2)
+        w.setframerate(rate)
+        w.writeframes(b"\0\0" * int(rate * seconds))
+
+
+def make_project(tmp_path: Path) -> Path:
+    (tmp_path / ".skgd" / "memory").mkdir(parents=True)
+    for rel in ("state.yaml", "memory/assets-catalog.md"):
+        (tmp_path / ".skgd" / rel).write_bytes((TEMPLATES / rel).read_bytes())
+    (tmp_path / "Assets").mkdir()
+    return tmp_path
+
+
+def test_image_and_wav_headers(tmp_path):
+    assert image_size(png(32, 16), ".png") == (32, 16)
+    path = tmp_path / "a.wav"
+    write_wav(path, 1.5)
+    data = path.read_bytes()
+    assert audio_duration(path, data, len(data)) == 1.5
+
+
+def test_truncated_mp3_headers_do_not_raise(tmp_path):
+    path = tmp_path / "a.mp3"
+    assert audio_duration(path, b"ID3\x03", 4) is None
+    # A cut-off Xing header falls back to the constant bitrate estimate
+    head = b"ID3\x03\0\0\0\0\0\0\xff\xfb\x90\0Xing\0\0\0"
+    assert audio_duration(path, head, len(head)) == (len(head) - 10) * 8 / 128000
+
+
+def test_malformed_animation_has_unknown_frames():
+    head = b"m_SampleRate: 1.2.3\nm_StopTime: 2\n"
+    assert animation_info(head, ".anim") == ("Unity clip", None)
+    head = b"m_SampleRate: 30\nm_StopTime: 2\n"
+    assert animation_info(head, ".anim") == ("Unity clip", 60)
+
+
+def test_scan_survives_bad_files_and_flags_duplicates(tmp_path):
+    dest = make_project(tmp_path)
+    (dest / "Assets" / "bad.mp3").write_bytes(b"ID3\x03")
+    (dest / "Assets" / "hero.png").write_bytes(png(64, 64))
+    (dest / "Assets" / "copy.png").write_bytes(png(64, 64))
+
+    result = scan_assets(dest, "unity", jobs=2)
+
+    assert result["assets"]["Assets/bad.mp3"]["duration"] is None
+    assert result["assets"]["Assets/hero.png"]["width"] == 64
+    assert result["duplicates"] == [["Assets/copy.png", "Assets/hero.png"]]
+    assert scan_assets(dest, "unity")["analyzed"] == 0
+
+
+def test_render_catalog_rows_and_placeholders(tmp_path):
+    dest = make_project(tmp_path)
+    (dest / "Assets" / "hero.png").write_bytes(png(64, 32))
+    result = scan_assets(dest, "unity")
+    text = (dest / ".skgd" / "memory" / "assets-catalog.md").read_text(encoding="utf-8")
+
+    out = render_catalog(text, result, {"hero.png": ["001-move"]})
+
+    assert "| hero | `Assets/hero.png` | 64×32 (" in out
+    assert "| 001-move | 1 | 0 | 0 | 0 |" in out
+    assert out.count("*No assets yet*") == 3
+    assert "## Sourcing Guidelines" in out
+
+
+def test_state_counts_keep_defined(tmp_path):
+    dest = make_project(tmp_path)
+    (dest / "Assets" / "hero.png").write_bytes(png(8, 8))
+    store = StateStore(dest)
+    store.set("assets.by_category.sprites.defined", 4)
+
+    update_state_counts(dest, scan_assets(dest, "unity"))
+
+    by_category = store.get("assets.by_category")
+    assert by_category["sprites"] == {"defined": 4, "created": 1}
+    assert by_category["audio"] == {"defined": 0, "created": 0}
+    assert store.get("assets.total_created") == 1
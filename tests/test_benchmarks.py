@@ -0,0 +1,50 @@
+"""Benchmark generator: synthetic projects match their scale and upgrade cleanly."""
+
+import importlib.util
+from pathlib import Path
+
+from skgd.cli import detect_existing_project
+from skgd.fleet import scan_one, upgrade_one
+
+GENERATE = Path(__file__).resolve().parent.parent / "benchmarks" / "generate.py"
+
+
+def load_generator():
+    spec = importlib.util.spec_from_file_location("skgd_bench_generate", GENERATE)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_small_project_has_the_scale_sizes(tmp_path):
+    generate = load_generator()
+    specs, tasks, learnings, _, assets = generate.SCALES["small"]
+    dest = generate.make_project(tmp_path / "game", "small", "godot")
+
+    assert detect_existing_project(dest)["specs_count"] == specs
+    task_lines = [line for path in (dest / "docs" / "specs").glob("*/tasks.md")
+                  for line in path.read_text(encoding="utf-8").splitlines() if line.startswith("- [")]
+    assert len(task_lines) == specs * tasks
+    entries = (dest / ".skgd" / "memory" / "learnings.md").read_text(encoding="utf-8").count("\n- 2025-")
+    assert entries == learnings
+    assert len([p for p in (dest / "assets").rglob("*") if p.is_file()]) == assets
+    assert (dest / "project.godot").is_file()
+
+    # Same seed, same project: runs stay comparable between commits
+    again = generate.make_project(tmp_path / "again", "small", "godot")
+    for spec in (dest / "docs" / "specs").iterdir():
+        assert (again / "docs" / "specs" / spec.name / "tasks.md").read_bytes() == (
+            spec / "tasks.md").read_bytes()
+
+
+def test_v1_project_upgrades_to_current(tmp_path):
+    dest = load_generator().make_v1_project(tmp_path / "old", "small")
+
+    info = detect_existing_project(dest)
+    assert info["version"] == "1.0"
+    assert not (dest / ".skgd" / "manifest.json").exists()
+
+    result = upgrade_one(dest)
+    assert result["error"] is None and result["outcome"].startswith("upgraded to v")
+    assert (dest / ".skgd" / "manifest.json").is_file()
+    assert scan_one(dest)["outcome"] == "up to date"
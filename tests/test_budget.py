@@ -0,0 +1,62 @@
+"""Context budget: token estimates, layer budgets, workflows and history."""
+
+from pathlib import Path
+
+from click.testing import CliRunner
+
+from skgd.budget import budget, estimate_tokens, load_history, measure_project, record_history
+
+
+def make_project(tmp_path: Path) -> Path:
+    memory = tmp_path / ".skgd" / "memory"
+    memory.mkdir(parents=True)
+    (tmp_path / ".skgd" / "config.yaml").write_text("budget:\n  constitution: 5\n  learnings-core: 0\n")
+    (memory / "constitution.md").write_text("Players always feel in control of the hero.\n")
+    (memory / "learnings-core.md").write_text("word " * 2000)
+    (tmp_path / ".claude" / "commands").mkdir(parents=True)
+    (tmp_path / ".claude" / "commands" / "implement.md").write_text(
+        "Read `.skgd/memory/constitution.md` first.\n")
+    (tmp_path / ".claude" / "commands" / "_scout.md").write_text("Shared.\n")
+    (tmp_path / "CLAUDE.md").write_text("# Game\n")
+    return tmp_path
+
+
+def test_estimate_tokens():
+    assert estimate_tokens("") == 0
+    assert estimate_tokens("hello world") == 4
+    assert estimate_tokens("2024") == 2
+    assert estimate_tokens("----") == 1
+    assert estimate_tokens("élan") == 2
+
+
+def test_measure_applies_config_budgets_and_references(tmp_path):
+    dest = make_project(tmp_path)
+    result = measure_project(dest)
+
+    layers = {layer["name"]: layer for layer in result["layers"]}
+    assert layers["constitution"]["budget"] == 5 and layers["constitution"]["over"]
+    assert layers["learnings-core"]["budget"] is None and not layers["learnings-core"]["over"]
+    workflows = {w["command"]: w for w in result["workflows"]}
+    assert list(workflows) == ["implement"]
+    assert workflows["implement"]["files"] == ["CLAUDE.md", ".claude/commands/implement.md",
+                                               ".skgd/memory/constitution.md"]
+
+
+def test_history_records_only_changes(tmp_path):
+    dest = make_project(tmp_path)
+    result = measure_project(dest)
+    assert record_history(dest, result) is None
+    assert record_history(dest, result) is None
+    assert len(load_history(dest)) == 1
+
+    (dest / ".skgd" / "memory" / "constitution.md").write_text("Short.\n")
+    previous = record_history(dest, measure_project(dest))
+    assert previous["layers"]["constitution"] == result["layers"][0]["tokens"]
+    assert len(load_history(dest)) == 2
+
+
+def test_over_budget_exits_non_zero(tmp_path, monkeypatch):
+    monkeypatch.chdir(make_project(tmp_path))
+    result = CliRunner().invoke(budget, ["--no-record"])
+    assert result.exit_code == 1
+    assert "Over budget: .skgd/memory/constitution.md" in result.output
@@ -0,0 +1,71 @@
+"""Template sources: pack format, packed vs loose reads and extraction."""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from skgd.bundle import (LooseTemplates, PackedTemplates, TemplateBundle, copy_tree,
+                         open_template_source, pack_tree)
+
+
+def make_templates(root: Path) -> Path:
+    commands = root / "en" / "claude" / "commands"
+    commands.mkdir(parents=True)
+    (commands / "spec.md").write_text("# /spec\n")
+    (commands / "plan.md").write_text("# /plan\n" * 100)
+    scripts = root / "en" / "skgd" / "scripts"
+    scripts.mkdir(parents=True)
+    (scripts / "check.sh").write_text("#!/bin/sh\nexit 0\n")
+    os.chmod(scripts / "check.sh", 0o755)
+    return root
+
+
+def test_pack_roundtrip(tmp_path):
+    root = make_templates(tmp_path / "templates")
+    assert pack_tree(root / "en", tmp_path / "en.pack", prefix="en/") == 3
+
+    bundle = TemplateBundle(tmp_path / "en.pack")
+    assert sorted(bundle.members) == ["en/claude/commands/plan.md", "en/claude/commands/spec.md",
+                                      "en/skgd/scripts/check.sh"]
+    assert bundle.read_bytes("en/claude/commands/plan.md") == b"# /plan\n" * 100
+    bundle.close()
+
+    (tmp_path / "bad.pack").write_bytes(b"NOTAPACK" + b"\0" * 12)
+    with pytest.raises(ValueError, match="Not a template bundle"):
+        TemplateBundle(tmp_path / "bad.pack")
+
+
+def test_packed_and_loose_sources_agree(tmp_path, monkeypatch):
+    root = make_templates(tmp_path / "templates")
+    packs = tmp_path / "packs"
+    packs.mkdir()
+    pack_tree(root / "en", packs / "en.pack", prefix="en/")
+    loose, packed = LooseTemplates(root), PackedTemplates(packs)
+
+    for source in (loose, packed):
+        assert source.files("en/claude/commands") == ["en/claude/commands/plan.md",
+                                                      "en/claude/commands/spec.md"]
+        assert source.exists("en/claude") and source.exists("en/skgd/scripts/check.sh")
+        assert not source.exists("fr/claude") and source.files("fr/") == []
+        assert source.read_bytes("en/claude/commands/spec.md") == b"# /spec\n"
+
+    monkeypatch.delenv("SKGD_DEV", raising=False)
+    assert isinstance(open_template_source(packs), PackedTemplates)
+    assert isinstance(open_template_source(root), LooseTemplates)
+    monkeypatch.setenv("SKGD_DEV", "1")
+    assert isinstance(open_template_source(packs), LooseTemplates)
+
+
+def test_extract_keeps_executable_bits(tmp_path):
+    root = make_templates(tmp_path / "templates")
+    packs = tmp_path / "packs"
+    packs.mkdir()
+    pack_tree(root / "en", packs / "en.pack", prefix="en/")
+
+    files = copy_tree(PackedTemplates(packs), "en/skgd", tmp_path / "game" / ".skgd")
+
+    assert files == ["en/skgd/scripts/check.sh"]
+    script = tmp_path / "game" / ".skgd" / "scripts" / "check.sh"
+    assert script.read_text() == "#!/bin/sh\nexit 0\n"
+    assert os.access(script, os.X_OK)
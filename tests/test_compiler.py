@@ -0,0 +1,74 @@
+"""Command compiler: @engine blocks, @include partials and shipped templates."""
+
+from pathlib import Path
+
+import pytest
+
+from skgd.bundle import LooseTemplates
+from skgd.compiler import ENGINES, TemplateError, command_renderer, compile_report, compile_text
+
+TEMPLATES = Path(__file__).resolve().parent.parent / "src" / "skgd" / "templates"
+
+TEXT = """# Implement
+
+Before.
+
+<!-- @engine unity -->
+Unity step.
+<!-- @end -->
+
+<!-- @engine godot -->
+Godot step.
+<!-- @end -->
+
+After.
+"""
+
+
+def no_partials(name):
+    raise AssertionError(name)
+
+
+def test_engine_blocks_keep_one_engine_and_paragraph_spacing():
+    assert compile_text(TEXT, "unity", no_partials) == "# Implement\n\nBefore.\n\nUnity step.\n\nAfter.\n"
+    assert compile_text(TEXT, "godot", no_partials) == "# Implement\n\nBefore.\n\nGodot step.\n\nAfter.\n"
+    both = compile_text(TEXT, None, no_partials)
+    assert "Unity step." in both and "Godot step." in both and "@engine" not in both
+
+
+def test_include_fills_arguments_and_compiles_partials():
+    partials = {"lang": "Answer in {{language}}.\n<!-- @engine godot -->\nUse GDScript.\n<!-- @end -->\n"}
+    text = "A\n<!-- @include lang language=French -->\nB"
+    assert compile_text(text, "godot", partials.__getitem__) == "A\nAnswer in French.\nUse GDScript.\nB"
+    assert compile_text(text, "unity", partials.__getitem__) == "A\nAnswer in French.\nB"
+
+
+@pytest.mark.parametrize("text, message", [
+    ("<!-- @engine unreal -->\n<!-- @end -->", "unknown engine"),
+    ("<!-- @end -->", "@end without @engine"),
+    ("<!-- @engine unity -->\n<!-- @engine godot -->", "inside an @engine block"),
+    ("<!-- @engine unity -->\ntext", "never closed"),
+    ("<!-- @include -->", "needs a partial name"),
+])
+def test_malformed_directives_are_errors(text, message):
+    with pytest.raises(TemplateError, match=message):
+        compile_text(text, "unity", no_partials)
+
+
+@pytest.mark.parametrize("lang", ["en", "fr"])
+@pytest.mark.parametrize("engine", ENGINES)
+def test_shipped_commands_compile_cleanly(lang, engine):
+    source = LooseTemplates(TEMPLATES)
+    render = command_renderer(source, lang, engine)
+    other_tools = "mcp__gdai__" if engine == "unity" else "mcp__UnityMCP__"
+    for rel in source.files(f"{lang}/claude/commands/"):
+        text = render(rel).decode("utf-8")
+        assert "<!-- @" not in text, rel
+        assert other_tools not in text, rel
+
+
+def test_report_counts_savings():
+    rows = {r["command"]: r for r in compile_report(LooseTemplates(TEMPLATES), "en", "godot")}
+    assert rows["implement"]["saved_bytes"] > 0
+    assert rows["implement"]["bytes"] + rows["implement"]["saved_bytes"] == rows["implement"]["all_engines_bytes"]
+    assert rows["pillars"]["saved_bytes"] == 0
@@ -0,0 +1,76 @@
+"""Copy engine: file copies, trees, parallel writes and stats."""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from skgd.copyengine import CopyStats, copy_file, copy_files, copy_tree, human_size, write_files
+
+
+def make_tree(root: Path) -> Path:
+    (root / "commands" / "deep").mkdir(parents=True)
+    for i in range(12):
+        (root / "commands" / f"c{i}.md").write_text(f"command {i}\n" * (i + 1))
+    (root / "commands" / "deep" / "run.sh").write_text("#!/bin/sh\n")
+    os.chmod(root / "commands" / "deep" / "run.sh", 0o755)
+    (root / "commands" / "empty.md").write_bytes(b"")
+    (root / "__pycache__").mkdir()
+    (root / "__pycache__" / "x.pyc").write_bytes(b"\0")
+    return root
+
+
+def test_human_size():
+    assert [human_size(n) for n in (512, 2048, 5 * 1024 ** 2, 3 * 1024 ** 4)] == [
+        "512 B", "2.0 KB", "5.0 MB", "3072.0 GB"]
+
+
+def test_copy_file_keeps_content_mode_and_mtime(tmp_path):
+    src = tmp_path / "a.sh"
+    src.write_bytes(b"x" * 70000)
+    os.chmod(src, 0o750)
+    os.utime(src, ns=(10 ** 18, 10 ** 18))
+    stats = CopyStats()
+
+    assert copy_file(src, tmp_path / "b.sh", stats) == 70000
+
+    dst = tmp_path / "b.sh"
+    assert dst.read_bytes() == src.read_bytes()
+    assert dst.stat().st_mode & 0o777 == 0o750
+    assert dst.stat().st_mtime_ns == src.stat().st_mtime_ns
+    assert (stats.files, stats.bytes) == (1, 70000)
+    assert set(stats.methods) <= {"reflink", "copy_file_range", "copyfile"}
+
+
+@pytest.mark.skipif(not hasattr(os, "symlink") or os.name == "nt", reason="symlinks")
+def test_copy_tree_preserves_symlinks_and_prunes(tmp_path):
+    src = make_tree(tmp_path / "src")
+    os.symlink("c0.md", src / "commands" / "latest.md")
+    stats = CopyStats()
+
+    count = copy_tree(src, tmp_path / "dst", ignore=lambda rel: rel.startswith("__pycache__"),
+                      jobs=4, stats=stats)
+
+    dst = tmp_path / "dst"
+    assert count == 15
+    assert os.readlink(dst / "commands" / "latest.md") == "c0.md"
+    assert (dst / "commands" / "c11.md").read_text() == "command 11\n" * 12
+    assert (dst / "commands" / "empty.md").read_bytes() == b""
+    assert os.access(dst / "commands" / "deep" / "run.sh", os.X_OK)
+    assert not (dst / "__pycache__").exists()
+    assert stats.files == 15 and stats.methods["symlink"] == 1
+    assert stats.seconds > 0 and "15 files" in stats.describe()
+
+
+def test_copy_errors_are_raised(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        copy_files([(tmp_path / f"missing{i}", tmp_path / "out" / f"{i}") for i in range(10)], jobs=4)
+
+
+def test_write_files_creates_directories(tmp_path):
+    items = [(tmp_path / "d" / f"{i}" / "f.txt", b"data", 0o600 if i == 0 else 0) for i in range(9)]
+    stats = CopyStats()
+    write_files(items, jobs=3, stats=stats)
+    assert all(dst.read_bytes() == b"data" for dst, _, _ in items)
+    assert (tmp_path / "d" / "0" / "f.txt").stat().st_mode & 0o777 == 0o600
+    assert stats.to_dict()["methods"] == {"write": 9}
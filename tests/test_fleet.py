@@ -0,0 +1,55 @@
+"""Fleet mode: project discovery, per-project isolation and upgrades."""
+
+from pathlib import Path
+
+from click.testing import CliRunner
+
+from skgd.cli import main
+from skgd.fleet import discover_projects, run_fleet, scan_one, upgrade_one
+
+
+def init_project(root: Path, name: str, monkeypatch) -> Path:
+    monkeypatch.chdir(root)
+    result = CliRunner().invoke(main, ["init", name, "--engine", "unity", "--no-interactive"], input="")
+    assert result.exit_code == 0, result.output
+    return root / name
+
+
+def test_discovery_skips_engine_folders_and_nested_projects(tmp_path):
+    for rel in ("a/.skgd", "a/sub/.skgd", "games/b/.skgd", "node_modules/c/.skgd",
+                "Library/d/.skgd", ".hidden/e/.skgd", "deep/1/2/3/f/.skgd"):
+        (tmp_path / rel).mkdir(parents=True)
+    assert discover_projects(tmp_path) == [tmp_path / "a", tmp_path / "deep/1/2/3/f", tmp_path / "games/b"]
+    assert discover_projects(tmp_path, max_depth=2) == [tmp_path / "a", tmp_path / "games/b"]
+
+
+def test_scan_and_upgrade_report_each_project(tmp_path, monkeypatch):
+    fresh = init_project(tmp_path, "fresh", monkeypatch)
+    stale = init_project(tmp_path, "stale", monkeypatch)
+    (stale / ".claude" / "commands" / "plan.md").unlink()
+    broken = tmp_path / "broken"
+    (broken / ".skgd").mkdir(parents=True)
+    (broken / ".skgd" / "config.yaml").write_text("engine: [unterminated\n")
+
+    results = {Path(r["path"]).name: r for r in run_fleet(scan_one, [broken, fresh, stale], jobs=2)}
+    assert results["fresh"]["outcome"] == "up to date"
+    assert results["stale"]["outcome"] == "1 files outdated"
+    assert results["broken"]["outcome"] == "upgrade available"
+
+    dry = upgrade_one(stale, dry_run=True)
+    assert dry["error"] is None and dry["outcome"].startswith("would change ")
+    assert not (stale / ".claude" / "commands" / "plan.md").exists()
+
+    assert upgrade_one(fresh)["outcome"] == "up to date"
+    done = upgrade_one(stale)
+    assert done["error"] is None and done["outcome"].startswith("upgraded to v")
+    assert (stale / ".claude" / "commands" / "plan.md").is_file()
+    assert scan_one(stale)["outcome"] == "up to date"
+
+
+def test_a_failing_project_does_not_stop_the_others(tmp_path, monkeypatch):
+    fresh = init_project(tmp_path, "fresh", monkeypatch)
+    missing = tmp_path / "gone"
+    results = run_fleet(upgrade_one, [missing, fresh], jobs=1)
+    assert results[0]["outcome"] == "error" and results[0]["error"]
+    assert results[1]["outcome"] == "up to date"
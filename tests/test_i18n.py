@@ -0,0 +1,71 @@
+"""Message catalogs: compilation, English fallback, cache and skgd msg."""
+
+import json
+from pathlib import Path
+
+from click.testing import CliRunner
+
+from skgd.i18n import CACHE_DIR, MESSAGES_FILE, Catalog, compile_messages, lookup, msg
+
+MESSAGES = """en:
+  done: "Done"
+  playtest:
+    passed: "PASSED"
+    failed: "FAILED {count}"
+fr:
+  playtest:
+    passed: "REUSSI"
+"""
+
+
+def make_project(tmp_path: Path, text: str = MESSAGES) -> Path:
+    (tmp_path / ".skgd" / "i18n").mkdir(parents=True)
+    (tmp_path / ".skgd" / "config.yaml").write_text("user:\n  language: fr\n")
+    (tmp_path / MESSAGES_FILE).write_text(text, encoding="utf-8")
+    return tmp_path
+
+
+def test_compile_flattens_sections():
+    compiled = compile_messages(MESSAGES.encode())
+    assert compiled["en"] == {"done": "Done", "playtest.passed": "PASSED",
+                              "playtest.failed": "FAILED {count}"}
+    assert compiled["fr"] == {"playtest.passed": "REUSSI"}
+
+
+def test_missing_keys_fall_back_to_english():
+    catalog = Catalog(lambda: MESSAGES.encode())
+    assert catalog.get("playtest.passed", "fr") == "REUSSI"
+    assert catalog.get("done", "fr") == "Done"
+    assert catalog.get("done", "de") == "Done"
+    assert catalog.get("nope", "fr") is None
+    assert catalog.section("playtest", "fr") == {"passed": "REUSSI", "failed": "FAILED {count}"}
+
+
+def test_project_catalog_falls_back_to_the_package():
+    project = Catalog(lambda: b"en:\n  done: 'Finished'\n")
+    package = Catalog(lambda: MESSAGES.encode())
+    assert lookup("done", "en", [project, package]) == ("Finished", {})
+    assert lookup("playtest.passed", "fr", [project, package]) == ("REUSSI", {})
+    assert lookup("playtest", "en", [project, package])[1]["failed"] == "FAILED {count}"
+
+
+def test_compiled_tables_are_cached_until_the_source_changes(tmp_path):
+    dest = make_project(tmp_path)
+    source = dest / MESSAGES_FILE
+    Catalog(source.read_bytes, dest / CACHE_DIR).messages("fr")
+    cached = json.loads((dest / CACHE_DIR / "fr.json").read_text(encoding="utf-8"))
+    assert cached["messages"] == {"playtest.passed": "REUSSI"}
+
+    assert Catalog(source.read_bytes, dest / CACHE_DIR).get("playtest.passed", "fr") == "REUSSI"
+    source.write_text(MESSAGES.replace("REUSSI", "OK"), encoding="utf-8")
+    assert Catalog(source.read_bytes, dest / CACHE_DIR).get("playtest.passed", "fr") == "OK"
+
+
+def test_msg_uses_the_project_language(tmp_path, monkeypatch):
+    monkeypatch.chdir(make_project(tmp_path))
+    runner = CliRunner()
+    assert runner.invoke(msg, ["playtest.passed"]).output == "REUSSI\n"
+    result = runner.invoke(msg, ["playtest.failed", "--set", "count=2", "--lang", "en"])
+    assert result.output == "FAILED 2\n"
+    result = runner.invoke(msg, ["nope.missing"])
+    assert result.exit_code != 0 and "Unknown message key" in result.output
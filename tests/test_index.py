@@ -0,0 +1,80 @@
+"""Project index: task and criteria parsing, incremental updates and queries."""
+
+from pathlib import Path
+
+from skgd.index import (feature_summary, get_state, open_index, parse_criteria, parse_tasks,
+                        query_tasks, update_index)
+from skgd.state import StateStore
+
+TEMPLATE = Path(__file__).resolve().parent.parent / "src" / "skgd" / "templates" / "en" / "skgd" / "state.yaml"
+
+TASKS = """# Tasks
+
+## Phase 1: Setup
+- [x] T001 Create folders
+- [ ] T002 [P] [MVP] PlayerData asset
+
+## Phase 2: User Story 1
+- [ ] T003 [US1] PlayerController
+- [ ] T004 [POLISH] Dust particles
+
+## Phase 3: Polish
+- [ ] T005 Tune values
+"""
+
+
+def make_project(tmp_path: Path) -> Path:
+    (tmp_path / ".skgd").mkdir()
+    (tmp_path / ".skgd" / "state.yaml").write_text(TEMPLATE.read_text(encoding="utf-8"), encoding="utf-8")
+    spec = tmp_path / "docs" / "specs" / "001-move"
+    spec.mkdir(parents=True)
+    (spec / "spec.md").write_text("| AC-1 | Walks |\n| AC-2 | Jumps |\n")
+    (spec / "tasks.md").write_text(TASKS + "- [ ] AC-1: Walks\n")
+    (tmp_path / "docs" / "specs" / "002-combat").mkdir()
+    (tmp_path / "docs" / "specs" / "002-combat" / "spec.md").write_text("- [x] AC-1: Hits\n")
+    return tmp_path
+
+
+def test_parse_tasks_tags_and_tiers():
+    tasks = {t["task_id"]: t for t in parse_tasks(TASKS)}
+    assert tasks["T001"]["checked"] and tasks["T001"]["phase"] == "Phase 1: Setup"
+    assert (tasks["T002"]["tags"], tasks["T002"]["tier"]) == (["P", "MVP"], "mvp")
+    assert (tasks["T003"]["tier"], tasks["T004"]["tier"], tasks["T005"]["tier"]) == ("core", "polish", "polish")
+    assert tasks["T002"]["description"] == "PlayerData asset"
+
+
+def test_parse_criteria_checkboxes_and_tables():
+    criteria = parse_criteria("- [x] AC-1: Walks\n| AC-2 | Jumps |\n| Header | x |\n")
+    assert [(c["ac_id"], c["checked"]) for c in criteria] == [("AC-1", True), ("AC-2", False)]
+
+
+def test_summary_and_queries(tmp_path):
+    dest = make_project(tmp_path)
+    conn = open_index(dest)
+    update_index(dest, conn)
+
+    summary = {f["feature"]: f for f in feature_summary(conn, dest)}
+    assert summary["001-move"] == {"feature": "001-move", "files": ["spec.md", "tasks.md"],
+                                   "tasks": 5, "done": 1, "mvp_remaining": 2, "criteria": 2}
+    assert summary["002-combat"]["tasks"] == 0
+    assert [r["task_id"] for r in query_tasks(conn, remaining=True, tier="polish")] == ["T004", "T005"]
+    assert [r["task_id"] for r in query_tasks(conn, tag="P")] == ["T002"]
+    assert get_state(conn, "phase") == "uninitialized"
+
+
+def test_only_changed_files_are_reparsed(tmp_path):
+    dest = make_project(tmp_path)
+    conn = open_index(dest)
+    assert update_index(dest, conn)["reindexed"] == 4
+    assert update_index(dest, conn)["reindexed"] == 0
+
+    tasks = dest / "docs" / "specs" / "001-move" / "tasks.md"
+    tasks.write_text(TASKS.replace("- [ ] T003", "- [x] T003"))
+    StateStore(dest).set("phase", "production")  # Journal only, picked up by the index
+    (dest / "docs" / "specs" / "002-combat" / "spec.md").unlink()
+
+    stats = update_index(dest, conn)
+    assert (stats["reindexed"], stats["removed"]) == (2, 1)
+    assert [r["task_id"] for r in query_tasks(conn, remaining=True, tier="core")] == []
+    assert get_state(conn, "phase") == "production"
+    assert conn.execute("SELECT COUNT(*) FROM criteria WHERE feature = '002-combat'").fetchone()[0] == 0
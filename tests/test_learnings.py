@@ -0,0 +1,77 @@
+"""Learnings digest: entry parsing, MinHash similarity and clustering."""
+
+from pathlib import Path
+
+from skgd.learnings import (cluster_entries, iter_entries, normalize, render_digest,
+                            signature, similarity)
+
+LEARNINGS = """# Project Learnings
+
+## Technical Learnings
+
+### Unity Patterns That Work
+<!-- Auto-populated -->
+- 2024-01-15 player-movement: ScriptableObject events decouple input from movement
+- 2024-02-03 combat: ScriptableObject events decouple input from the movement code
+- [2024-03-10] inventory: ScriptableObject events decouple input from movement
+
+## Design Learnings
+
+### Mechanics That Feel Good
+<!-- Auto-populated -->
+- 2024-01-15 player-movement: Coyote time of 0.15s feels responsive
+- 2024-01-20 player-movement: Enemies telegraph attacks with a red flash
+"""
+
+
+def write_learnings(tmp_path: Path) -> Path:
+    path = tmp_path / "learnings.md"
+    path.write_text(LEARNINGS, encoding="utf-8")
+    return path
+
+
+def test_iter_entries_reads_metadata_and_sections(tmp_path):
+    entries = list(iter_entries(write_learnings(tmp_path)))
+    assert len(entries) == 5
+    assert entries[0]["section"] == "Technical"
+    assert entries[0]["subsection"] == "Unity Patterns That Work"
+    assert (entries[2]["date"], entries[2]["feature"]) == ("2024-03-10", "inventory")
+    assert entries[3]["text"] == "Coyote time of 0.15s feels responsive"
+
+
+def test_signature_similarity_tracks_overlap():
+    a = signature(normalize("ScriptableObject events decouple input from movement"))
+    b = signature(normalize("ScriptableObject events decouple input from the movement code"))
+    c = signature(normalize("Coyote time of 0.15s feels responsive"))
+    assert similarity(a, a) == 1.0
+    assert similarity(a, b) > 0.5 > similarity(a, c)
+    assert normalize("Élan, ÉLAN!") == "elan elan"
+
+
+def test_near_duplicates_form_one_cluster(tmp_path):
+    result = cluster_entries(iter_entries(write_learnings(tmp_path)))
+
+    assert result["entries"] == 5
+    counts = [(c["section"], c["count"]) for c in result["clusters"]]
+    assert counts == [("Technical", 3), ("Design", 1), ("Design", 1)]
+    top = result["clusters"][0]
+    assert (top["first_seen"], top["last_seen"]) == ("2024-01-15", "2024-03-10")
+    assert top["features"] == ["player-movement", "combat", "inventory"]
+    assert top["variants"] == ["ScriptableObject events decouple input from the movement code"]
+
+
+def test_identical_text_in_other_sections_stays_apart():
+    entries = [{"section": s, "subsection": None, "date": None, "feature": None,
+                "text": "Playtest every Friday", "line": i}
+               for i, s in enumerate(["Process", "Design", "Process"])]
+    clusters = cluster_entries(iter(entries))["clusters"]
+    assert [(c["section"], c["count"]) for c in clusters] == [("Design", 1), ("Process", 2)]
+
+
+def test_render_digest_hides_singletons(tmp_path):
+    result = cluster_entries(iter_entries(write_learnings(tmp_path)))
+    digest = render_digest(result, "learnings.md", min_count=2)
+    assert "*5 entries in learnings.md → 3 clusters (1 recurring)*" in digest
+    assert "- **×3** (2024-01-15 → 2024-03-10) ScriptableObject events" in digest
+    assert "Coyote" not in digest
+    assert "*2 clusters below 2 entries not shown" in digest
@@ -0,0 +1,77 @@
+"""Incremental upgrades: manifest plan/apply/remove and init -> upgrade."""
+
+import json
+from pathlib import Path
+
+from click.testing import CliRunner
+
+from skgd.cli import main
+from skgd.manifest import apply_sync, build_manifest, load_installed_manifest, plan_sync
+
+
+class DirSource:
+    """Minimal template source over a loose directory."""
+
+    def __init__(self, root: Path):
+        self.root = root
+
+    def copy_files(self, pairs):
+        for rel, dst in pairs:
+            dst.parent.mkdir(parents=True, exist_ok=True)
+            dst.write_bytes((self.root / rel).read_bytes())
+
+
+def make_templates(tmp_path: Path) -> Path:
+    commands = tmp_path / "templates" / "en" / "claude" / "commands"
+    commands.mkdir(parents=True)
+    (commands / "spec.md").write_text("spec v1\n")
+    (commands / "plan.md").write_text("plan v1\n")
+    return tmp_path / "templates"
+
+
+def actions(ops):
+    return {op["path"]: op["action"] for op in ops}
+
+
+def test_plan_apply_and_remove(tmp_path):
+    templates = make_templates(tmp_path)
+    dest = tmp_path / "game"
+    source = DirSource(templates)
+
+    ops = plan_sync(dest, templates, "en", ["commands"])
+    assert actions(ops) == {".claude/commands/plan.md": "add", ".claude/commands/spec.md": "add"}
+    apply_sync(dest, source, ops)
+    assert set(load_installed_manifest(dest)["files"]) == {".claude/commands/plan.md",
+                                                           ".claude/commands/spec.md"}
+    assert all(op["action"] == "keep" for op in plan_sync(dest, templates, "en", ["commands"]))
+
+    # A template changes and another is dropped from the package
+    (templates / "en" / "claude" / "commands" / "spec.md").write_text("spec v2\n")
+    (templates / "en" / "claude" / "commands" / "plan.md").unlink()
+    ops = plan_sync(dest, templates, "en", ["commands"])
+    assert actions(ops) == {".claude/commands/spec.md": "update", ".claude/commands/plan.md": "remove"}
+    result = apply_sync(dest, source, ops)
+    assert result["removed"] == [".claude/commands/plan.md"]
+    assert (dest / ".claude" / "commands" / "spec.md").read_text() == "spec v2\n"
+    assert not (dest / ".claude" / "commands" / "plan.md").exists()
+
+
+def test_build_manifest_hashes_templates(tmp_path):
+    templates = make_templates(tmp_path)
+    files = build_manifest(templates)["files"]
+    assert set(files) == {"en/claude/commands/plan.md", "en/claude/commands/spec.md"}
+    assert len(files["en/claude/commands/spec.md"]["sha256"]) == 64
+
+
+def test_upgrade_right_after_init_is_a_no_op(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    runner = CliRunner()
+    result = runner.invoke(main, ["init", "demo", "--engine", "godot", "--no-interactive"], input="")
+    assert result.exit_code == 0, result.output
+    manifest = json.loads((tmp_path / "demo" / ".skgd" / "manifest.json").read_text())
+    assert any(path.startswith(".claude/data/") for path in manifest["files"])
+
+    monkeypatch.chdir(tmp_path / "demo")
+    result = runner.invoke(main, ["upgrade", "-y"])
+    assert result.exit_code == 0, result.output
+    assert "Nothing to upgrade" in result.output
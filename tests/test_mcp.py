@@ -0,0 +1,104 @@
+"""MCP tooling: the fake servers, bench statistics and a stdio bench run."""
+
+import io
+import json
+import os
+from pathlib import Path
+
+import click
+import pytest
+
+from skgd.fakemcp import FakeServer
+from skgd.mcp import (DEFAULT_SCRIPTS, StdioClient, configured_servers, default_script,
+                      expand_script, fake_server_argv, load_script, percentile, resolve_server,
+                      run_bench)
+
+SRC = str(Path(__file__).resolve().parent.parent / "src")
+
+
+def call(server: FakeServer, tool: str, **arguments) -> dict:
+    response = server.handle({"jsonrpc": "2.0", "id": 1, "method": "tools/call",
+                              "params": {"name": tool, "arguments": arguments}})
+    return response["result"]
+
+
+def test_fake_unity_editor_keeps_state():
+    server = FakeServer("unity")
+    assert json.loads(call(server, "manage_editor", action="play")["content"][0]["text"])["isPlaying"]
+    state = json.loads(call(server, "manage_editor", action="get_state")["content"][0]["text"])
+    assert state["isPlaying"] and state["activeScene"] == "Assets/Scenes/Main.unity"
+
+    failed = call(server, "manage_editor", action="explode")
+    assert failed["isError"] and "Unknown action 'explode'" in failed["content"][0]["text"]
+    unknown = server.handle({"id": 2, "method": "tools/call", "params": {"name": "get_godot_errors"}})
+    assert unknown["error"]["code"] == -32602
+    assert server.handle({"method": "notifications/initialized"}) is None
+
+
+def test_fake_server_speaks_newline_delimited_json():
+    out = io.BytesIO()
+    lines = [b'{"jsonrpc":"2.0","id":1,"method":"initialize","params":{}}\n', b"\n", b"not json\n",
+             b'{"jsonrpc":"2.0","id":2,"method":"tools/list"}\n']
+    FakeServer("godot").serve(iter(lines), out)
+
+    replies = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert replies[0]["result"]["serverInfo"]["name"] == "skgd-fake-godot"
+    assert replies[1]["error"]["code"] == -32700
+    tools = {t["name"]: t["annotations"]["readOnlyHint"] for t in replies[2]["result"]["tools"]}
+    assert tools["get_project_info"] is True and tools["play_scene"] is False
+
+
+def test_error_rate_is_reproducible_with_a_seed():
+    runs = []
+    for _ in range(2):
+        server = FakeServer("godot", error_rate=0.5, seed=7)
+        runs.append([call(server, "get_godot_errors")["isError"] for _ in range(40)])
+    assert runs[0] == runs[1]
+    assert 0 < sum(runs[0]) < 40
+
+
+def test_script_helpers(tmp_path):
+    script = tmp_path / "calls.yaml"
+    script.write_text("- tool: a\n  repeat: 2\n- tool: b\n")
+    steps = load_script(script)
+    assert [s["tool"] for s in expand_script(steps, 2)] == ["a", "a", "b", "a", "a", "b"]
+
+    script.write_text("- arguments: {}\n")
+    with pytest.raises(click.ClickException, match="call 1 has no tool name"):
+        load_script(script)
+
+    assert percentile([1.0, 2.0, 3.0, 4.0], 50) == 2.5
+    assert percentile([], 99) == 0.0
+    assert default_script(["get_project_info", "get_godot_errors"], "unity") == DEFAULT_SCRIPTS["godot"]
+
+
+def test_server_resolution(tmp_path, monkeypatch):
+    monkeypatch.setenv("HOME", str(tmp_path / "home"))
+    dest = tmp_path / "game"
+    (dest / ".skgd").mkdir(parents=True)
+    (dest / ".skgd" / "config.yaml").write_text("engine: godot\n")
+    (dest / ".mcp.json").write_text(json.dumps({"mcpServers": {
+        "gdai": {"command": "uvx", "args": ["gdai-mcp"], "env": {"PORT": 3571}}}}))
+
+    assert set(configured_servers(dest)) == {"gdai"}
+    argv, env, label, engine = resolve_server(dest, (), None, None)
+    assert (argv, label, engine, env["PORT"]) == (["uvx", "gdai-mcp"], "gdai", "godot", "3571")
+    assert resolve_server(dest, (), None, "unity")[2:] == ("fake-unity", "unity")
+    with pytest.raises(click.ClickException, match="'UnityMCP' is not configured"):
+        resolve_server(dest, (), "UnityMCP", None)
+
+
+def test_bench_against_the_fake_server(monkeypatch):
+    monkeypatch.setenv("PYTHONPATH", SRC + os.pathsep + os.environ.get("PYTHONPATH", ""))
+    client = StdioClient(fake_server_argv("unity", "--error-rate", "0.25", "--seed", "3"))
+    try:
+        report = run_bench(client, None, "unity", iterations=5, warmup=1, concurrency=3, timeout=10)
+    finally:
+        client.close()
+
+    assert report["server"]["name"] == "skgd-fake-unity"
+    assert report["calls"] == 20 and report["latency"]["count"] == 20
+    assert set(report["by_tool"]) == {"manage_editor", "manage_scene", "read_console"}
+    assert report["by_tool"]["manage_scene"]["count"] == 10
+    assert report["errors"] == report["errors_by_kind"].get("tool", 0) > 0
+    assert report["missing_tools"] == []
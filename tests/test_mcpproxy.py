@@ -0,0 +1,117 @@
+"""Caching MCP proxy: cache hits, coalescing and invalidation."""
+
+import io
+import json
+
+from skgd.mcpproxy import CachingProxy, load_stats, stats_file
+
+
+class Proxy(CachingProxy):
+    """Proxy driven directly, recording what it forwards upstream."""
+
+    def __init__(self, **kwargs):
+        self.out = io.BytesIO()
+        super().__init__(["unused"], env={}, client_out=self.out, **kwargs)
+        self.sent = []
+
+    def to_upstream(self, line: bytes) -> None:
+        self.sent.append(json.loads(line))
+
+    def request(self, request_id, tool, **arguments):
+        message = {"jsonrpc": "2.0", "id": request_id, "method": "tools/call",
+                   "params": {"name": tool, "arguments": arguments}}
+        self.from_client(json.dumps(message).encode())
+
+    def respond(self, request_id, text):
+        message = {"jsonrpc": "2.0", "id": request_id,
+                   "result": {"content": [{"type": "text", "text": text}]}}
+        self.from_upstream(json.dumps(message).encode())
+
+    def replies(self):
+        return [json.loads(line) for line in self.out.getvalue().splitlines()]
+
+
+def texts(proxy):
+    return [(r["id"], r["result"]["content"][0]["text"]) for r in proxy.replies()]
+
+
+def test_read_only_calls_are_cached():
+    proxy = Proxy()
+    proxy.request(1, "manage_scene", action="get_hierarchy")
+    proxy.respond(1, "tree v1")
+    proxy.request(2, "manage_scene", action="get_hierarchy")
+
+    assert [m["id"] for m in proxy.sent] == [1]
+    assert texts(proxy) == [(1, "tree v1"), (2, "tree v1")]
+    counts = proxy.stats.snapshot()
+    assert (counts["hits"], counts["misses"]) == (1, 1)
+
+
+def test_identical_reads_in_flight_are_coalesced():
+    proxy = Proxy()
+    proxy.request(1, "manage_gameobject", action="find", name="Player")
+    proxy.request(2, "manage_gameobject", action="find", name="Player")
+    proxy.request(3, "manage_gameobject", action="find", name="Enemy")
+    assert [m["id"] for m in proxy.sent] == [1, 3]
+
+    proxy.respond(1, "found")
+    assert texts(proxy) == [(1, "found"), (2, "found")]
+    assert proxy.stats.snapshot()["coalesced"] == 1
+
+
+def test_mutations_invalidate_and_are_never_cached():
+    proxy = Proxy()
+    proxy.request(1, "manage_scene", action="get_hierarchy")
+    proxy.respond(1, "tree v1")
+    proxy.request(2, "manage_gameobject", action="create", name="Enemy")
+    proxy.respond(2, "created")
+    proxy.request(3, "manage_scene", action="get_hierarchy")
+    proxy.respond(3, "tree v2")
+    proxy.request(4, "manage_gameobject", action="create", name="Enemy")
+
+    assert [m["id"] for m in proxy.sent] == [1, 2, 3, 4]
+    assert texts(proxy)[-1] == (3, "tree v2")
+    assert proxy.stats.snapshot()["mutations"] == 2
+
+
+def test_reads_overtaken_by_a_mutation_are_not_cached():
+    proxy = Proxy()
+    proxy.request(1, "manage_scene", action="get_hierarchy")
+    proxy.request(2, "manage_gameobject", action="delete", name="Enemy")
+    proxy.respond(1, "stale tree")
+    proxy.respond(2, "deleted")
+    proxy.request(3, "manage_scene", action="get_hierarchy")
+    assert [m["id"] for m in proxy.sent] == [1, 2, 3]
+
+
+def test_server_notifications_invalidate():
+    proxy = Proxy()
+    proxy.request(1, "get_project_info")
+    proxy.respond(1, "info")
+    proxy.from_upstream(b'{"jsonrpc": "2.0", "method": "notifications/resources/updated"}')
+    proxy.request(2, "get_project_info")
+    assert [m["id"] for m in proxy.sent] == [1, 2]
+    assert proxy.stats.invalidations == 1
+
+
+def test_read_only_hint_uses_the_default_ttl():
+    proxy = Proxy(default_ttl=30)
+    proxy.from_client(b'{"jsonrpc": "2.0", "id": 1, "method": "tools/list"}')
+    proxy.from_upstream(json.dumps({"jsonrpc": "2.0", "id": 1, "result": {"tools": [
+        {"name": "list_sprites", "annotations": {"readOnlyHint": True}},
+        {"name": "paint", "annotations": {}},
+    ]}}).encode())
+    assert proxy.ttl_for("list_sprites", {}) == 30
+    assert proxy.ttl_for("paint", {}) is None
+    assert proxy.ttl_for("manage_editor", {"action": "play"}) is None
+
+
+def test_stats_are_written_per_server(tmp_path):
+    proxy = Proxy(stats_path=stats_file(tmp_path, "unity mcp"), name="unity mcp")
+    proxy.request(1, "read_console")
+    proxy.respond(1, "no errors")
+    proxy.save_stats(force=True)
+
+    assert stats_file(tmp_path, "unity mcp").name == "unity_mcp.json"
+    stats = load_stats(tmp_path)
+    assert [(s["server"], s["calls"]) for s in stats] == [("unity mcp", 1)]
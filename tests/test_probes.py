@@ -0,0 +1,66 @@
+"""Prerequisite probes: detection, cached results and MCP status."""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from skgd.probes import apply_mcp_status, load_cached_probes, probe_ok, run_probes
+
+pytestmark = pytest.mark.skipif(os.name == "nt", reason="uses shell scripts as fake tools")
+
+
+def fake_tool(bin_dir: Path, name: str, script: str) -> Path:
+    path = bin_dir / name
+    path.write_text("#!/bin/sh\n" + script + "\n")
+    os.chmod(path, 0o755)
+    return path
+
+
+@pytest.fixture
+def bin_dir(tmp_path, monkeypatch):
+    path = tmp_path / "bin"
+    path.mkdir()
+    monkeypatch.setenv("PATH", str(path))
+    return path
+
+
+def test_found_missing_and_failing_tools(bin_dir):
+    fake_tool(bin_dir, "uvx", "echo 'uv 0.4.1'")
+    fake_tool(bin_dir, "godot4", "echo broken >&2; exit 3")
+
+    results = run_probes(["uvx", "godot", "blender"])
+
+    assert results["uvx"]["version"] == "uv 0.4.1" and probe_ok(results, "uvx")
+    assert results["godot"]["path"] == str(bin_dir / "godot4")
+    assert (results["godot"]["status"], results["godot"]["version"]) == ("error", "broken")
+    assert results["blender"]["status"] == "missing" and not probe_ok(results, "blender")
+
+
+def test_cache_is_reused_until_a_binary_or_path_changes(bin_dir, tmp_path, monkeypatch):
+    cache = tmp_path / "cache"
+    tool = fake_tool(bin_dir, "npx", "echo 10.0.0")
+    assert run_probes(["npx"], cache)["npx"]["version"] == "10.0.0"
+
+    fake_tool(bin_dir, "npx", "echo 11.0.0")
+    os.utime(tool, (1, 1))
+    assert set(load_cached_probes(cache)) == set()  # Binary replaced
+    assert run_probes(["npx"], cache)["npx"]["version"] == "11.0.0"
+    assert run_probes(["npx"], cache)["npx"]["version"] == "11.0.0"
+    assert set(load_cached_probes(cache)) == {"npx"}
+
+    monkeypatch.setenv("PATH", str(bin_dir) + os.pathsep + str(tmp_path))
+    assert load_cached_probes(cache) == {}
+
+
+def test_mcp_status_follows_launcher_tools():
+    config = {"engine": {"unity": {"status": "connected"}, "gdai": {"status": "missing"}},
+              "assets": {"blender": {"status": "unchecked"}}}
+    ok = {"found": True, "status": "ok"}
+    results = {"uvx": ok, "godot": ok, "blender": {"found": False, "status": "missing"}}
+
+    apply_mcp_status(config, results)
+
+    assert config["engine"]["unity"]["status"] == "connected"
+    assert config["engine"]["gdai"]["status"] == "unchecked"
+    assert config["assets"]["blender"]["status"] == "missing"
@@ -0,0 +1,80 @@
+"""Native scout: report contents per profile and rendering."""
+
+from pathlib import Path
+
+from skgd.index import index_path
+from skgd.scout import learnings_patterns, plan_phase_points, render_report, run_scout
+from skgd.state import StateStore
+
+TEMPLATE = Path(__file__).resolve().parent.parent / "src" / "skgd" / "templates" / "en" / "skgd" / "state.yaml"
+
+LEARNINGS_CORE = """# Core Learnings
+
+### Unity Architecture (C#)
+| Pattern | Evidence | Confidence |
+|---------|----------|------------|
+| ScriptableObject events | 001-move | HIGH |
+
+### Godot Architecture
+| Pattern | Evidence | Confidence |
+|---------|----------|------------|
+| Signals up, calls down | 002-combat | HIGH |
+
+## Anti-Patterns
+| Don't Do | Why |
+|----------|-----|
+| Find() in Update | Slow |
+"""
+
+
+def make_project(tmp_path: Path) -> Path:
+    (tmp_path / ".skgd" / "memory").mkdir(parents=True)
+    (tmp_path / ".skgd" / "config.yaml").write_text("engine: unity\nuser:\n  language: en\n")
+    (tmp_path / ".skgd" / "state.yaml").write_text(TEMPLATE.read_text(encoding="utf-8"), encoding="utf-8")
+    (tmp_path / ".skgd" / "memory" / "learnings-core.md").write_text(LEARNINGS_CORE)
+    spec = tmp_path / "docs" / "specs" / "001-move"
+    spec.mkdir(parents=True)
+    (spec / "tasks.md").write_text("## Phase 1: Setup\n- [x] T001 Folders\n\n"
+                                   "## Phase 2: Core\n- [ ] T002 Controller\n- [ ] T003 [POLISH] Dust\n")
+    (spec / "plan.md").write_text("## Phase 2: Core\n- Use a CharacterController\n- Read input once\n")
+    return tmp_path
+
+
+def test_learnings_patterns_filter_by_engine():
+    assert learnings_patterns(LEARNINGS_CORE, "unity") == ["ScriptableObject events", "Avoid: Find() in Update"]
+    assert learnings_patterns(LEARNINGS_CORE, "godot")[0] == "Signals up, calls down"
+
+
+def test_plan_phase_points():
+    plan = "## Phase 1: Setup\n- a\n## Phase 2: Core\n- b\n- c\n### Notes\n- d\n"
+    assert plan_phase_points(plan, "Phase 2: Core") == ["b", "c"]
+    assert plan_phase_points(plan, "Setup") == []
+
+
+def test_implement_report_resumes_at_the_first_open_task(tmp_path):
+    dest = make_project(tmp_path)
+    StateStore(dest).set("production.current_spec", "001-move")
+
+    report = run_scout(dest, "implement")
+
+    assert (report["status"], report["feature"]) == ("resume", "001-move")
+    assert report["tasks"] == {"total": 3, "done": 1, "remaining": 2,
+                               "mvp_remaining": ["T002 Controller"], "polish_remaining": 1}
+    assert report["session"]["resume_from"] == "T002"
+    assert report["phase"] == {"name": "Phase 2: Core",
+                               "points": ["Use a CharacterController", "Read input once"]}
+    assert report["learnings"] == ["ScriptableObject events", "Avoid: Find() in Update"]
+    # The index cache is the only file written
+    assert index_path(dest).is_file()
+
+    text = render_report(report)
+    assert text.startswith("## Scout Report: implement\n**Status:** resume\n**Engine:** unity")
+    assert "- MVP remaining: 1\n  - T002 Controller" in text
+
+
+def test_missing_tasks_block_the_report(tmp_path):
+    dest = make_project(tmp_path)
+    report = run_scout(dest, "implement", "002-combat")
+    assert report["status"] == "blocked"
+    assert report["blockers"] == ["docs/specs/002-combat/tasks.md not found (run /tasks)"]
+    assert "**Blockers:** docs/specs/002-combat/tasks.md not found" in render_report(report)
@@ -0,0 +1,73 @@
+"""Design document search: tokenizer, sections, BM25 ranking and reindexing."""
+
+import os
+from pathlib import Path
+
+from skgd.search import (classify, open_search_index, search, split_sections, tokenize,
+                         update_search_index)
+
+
+def make_project(tmp_path: Path) -> Path:
+    (tmp_path / ".skgd").mkdir()
+    spec = tmp_path / "docs" / "specs" / "001-move"
+    spec.mkdir(parents=True)
+    (tmp_path / "docs" / "game-brief.md").write_text(
+        "# Brief\n\n## Vision\nA cosy farming game.\n\n## Movement\nThe hero can jump.\n")
+    (spec / "spec.md").write_text(
+        "# Movement\n\n## Double Jump\nDouble jump with coyote time. Jump buffering too.\n")
+    return tmp_path
+
+
+def test_tokenize_folds_accents_stopwords_and_plurals():
+    assert tokenize("The Pillars of Élan!") == ["pillar", "elan"]
+    assert tokenize("boss fights, a b") == ["boss", "fight"]
+
+
+def test_split_sections_ignores_headings_in_fences():
+    text = "intro\n# A\none\n```\n# not a heading\n```\n## B\ntwo\n"
+    sections = split_sections(text)
+    assert [(s["heading"], s["start_line"], s["end_line"]) for s in sections] == [
+        ("", 1, 1), ("A", 2, 6), ("A > B", 7, 8)]
+
+
+def test_classify_paths():
+    assert classify("docs/specs/001-move/plan.md") == ("plan", "001-move")
+    assert classify("docs/specs/_archived/002-old/spec.md") == ("spec", "002-old")
+    assert classify("docs/game-brief.md") == ("brief", None)
+    assert classify(".skgd/memory/learnings.md") == ("memory", None)
+
+
+def test_bm25_ranks_the_denser_section_first(tmp_path):
+    dest = make_project(tmp_path)
+    conn = open_search_index(dest)
+    update_search_index(dest, conn)
+
+    hits = search(conn, "jump")
+    assert [(h["path"], h["heading"]) for h in hits] == [
+        ("docs/specs/001-move/spec.md", "Movement > Double Jump"),
+        ("docs/game-brief.md", "Brief > Movement"),
+    ]
+    assert hits[0]["score"] > hits[1]["score"]
+    assert search(conn, "jump", doc_types=["brief"])[0]["path"] == "docs/game-brief.md"
+    assert search(conn, "jump", feature="001-move")[0]["feature"] == "001-move"
+    assert [h["terms"] for h in search(conn, "buff*")] == [["buffering"]]
+    assert search(conn, "dragon") == []
+
+
+def test_only_changed_documents_are_reindexed(tmp_path):
+    dest = make_project(tmp_path)
+    conn = open_search_index(dest)
+    assert update_search_index(dest, conn)["reindexed"] == 2
+    assert update_search_index(dest, conn)["reindexed"] == 0
+
+    # Touched but identical content is not reparsed
+    brief = dest / "docs" / "game-brief.md"
+    os.utime(brief, ns=(1, 1))
+    assert update_search_index(dest, conn)["reindexed"] == 0
+
+    brief.write_text("# Brief\n\n## Combat\nDragons breathe fire.\n")
+    (dest / "docs" / "specs" / "001-move" / "spec.md").unlink()
+    stats = update_search_index(dest, conn)
+    assert (stats["reindexed"], stats["removed"]) == (1, 1)
+    assert search(conn, "jump") == []
+    assert search(conn, "dragon")[0]["heading"] == "Brief > Combat"
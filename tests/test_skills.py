@@ -0,0 +1,101 @@
+"""Skill selection: profile rules, per-file rules and ``skgd skills``."""
+
+import json
+from pathlib import Path
+
+from click.testing import CliRunner
+
+from skgd.bundle import LooseTemplates
+from skgd.cli import main
+from skgd.skills import (file_mismatch, load_skill_rules, mismatch, project_profile, skill_report,
+                         skill_selector)
+
+RULES = {
+    "unity-gamedev": {"engine": ["unity"]},
+    "pixellab-assets": {"asset_mcp": ["pixellab"],
+                        "files": {"reference/tilesets.md": {"profile": ["pixel-2d"]}}},
+}
+
+
+def profile(engine="godot", style=None, pixellab=False) -> dict:
+    return project_profile({"engine": engine, "mcp": {"assets": {
+        "profile": style, "pixellab": {"enabled": pixellab}, "blender": {"enabled": False}}}})
+
+
+def test_project_profile_and_mismatch():
+    assert profile(pixellab=True) == {"engine": "godot", "profile": None, "asset_mcps": ["pixellab"]}
+    assert project_profile({}) == {"engine": "unity", "profile": None, "asset_mcps": []}
+
+    assert mismatch(RULES["unity-gamedev"], profile()) == "engine is godot (needs unity)"
+    assert mismatch(RULES["pixellab-assets"], profile()) == "asset MCP pixellab not enabled"
+    assert mismatch({"profile": ["pixel-2d"]}, profile(style="realistic-3d")) == (
+        "art style is realistic-3d (needs pixel-2d)")
+    # No profile chosen yet matches every profile
+    assert mismatch({"profile": ["pixel-2d"]}, profile()) is None
+
+    rule = RULES["pixellab-assets"]
+    assert file_mismatch(rule, "SKILL.md", profile(style="realistic-3d", pixellab=True)) is None
+    assert file_mismatch(rule, "reference/tilesets.md", profile(style="realistic-3d", pixellab=True))
+
+
+def test_selector_only_filters_skill_paths():
+    include = skill_selector(RULES, profile(style="pixel-2d", pixellab=True))
+    assert include("en/claude/commands/plan.md")
+    assert include("common/skills/godot-gamedev/SKILL.md")  # Not listed: everywhere
+    assert not include("common/skills/unity-gamedev/SKILL.md")
+    assert include("common/skills/pixellab-assets/reference/tilesets.md")
+
+
+def test_report_and_rules_from_a_template_source(tmp_path):
+    skills = tmp_path / "common" / "skills"
+    for rel in ("unity-gamedev/SKILL.md", "pixellab-assets/SKILL.md",
+                "pixellab-assets/reference/tilesets.md"):
+        (skills / rel).parent.mkdir(parents=True, exist_ok=True)
+        (skills / rel).write_text("# skill\n")
+    (tmp_path / "common" / "skills.yaml").write_text(
+        "skills:\n  unity-gamedev:\n    engine: [unity]\n  pixellab-assets:\n"
+        "    asset_mcp: [pixellab]\n    files:\n      reference/tilesets.md:\n"
+        "        profile: [pixel-2d]\n")
+    source = LooseTemplates(tmp_path)
+
+    rules = load_skill_rules(source)
+    assert rules == RULES
+    report = skill_report(source, rules, profile("unity", "realistic-3d", pixellab=True))
+    assert report == [
+        {"skill": "pixellab-assets", "files": 1,
+         "skipped": {"reference/tilesets.md": "art style is realistic-3d (needs pixel-2d)"}},
+        {"skill": "unity-gamedev", "files": 1, "skipped": {}},
+    ]
+    assert load_skill_rules(LooseTemplates(tmp_path / "missing")) == {}
+
+
+def test_skills_command_follows_the_config(tmp_path, monkeypatch):
+    runner = CliRunner()
+    monkeypatch.chdir(tmp_path)
+    result = runner.invoke(main, ["init", "game", "--engine", "godot", "--no-interactive"], input="")
+    assert result.exit_code == 0, result.output
+    dest = tmp_path / "game"
+    skills_dir = dest / ".claude" / "skills"
+    assert (skills_dir / "godot-gamedev").is_dir()
+    assert not (skills_dir / "unity-gamedev").exists() and not (skills_dir / "pixellab-assets").exists()
+
+    monkeypatch.chdir(dest)
+    config = dest / ".skgd" / "config.yaml"
+    text = config.read_text(encoding="utf-8")
+    config.write_text(text.replace("    pixellab:\n      enabled: false",
+                                   "    pixellab:\n      enabled: true"), encoding="utf-8")
+
+    dry = json.loads(runner.invoke(main, ["skills", "--dry-run", "--json"]).output)
+    assert dry["profile"]["asset_mcps"] == ["pixellab"] and not dry["applied"]
+    added = {c["path"] for c in dry["changes"] if c["action"] == "add"}
+    assert added and all(Path(p).parts[:3] == (".claude", "skills", "pixellab-assets") for p in added)
+    assert not (skills_dir / "pixellab-assets").exists()
+
+    result = runner.invoke(main, ["skills"])
+    assert result.exit_code == 0, result.output
+    assert (skills_dir / "pixellab-assets" / "SKILL.md").is_file()
+    assert "Skills are up to date." in runner.invoke(main, ["skills"]).output
+
+    config.write_text(text, encoding="utf-8")
+    assert "Removed .claude/skills/pixellab-assets/SKILL.md" in runner.invoke(main, ["skills"]).output
+    assert not (skills_dir / "pixellab-assets" / "SKILL.md").exists()
@@ -0,0 +1,80 @@
+"""Snapshot store: deduplicated objects, diffs and restore."""
+
+from pathlib import Path
+
+from skgd.snapshot import (create_snapshot, diff_trees, list_snapshots, load_snapshot,
+                           next_version, object_path, restore_snapshot)
+from skgd.state import StateStore
+
+TEMPLATE = Path(__file__).resolve().parent.parent / "src" / "skgd" / "templates" / "en" / "skgd" / "state.yaml"
+
+
+def make_project(tmp_path: Path) -> Path:
+    (tmp_path / ".skgd").mkdir()
+    (tmp_path / ".skgd" / "state.yaml").write_text(TEMPLATE.read_text(encoding="utf-8"), encoding="utf-8")
+    (tmp_path / "docs" / "specs").mkdir(parents=True)
+    (tmp_path / "docs" / "game-brief.md").write_text("brief v1\n")
+    (tmp_path / "docs" / "specs" / "001.md").write_text("spec\n")
+    return tmp_path
+
+
+def objects(dest: Path):
+    return sorted(p for p in (dest / ".skgd" / "snapshots" / "objects").rglob("*") if p.is_file())
+
+
+def test_next_version_increments_the_last_number():
+    assert next_version([]) == "v0.1"
+    assert next_version([{"version": "v0.9"}]) == "v0.10"
+    assert next_version([{"version": "v1.2-beta"}]) == "v1.3-beta"
+    assert next_version([{"version": "alpha"}]) == "alpha.1"
+
+
+def test_unchanged_files_are_stored_once(tmp_path):
+    dest = make_project(tmp_path)
+    first = create_snapshot(dest)
+    count = len(objects(dest))
+
+    (dest / "docs" / "game-brief.md").write_text("brief v2\n")
+    second = create_snapshot(dest)
+
+    assert (first["version"], second["version"]) == ("v0.1", "v0.2")
+    assert second["parent"] == "v0.1"
+    # Only the edited brief and the state bookkeeping are new objects
+    assert second["stats"]["objects_written"] == 2
+    assert len(objects(dest)) == count + 2
+    assert first["files"]["docs/specs/001.md"] == second["files"]["docs/specs/001.md"]
+    assert diff_trees(first["files"], second["files"])["modified"] == [".skgd/state.yaml",
+                                                                       "docs/game-brief.md"]
+    assert [s["version"] for s in list_snapshots(dest)] == ["v0.1", "v0.2"]
+    assert StateStore(dest).get("snapshots.latest") == "v0.2"
+
+
+def test_restore_writes_only_what_differs(tmp_path):
+    dest = make_project(tmp_path)
+    create_snapshot(dest, "v1")
+    (dest / "docs" / "game-brief.md").write_text("rewritten\n")
+    (dest / "docs" / "specs" / "002.md").write_text("new spec\n")
+
+    changes = restore_snapshot(dest, load_snapshot(dest, "v1"))
+
+    assert changes == {"added": [], "removed": [], "modified": ["docs/game-brief.md"]}
+    assert (dest / "docs" / "game-brief.md").read_text() == "brief v1\n"
+    assert (dest / "docs" / "specs" / "002.md").exists()
+
+    changes = restore_snapshot(dest, load_snapshot(dest, "v1"), delete=True)
+    assert changes["removed"] == ["docs/specs/002.md"]
+    assert not (dest / "docs" / "specs" / "002.md").exists()
+
+
+def test_restore_keeps_snapshot_bookkeeping(tmp_path):
+    dest = make_project(tmp_path)
+    manifest = create_snapshot(dest, "v1")
+    create_snapshot(dest, "v2")
+    sha = manifest["files"][".skgd/state.yaml"]["sha256"]
+    assert object_path(dest, sha).is_file()
+
+    restore_snapshot(dest, load_snapshot(dest, "v1"))
+
+    store = StateStore(dest)
+    assert store.get("snapshots.count") == 2
+    assert store.get("snapshots.latest") == "v2"
@@ -0,0 +1,19 @@
+"""Startup budget: `skgd --startup-profile` must stay within STARTUP_BUDGET_MS."""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import skgd
+
+
+def test_startup_profile_within_budget():
+    env = dict(os.environ)
+    # The profile re-runs the CLI in a child process; make skgd importable there
+    src = str(Path(skgd.__file__).resolve().parent.parent)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [src, env.get("PYTHONPATH")]))
+    result = subprocess.run([sys.executable, "-m", "skgd.cli", "--startup-profile"],
+                            capture_output=True, text=True, env=env)
+    assert result.returncode == 0, result.stdout + result.stderr
+    assert "within budget" in result.stdout
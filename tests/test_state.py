@@ -0,0 +1,80 @@
+"""Journaled state store: replay, in-place compaction and history archiving."""
+
+from pathlib import Path
+
+import yaml
+
+from skgd.state import HISTORY_LIMITS, StateStore, patch_yaml
+
+TEMPLATE = Path(__file__).resolve().parent.parent / "src" / "skgd" / "templates" / "en" / "skgd" / "state.yaml"
+
+
+def make_store(tmp_path: Path) -> StateStore:
+    (tmp_path / ".skgd").mkdir()
+    (tmp_path / ".skgd" / "state.yaml").write_text(TEMPLATE.read_text(encoding="utf-8"), encoding="utf-8")
+    return StateStore(tmp_path)
+
+
+def test_set_is_journaled_until_compaction(tmp_path):
+    store = make_store(tmp_path)
+    before = store.state_path.read_text(encoding="utf-8")
+    store.set("production.current_spec", "001-move")
+
+    assert store.state_path.read_text(encoding="utf-8") == before
+    assert store.get("production.current_spec") == "001-move"
+
+    assert store.compact() == {"entries": 1, "archived": 0}
+    assert not store.journal_path.exists()
+    assert StateStore(tmp_path).get("production.current_spec") == "001-move"
+
+
+def test_compaction_keeps_comments_and_layout(tmp_path):
+    store = make_store(tmp_path)
+    store.set("phase", "concept")
+    store.set("assets.by_category.sprites.created", 3)
+    store.append("implementation.sessions.history", {"date": "2025-01-01", "range": "T1-T3"})
+    store.compact()
+
+    text = store.state_path.read_text(encoding="utf-8")
+    assert "phase: concept                # uninitialized|concept|design|architecture|production" in text
+    assert "    sprites: { defined: 0, created: 3 }" in text
+    assert "    history:                  # [{date, range, completed, duration_min}]" in text
+    template = TEMPLATE.read_text(encoding="utf-8")
+    assert text.count("#") == template.count("#") + 1  # plus the journal-seq header
+    assert text.splitlines()[2] == "# journal-seq: 3"
+
+
+def test_patch_yaml_adds_and_removes_keys():
+    text = "a: 1  # one\nb:\n  c: 2\n# trailing\n"
+    old = yaml.safe_load(text)
+    new = {"a": 1, "b": {"d": [1, 2]}, "e": "x"}
+
+    patched = patch_yaml(text, old, new)
+
+    assert yaml.safe_load(patched) == new
+    assert patched.startswith("a: 1  # one\nb:\n")
+
+
+def test_patch_yaml_refuses_what_it_cannot_index():
+    text = "- a\n- b\n"
+    assert patch_yaml(text, {}, {"x": 1}) is None
+
+
+def test_seq_is_a_counter_across_compactions(tmp_path):
+    store = make_store(tmp_path)
+    store.set("a", 1)
+    store.compact()
+    store.set("b", 2)
+    entries, _ = store._read_journal()
+    assert [e["seq"] for e in entries] == [2]
+
+
+def test_history_is_archived_at_compaction(tmp_path):
+    store = make_store(tmp_path)
+    limit = HISTORY_LIMITS["pivots.history"]
+    for i in range(limit + 3):
+        store.append("pivots.history", {"n": i})
+
+    assert store.compact()["archived"] == 3
+    assert [item["n"] for item in store.get("pivots.history")] == list(range(3, limit + 3))
+    assert len(store.archive_path.read_text(encoding="utf-8").splitlines()) == 3
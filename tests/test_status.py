@@ -0,0 +1,67 @@
+"""Status dashboard: stage progress, next action, collected data and layout."""
+
+from pathlib import Path
+
+import pytest
+
+from skgd.state import StateStore
+from skgd.status import WIDTH, _width, collect_status, next_action, render_dashboard, stage_status
+
+TEMPLATE = Path(__file__).resolve().parent.parent / "src" / "skgd" / "templates" / "en" / "skgd" / "state.yaml"
+
+
+def make_project(tmp_path: Path) -> Path:
+    (tmp_path / ".skgd").mkdir()
+    (tmp_path / ".skgd" / "state.yaml").write_text(TEMPLATE.read_text(encoding="utf-8"), encoding="utf-8")
+    (tmp_path / ".skgd" / "config.yaml").write_text(
+        "project:\n  name: Moss Knight\n  game_type: platformer\nengine: godot\n"
+        "user:\n  language: fr\nmcp:\n  engine:\n    gdai:\n      status: connected\n")
+    spec = tmp_path / "docs" / "specs" / "001-move"
+    spec.mkdir(parents=True)
+    (spec / "tasks.md").write_text("## Phase 1: Core\n- [x] T001 Walk\n- [ ] T002 Jump\n")
+    return tmp_path
+
+
+def test_stage_status_follows_the_phase():
+    state = {"phase": "architecture", "architecture": {}}
+    assert [stage_status(state, s) for s in ("concept", "design", "architecture", "production")] == [
+        "done", "done", "in_progress", "pending"]
+    assert stage_status({"phase": "concept", "concept": {"game_brief_done": True}}, "concept") == "done"
+
+
+@pytest.mark.parametrize("state, expected", [
+    ({}, "/init"),
+    ({"phase": "concept"}, "/brainstorm"),
+    ({"phase": "concept", "concept": {"brainstorm_done": True}}, "/roadmap"),
+    ({"phase": "production", "implementation": {"active": True, "feature": "001-move"}}, "/implement 001-move"),
+    ({"phase": "production", "production": {"current_step": "plan", "current_spec": "002"}}, "/plan 002"),
+    ({"phase": "design"}, "/spec [next-feature]"),
+])
+def test_next_action(state, expected):
+    assert next_action(state, {}) == expected
+
+
+def test_collect_and_render(tmp_path):
+    dest = make_project(tmp_path)
+    store = StateStore(dest)
+    store.set("phase", "production")
+    store.set("production.current_spec", "001-move")
+
+    status = collect_status(dest)
+
+    assert (status["project"], status["engine"], status["language"]) == ("Moss Knight", "godot", "fr")
+    assert status["tasks"] == {"total": 2, "done": 1, "mvp_remaining": 1}
+    assert status["mcp"] == {"name": "Godot", "key": "gdai", "status": "connected"}
+    assert status["specs"]["in_progress"] == "001-move"
+
+    box = render_dashboard(status).splitlines()
+    assert {_width(line) for line in box} == {WIDTH + 2}
+    text = "\n".join(box)
+    assert "Moss Knight" in text and "🟢 connected" in text
+    assert "1/2" in text
+
+
+def test_long_values_are_truncated_to_the_box(tmp_path):
+    status = collect_status(make_project(tmp_path))
+    status["project"] = "Ω" * 200
+    assert {_width(line) for line in render_dashboard(status).splitlines()} == {WIDTH + 2}
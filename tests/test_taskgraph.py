@@ -0,0 +1,81 @@
+"""Task graph: implied and explicit edges, cycles, waves and critical path."""
+
+from skgd.taskgraph import build_graph, explicit_edges, find_cycle, schedule
+
+TASKS = """# Tasks: Player Movement
+
+## Phase 1: Setup
+
+- [x] T001 Create folders
+- [ ] T002 [P] PlayerData asset
+- [ ] T003 [P] InputActions asset
+
+## Phase 2: User Story 1 - Walk
+
+- [ ] T004 [US1] PlayerController
+- [ ] T005 [US1] Walk animation
+
+## Phase 3: User Story 2 - Jump
+
+*Depends on: US1*
+
+- [ ] T006 [US2] Jump logic
+- [ ] T007 [US2] Landing dust, depends on T004
+
+## Phase 4: Polish
+
+- [ ] T008 Tune values
+
+## Dependencies
+
+T006 → T008
+"""
+
+
+def order(graph):
+    return {edge for edge, kind in graph["edges"].items() if kind == "order"}
+
+
+def test_phases_and_parallel_markers_imply_order():
+    graph = build_graph(TASKS)
+    edges = order(graph)
+    # T002 and T003 are parallel: both follow T001 and both precede US1
+    assert {("T001", "T002"), ("T001", "T003"), ("T002", "T004"), ("T003", "T004")} <= edges
+    assert ("T002", "T003") not in edges
+    # US2 waits for the foundation and for US1, the polish phase for both stories
+    assert {("T005", "T006"), ("T005", "T008"), ("T007", "T008")} <= edges
+    assert graph["edges"][("T004", "T007")] == "explicit"
+    assert [p["story"] for p in graph["phases"]] == [None, "US1", "US2", None]
+    assert graph["problems"] == []
+
+
+def test_explicit_edges_arrows_and_diagrams():
+    text = "T001, T002 -> T003\nT005 ← T004\n```\nT006\n  ↓\nT007 → T008\n```\n"
+    assert explicit_edges(text) == [
+        ("T001", "T003", 1), ("T002", "T003", 1), ("T004", "T005", 2),
+        ("T007", "T008", 6), ("T006", "T007", 6),
+    ]
+
+
+def test_unknown_references_are_reported():
+    graph = build_graph(TASKS + "T008 → T099\n")
+    assert [(p["kind"], p["task"]) for p in graph["problems"]] == [("missing", "T099")]
+
+
+def test_find_cycle():
+    nodes = ["T001", "T002", "T003"]
+    assert find_cycle(nodes, [("T001", "T002"), ("T002", "T003")]) is None
+    cycle = find_cycle(nodes, [("T001", "T002"), ("T002", "T003"), ("T003", "T002")])
+    assert cycle == ["T002", "T003", "T002"]
+
+
+def test_waves_and_critical_path():
+    plan = schedule(build_graph(TASKS))
+    assert plan["waves"] == [["T001"], ["T002", "T003"], ["T004"], ["T005"],
+                             ["T006"], ["T007"], ["T008"]]
+    assert plan["critical_path"] == ["T001", "T002", "T004", "T005", "T006", "T007", "T008"]
+
+    # Completed tasks take no time when only the remaining work is scheduled
+    remaining = schedule(build_graph(TASKS), remaining=True)
+    assert remaining["waves"][0] == ["T002", "T003"]
+    assert "T001" not in remaining["critical_path"]
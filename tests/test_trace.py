@@ -0,0 +1,67 @@
+"""Span tracing: no-op when off, nested spans, threads and the trace file."""
+
+import json
+import threading
+from pathlib import Path
+
+import pytest
+
+from skgd import trace
+
+
+@pytest.fixture
+def tracer(tmp_path):
+    tracer = trace.start(str(tmp_path / "trace.json"))
+    yield tracer
+    trace._tracer = None
+
+
+@trace.traced("work.outer")
+def outer():
+    with trace.span("work.inner", files=2) as s:
+        s.set(bytes=10)
+
+
+def test_spans_are_no_ops_when_tracing_is_off():
+    assert trace._tracer is None
+    assert trace.span("x") is trace._NULL_SPAN
+    outer()
+
+
+def test_nested_spans_record_self_time(tracer):
+    outer()
+    with pytest.raises(ValueError):
+        with trace.span("work.fail"):
+            raise ValueError
+
+    events = {e["name"]: e for e in tracer.events}
+    assert events["work.inner"]["args"] == {"files": 2, "bytes": 10}
+    assert events["work.fail"]["args"] == {"error": "ValueError"}
+    calls, total, own = tracer.totals["work.outer"]
+    assert calls == 1 and own == total - tracer.totals["work.inner"][1]
+    assert "work.outer" in tracer.summary()
+
+
+def test_worker_threads_get_their_own_track(tracer, capsys):
+    worker = threading.Thread(target=outer, name="probe-worker")
+    worker.start()
+    worker.join()
+    outer()
+
+    trace.finish()
+
+    data = json.loads(Path(tracer.path).read_text(encoding="utf-8"))
+    names = {e["args"]["name"] for e in data["traceEvents"] if e["name"] == "thread_name"}
+    assert "probe-worker" in names
+    assert len([e for e in data["traceEvents"] if e.get("ph") == "X"]) == 4
+    assert "4 spans written to" in capsys.readouterr().err
+    assert trace._tracer is None
+
+
+@pytest.mark.parametrize("value, expected", [
+    ("", None), ("0", None), ("off", None), ("1", trace.DEFAULT_TRACE_FILE),
+    ("yes", trace.DEFAULT_TRACE_FILE), ("run.json", "run.json"),
+])
+def test_env_trace_path(monkeypatch, value, expected):
+    monkeypatch.setenv("SKGD_TRACE", value)
+    assert trace.env_trace_path() == expected
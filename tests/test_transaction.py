@@ -0,0 +1,102 @@
+"""Transactional installs: per-file commit, concurrent edits and rollback."""
+
+import json
+import os
+from pathlib import Path
+
+import click
+import pytest
+
+from skgd.transaction import JOURNAL, TXN_DIR, Transaction, recover
+
+
+def make_project(tmp_path: Path) -> Path:
+    dest = tmp_path / "game"
+    (dest / ".claude" / "commands").mkdir(parents=True)
+    (dest / ".skgd" / "memory").mkdir(parents=True)
+    (dest / ".claude" / "commands" / "spec.md").write_text("old spec\n")
+    (dest / ".claude" / "commands" / "gone.md").write_text("obsolete\n")
+    (dest / ".skgd" / "config.yaml").write_text("engine: unity\n")
+    (dest / ".skgd" / "memory" / "learnings.md").write_text("lesson\n" * 1000)
+    return dest
+
+
+def test_fresh_project_is_renamed_into_place(tmp_path):
+    dest = tmp_path / "new"
+    with Transaction(dest) as txn:
+        (txn.root / ".skgd").mkdir()
+        (txn.root / ".skgd" / "config.yaml").write_text("engine: godot\n")
+    assert (dest / ".skgd" / "config.yaml").read_text() == "engine: godot\n"
+    assert not (tmp_path / ".new.skgd-txn").exists()
+
+
+def test_commit_applies_only_written_files(tmp_path):
+    dest = make_project(tmp_path)
+    with Transaction(dest) as txn:
+        (txn.root / ".claude" / "commands" / "spec.md").write_text("new spec\n")
+        (txn.root / ".claude" / "commands" / "gone.md").unlink()
+        (txn.root / ".claude" / "commands" / "plan.md").write_text("plan\n")
+        # Edited in the project while the installer runs; not written by it
+        (dest / ".skgd" / "config.yaml").write_text("engine: godot\n")
+        assert txn.plan() == [
+            {"action": "remove", "path": ".claude/commands/gone.md"},
+            {"action": "add", "path": ".claude/commands/plan.md"},
+            {"action": "update", "path": ".claude/commands/spec.md"},
+        ]
+
+    assert (dest / ".claude" / "commands" / "spec.md").read_text() == "new spec\n"
+    assert (dest / ".claude" / "commands" / "plan.md").read_text() == "plan\n"
+    assert not (dest / ".claude" / "commands" / "gone.md").exists()
+    assert (dest / ".skgd" / "config.yaml").read_text() == "engine: godot\n"
+    assert (dest / ".skgd" / "memory" / "learnings.md").read_text() == "lesson\n" * 1000
+    assert not (dest / TXN_DIR).exists()
+
+
+def test_learnings_are_staged_as_placeholders(tmp_path):
+    dest = make_project(tmp_path)
+    with Transaction(dest, dry_run=True) as txn:
+        staged = txn.root / ".skgd" / "memory" / "learnings.md"
+        assert staged.is_file() and staged.stat().st_size == 0
+        assert txn.plan() == []
+
+
+def test_conflicting_edit_aborts_the_commit(tmp_path):
+    dest = make_project(tmp_path)
+    with pytest.raises(click.ClickException, match="spec.md"):
+        with Transaction(dest) as txn:
+            (txn.root / ".claude" / "commands" / "spec.md").write_text("installer\n")
+            (txn.root / ".claude" / "commands" / "plan.md").write_text("plan\n")
+            path = dest / ".claude" / "commands" / "spec.md"
+            path.write_text("user edit\n")
+            os.utime(path, ns=(1, 1))
+    assert (dest / ".claude" / "commands" / "spec.md").read_text() == "user edit\n"
+    assert not (dest / ".claude" / "commands" / "plan.md").exists()
+    assert not (dest / TXN_DIR).exists()
+
+
+def test_dry_run_writes_nothing(tmp_path):
+    dest = make_project(tmp_path)
+    with Transaction(dest, dry_run=True) as txn:
+        (txn.root / ".claude" / "commands" / "spec.md").write_text("new\n")
+        assert txn.plan() == [{"action": "update", "path": ".claude/commands/spec.md"}]
+    assert (dest / ".claude" / "commands" / "spec.md").read_text() == "old spec\n"
+    assert not (dest / TXN_DIR).exists()
+
+
+def test_recover_rolls_back_an_interrupted_commit(tmp_path):
+    dest = make_project(tmp_path)
+    work = dest / TXN_DIR
+    (work / "backup" / ".claude" / "commands").mkdir(parents=True)
+    # Crash after spec.md was swapped and plan.md was added
+    os.replace(dest / ".claude" / "commands" / "spec.md", work / "backup" / ".claude" / "commands" / "spec.md")
+    (dest / ".claude" / "commands" / "spec.md").write_text("new spec\n")
+    (dest / ".claude" / "commands" / "plan.md").write_text("plan\n")
+    (work / JOURNAL).write_text(json.dumps({"status": "committing", "files": [
+        {"path": ".claude/commands/spec.md", "had_original": True},
+        {"path": ".claude/commands/plan.md", "had_original": False},
+    ]}))
+
+    assert recover(dest) == "rolled back"
+    assert (dest / ".claude" / "commands" / "spec.md").read_text() == "old spec\n"
+    assert not (dest / ".claude" / "commands" / "plan.md").exists()
+    assert not work.exists()
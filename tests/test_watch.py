@@ -0,0 +1,105 @@
+"""Watch mode: change routing, watchers, debouncing and the refreshers."""
+
+import sys
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from skgd.cli import main
+from skgd.watch import InotifyWatcher, PollingWatcher, Refresher, collect, route, watched_dir
+
+
+@pytest.mark.parametrize("rel, engine, expected", [
+    ("docs/specs/001-move/tasks.md", "unity", {"index", "search", "assets"}),
+    ("docs/specs/001-move/notes.md", "unity", {"search"}),
+    (".skgd/state.yaml", "godot", {"index"}),
+    (".skgd/memory/learnings.md", "godot", {"search", "budget"}),
+    (".claude/commands/plan.md", "unity", {"budget"}),
+    ("Assets/Sprites/hero.png", "unity", {"assets"}),
+    ("Assets/Sprites/hero.png.meta", "unity", set()),
+    ("sprites/hero.png", "unity", set()),
+    ("sprites/hero.png", "godot", {"assets"}),
+    ("addons/gut/icon.png", "godot", set()),
+])
+def test_file_routes(rel, engine, expected):
+    assert route(rel, False, engine) == expected
+
+
+def test_directory_routes_and_watched_dirs():
+    assert route("docs/specs/002-jump", True, "unity") == {"index", "search", "assets"}
+    assert route("docs", True, "unity") == {"index", "search", "assets"}
+    assert route("Assets/Audio", True, "unity") == {"assets"}
+    assert watched_dir("Assets", "unity") and not watched_dir("Scenes", "unity")
+    assert watched_dir("Scenes", "godot") and watched_dir(".skgd", "godot")
+    assert not watched_dir(".godot", "godot") and not watched_dir(".skgd/cache", "godot")
+
+
+class FakeWatcher:
+    def __init__(self, batches):
+        self.batches = list(batches)
+
+    def wait(self, timeout):
+        return self.batches.pop(0) if self.batches else set()
+
+
+def test_collect_merges_a_burst_until_quiet():
+    watcher = FakeWatcher([{("b", False)}, {("c", False)}, set(), {("late", False)}])
+    assert collect(watcher, {("a", False)}, 0.1) == {("a", False), ("b", False), ("c", False)}
+    assert collect(FakeWatcher([None]), {("a", False)}, 0.1) is None
+    assert collect(watcher, None, 0.1) is None
+
+
+def make_tree(root: Path) -> Path:
+    (root / "docs" / "specs" / "001-move").mkdir(parents=True)
+    (root / ".skgd" / "cache").mkdir(parents=True)
+    return root
+
+
+def test_polling_watcher_sees_relevant_files_only(tmp_path):
+    dest = make_tree(tmp_path)
+    watcher = PollingWatcher(dest, "godot", interval=0.01)
+    (dest / "docs" / "specs" / "001-move" / "spec.md").write_text("# Move\n")
+    (dest / ".skgd" / "cache" / "index.db").write_text("x")
+    (dest / "hero.png.import").write_text("x")
+    assert watcher.wait(1.0) == {("docs/specs/001-move/spec.md", False)}
+    assert watcher.wait(0.02) == set()
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="inotify is Linux-only")
+def test_inotify_watcher_follows_new_directories(tmp_path):
+    dest = make_tree(tmp_path)
+    watcher = InotifyWatcher(dest, "godot")
+    try:
+        (dest / "docs" / "specs" / "002-jump").mkdir()
+        assert watcher.wait(1.0) == {("docs/specs/002-jump", True)}
+        (dest / "docs" / "specs" / "002-jump" / "plan.md").write_text("# Plan\n")
+        (dest / ".skgd" / "cache" / "index.db").write_text("x")
+        assert watcher.wait(1.0) == {("docs/specs/002-jump/plan.md", False)}
+        assert watcher.wait(0.01) == set()
+    finally:
+        watcher.close()
+
+
+def test_refresher_reports_only_changes(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    result = CliRunner().invoke(main, ["init", "game", "--engine", "godot", "--no-interactive"], input="")
+    assert result.exit_code == 0, result.output
+    dest = tmp_path / "game"
+
+    refresher = Refresher(dest)
+    try:
+        refresher.refresh({"index", "search"})
+        assert refresher.refresh({"index", "search"}) == []
+        spec = dest / "docs" / "specs" / "001-move"
+        spec.mkdir(parents=True)
+        (spec / "tasks.md").write_text("- [ ] T001 Walk\n")
+        notes = refresher.refresh({"index", "search"})
+        assert notes == ["index: 1 reindexed, 0 removed", "search: 1 reindexed, 0 removed"]
+    finally:
+        refresher.close()
+
+    monkeypatch.chdir(dest)
+    result = CliRunner().invoke(main, ["watch", "--once"])
+    assert result.exit_code == 0, result.output
+    assert "Initial refresh in" in result.output